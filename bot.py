@@ -3,6 +3,10 @@ from discord import app_commands
 from discord.ext import commands, tasks
 import config
 from database import db
+from utils.broadcast import broadcaster, BroadcastMessage, RESULTS_CHANNELS
+from utils.dm_dispatcher import dm_dispatcher
+from utils.bulk_seeder import SeedBatch, TEAM_COLUMNS, NPC_PLAYER_COLUMNS
+from utils.request_cache import CachedCommandTree, begin_unit_of_work
 import asyncio
 from datetime import datetime, timedelta
 import logging
@@ -21,6 +25,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Visualizer images seeded into image_cache on first boot
+VISUALIZER_IMAGE_URLS = {
+    'stadium': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/stadium.jpg',
+    'player_home': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/player_home.png',
+    'player_away': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/player_away.png',
+    'defender_home': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/defender_home.png',
+    'defender_away': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/defender_away.png',
+    'goalie_home': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/goalie_home.png',
+    'goalie_away': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/goalie_away.png',
+    'ball': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/ball.png'
+}
+
 # Bot intents
 intents = discord.Intents.default()
 intents.message_content = True
@@ -33,7 +49,8 @@ class FootballBot(commands.Bot):
         super().__init__(
             command_prefix=config.BOT_PREFIX,
             intents=intents,
-            help_command=None
+            help_command=None,
+            tree_cls=CachedCommandTree
         )
         self.season_task_started = False
         self.match_window_lock = asyncio.Lock()
@@ -44,342 +61,24 @@ class FootballBot(commands.Bot):
 
         await db.connect()
 
-        # ============================================
-        # AUTO-MIGRATE: Add fractional stat columns
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                # Check if fractional columns exist
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'players'
-                      AND column_name = 'pace_fractional'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding fractional stat tracking columns...")
-            
-                    # Add all 6 fractional columns
-                    await conn.execute("""
-                        ALTER TABLE players
-                        ADD COLUMN pace_fractional DECIMAL(5, 2) DEFAULT 0.0,
-                        ADD COLUMN shooting_fractional DECIMAL(5, 2) DEFAULT 0.0,
-                        ADD COLUMN passing_fractional DECIMAL(5, 2) DEFAULT 0.0,
-                        ADD COLUMN dribbling_fractional DECIMAL(5, 2) DEFAULT 0.0,
-                        ADD COLUMN defending_fractional DECIMAL(5, 2) DEFAULT 0.0,
-                        ADD COLUMN physical_fractional DECIMAL(5, 2) DEFAULT 0.0
-                    """)
-            
-                    # Initialize existing players to 0.0
-                    await conn.execute("""
-                        UPDATE players
-                        SET pace_fractional = 0.0,
-                            shooting_fractional = 0.0,
-                            passing_fractional = 0.0,
-                            dribbling_fractional = 0.0,
-                            defending_fractional = 0.0,
-                            physical_fractional = 0.0
-                        WHERE pace_fractional IS NULL
-                    """)
-            
-                    logger.info("✅ Fractional stat columns added!")
-                else:
-                    logger.info("✅ Fractional stat columns already exist")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Fractional stats migration warning: {e}")
-        
-        # ============================================
-        # AUTO-MIGRATE: Add missing column if needed
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'game_state'
-                      AND column_name = 'current_match_of_week'
-                """)
-
-                if not result:
-                    logger.info("📋 Auto-migration: Adding current_match_of_week column...")
-                    await conn.execute("""
-                        ALTER TABLE game_state
-                        ADD COLUMN current_match_of_week INTEGER DEFAULT 0
-                    """)
-                    await conn.execute("""
-                        UPDATE game_state
-                        SET current_match_of_week = 0
-                        WHERE current_match_of_week IS NULL
-                    """)
-                    logger.info("✅ Auto-migration complete!")
-                else:
-                    logger.info("✅ current_match_of_week column already exists")
-        except Exception as e:
-            logger.warning(f"⚠️ Auto-migration warning: {e}")
+        await self.seed_image_cache()
 
-        # ============================================
-        # AUTO-MIGRATE: Add last_reminded column
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'players'
-                      AND column_name = 'last_reminded'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding last_reminded column for training notifications...")
-                    await conn.execute("""
-                        ALTER TABLE players
-                        ADD COLUMN last_reminded TEXT
-                    """)
-                    logger.info("✅ last_reminded column added")
-                else:
-                    logger.info("✅ last_reminded column already exists")
-        except Exception as e:
-            logger.warning(f"⚠️ Migration warning: {e}")
-
-        # ============================================
-        # AUTO-MIGRATE: Add season stats to european_npc_players
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                # Check if season_goals exists
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'european_npc_players'
-                      AND column_name = 'season_goals'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding season_goals to european_npc_players...")
-                    await conn.execute("""
-                        ALTER TABLE european_npc_players
-                        ADD COLUMN season_goals INTEGER DEFAULT 0
-                    """)
-                    logger.info("✅ season_goals column added")
-                else:
-                    logger.info("✅ season_goals column already exists")
-
-                # Check if season_assists exists
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'european_npc_players'
-                      AND column_name = 'season_assists'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding season_assists to european_npc_players...")
-                    await conn.execute("""
-                        ALTER TABLE european_npc_players
-                        ADD COLUMN season_assists INTEGER DEFAULT 0
-                    """)
-                    logger.info("✅ season_assists column added")
-                else:
-                    logger.info("✅ season_assists column already exists")
+        await self.initialize_data()
 
-        except Exception as e:
-            logger.warning(f"⚠️ European NPC stats migration warning: {e}")
+        # Team names / leagues for every club (domestic and European), so lookups never query
+        from utils.team_directory import team_directory
+        await team_directory.load()
 
-        # ============================================
-        # AUTO-MIGRATE: Add season_motm column
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'players'
-                      AND column_name = 'season_motm'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding season_motm column...")
-                    await conn.execute("""
-                        ALTER TABLE players
-                        ADD COLUMN season_motm INTEGER DEFAULT 0
-                    """)
-                    await conn.execute("""
-                        UPDATE players
-                        SET season_motm = 0
-                        WHERE season_motm IS NULL
-                    """)
-                    logger.info("✅ season_motm column added")
-                else:
-                    logger.info("✅ season_motm column already exists")
-        except Exception as e:
-            logger.warning(f"⚠️ Migration warning: {e}")
+        # Warm squad strength cache so the first matchweek needs no rating queries
+        from utils.team_strength import team_strength
+        await team_strength.warm_up()
 
-        # ============================================
-        # AUTO-MIGRATE: Add career_motm column
-        # ============================================
         try:
-            async with db.pool.acquire() as conn:
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'players'
-                      AND column_name = 'career_motm'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding career_motm column...")
-                    await conn.execute("""
-                        ALTER TABLE players
-                        ADD COLUMN career_motm INTEGER DEFAULT 0
-                    """)
-                    await conn.execute("""
-                        UPDATE players
-                        SET career_motm = 0
-                        WHERE career_motm IS NULL
-                    """)
-                    logger.info("✅ career_motm column added")
-                else:
-                    logger.info("✅ career_motm column already exists")
+            from utils.crest_service import crest_service
+            await crest_service.warm_up()
         except Exception as e:
-            logger.warning(f"⚠️ Migration warning: {e}")
+            logger.warning(f"⚠️ Crest cache warm-up skipped: {e}")
 
-        # ============================================
-        # AUTO-MIGRATE: Add motm column to match_participants
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                result = await conn.fetchrow("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'match_participants'
-                      AND column_name = 'motm'
-                """)
-
-                if not result:
-                    logger.info("📋 Adding motm column to match_participants...")
-                    await conn.execute("""
-                        ALTER TABLE match_participants
-                        ADD COLUMN motm BOOLEAN DEFAULT FALSE
-                    """)
-                    await conn.execute("""
-                        UPDATE match_participants
-                        SET motm = FALSE
-                        WHERE motm IS NULL
-                    """)
-                    logger.info("✅ motm column added to match_participants")
-                else:
-                    logger.info("✅ motm column already exists in match_participants")
-        except Exception as e:
-            logger.warning(f"⚠️ Migration warning: {e}")
-        
-        # ============================================
-        # AUTO-SETUP: Image Cache for Visualizations
-        # ============================================
-        try:
-            async with db.pool.acquire() as conn:
-                # Check if image_cache table exists
-                result = await conn.fetchrow("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = 'image_cache'
-                    )
-                """)
-        
-                # FIX: Check count BEFORE using it in the condition
-                count = 0
-                if result['exists']:
-                    count = await conn.fetchval("SELECT COUNT(*) FROM image_cache")
-        
-                # FORCE RELOAD if table empty OR doesn't exist
-                if not result['exists'] or count == 0:
-                    logger.info("📋 Creating/reloading image_cache table...")
-            
-                    # Create table
-                    await conn.execute("""
-                        CREATE TABLE IF NOT EXISTS image_cache (
-                            image_key VARCHAR(50) PRIMARY KEY,
-                            image_data BYTEA NOT NULL,
-                            image_format VARCHAR(10) NOT NULL,
-                            width INTEGER NOT NULL,
-                            height INTEGER NOT NULL,
-                            cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            file_size INTEGER NOT NULL
-                        )
-                    """)
-            
-                    await conn.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_image_cache_last_accessed 
-                        ON image_cache(last_accessed)
-                    """)
-            
-                    logger.info("✅ image_cache table created")
-        
-                # CHECK FOR MISSING IMAGES (always runs)
-                logger.info("🔍 Checking for missing images...")
-        
-                import requests
-                from PIL import Image
-                import io
-        
-                IMAGE_URLS = {
-                    'stadium': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/stadium.jpg',
-                    'player_home': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/player_home.png',
-                    'player_away': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/player_away.png',
-                    'defender_home': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/defender_home.png',
-                    'defender_away': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/defender_away.png',
-                    'goalie_home': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/goalie_home.png',
-                    'goalie_away': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/goalie_away.png',
-                    'ball': 'https://raw.githubusercontent.com/wowmk1/FootballCareerBot/main/assets/ball.png'
-                }
-        
-                for key, url in IMAGE_URLS.items():
-                    # Check if this specific image exists
-                    exists = await conn.fetchval(
-                        "SELECT EXISTS(SELECT 1 FROM image_cache WHERE image_key = $1)", key
-                    )
-            
-                    if not exists:
-                        logger.info(f"  📥 Downloading missing image: {key}")
-                        try:
-                            # Download image
-                            response = requests.get(url, timeout=30)
-                            response.raise_for_status()
-                    
-                            # Load with PIL
-                            img = Image.open(io.BytesIO(response.content))
-                    
-                            # Convert to bytes
-                            buffer = io.BytesIO()
-                            img_format = img.format or 'PNG'
-                            img.save(buffer, format=img_format)
-                            image_bytes = buffer.getvalue()
-                    
-                            # Insert into database
-                            await conn.execute("""
-                                INSERT INTO image_cache 
-                                (image_key, image_data, image_format, width, height, file_size)
-                                VALUES ($1, $2, $3, $4, $5, $6)
-                            """, key, image_bytes, img_format, img.width, img.height, len(image_bytes))
-                    
-                            logger.info(f"    ✅ Cached '{key}' ({len(image_bytes) // 1024} KB)")
-                    
-                        except Exception as e:
-                            logger.error(f"    ❌ Failed to cache '{key}': {e}")
-        
-                final_count = await conn.fetchval("SELECT COUNT(*) FROM image_cache")
-                logger.info(f"✅ Image cache ready! ({final_count}/8 images)")
-                
-        except Exception as e:
-            logger.warning(f"⚠️ Image cache setup warning: {e}")
-        
-                # ============================================
-                # END AUTO-MIGRATE
-                # ============================================
-
-        await self.initialize_data()
         await self.load_cogs()
 
         # Initialize match engine
@@ -388,6 +87,9 @@ class FootballBot(commands.Bot):
         me_module.match_engine = MatchEngine(self)
         logger.info("✅ Match engine initialized")
 
+        # Resume (or fast-simulate) matches a restart interrupted
+        await me_module.match_engine.recover_interrupted_matches()
+
         # Cache team crests
         from utils.football_data_api import cache_all_crests
         await cache_all_crests()
@@ -417,6 +119,70 @@ class FootballBot(commands.Bot):
             self.season_task_started = True
             logger.info("✅ Background tasks started (simplified system with health monitoring)")
 
+    async def seed_image_cache(self):
+        """Download any visualizer images missing from image_cache (schema comes from migrations)"""
+        try:
+            async with db.pool.acquire() as conn:
+                cached = await conn.fetch(
+                    "SELECT image_key FROM image_cache WHERE image_key = ANY($1::varchar[])",
+                    list(VISUALIZER_IMAGE_URLS)
+                )
+                cached_keys = {row['image_key'] for row in cached}
+                missing = [key for key in VISUALIZER_IMAGE_URLS if key not in cached_keys]
+
+                if not missing:
+                    logger.info(f"✅ Image cache ready! ({len(cached)}/{len(VISUALIZER_IMAGE_URLS)} images)")
+                    return
+
+                import requests
+                from PIL import Image
+                import io
+
+                for key in missing:
+                    logger.info(f"  📥 Downloading missing image: {key}")
+                    try:
+                        # Download image
+                        response = await asyncio.to_thread(requests.get, VISUALIZER_IMAGE_URLS[key], timeout=30)
+                        response.raise_for_status()
+
+                        # Load with PIL
+                        img = Image.open(io.BytesIO(response.content))
+
+                        # Convert to bytes
+                        buffer = io.BytesIO()
+                        img_format = img.format or 'PNG'
+                        img.save(buffer, format=img_format)
+                        image_bytes = buffer.getvalue()
+
+                        # Insert into database
+                        await conn.execute("""
+                            INSERT INTO image_cache 
+                            (image_key, image_data, image_format, width, height, file_size)
+                            VALUES ($1, $2, $3, $4, $5, $6)
+                        """, key, image_bytes, img_format, img.width, img.height, len(image_bytes))
+
+                        logger.info(f"    ✅ Cached '{key}' ({len(image_bytes) // 1024} KB)")
+
+                    except Exception as e:
+                        logger.error(f"    ❌ Failed to cache '{key}': {e}")
+
+                final_count = await conn.fetchval(
+                    "SELECT COUNT(*) FROM image_cache WHERE image_key = ANY($1::varchar[])",
+                    list(VISUALIZER_IMAGE_URLS)
+                )
+                logger.info(f"✅ Image cache ready! ({final_count}/{len(VISUALIZER_IMAGE_URLS)} images)")
+
+        except Exception as e:
+            logger.warning(f"⚠️ Image cache setup warning: {e}")
+
+    async def close(self):
+        """Stop render workers and the crest HTTP session before disconnecting"""
+        from utils.render_executor import render_executor
+        from utils.crest_service import crest_service
+        render_executor.shutdown()
+        await crest_service.close()
+        await super().close()
+
     async def load_cogs(self):
         """Load all command modules"""
         cogs = [
@@ -457,22 +223,27 @@ class FootballBot(commands.Bot):
 
         if team_count == 0:
             logger.info("📊 Initializing teams...")
+            batch = SeedBatch()
+            for team in ALL_TEAMS:
+                if team['league'] == 'Premier League':
+                    budget = 150000000
+                    wage_budget = 200000
+                elif team['league'] == 'Championship':
+                    budget = 50000000
+                    wage_budget = 80000
+                else:
+                    budget = 10000000
+                    wage_budget = 30000
+
+                batch.add('teams', TEAM_COLUMNS,
+                          (team['team_id'], team['team_name'], team['league'], budget, wage_budget))
+            await batch.write()
+            
+            # Seeded rows carry the column default position; rank them before anything reads positions
+            from utils.standings import standings
             async with db.pool.acquire() as conn:
-                for team in ALL_TEAMS:
-                    if team['league'] == 'Premier League':
-                        budget = 150000000
-                        wage_budget = 200000
-                    elif team['league'] == 'Championship':
-                        budget = 50000000
-                        wage_budget = 80000
-                    else:
-                        budget = 10000000
-                        wage_budget = 30000
-
-                    await conn.execute('''
-                        INSERT INTO teams (team_id, team_name, league, budget, wage_budget)
-                        VALUES ($1, $2, $3, $4, $5)
-                    ''', team['team_id'], team['team_name'], team['league'], budget, wage_budget)
+                await standings.rerank(conn)
+            standings.invalidate()
             logger.info(f"✅ Added {len(ALL_TEAMS)} teams")
 
         async with db.pool.acquire() as conn:
@@ -486,6 +257,10 @@ class FootballBot(commands.Bot):
                 LEAGUE_ONE_PLAYERS
             )
 
+        # Every NPC name in use, so generated squads / regens never probe the DB for uniqueness
+        from utils.name_allocator import name_allocator
+        await name_allocator.load(force=True)
+
         async with db.pool.acquire() as conn:
             result = await conn.fetchrow("SELECT COUNT(*) as count FROM npc_players")
             npc_count = result['count']
@@ -508,52 +283,24 @@ class FootballBot(commands.Bot):
             logger.info(f"✅ European teams populated! {teams} teams, {players} players")
 
     async def populate_real_players(self, pl_players, champ_players, l1_players):
-        """Populate real players with proper stats"""
-        import random
+        """Populate real players with proper stats (built in memory, written with one COPY)"""
+        batch = SeedBatch()
 
-        logger.info("⚽ Adding real Premier League players...")
-        async with db.pool.acquire() as conn:
-            for p in pl_players:
+        for league, players in (('Premier League', pl_players), ('Championship', champ_players),
+                                ('League One', l1_players)):
+            logger.info(f"⚽ Adding real {league} players...")
+            for p in players:
                 stats = self.calculate_player_stats(p['overall_rating'], p['position'])
-                await conn.execute('''
-                    INSERT INTO npc_players (player_name, team_id, position, age, overall_rating,
-                                            pace, shooting, passing, dribbling, defending, physical,
-                                            is_regen)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, FALSE)
-                ''', p['player_name'], p['team_id'], p['position'], p['age'], p['overall_rating'],
-                                   stats['pace'], stats['shooting'], stats['passing'], stats['dribbling'],
-                                   stats['defending'], stats['physical'])
+                batch.add('npc_players', NPC_PLAYER_COLUMNS, (
+                    p['player_name'], p['team_id'], p['position'], p['age'], p['overall_rating'],
+                    stats['pace'], stats['shooting'], stats['passing'], stats['dribbling'],
+                    stats['defending'], stats['physical'], False
+                ))
 
-        logger.info(f"✅ Added {len(pl_players)} Premier League players")
-
-        logger.info("⚽ Adding real Championship players...")
-        async with db.pool.acquire() as conn:
-            for p in champ_players:
-                stats = self.calculate_player_stats(p['overall_rating'], p['position'])
-                await conn.execute('''
-                    INSERT INTO npc_players (player_name, team_id, position, age, overall_rating,
-                                            pace, shooting, passing, dribbling, defending, physical,
-                                            is_regen)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, FALSE)
-                ''', p['player_name'], p['team_id'], p['position'], p['age'], p['overall_rating'],
-                                   stats['pace'], stats['shooting'], stats['passing'], stats['dribbling'],
-                                   stats['defending'], stats['physical'])
+        await batch.write()
 
+        logger.info(f"✅ Added {len(pl_players)} Premier League players")
         logger.info(f"✅ Added {len(champ_players)} Championship players")
-
-        logger.info("⚽ Adding real League One players...")
-        async with db.pool.acquire() as conn:
-            for p in l1_players:
-                stats = self.calculate_player_stats(p['overall_rating'], p['position'])
-                await conn.execute('''
-                    INSERT INTO npc_players (player_name, team_id, position, age, overall_rating,
-                                            pace, shooting, passing, dribbling, defending, physical,
-                                            is_regen)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, FALSE)
-                ''', p['player_name'], p['team_id'], p['position'], p['age'], p['overall_rating'],
-                                   stats['pace'], stats['shooting'], stats['passing'], stats['dribbling'],
-                                   stats['defending'], stats['physical'])
-
         logger.info(f"✅ Added {len(l1_players)} League One players")
 
     def calculate_player_stats(self, base, position):
@@ -614,67 +361,63 @@ class FootballBot(commands.Bot):
         try:
             state = await db.get_game_state()
 
-            for guild in self.guilds:
-                channel = discord.utils.get(guild.text_channels, name="match-results")
-                if not channel:
-                    channel = discord.utils.get(guild.text_channels, name="general")
-
-                if channel:
-                    embed = discord.Embed(
-                        title="🟢 MATCH WINDOW OPEN!",
-                        description=f"**Week {state['current_week']}** matches are now playable!\n\n"
-                                    f"Use `/play_match` to play your match!",
-                        color=discord.Color.green()
-                    )
+            # One query for every guild; each guild only mentions its own members
+            async with db.pool.acquire() as conn:
+                players = await conn.fetch("""
+                    SELECT DISTINCT p.user_id, p.player_name, t.team_name
+                    FROM players p
+                    JOIN teams t ON p.team_id = t.team_id
+                    WHERE p.retired = FALSE
+                      AND p.team_id != 'free_agent'
+                      AND EXISTS (
+                        SELECT 1 FROM fixtures f
+                        WHERE (f.home_team_id = p.team_id OR f.away_team_id = p.team_id)
+                        AND f.week_number = $1
+                        AND f.played = FALSE
+                      )
+                """, state['current_week'])
+
+            def build(guild):
+                embed = discord.Embed(
+                    title="🟢 MATCH WINDOW OPEN!",
+                    description=f"**Week {state['current_week']}** matches are now playable!\n\n"
+                                f"Use `/play_match` to play your match!",
+                    color=discord.Color.green()
+                )
 
-                    embed.add_field(
-                        name="⏰ Window Open",
-                        value="**3:00 PM - 5:00 PM EST**\n2 hour window",
-                        inline=True
-                    )
+                embed.add_field(
+                    name="⏰ Window Open",
+                    value="**3:00 PM - 5:00 PM EST**\n2 hour window",
+                    inline=True
+                )
+
+                embed.add_field(
+                    name="⚡ Quick Commands",
+                    value="`/play_match` - Play your match\n`/season` - Check schedule",
+                    inline=True
+                )
+
+                player_mentions = []
+                for p in players:
+                    member = guild.get_member(p['user_id'])
+                    if member:
+                        player_mentions.append(f"{member.mention} ({p['team_name']})")
+
+                if player_mentions:
+                    mentions_text = "\n".join(player_mentions[:10])
+                    if len(player_mentions) > 10:
+                        mentions_text += f"\n*...and {len(player_mentions) - 10} more*"
 
                     embed.add_field(
-                        name="⚡ Quick Commands",
-                        value="`/play_match` - Play your match\n`/season` - Check schedule",
-                        inline=True
+                        name="👥 Players with Matches",
+                        value=mentions_text,
+                        inline=False
                     )
 
-                    async with db.pool.acquire() as conn:
-                        players = await conn.fetch("""
-                            SELECT DISTINCT p.user_id, p.player_name, t.team_name
-                            FROM players p
-                            JOIN teams t ON p.team_id = t.team_id
-                            WHERE p.retired = FALSE
-                              AND p.team_id != 'free_agent'
-                              AND EXISTS (
-                                SELECT 1 FROM fixtures f
-                                WHERE (f.home_team_id = p.team_id OR f.away_team_id = p.team_id)
-                                AND f.week_number = $1
-                                AND f.played = FALSE
-                              )
-                        """, state['current_week'])
-
-                    player_mentions = []
-                    for p in players:
-                        member = guild.get_member(p['user_id'])
-                        if member:
-                            player_mentions.append(f"{member.mention} ({p['team_name']})")
-
-                    if player_mentions:
-                        mentions_text = "\n".join(player_mentions[:10])
-                        if len(player_mentions) > 10:
-                            mentions_text += f"\n*...and {len(player_mentions) - 10} more*"
-
-                        embed.add_field(
-                            name="👥 Players with Matches",
-                            value=mentions_text,
-                            inline=False
-                        )
-
-                    embed.set_footer(text="Window closes at 5:00 PM EST!")
-
-                    await channel.send(embed=embed)
-                    logger.info(f"✅ Posted match window notification to {guild.name}")
+                embed.set_footer(text="Window closes at 5:00 PM EST!")
+                return [BroadcastMessage(embed=embed)]
+
+            await broadcaster.broadcast(self, "match_window_open", build, RESULTS_CHANNELS)
         except Exception as e:
             logger.warning(f"⚠️ Could not post match window notification: {e}")
 
@@ -683,72 +426,67 @@ class FootballBot(commands.Bot):
         try:
             state = await db.get_game_state()
 
-            for guild in self.guilds:
-                channel = discord.utils.get(guild.text_channels, name="match-results")
-                if not channel:
-                    channel = discord.utils.get(guild.text_channels, name="general")
-
-                if channel:
-                    embed = discord.Embed(
-                        title="🟢 EUROPEAN WINDOW OPEN!",
-                        description=f"**Week {state['current_week']}** Champions League & Europa League matches are now playable!\n\n"
-                                    f"Use `/play_match` to play your European match!",
-                        color=discord.Color.blue()
-                    )
+            # Find players with European matches (once for every guild)
+            async with db.pool.acquire() as conn:
+                players = await conn.fetch("""
+                    SELECT DISTINCT p.user_id, p.player_name, t.team_name, f.competition
+                    FROM players p
+                    JOIN teams t ON p.team_id = t.team_id
+                    JOIN european_fixtures f ON (f.home_team_id = p.team_id OR f.away_team_id = p.team_id)
+                    WHERE p.retired = FALSE
+                      AND p.team_id != 'free_agent'
+                      AND f.week_number = $1
+                      AND f.played = FALSE
+                """, state['current_week'])
+
+            def build(guild):
+                embed = discord.Embed(
+                    title="🟢 EUROPEAN WINDOW OPEN!",
+                    description=f"**Week {state['current_week']}** Champions League & Europa League matches are now playable!\n\n"
+                                f"Use `/play_match` to play your European match!",
+                    color=discord.Color.blue()
+                )
 
-                    embed.add_field(
-                        name="🏆 Window Open",
-                        value="**12:00 PM - 2:00 PM EST**\n2 hour window",
-                        inline=True
-                    )
+                embed.add_field(
+                    name="🏆 Window Open",
+                    value="**12:00 PM - 2:00 PM EST**\n2 hour window",
+                    inline=True
+                )
 
-                    embed.add_field(
-                        name="⚡ Quick Commands",
-                        value="`/play_match` - Play your match\n`/european` - Check fixtures",
-                        inline=True
-                    )
+                embed.add_field(
+                    name="⚡ Quick Commands",
+                    value="`/play_match` - Play your match\n`/european` - Check fixtures",
+                    inline=True
+                )
+
+                player_mentions = []
+                for p in players:
+                    member = guild.get_member(p['user_id'])
+                    if member:
+                        comp_emoji = "🏆" if p['competition'] == 'CL' else "🌟"
+                        player_mentions.append(f"{comp_emoji} {member.mention} ({p['team_name']})")
 
-                    # Find players with European matches
-                    async with db.pool.acquire() as conn:
-                        players = await conn.fetch("""
-                            SELECT DISTINCT p.user_id, p.player_name, t.team_name, f.competition
-                            FROM players p
-                            JOIN teams t ON p.team_id = t.team_id
-                            JOIN european_fixtures f ON (f.home_team_id = p.team_id OR f.away_team_id = p.team_id)
-                            WHERE p.retired = FALSE
-                              AND p.team_id != 'free_agent'
-                              AND f.week_number = $1
-                              AND f.played = FALSE
-                        """, state['current_week'])
-
-                    player_mentions = []
-                    for p in players:
-                        member = guild.get_member(p['user_id'])
-                        if member:
-                            comp_emoji = "🏆" if p['competition'] == 'CL' else "🌟"
-                            player_mentions.append(f"{comp_emoji} {member.mention} ({p['team_name']})")
-
-                    if player_mentions:
-                        mentions_text = "\n".join(player_mentions[:10])
-                        if len(player_mentions) > 10:
-                            mentions_text += f"\n*...and {len(player_mentions) - 10} more*"
-
-                        embed.add_field(
-                            name="👥 Players with European Matches",
-                            value=mentions_text,
-                            inline=False
-                        )
+                if player_mentions:
+                    mentions_text = "\n".join(player_mentions[:10])
+                    if len(player_mentions) > 10:
+                        mentions_text += f"\n*...and {len(player_mentions) - 10} more*"
 
                     embed.add_field(
-                        name="ℹ️ Domestic Matches",
-                        value="League matches open later at **3:00 PM EST**",
+                        name="👥 Players with European Matches",
+                        value=mentions_text,
                         inline=False
                     )
 
-                    embed.set_footer(text="European window closes at 2:00 PM EST • Domestic opens at 3:00 PM!")
+                embed.add_field(
+                    name="ℹ️ Domestic Matches",
+                    value="League matches open later at **3:00 PM EST**",
+                    inline=False
+                )
 
-                    await channel.send(embed=embed)
-                    logger.info(f"✅ Posted European window open notification to {guild.name}")
+                embed.set_footer(text="European window closes at 2:00 PM EST • Domestic opens at 3:00 PM!")
+                return [BroadcastMessage(embed=embed)]
+
+            await broadcaster.broadcast(self, "european_window_open", build, RESULTS_CHANNELS)
         except Exception as e:
             logger.warning(f"⚠️ Could not post European window notification: {e}")
 
@@ -757,39 +495,32 @@ class FootballBot(commands.Bot):
         try:
             state = await db.get_game_state()
 
-            for guild in self.guilds:
-                channel = discord.utils.get(guild.text_channels, name="match-results")
-                if not channel:
-                    channel = discord.utils.get(guild.text_channels, name="general")
-
-                if channel:
-                    embed = discord.Embed(
-                        title="🔴 MATCH WINDOW CLOSED",
-                        description=f"**Week {state['current_week']}** is complete! Advancing to Week {state['current_week'] + 1}...",
-                        color=discord.Color.red()
-                    )
+            embed = discord.Embed(
+                title="🔴 MATCH WINDOW CLOSED",
+                description=f"**Week {state['current_week']}** is complete! Advancing to Week {state['current_week'] + 1}...",
+                color=discord.Color.red()
+            )
 
-                    if week_results:
-                        results_text = ""
-                        for result in week_results[:5]:
-                            results_text += f"**{result['home_team_name']}** {result['home_score']} - {result['away_score']} **{result['away_team_name']}**\n"
+            if week_results:
+                results_text = ""
+                for result in week_results[:5]:
+                    results_text += f"**{result['home_team_name']}** {result['home_score']} - {result['away_score']} **{result['away_team_name']}**\n"
 
-                        embed.add_field(
-                            name="📊 Recent Results",
-                            value=results_text,
-                            inline=False
-                        )
+                embed.add_field(
+                    name="📊 Recent Results",
+                    value=results_text,
+                    inline=False
+                )
 
-                    embed.add_field(
-                        name="📅 Next Match Window",
-                        value="Check `/season` for schedule",
-                        inline=False
-                    )
+            embed.add_field(
+                name="📅 Next Match Window",
+                value="Check `/season` for schedule",
+                inline=False
+            )
 
-                    embed.set_footer(text="Use /league table to see updated standings!")
+            embed.set_footer(text="Use /league table to see updated standings!")
 
-                    await channel.send(embed=embed)
-                    logger.info(f"✅ Posted window closed notification to {guild.name}")
+            await broadcaster.broadcast(self, "match_window_closed", [BroadcastMessage(embed=embed)], RESULTS_CHANNELS)
         except Exception as e:
             logger.warning(f"⚠️ Could not post window closed notification: {e}")
 
@@ -798,57 +529,50 @@ class FootballBot(commands.Bot):
         try:
             state = await db.get_game_state()
 
-            for guild in self.guilds:
-                channel = discord.utils.get(guild.text_channels, name="match-results")
-                if not channel:
-                    channel = discord.utils.get(guild.text_channels, name="general")
-
-                if channel:
-                    embed = discord.Embed(
-                        title="🔴 EUROPEAN WINDOW CLOSED",
-                        description=f"**Week {state['current_week']}** European matches (12-2 PM) are complete!",
-                        color=discord.Color.blue()
-                    )
+            embed = discord.Embed(
+                title="🔴 EUROPEAN WINDOW CLOSED",
+                description=f"**Week {state['current_week']}** European matches (12-2 PM) are complete!",
+                color=discord.Color.blue()
+            )
 
-                    # Get European results from this window
-                    async with db.pool.acquire() as conn:
-                        results = await conn.fetch("""
-                            SELECT 
-                                COALESCE(ht.team_name, eht.team_name) as home_team,
-                                COALESCE(at.team_name, eat.team_name) as away_team,
-                                f.home_score, f.away_score, f.competition
-                            FROM european_fixtures f
-                            LEFT JOIN teams ht ON f.home_team_id = ht.team_id
-                            LEFT JOIN teams at ON f.away_team_id = at.team_id
-                            LEFT JOIN european_teams eht ON f.home_team_id = eht.team_id
-                            LEFT JOIN european_teams eat ON f.away_team_id = eat.team_id
-                            WHERE f.week_number = $1 AND f.played = TRUE
-                            ORDER BY f.fixture_id DESC
-                            LIMIT 5
-                        """, state['current_week'])
-
-                    if results:
-                        results_text = ""
-                        for r in results:
-                            comp_emoji = "🏆" if r['competition'] == 'CL' else "🌟"
-                            results_text += f"{comp_emoji} **{r['home_team']}** {r['home_score']} - {r['away_score']} **{r['away_team']}**\n"
-
-                        embed.add_field(
-                            name="📊 European Results",
-                            value=results_text,
-                            inline=False
-                        )
+            # Get European results from this window
+            async with db.pool.acquire() as conn:
+                results = await conn.fetch("""
+                    SELECT 
+                        COALESCE(ht.team_name, eht.team_name) as home_team,
+                        COALESCE(at.team_name, eat.team_name) as away_team,
+                        f.home_score, f.away_score, f.competition
+                    FROM european_fixtures f
+                    LEFT JOIN teams ht ON f.home_team_id = ht.team_id
+                    LEFT JOIN teams at ON f.away_team_id = at.team_id
+                    LEFT JOIN european_teams eht ON f.home_team_id = eht.team_id
+                    LEFT JOIN european_teams eat ON f.away_team_id = eat.team_id
+                    WHERE f.week_number = $1 AND f.played = TRUE
+                    ORDER BY f.fixture_id DESC
+                    LIMIT 5
+                """, state['current_week'])
+
+            if results:
+                results_text = ""
+                for r in results:
+                    comp_emoji = "🏆" if r['competition'] == 'CL' else "🌟"
+                    results_text += f"{comp_emoji} **{r['home_team']}** {r['home_score']} - {r['away_score']} **{r['away_team']}**\n"
+
+                embed.add_field(
+                    name="📊 European Results",
+                    value=results_text,
+                    inline=False
+                )
 
-                    embed.add_field(
-                        name="⏰ Domestic Window Opens Soon",
-                        value=f"League matches open at **3:00 PM EST** (in 1 hour)\nUse `/season` to check your match!",
-                        inline=False
-                    )
+            embed.add_field(
+                name="⏰ Domestic Window Opens Soon",
+                value=f"League matches open at **3:00 PM EST** (in 1 hour)\nUse `/season` to check your match!",
+                inline=False
+            )
 
-                    embed.set_footer(text="Domestic league matches open at 3:00 PM EST!")
+            embed.set_footer(text="Domestic league matches open at 3:00 PM EST!")
 
-                    await channel.send(embed=embed)
-                    logger.info(f"✅ Posted European window closed notification to {guild.name}")
+            await broadcaster.broadcast(self, "european_window_closed", [BroadcastMessage(embed=embed)], RESULTS_CHANNELS)
         except Exception as e:
             logger.warning(f"⚠️ Could not post European window closed notification: {e}")
 
@@ -858,54 +582,47 @@ class FootballBot(commands.Bot):
             # ✅ FIX: Calculate new week from parameter (don't read database!)
             new_week = completing_week + 1
 
-            for guild in self.guilds:
-                channel = discord.utils.get(guild.text_channels, name="match-results")
-                if not channel:
-                    channel = discord.utils.get(guild.text_channels, name="general")
-
-                if channel:
-                    embed = discord.Embed(
-                        title="🔴 DOMESTIC WINDOW CLOSED",
-                        description=f"**Week {completing_week}** is complete!\n\n⏭️ Advancing to **Week {new_week}**...",
-                        color=discord.Color.red()
-                    )
+            embed = discord.Embed(
+                title="🔴 DOMESTIC WINDOW CLOSED",
+                description=f"**Week {completing_week}** is complete!\n\n⏭️ Advancing to **Week {new_week}**...",
+                color=discord.Color.red()
+            )
 
-                    # Get recent domestic results
-                    async with db.pool.acquire() as conn:
-                        results = await conn.fetch("""
-                            SELECT 
-                                ht.team_name as home_team,
-                                at.team_name as away_team,
-                                f.home_score, f.away_score
-                            FROM fixtures f
-                            JOIN teams ht ON f.home_team_id = ht.team_id
-                            JOIN teams at ON f.away_team_id = at.team_id
-                            WHERE f.week_number = $1 AND f.played = TRUE
-                            ORDER BY f.fixture_id DESC
-                            LIMIT 5
-                        """, completing_week)
-
-                    if results:
-                        results_text = ""
-                        for r in results:
-                            results_text += f"⚽ **{r['home_team']}** {r['home_score']} - {r['away_score']} **{r['away_team']}**\n"
-
-                        embed.add_field(
-                            name="📊 Recent League Results",
-                            value=results_text,
-                            inline=False
-                        )
+            # Get recent domestic results
+            async with db.pool.acquire() as conn:
+                results = await conn.fetch("""
+                    SELECT 
+                        ht.team_name as home_team,
+                        at.team_name as away_team,
+                        f.home_score, f.away_score
+                    FROM fixtures f
+                    JOIN teams ht ON f.home_team_id = ht.team_id
+                    JOIN teams at ON f.away_team_id = at.team_id
+                    WHERE f.week_number = $1 AND f.played = TRUE
+                    ORDER BY f.fixture_id DESC
+                    LIMIT 5
+                """, completing_week)
+
+            if results:
+                results_text = ""
+                for r in results:
+                    results_text += f"⚽ **{r['home_team']}** {r['home_score']} - {r['away_score']} **{r['away_team']}**\n"
+
+                embed.add_field(
+                    name="📊 Recent League Results",
+                    value=results_text,
+                    inline=False
+                )
 
-                    embed.add_field(
-                        name=f"📅 Week {new_week} Begins",
-                        value=f"Use `/season` to see when your next match is!\nUse `/league table` for updated standings!",
-                        inline=False
-                    )
+            embed.add_field(
+                name=f"📅 Week {new_week} Begins",
+                value=f"Use `/season` to see when your next match is!\nUse `/league table` for updated standings!",
+                inline=False
+            )
 
-                    embed.set_footer(text=f"Week {completing_week} complete • Week {new_week} starts now!")
+            embed.set_footer(text=f"Week {completing_week} complete • Week {new_week} starts now!")
 
-                    await channel.send(embed=embed)
-                    logger.info(f"✅ Posted domestic window closed notification to {guild.name}")
+            await broadcaster.broadcast(self, "domestic_window_closed", [BroadcastMessage(embed=embed)], RESULTS_CHANNELS)
         except Exception as e:
             logger.error(f"❌ Could not post domestic window closed notification: {e}", exc_info=True)
 
@@ -937,6 +654,8 @@ class FootballBot(commands.Bot):
         ✅ FIXED: Proper handling of 4-value return from is_match_window_time()
         ✅ FIXED: Passes current_week to is_match_window_time()
         """
+        # Each run is one background job: dedupe its player/team reads
+        begin_unit_of_work()
         try:
             from utils.season_manager import (
                 is_match_window_time,
@@ -1035,6 +754,7 @@ class FootballBot(commands.Bot):
         SELF-HEALING: Errors logged but task continues
         ✅ FIXED: Passes current_week to all should_send_warning() calls
         """
+        begin_unit_of_work()
         try:
             from utils.season_manager import (
                 should_send_warning,
@@ -1096,6 +816,9 @@ class FootballBot(commands.Bot):
         """
         Check for players whose training is ready and send reminders
         Uses daily 2:30 PM EST reset system
+
+        "Not trained / not reminded since the reset" is filtered in SQL, DMs go out
+        concurrently through the DM dispatcher, and every success is recorded in one UPDATE
         """
         try:
             est = pytz.timezone('US/Eastern')
@@ -1121,110 +844,64 @@ class FootballBot(commands.Bot):
                 # 1. Haven't trained since today's reset
                 # 2. Haven't been reminded today
                 rows = await conn.fetch("""
-                    SELECT user_id, player_name, last_training, last_reminded
+                    SELECT user_id, training_streak
                     FROM players
                     WHERE retired = FALSE
                       AND team_id != 'free_agent'
                       AND (last_training IS NULL 
                            OR last_training::timestamp < $1)
+                      AND (last_reminded IS NULL
+                           OR last_reminded::timestamp < $1)
                 """, today_reset_naive)
 
-                logger.info(f"   Found {len(rows)} players who haven't trained since reset")
-            
-                sent_count = 0
-                for row in rows:
-                    # Check if already reminded today
-                    last_reminded = row.get('last_reminded')
-                    if last_reminded:
-                        # Parse the stored timestamp
-                        if isinstance(last_reminded, str):
-                            last_reminded_dt = datetime.fromisoformat(last_reminded)
-                        else:
-                            last_reminded_dt = last_reminded
-                    
-                        # Make timezone-aware for comparison
-                        if last_reminded_dt.tzinfo is None:
-                            last_reminded_dt = est.localize(last_reminded_dt)
-                    
-                        # Skip if already reminded today
-                        if last_reminded_dt >= today_reset:
-                            logger.debug(f"   - Skipped {row['player_name']}: already reminded today")
-                            continue
-                
-                    logger.info(f"   - Sending reminder to {row['player_name']}")
-                    success = await self.send_training_reminder(row['user_id'])
-
-                    if success:
-                        # ✅ FIX: Store as naive datetime string
-                        await conn.execute("""
-                            UPDATE players
-                            SET last_reminded = $1
-                            WHERE user_id = $2
-                        """, now_est.replace(tzinfo=None).isoformat(), row['user_id'])
-                    
-                        sent_count += 1
-                        logger.info(f"     ✅ Reminder sent successfully")
-            
-                if sent_count > 0:
-                    logger.info(f"✅ Sent {sent_count} training reminders total")
-                else:
-                    logger.info(f"   No new reminders needed")
+            logger.info(f"   Found {len(rows)} players to remind")
+            if not rows:
+                return
 
-        except Exception as e:
-            logger.error(f"❌ ERROR in check_training_reminders: {e}", exc_info=True)
+            report = await dm_dispatcher.send_many(
+                self, "training_reminders",
+                [(row['user_id'], {'embed': self.training_reminder_embed(row['training_streak'])}) for row in rows]
+            )
 
-    async def send_training_reminder(self, user_id: int):
-        """Send DM when training is available - Daily 2:30 PM EST reset"""
-        try:
-            player = await db.get_player(user_id)
-            if not player:
-                return False
+            if report.sent:
+                # ✅ FIX: Store as naive datetime string
+                async with db.pool.acquire() as conn:
+                    await conn.execute("""
+                        UPDATE players
+                        SET last_reminded = $1
+                        WHERE user_id = ANY($2::bigint[])
+                    """, now_est.replace(tzinfo=None).isoformat(), report.sent)
 
-            est = pytz.timezone('US/Eastern')
-            now_est = datetime.now(est)
-            today_reset = now_est.replace(hour=14, minute=30, second=0, microsecond=0)
-            
-            # Check if player has already trained since today's reset
-            if player['last_training']:
-                last_train = datetime.fromisoformat(player['last_training'])
-                
-                # Make timezone-aware if needed
-                if last_train.tzinfo is None:
-                    last_train = est.localize(last_train)
-                
-                # If they trained after today's reset, don't send reminder
-                if last_train >= today_reset:
-                    logger.warning(f"⚠️ Skipped reminder for user {user_id} - already trained today")
-                    return False
-
-            user = await self.fetch_user(user_id)
-            embed = discord.Embed(
-                title="💪 Training Available!",
-                description="**Training has reset for the day!**\n\nUse `/train` to improve your stats.",
-                color=discord.Color.green()
-            )
+                logger.info(f"✅ Sent {len(report.sent)} training reminders total")
+            else:
+                logger.info(f"   No new reminders sent")
 
-            embed.add_field(
-                name="🔥 Daily Training",
-                value=f"Train every day to maintain your streak!\n"
-                      f"Current streak: **{player['training_streak']} days**\n"
-                      f"30-day streak = +3 potential",
-                inline=False
-            )
+        except Exception as e:
+            logger.error(f"❌ ERROR in check_training_reminders: {e}", exc_info=True)
 
-            embed.add_field(
-                name="⏰ Training Window",
-                value=f"Training resets **daily at 2:30 PM EST**\nYou have until tomorrow's reset to train!",
-                inline=False
-            )
+    @staticmethod
+    def training_reminder_embed(training_streak):
+        """DM shown when training is available - Daily 2:30 PM EST reset"""
+        embed = discord.Embed(
+            title="💪 Training Available!",
+            description="**Training has reset for the day!**\n\nUse `/train` to improve your stats.",
+            color=discord.Color.green()
+        )
 
-            await user.send(embed=embed)
-            logger.info(f"✅ Sent training reminder to user {user_id}")
-            return True
+        embed.add_field(
+            name="🔥 Daily Training",
+            value=f"Train every day to maintain your streak!\n"
+                  f"Current streak: **{training_streak} days**\n"
+                  f"30-day streak = +3 potential",
+            inline=False
+        )
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not send training reminder to {user_id}: {e}")
-            return False
+        embed.add_field(
+            name="⏰ Training Window",
+            value=f"Training resets **daily at 2:30 PM EST**\nYou have until tomorrow's reset to train!",
+            inline=False
+        )
+        return embed
 
     @tasks.loop(minutes=5)
     async def check_database_health(self):
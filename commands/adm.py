@@ -270,6 +270,11 @@ class AdminCommands(commands.Cog):
                 team_id, team['league'], wage, 3, user.id
             )
         
+        from utils.team_strength import team_strength
+        from utils.season_projection import season_projector
+        team_strength.invalidate(player['team_id'], team_id)
+        season_projector.invalidate()
+        
         embed = discord.Embed(
             title="✅ Player Assigned",
             description=f"{user.mention} → **{team['team_name']}**",
@@ -374,71 +379,18 @@ class AdminCommands(commands.Cog):
     
         await interaction.response.defer()
     
+        from utils.league_system import recalculate_all_tables
+    
         async with db.pool.acquire() as conn:
-            # Reset all team stats
-            await conn.execute("""
-                UPDATE teams SET 
-                    played = 0, won = 0, drawn = 0, lost = 0,
-                    goals_for = 0, goals_against = 0, points = 0
-            """)
+            summary = await recalculate_all_tables(conn)
         
-            # Get all played fixtures
-            fixtures = await conn.fetch("""
-                SELECT fixture_id, home_team_id, away_team_id, home_score, away_score
-                FROM fixtures 
-                WHERE played = true 
-                ORDER BY week_number, fixture_id
-            """)
-        
-            # Recalculate for each fixture
-            for fixture in fixtures:
-                # Home team stats
-                if fixture['home_score'] > fixture['away_score']:
-                    h_won, h_drawn, h_lost, h_points = 1, 0, 0, 3
-                elif fixture['home_score'] == fixture['away_score']:
-                    h_won, h_drawn, h_lost, h_points = 0, 1, 0, 1
-                else:
-                    h_won, h_drawn, h_lost, h_points = 0, 0, 1, 0
-            
-                await conn.execute("""
-                    UPDATE teams SET
-                        played = played + 1,
-                        won = won + $1,
-                        drawn = drawn + $2,
-                        lost = lost + $3,
-                        goals_for = goals_for + $4,
-                        goals_against = goals_against + $5,
-                        points = points + $6
-                    WHERE team_id = $7
-                """, h_won, h_drawn, h_lost, fixture['home_score'], 
-                     fixture['away_score'], h_points, fixture['home_team_id'])
-            
-                # Away team stats
-                if fixture['away_score'] > fixture['home_score']:
-                    a_won, a_drawn, a_lost, a_points = 1, 0, 0, 3
-                elif fixture['away_score'] == fixture['home_score']:
-                    a_won, a_drawn, a_lost, a_points = 0, 1, 0, 1
-                else:
-                    a_won, a_drawn, a_lost, a_points = 0, 0, 1, 0
-            
-                await conn.execute("""
-                    UPDATE teams SET
-                        played = played + 1,
-                        won = won + $1,
-                        drawn = drawn + $2,
-                        lost = lost + $3,
-                        goals_for = goals_for + $4,
-                        goals_against = goals_against + $5,
-                        points = points + $6
-                    WHERE team_id = $7
-                """, a_won, a_drawn, a_lost, fixture['away_score'], 
-                     fixture['home_score'], a_points, fixture['away_team_id'])
+            played_fixtures = await conn.fetchval("SELECT COUNT(*) FROM fixtures WHERE played = true")
         
             # Get summary
             teams = await conn.fetch("""
                 SELECT team_name, league, played, points 
                 FROM teams 
-                ORDER BY league, points DESC, (goals_for - goals_against) DESC
+                ORDER BY league, position
             """)
     
         # Build summary by league
@@ -448,7 +400,8 @@ class AdminCommands(commands.Cog):
     
         embed = discord.Embed(
             title="✅ League Tables Recalculated",
-            description=f"Recalculated stats for **{len(fixtures)} fixtures**",
+            description=f"Recalculated stats from **{played_fixtures} played fixtures** "
+                        f"({summary['teams']} teams, {summary['groups']} group rows) in {summary['elapsed_ms']:.0f}ms",
             color=discord.Color.green()
         )
     
@@ -1279,48 +1232,24 @@ class AdminCommands(commands.Cog):
             await channel.send("🎬 **Generating animated highlights...**")
             
             try:
-                from match_visualizer import MatchVisualizer
-                from PIL import Image
-                import io
+                from match_visualizer import generate_highlight_reel
                 
-                all_frames = []
+                # 10 animated frames per goal, rendered off the event loop
+                clips = [{
+                    'action': goal_action['action'],
+                    'player_name': goal_action['player']['player_name'],
+                    'player_position': goal_action['player']['position'],
+                    'defender_name': goal_action['defender']['player_name'] if goal_action['defender'] else None,
+                    'start_pos': goal_action['start_pos'],
+                    'end_pos': goal_action['end_pos'],
+                    'is_home': True,
+                    'success': True,
+                    'is_goal': True
+                } for goal_action in goal_actions]
                 
-                for goal_action in goal_actions:
-                    # Create 10 animated frames per goal
-                    frames = await MatchVisualizer.create_action_animation(
-                        action=goal_action['action'],
-                        player_name=goal_action['player']['player_name'],
-                        player_position=goal_action['player']['position'],
-                        defender_name=goal_action['defender']['player_name'] if goal_action['defender'] else None,
-                        start_pos=goal_action['start_pos'],
-                        end_pos=goal_action['end_pos'],
-                        is_home=True,
-                        success=True,
-                        is_goal=True,
-                        frames=10
-                    )
-                    all_frames.extend(frames)
-                
-                # Resize and save as GIF
-                resized_frames = []
-                for frame in all_frames:
-                    new_width = int(frame.width * 0.7)
-                    new_height = int(frame.height * 0.7)
-                    resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    resized_frames.append(resized)
-                
-                buffer = io.BytesIO()
-                resized_frames[0].save(
-                    buffer,
-                    format='GIF',
-                    save_all=True,
-                    append_images=resized_frames[1:],
-                    duration=70,
-                    loop=0,
-                    optimize=True,
-                    quality=85
-                )
-                buffer.seek(0)
+                preset = {'frames_per_goal': 10, 'frames_per_action': 10, 'resize_factor': 0.7,
+                          'quality': 85, 'duration': 70}
+                buffer = await generate_highlight_reel(clips, [preset], max_size_mb=float('inf'))
                 
                 await channel.send(
                     content=f"⚽ **Match Highlights!** ({len(goal_actions)} goal{'s' if len(goal_actions) != 1 else ''})",
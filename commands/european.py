@@ -8,6 +8,7 @@ from discord import app_commands
 from discord.ext import commands
 from database import db
 from utils.football_data_api import get_team_crest_url, get_competition_logo
+from utils.team_directory import team_directory
 import config
 
 class European(commands.Cog):
@@ -159,61 +160,13 @@ class European(commands.Cog):
         comp_emoji = "⭐" if competition_value == 'CL' else "🌟"
         comp_color = discord.Color.blue() if competition_value == 'CL' else discord.Color.gold()
         
-        # Helper function to generate combined crest image
-        async def generate_crests_image(home_url, away_url):
-            """Generate combined image with both crests side by side"""
-            try:
-                from io import BytesIO
-                from PIL import Image
-                import aiohttp
-                
-                async with aiohttp.ClientSession() as session:
-                    home_img_bytes = None
-                    away_img_bytes = None
-                    
-                    if home_url:
-                        try:
-                            async with session.get(home_url, timeout=aiohttp.ClientTimeout(total=5)) as r:
-                                if r.status == 200:
-                                    home_img_bytes = await r.read()
-                        except:
-                            pass
-                    
-                    if away_url:
-                        try:
-                            async with session.get(away_url, timeout=aiohttp.ClientTimeout(total=5)) as r:
-                                if r.status == 200:
-                                    away_img_bytes = await r.read()
-                        except:
-                            pass
-                
-                size = (100, 100)
-                padding = 40
-                width = size[0] * 2 + padding
-                height = size[1]
-                img = Image.new("RGBA", (width, height), (255, 255, 255, 0))
-                
-                if home_img_bytes:
-                    try:
-                        home = Image.open(BytesIO(home_img_bytes)).convert("RGBA").resize(size)
-                        img.paste(home, (0, 0), home)
-                    except:
-                        pass
-                
-                if away_img_bytes:
-                    try:
-                        away = Image.open(BytesIO(away_img_bytes)).convert("RGBA").resize(size)
-                        img.paste(away, (size[0] + padding, 0), away)
-                    except:
-                        pass
-                
-                buffer = BytesIO()
-                img.save(buffer, format="PNG")
-                buffer.seek(0)
-                return buffer
-            except Exception as e:
-                print(f"Error generating crests image: {e}")
-                return None
+        from utils.crest_service import crest_service
+        
+        # Fetch every crest on the page at once (no-op when already cached)
+        await crest_service.prefetch(
+            [get_team_crest_url(f['home_team_id']) for f in fixtures[:10]] +
+            [get_team_crest_url(f['away_team_id']) for f in fixtures[:10]]
+        )
         
         embeds = []
         files = []
@@ -255,7 +208,7 @@ class European(commands.Cog):
             
             # Generate combined crests image
             if home_crest or away_crest:
-                crests_buffer = await generate_crests_image(home_crest, away_crest)
+                crests_buffer = await crest_service.get_composite(home_crest, away_crest)
                 if crests_buffer:
                     file = discord.File(fp=crests_buffer, filename=f"crests_{idx}.png")
                     embed.set_image(url=f"attachment://crests_{idx}.png")
@@ -533,18 +486,9 @@ class European(commands.Cog):
             competition_value = competition.value
         
         async with db.pool.acquire() as conn:
-            ties = await conn.fetch("""
-                SELECT k.*, k.home_team_id, k.away_team_id, k.winner_team_id,
-                       COALESCE(ht.team_name, eht.team_name) as home_name,
-                       COALESCE(at.team_name, eat.team_name) as away_name,
-                       COALESCE(wt.team_name, ewt.team_name) as winner_name
+            rows = await conn.fetch("""
+                SELECT k.*
                 FROM european_knockout k
-                LEFT JOIN teams ht ON k.home_team_id = ht.team_id
-                LEFT JOIN teams at ON k.away_team_id = at.team_id
-                LEFT JOIN teams wt ON k.winner_team_id = wt.team_id
-                LEFT JOIN european_teams eht ON k.home_team_id = eht.team_id
-                LEFT JOIN european_teams eat ON k.away_team_id = eat.team_id
-                LEFT JOIN european_teams ewt ON k.winner_team_id = ewt.team_id
                 WHERE k.competition = $1
                 ORDER BY CASE k.stage
                     WHEN 'r16' THEN 1
@@ -554,6 +498,16 @@ class European(commands.Cog):
                 END
             """, competition_value)
         
+        # Names come from the team directory instead of six joins
+        await team_directory.ensure_loaded()
+        ties = [
+            {**dict(row),
+             'home_name': team_directory.name(row['home_team_id'], default=None),
+             'away_name': team_directory.name(row['away_team_id'], default=None),
+             'winner_name': team_directory.name(row['winner_team_id'], default=None)}
+            for row in rows
+        ]
+        
         if not ties:
             await interaction.followup.send("⏳ Knockout stage hasn't started yet!", ephemeral=True)
             return
@@ -2,6 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from database import db
+import config
 from utils.football_data_api import get_team_crest_url, get_competition_logo
 
 class LeagueCommands(commands.Cog):
@@ -164,6 +165,66 @@ class LeagueCommands(commands.Cog):
         embed.set_footer(text=f"Season {state['current_season']} • Week {state['current_week']}")
         
         await interaction.response.send_message(embed=embed)
+    
+    async def projections(self, interaction: discord.Interaction, league: str = "Premier League"):
+        """Monte-Carlo season projections (called by /league command)"""
+        from utils.season_projection import season_projector
+        
+        await interaction.response.defer()
+        
+        projection = await season_projector.project_league(league)
+        
+        if not projection:
+            await interaction.followup.send(f"❌ No data found for {league}!", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title=f"🔮 {league} Season Projections",
+            description=f"Chances from {projection['runs']:,} simulations of the remaining {projection['remaining_fixtures']} fixtures",
+            color=discord.Color.purple()
+        )
+        
+        comp_logo = get_competition_logo(league)
+        if comp_logo:
+            embed.set_author(name=league, icon_url=comp_logo)
+        
+        # Only show the columns that apply to this league
+        columns = [("Title", 'title')]
+        if config.CL_QUALIFICATION_POSITIONS.get(league):
+            columns.append(("  UCL", 'champions_league'))
+        if config.EL_QUALIFICATION_POSITIONS.get(league):
+            columns.append(("  UEL", 'europa_league'))
+        if config.PROMOTION_PLACES.get(league):
+            columns.append((" Prom", 'promotion'))
+        if config.RELEGATION_PLACES.get(league):
+            columns.append(("  Rel", 'relegation'))
+        
+        def fmt_pct(value):
+            if value == 0:
+                return "-".rjust(5)
+            if value < 0.01:
+                return "<1%".rjust(5)
+            if value > 0.99 and value < 1:
+                return ">99%".rjust(5)
+            return f"{value * 100:.0f}%".rjust(5)
+        
+        lines = ["```"]
+        lines.append("Pos Team             Pts  xPos " + " ".join(header for header, _ in columns))
+        lines.append("─" * (32 + 6 * len(columns)))
+        
+        for pos, team in enumerate(projection['teams'], 1):
+            team_name = team['team_name'][:16].ljust(16)
+            values = " ".join(fmt_pct(team[key]) for _, key in columns)
+            lines.append(f"{pos:2}  {team_name} {team['points']:3} {team['expected_position']:5.1f} {values}")
+        
+        lines.append("```")
+        embed.description += "\n" + "\n".join(lines)
+        
+        embed.set_footer(
+            text=f"Season {projection['season']} • Week {projection['week']} • Simulated in {projection['elapsed_ms']:.0f}ms"
+        )
+        
+        await interaction.followup.send(embed=embed)
 
 async def setup(bot):
     await bot.add_cog(LeagueCommands(bot))
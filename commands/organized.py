@@ -54,6 +54,7 @@ class OrganizedCommands(commands.Cog):
             app_commands.Choice(name="👟 Top Scorers", value="scorers"),
             app_commands.Choice(name="📅 My Fixtures", value="fixtures"),
             app_commands.Choice(name="📋 Recent Results", value="results"),
+            app_commands.Choice(name="🔮 Season Projections", value="projections"),
         ],
         league=[
             app_commands.Choice(name="Premier League", value="Premier League"),
@@ -81,6 +82,8 @@ class OrganizedCommands(commands.Cog):
             await self._show_fixtures(interaction)
         elif action == "results":
             await self._show_results(interaction)
+        elif action == "projections":
+            await self._show_projections(interaction, league)
     
     # ========== HELPER METHODS ==========
     
@@ -155,6 +158,14 @@ class OrganizedCommands(commands.Cog):
             await season_cog.results(interaction)
         else:
             await interaction.response.send_message("❌ Results command not available", ephemeral=True)
+    
+    async def _show_projections(self, interaction: discord.Interaction, league: str):
+        """Show season projections"""
+        league_cog = self.bot.get_cog('LeagueCommands')
+        if league_cog:
+            await league_cog.projections(interaction, league)
+        else:
+            await interaction.response.send_message("❌ Projections command not available", ephemeral=True)
 
 
 async def setup(bot):
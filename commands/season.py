@@ -9,6 +9,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from database import db
+from utils.standings import standings
 import config
 from datetime import datetime
 
@@ -606,8 +607,7 @@ class SeasonCommands(commands.Cog):
             if player['team_id'] != 'free_agent':
                 team = await db.get_team(player['team_id'])
                 if team:
-                    table = await db.get_league_table(team['league'])
-                    team_position = next((i + 1 for i, t in enumerate(table) if t['team_id'] == team['team_id']), None)
+                    team_position = await standings.get_position(team['team_id'], team['league'])
 
                     if team_position:
                         achievements.append(f"📊 Team Finish: **{team_position}** in {team['league']}")
@@ -200,6 +200,11 @@ class ClubButton(discord.ui.Button):
                                (await db.get_game_state())['current_week']
                                )
 
+        from utils.team_strength import team_strength
+        from utils.season_projection import season_projector
+        team_strength.invalidate(self.club['team_id'])
+        season_projector.invalidate()
+
         # Add news
         await db.add_news(
             f"NEW SIGNING: {self.parent_view.player_name} joins {self.club['team_name']}",
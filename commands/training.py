@@ -836,6 +836,10 @@ class TrainingCommands(commands.Cog):
                 VALUES ($1, $2, $3, $4, $5)
             ''', interaction.user.id, str(actual_gains), new_streak >= 7, player['overall_rating'], new_overall)
 
+        if new_overall != player['overall_rating']:
+            from utils.team_strength import team_strength
+            team_strength.invalidate(player['team_id'])
+
         from utils.form_morale_system import update_player_morale
         await update_player_morale(interaction.user.id, 'training')
 
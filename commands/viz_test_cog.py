@@ -9,8 +9,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
-import io
-from PIL import Image
 
 
 class VizTestCog(commands.Cog):
@@ -28,7 +26,7 @@ class VizTestCog(commands.Cog):
         try:
             # Import check
             try:
-                from match_visualizer import generate_action_visualization, CoordinateMapper, MatchVisualizer
+                from match_visualizer import generate_action_visualization, CoordinateMapper
                 from match_highlights import MatchHighlightsGenerator
                 await interaction.followup.send("✅ **Visualization system loaded!**")
             except ImportError as e:
@@ -185,85 +183,34 @@ class VizTestCog(commands.Cog):
                              "⚽ Goal 3: Away team\n\n"
                              "**Optimized: 10 frames per goal + 70% resolution**")
             
-            # ✅ CREATE 3 GOALS WITH OPTIMIZATION
-            all_frames = []
-            
-            # Goal 1: Striker
-            test_player['position'] = 'ST'
-            start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
-                'shoot', 'ST', True
-            )
-            frames1 = await MatchVisualizer.create_action_animation(
-                action='shoot',
-                player_name=test_player['player_name'],
-                player_position='ST',
-                defender_name='Defender',
-                start_pos=(start_x, start_y),
-                end_pos=(end_x, end_y),
-                is_home=True,
-                success=True,
-                is_goal=True,
-                frames=10  # ✅ Reduced from 15 to 10
-            )
-            all_frames.extend(frames1)
-            
-            # Goal 2: Winger
-            start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
-                'shoot', 'W', True
-            )
-            frames2 = await MatchVisualizer.create_action_animation(
-                action='shoot',
-                player_name=test_player['player_name'],
-                player_position='W',
-                defender_name='Defender',
-                start_pos=(start_x, start_y),
-                end_pos=(end_x, end_y),
-                is_home=True,
-                success=True,
-                is_goal=True,
-                frames=10  # ✅ Reduced from 15 to 10
-            )
-            all_frames.extend(frames2)
-            
-            # Goal 3: Away team
-            start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
-                'shoot', 'ST', False
-            )
-            frames3 = await MatchVisualizer.create_action_animation(
-                action='shoot',
-                player_name='Away Striker',
-                player_position='ST',
-                defender_name='Defender',
-                start_pos=(start_x, start_y),
-                end_pos=(end_x, end_y),
-                is_home=False,
-                success=True,
-                is_goal=True,
-                frames=10  # ✅ Reduced from 15 to 10
-            )
-            all_frames.extend(frames3)
-            
-            # ✅ RESIZE FRAMES TO 70% (reduces file size by ~50%)
-            resized_frames = []
-            for frame in all_frames:
-                new_width = int(frame.width * 0.7)
-                new_height = int(frame.height * 0.7)
-                resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                resized_frames.append(resized)
-            
-            # ✅ COMBINE WITH OPTIMIZATION
-            buffer = io.BytesIO()
-            resized_frames[0].save(
-                buffer,
-                format='GIF',
-                save_all=True,
-                append_images=resized_frames[1:],
-                duration=70,
-                loop=0,
-                optimize=True,  # ✅ Compress GIF
-                quality=85      # ✅ Good quality but smaller
-            )
-            buffer.seek(0)
+            # ✅ CREATE 3 GOALS WITH OPTIMIZATION (rendered in the render executor)
+            from match_visualizer import generate_highlight_reel
+            
+            clips = []
+            for player_name, position, is_home in [
+                (test_player['player_name'], 'ST', True),   # Goal 1: Striker
+                (test_player['player_name'], 'W', True),    # Goal 2: Winger
+                ('Away Striker', 'ST', False),              # Goal 3: Away team
+            ]:
+                start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
+                    'shoot', position, is_home
+                )
+                clips.append({
+                    'action': 'shoot',
+                    'player_name': player_name,
+                    'player_position': position,
+                    'defender_name': 'Defender',
+                    'start_pos': (start_x, start_y),
+                    'end_pos': (end_x, end_y),
+                    'is_home': is_home,
+                    'success': True,
+                    'is_goal': True
+                })
+            
+            # ✅ 10 frames per goal, 70% size, compressed GIF
+            preset = {'frames_per_goal': 10, 'frames_per_action': 10, 'resize_factor': 0.7,
+                      'quality': 85, 'duration': 70}
+            buffer = await generate_highlight_reel(clips, [preset], max_size_mb=float('inf'))
             
             # Check file size
             file_size_mb = len(buffer.getvalue()) / (1024 * 1024)
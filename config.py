@@ -37,6 +37,12 @@ TRAINING_COOLDOWN_HOURS = 23.75  # 23 hours 45 minutes (prevents daily drift)
 TRANSFER_WINDOW_WEEKS = [15, 16, 17, 30, 31, 32]
 TRANSFER_OFFERS_PER_WINDOW = 3
 
+# Rendering Configuration (match visuals, highlight reels, crests)
+RENDER_WORKERS = int(os.getenv('RENDER_WORKERS', '2'))  # 0 = render in a thread instead of processes
+RENDER_MAX_PENDING = 8        # Jobs allowed to wait for a worker before callers are held back
+RENDER_QUEUE_TIMEOUT = 30     # Seconds a caller waits for a queue slot
+RENDER_JOB_TIMEOUT = 90       # Seconds before a single render job is killed
+
 # Notification Configuration
 NOTIFY_MATCH_WINDOW = True
 NOTIFY_TRAINING_READY = True
@@ -77,6 +83,19 @@ EL_QUALIFICATION_POSITIONS = {
     'League One': []
 }
 
+# Promotion/relegation places (number of teams at the top/bottom of each table)
+PROMOTION_PLACES = {
+    'Premier League': 0,
+    'Championship': 2,
+    'League One': 2
+}
+
+RELEGATION_PLACES = {
+    'Premier League': 3,
+    'Championship': 3,
+    'League One': 0
+}
+
 print("✅ Config loaded successfully")
 print(f"📊 Environment: production")
 print(f"⚽ Match schedule: Mon/Wed/Sat (1 game week per real day)")
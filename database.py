@@ -6,6 +6,8 @@ import random
 import logging
 from datetime import datetime, timedelta
 
+from utils.request_cache import TrackedConnection, cached_read, game_state_cache
+
 logger = logging.getLogger(__name__)
 
 class Database:
@@ -20,15 +22,13 @@ class Database:
             config.DATABASE_URL,
             min_size=5,  # Increase minimum
             max_size=25,  # Increase maximum
-            command_timeout=60  # Add timeout
+            command_timeout=60,  # Add timeout
+            connection_class=TrackedConnection  # Writes invalidate the read caches
         )
-        await self.create_tables()
-        
-        # Run transfer window migration
-        await self.migrate_transfer_windows()
         
-        # Add performance indexes
-        await self.add_performance_indexes()
+        # Versioned schema migrations (migrations/*.sql); a single version check when current
+        from utils.migration_runner import migration_runner
+        await migration_runner.run(self.pool)
         
         logger.info("✅ Database connected")
         print("✅ Database connected")
@@ -68,7 +68,8 @@ class Database:
             self.pool = await asyncpg.create_pool(
                 config.DATABASE_URL,
                 min_size=1,
-                max_size=10
+                max_size=10,
+                connection_class=TrackedConnection
             )
             
             logger.info("✅ Database reconnected successfully")
@@ -96,519 +97,19 @@ class Database:
         
         return None
     
-    async def add_performance_indexes(self):
-        """Add performance indexes to database"""
-        try:
-            async with self.pool.acquire() as conn:
-                indexes = [
-                    'CREATE INDEX IF NOT EXISTS idx_players_team_id ON players(team_id)',
-                    'CREATE INDEX IF NOT EXISTS idx_fixtures_week ON fixtures(week_number)',
-                    'CREATE INDEX IF NOT EXISTS idx_fixtures_playable ON fixtures(playable, played)',
-                    'CREATE INDEX IF NOT EXISTS idx_match_participants_user ON match_participants(user_id)',
-                    'CREATE INDEX IF NOT EXISTS idx_match_participants_match ON match_participants(match_id)',
-                    'CREATE INDEX IF NOT EXISTS idx_news_user_created ON news(user_id, created_at DESC)',
-                    'CREATE INDEX IF NOT EXISTS idx_training_user_date ON training_history(user_id, training_date DESC)',
-                    'CREATE INDEX IF NOT EXISTS idx_players_retired ON players(retired, age)',
-                    'CREATE INDEX IF NOT EXISTS idx_npc_players_team ON npc_players(team_id, retired)',
-                    'CREATE INDEX IF NOT EXISTS idx_transfer_offers_user ON transfer_offers(user_id, status)',
-                    'CREATE INDEX IF NOT EXISTS idx_match_events_fixture ON match_events(fixture_id, minute)',
-                    'CREATE INDEX IF NOT EXISTS idx_players_last_reminded ON players(last_reminded)',
-                    'CREATE INDEX IF NOT EXISTS idx_transfer_offers_week ON transfer_offers(offer_week)',
-                    'CREATE INDEX IF NOT EXISTS idx_fixtures_week_playable ON fixtures(week_number, playable, played)',
-                ]
-                
-                for index_sql in indexes:
-                    await conn.execute(index_sql)
-                
-                print("✅ Performance indexes verified")
-        except Exception as e:
-            print(f"⚠️ Index creation warning: {e}")
-    
-    async def migrate_transfer_windows(self):
-        """Migrate database for transfer window system"""
-        try:
-            async with self.pool.acquire() as conn:
-                # Check if migration already ran
-                result = await conn.fetchrow("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = 'transfer_offers'
-                    )
-                """)
-                
-                if result['exists']:
-                    print("✅ Transfer window tables already exist")
-                    return
-                
-                print("🔄 Running transfer window migration...")
-                
-                # Add new columns to players table
-                await conn.execute("""
-                    ALTER TABLE players 
-                    ADD COLUMN IF NOT EXISTS last_transfer_window INTEGER
-                """)
-                print("  ✅ Added last_transfer_window column")
-                
-                await conn.execute("""
-                    ALTER TABLE players 
-                    ADD COLUMN IF NOT EXISTS transfers_this_season INTEGER DEFAULT 0
-                """)
-                print("  ✅ Added transfers_this_season column")
-                
-                # Create transfer_offers table
-                await conn.execute("""
-                    CREATE TABLE IF NOT EXISTS transfer_offers (
-                        offer_id SERIAL PRIMARY KEY,
-                        user_id BIGINT NOT NULL,
-                        team_id TEXT NOT NULL,
-                        wage_offer INTEGER NOT NULL,
-                        contract_length INTEGER NOT NULL,
-                        offer_week INTEGER NOT NULL,
-                        expires_week INTEGER NOT NULL,
-                        offer_type TEXT DEFAULT 'standard',
-                        previous_offer_id INTEGER,
-                        performance_bonus INTEGER DEFAULT 0,
-                        status TEXT DEFAULT 'pending',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                print("  ✅ Created transfer_offers table")
-                
-                # Create indexes
-                await conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_transfer_offers_user_status 
-                    ON transfer_offers(user_id, status)
-                """)
-                await conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_transfer_offers_week 
-                    ON transfer_offers(offer_week)
-                """)
-                print("  ✅ Created indexes")
-                
-                # Add column to game_state
-                await conn.execute("""
-                    ALTER TABLE game_state 
-                    ADD COLUMN IF NOT EXISTS transfer_window_active BOOLEAN DEFAULT FALSE
-                """)
-                print("  ✅ Added transfer_window_active column")
-                
-                print("✅ Transfer window migration completed successfully!")
-        except Exception as e:
-            print(f"⚠️ Migration warning: {e}")
-    
-    async def create_tables(self):
-        """Create all necessary tables"""
-        
-        async with self.pool.acquire() as conn:
-            # Game state table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS game_state (
-                    id INTEGER PRIMARY KEY,
-                    season_started BOOLEAN DEFAULT FALSE,
-                    current_season TEXT DEFAULT '2027/28',
-                    current_week INTEGER DEFAULT 0,
-                    current_year INTEGER DEFAULT 2027,
-                    season_start_date TEXT,
-                    last_match_day TEXT,
-                    next_match_day TEXT,
-                    match_window_open BOOLEAN DEFAULT FALSE,
-                    match_window_closes TEXT,
-                    fixtures_generated BOOLEAN DEFAULT FALSE,
-                    CONSTRAINT game_state_check CHECK (id = 1)
-                )
-            ''')
-            
-            await conn.execute('''
-                INSERT INTO game_state (id) VALUES (1) ON CONFLICT (id) DO NOTHING
-            ''')
-            
-            # Players table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS players (
-                    user_id BIGINT PRIMARY KEY,
-                    discord_username TEXT,
-                    player_name TEXT NOT NULL,
-                    position TEXT NOT NULL,
-                    age INTEGER DEFAULT 18,
-                    overall_rating INTEGER DEFAULT 60,
-                    pace INTEGER DEFAULT 60,
-                    shooting INTEGER DEFAULT 60,
-                    passing INTEGER DEFAULT 60,
-                    dribbling INTEGER DEFAULT 60,
-                    defending INTEGER DEFAULT 40,
-                    physical INTEGER DEFAULT 60,
-                    potential INTEGER DEFAULT 75,
-                    team_id TEXT DEFAULT 'free_agent',
-                    league TEXT DEFAULT NULL,
-                    contract_wage INTEGER DEFAULT 5000,
-                    contract_years INTEGER DEFAULT 0,
-                    form INTEGER DEFAULT 50,
-                    morale INTEGER DEFAULT 75,
-                    training_streak INTEGER DEFAULT 0,
-                    last_training TEXT,
-                    season_goals INTEGER DEFAULT 0,
-                    season_assists INTEGER DEFAULT 0,
-                    season_apps INTEGER DEFAULT 0,
-                    season_rating REAL DEFAULT 0.0,
-                    season_motm INTEGER DEFAULT 0,
-                    career_goals INTEGER DEFAULT 0,
-                    career_assists INTEGER DEFAULT 0,
-                    career_apps INTEGER DEFAULT 0,
-                    career_motm INTEGER DEFAULT 0,
-                    injury_weeks INTEGER DEFAULT 0,
-                    injury_type TEXT,
-                    retired BOOLEAN DEFAULT FALSE,
-                    retirement_date TEXT,
-                    joined_week INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Teams table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS teams (
-                    team_id TEXT PRIMARY KEY,
-                    team_name TEXT NOT NULL,
-                    league TEXT NOT NULL,
-                    position INTEGER DEFAULT 10,
-                    played INTEGER DEFAULT 0,
-                    won INTEGER DEFAULT 0,
-                    drawn INTEGER DEFAULT 0,
-                    lost INTEGER DEFAULT 0,
-                    goals_for INTEGER DEFAULT 0,
-                    goals_against INTEGER DEFAULT 0,
-                    points INTEGER DEFAULT 0,
-                    budget INTEGER DEFAULT 50000000,
-                    wage_budget INTEGER DEFAULT 100000,
-                    form TEXT DEFAULT ''
-                )
-            ''')
-            
-            # NPC Players table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS npc_players (
-                    npc_id SERIAL PRIMARY KEY,
-                    player_name TEXT NOT NULL,
-                    team_id TEXT,
-                    position TEXT NOT NULL,
-                    age INTEGER DEFAULT 25,
-                    overall_rating INTEGER DEFAULT 75,
-                    pace INTEGER DEFAULT 70,
-                    shooting INTEGER DEFAULT 70,
-                    passing INTEGER DEFAULT 70,
-                    dribbling INTEGER DEFAULT 70,
-                    defending INTEGER DEFAULT 50,
-                    physical INTEGER DEFAULT 70,
-                    season_goals INTEGER DEFAULT 0,
-                    season_assists INTEGER DEFAULT 0,
-                    season_apps INTEGER DEFAULT 0,
-                    market_value INTEGER DEFAULT 10000000,
-                    retired BOOLEAN DEFAULT FALSE,
-                    is_regen BOOLEAN DEFAULT FALSE,
-                    potential INTEGER DEFAULT 75
-                )
-            ''')
-            
-            # Fixtures table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS fixtures (
-                    fixture_id SERIAL PRIMARY KEY,
-                    home_team_id TEXT,
-                    away_team_id TEXT,
-                    competition TEXT DEFAULT 'Premier League',
-                    league TEXT NOT NULL,
-                    week_number INTEGER,
-                    season TEXT DEFAULT '2027/28',
-                    home_score INTEGER,
-                    away_score INTEGER,
-                    played BOOLEAN DEFAULT FALSE,
-                    playable BOOLEAN DEFAULT FALSE,
-                    match_date TEXT
-                )
-            ''')
-            
-            # Match events table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS match_events (
-                    event_id SERIAL PRIMARY KEY,
-                    fixture_id INTEGER,
-                    user_id BIGINT,
-                    npc_id INTEGER,
-                    event_type TEXT,
-                    minute INTEGER,
-                    description TEXT,
-                    dice_roll INTEGER,
-                    stat_modifier INTEGER,
-                    total_roll INTEGER,
-                    difficulty_class INTEGER,
-                    success BOOLEAN,
-                    rating_impact REAL DEFAULT 0.0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Active matches table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS active_matches (
-                    match_id SERIAL PRIMARY KEY,
-                    fixture_id INTEGER UNIQUE,
-                    home_team_id TEXT,
-                    away_team_id TEXT,
-                    home_score INTEGER DEFAULT 0,
-                    away_score INTEGER DEFAULT 0,
-                    current_minute INTEGER DEFAULT 0,
-                    events_completed INTEGER DEFAULT 0,
-                    match_state TEXT DEFAULT 'waiting',
-                    channel_id BIGINT,
-                    message_id BIGINT,
-                    last_event_time TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Match participants table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS match_participants (
-                    participant_id SERIAL PRIMARY KEY,
-                    match_id INTEGER,
-                    user_id BIGINT,
-                    team_id TEXT,
-                    match_rating REAL DEFAULT 5.0,
-                    actions_taken INTEGER DEFAULT 0,
-                    goals_scored INTEGER DEFAULT 0,
-                    assists INTEGER DEFAULT 0,
-                    joined BOOLEAN DEFAULT FALSE
-                )
-            ''')
-            
-            # Training history
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS training_history (
-                    training_id SERIAL PRIMARY KEY,
-                    user_id BIGINT,
-                    training_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    stat_gains TEXT,
-                    streak_bonus BOOLEAN DEFAULT FALSE,
-                    overall_before INTEGER,
-                    overall_after INTEGER
-                )
-            ''')
-            
-            # Transfers table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS transfers (
-                    transfer_id SERIAL PRIMARY KEY,
-                    user_id BIGINT,
-                    npc_id INTEGER,
-                    from_team TEXT,
-                    to_team TEXT,
-                    fee INTEGER,
-                    wage INTEGER,
-                    contract_length INTEGER,
-                    season TEXT DEFAULT '2027/28',
-                    transfer_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    transfer_type TEXT DEFAULT 'permanent'
-                )
-            ''')
-            
-            # News table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS news (
-                    news_id SERIAL PRIMARY KEY,
-                    headline TEXT NOT NULL,
-                    content TEXT,
-                    category TEXT,
-                    user_id BIGINT,
-                    importance INTEGER DEFAULT 5,
-                    week_number INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Notifications table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS notifications (
-                    notif_id SERIAL PRIMARY KEY,
-                    user_id BIGINT,
-                    message TEXT NOT NULL,
-                    notif_type TEXT,
-                    read BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Player Traits table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS player_traits (
-                    id SERIAL PRIMARY KEY,
-                    user_id BIGINT NOT NULL,
-                    trait_id TEXT NOT NULL,
-                    unlocked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(user_id, trait_id)
-                )
-            ''')
-            
-            # Achievements table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS achievements (
-                    achievement_id TEXT PRIMARY KEY,
-                    achievement_name TEXT NOT NULL,
-                    description TEXT,
-                    icon TEXT,
-                    category TEXT,
-                    rarity TEXT DEFAULT 'common'
-                )
-            ''')
-            
-            # Player achievements table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS player_achievements (
-                    id SERIAL PRIMARY KEY,
-                    user_id BIGINT NOT NULL,
-                    achievement_id TEXT NOT NULL,
-                    unlocked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    progress INTEGER DEFAULT 0,
-                    UNIQUE(user_id, achievement_id)
-                )
-            ''')
-            
-            # Settings table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS user_settings (
-                    user_id BIGINT PRIMARY KEY,
-                    notify_matches BOOLEAN DEFAULT TRUE,
-                    notify_training BOOLEAN DEFAULT TRUE,
-                    notify_transfers BOOLEAN DEFAULT TRUE,
-                    notify_news BOOLEAN DEFAULT TRUE
-                )
-            ''')
-
-            # European Teams
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS european_teams (
-                    team_id TEXT PRIMARY KEY,
-                    team_name TEXT NOT NULL,
-                    country TEXT NOT NULL,
-                    league TEXT NOT NULL,
-                    reputation INTEGER DEFAULT 75
-                )
-            ''')
-
-            # European NPC Players
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS european_npc_players (
-                    npc_id SERIAL PRIMARY KEY,
-                    player_name TEXT NOT NULL,
-                    team_id TEXT REFERENCES european_teams(team_id),
-                    position TEXT NOT NULL,
-                    overall_rating INTEGER NOT NULL,
-                    age INTEGER NOT NULL,
-                    nationality TEXT,
-                    pace INTEGER DEFAULT 70,
-                    shooting INTEGER DEFAULT 70,
-                    passing INTEGER DEFAULT 70,
-                    dribbling INTEGER DEFAULT 70,
-                    defending INTEGER DEFAULT 70,
-                    physical INTEGER DEFAULT 70,
-                    value INTEGER DEFAULT 1000000,
-                    wage INTEGER DEFAULT 50000,
-                    retired BOOLEAN DEFAULT FALSE
-                )
-            ''')
-
-            # European Fixtures
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS european_fixtures (
-                    fixture_id SERIAL PRIMARY KEY,
-                    competition TEXT NOT NULL,
-                    stage TEXT NOT NULL,
-                    group_name TEXT,
-                    home_team_id TEXT NOT NULL,
-                    away_team_id TEXT NOT NULL,
-                    week_number INTEGER NOT NULL,
-                    match_day INTEGER NOT NULL,
-                    home_score INTEGER,
-                    away_score INTEGER,
-                    played BOOLEAN DEFAULT FALSE,
-                    playable BOOLEAN DEFAULT FALSE,
-                    season TEXT DEFAULT '2027/28',
-                    leg INTEGER DEFAULT 1,
-                    tie_id INTEGER
-                )
-            ''')
-
-            # European Groups
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS european_groups (
-                    id SERIAL PRIMARY KEY,
-                    competition TEXT NOT NULL,
-                    group_name TEXT NOT NULL,
-                    team_id TEXT NOT NULL,
-                    played INTEGER DEFAULT 0,
-                    won INTEGER DEFAULT 0,
-                    drawn INTEGER DEFAULT 0,
-                    lost INTEGER DEFAULT 0,
-                    goals_for INTEGER DEFAULT 0,
-                    goals_against INTEGER DEFAULT 0,
-                    points INTEGER DEFAULT 0,
-                    season TEXT DEFAULT '2027/28'
-                )
-            ''')
-
-            # Knockout Ties
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS european_knockout (
-                    tie_id SERIAL PRIMARY KEY,
-                    competition TEXT NOT NULL,
-                    stage TEXT NOT NULL,
-                    home_team_id TEXT NOT NULL,
-                    away_team_id TEXT NOT NULL,
-                    first_leg_home_score INTEGER DEFAULT 0,
-                    first_leg_away_score INTEGER DEFAULT 0,
-                    second_leg_home_score INTEGER DEFAULT 0,
-                    second_leg_away_score INTEGER DEFAULT 0,
-                    aggregate_home INTEGER DEFAULT 0,
-                    aggregate_away INTEGER DEFAULT 0,
-                    winner_team_id TEXT,
-                    first_leg_played BOOLEAN DEFAULT FALSE,
-                    second_leg_played BOOLEAN DEFAULT FALSE,
-                    penalties_taken BOOLEAN DEFAULT FALSE,
-                    penalty_winner TEXT,
-                    season TEXT DEFAULT '2027/28'
-                )
-            ''')
-
-            # Player European Stats
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS player_european_stats (
-                    stat_id SERIAL PRIMARY KEY,
-                    user_id BIGINT NOT NULL,
-                    competition TEXT NOT NULL,
-                    stage TEXT DEFAULT 'group',
-                    appearances INTEGER DEFAULT 0,
-                    goals INTEGER DEFAULT 0,
-                    assists INTEGER DEFAULT 0,
-                    clean_sheets INTEGER DEFAULT 0,
-                    season TEXT DEFAULT '2027/28',
-                    UNIQUE(user_id, competition, season)
-                )
-            ''')
-        
-        print("✅ Database tables created")
-    
     @staticmethod
     def clamp_value(value: int, min_val: int = 0, max_val: int = 100) -> int:
         """Clamp a value between min and max"""
         return max(min_val, min(max_val, value))
     
     async def get_game_state(self):
-        """Get current game state with retry logic"""
+        """Get current game state with retry logic (process-wide TTL cache, cleared on writes)"""
         async def operation():
             async with self.pool.acquire() as conn:
                 row = await conn.fetchrow("SELECT * FROM game_state WHERE id = 1")
                 return dict(row) if row else None
         
-        return await self._execute_with_retry(operation)
+        return await game_state_cache.get(lambda: self._execute_with_retry(operation))
     
     async def update_game_state(self, **kwargs):
         """Update game state with retry logic"""
@@ -622,10 +123,13 @@ class Database:
                     *values
                 )
         
-        return await self._execute_with_retry(operation)
+        try:
+            return await self._execute_with_retry(operation)
+        finally:
+            game_state_cache.invalidate()
     
     async def get_player(self, user_id: int):
-        """Get player by user ID with retry logic"""
+        """Get player by user ID with retry logic (deduped within a unit of work)"""
         async def operation():
             async with self.pool.acquire() as conn:
                 row = await conn.fetchrow(
@@ -634,10 +138,10 @@ class Database:
                 )
                 return dict(row) if row else None
         
-        return await self._execute_with_retry(operation)
+        return await cached_read(('players', user_id), lambda: self._execute_with_retry(operation))
     
     async def get_team(self, team_id: str):
-        """Get team by team ID with retry logic"""
+        """Get team by team ID with retry logic (deduped within a unit of work)"""
         async def operation():
             async with self.pool.acquire() as conn:
                 row = await conn.fetchrow(
@@ -646,19 +150,14 @@ class Database:
                 )
                 return dict(row) if row else None
         
-        return await self._execute_with_retry(operation)
+        return await cached_read(('teams', team_id), lambda: self._execute_with_retry(operation))
     
     async def get_league_table(self, league: str):
-        """Get league standings with retry logic"""
+        """Get league standings with retry logic (served from the standings cache in position order)"""
+        from utils.standings import standings
+        
         async def operation():
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch(
-                    """SELECT * FROM teams 
-                       WHERE league = $1 
-                       ORDER BY points DESC, (goals_for - goals_against) DESC, goals_for DESC""",
-                    league
-                )
-                return [dict(row) for row in rows]
+            return await standings.get_table(league)
         
         return await self._execute_with_retry(operation)
     
@@ -746,7 +245,8 @@ class Database:
         Args:
             bot: Optional Discord bot instance for sending retirement notifications
         """
-        from data.player_names import get_random_player_name
+        from utils.bulk_seeder import SeedBatch, REGEN_PLAYER_COLUMNS
+        from utils.name_allocator import name_allocator
         
         async with self.pool.acquire() as conn:
             # Retire user players
@@ -794,20 +294,27 @@ class Database:
                 config.RETIREMENT_AGE
             )
             
-            for npc in old_npcs:
-                # Mark as retired
+            teams = {}
+            if old_npcs:
                 await conn.execute(
-                    "UPDATE npc_players SET retired = TRUE, team_id = 'retired' WHERE npc_id = $1",
-                    npc['npc_id']
+                    "UPDATE npc_players SET retired = TRUE, team_id = 'retired' WHERE npc_id = ANY($1::int[])",
+                    [npc['npc_id'] for npc in old_npcs]
                 )
-                
+                teams = {row['team_id']: dict(row) for row in await conn.fetch("SELECT * FROM teams")}
+            
+            # Regens are built in memory (names from the name index) and written with one COPY
+            regens = SeedBatch()
+            regen_names = iter(await name_allocator.allocate(sum(npc['team_id'] in teams for npc in old_npcs)))
+            for npc in old_npcs:
                 # Create regen ONLY if they were on a team
-                if npc['team_id'] and npc['team_id'] not in ['free_agent', 'retired']:
-                    await self.create_regen_player(npc['team_id'], npc['position'], npc['overall_rating'])
+                if npc['team_id'] in teams:
+                    regens.add('npc_players', REGEN_PLAYER_COLUMNS, self.build_regen_player(
+                        teams[npc['team_id']], npc['position'], npc['overall_rating'], next(regen_names)
+                    ))
                 
                 # News for notable retirements (80+ rated)
                 if npc['overall_rating'] >= 80:
-                    team = await self.get_team(npc['team_id'])
+                    team = teams.get(npc['team_id'])
                     team_name = team['team_name'] if team else 'Unknown'
                     await self.add_news(
                         f"Star Retires: {npc['player_name']}",
@@ -818,9 +325,15 @@ class Database:
                         7
                     )
             
+            regens_created = regens.count()
+            await regens.write(conn)
+            
             if old_players or old_npcs:
+                from utils.team_strength import team_strength
+                team_strength.invalidate_all()
+                
                 print(f"✅ Retired {len(old_players)} user + {len(old_npcs)} NPC players")
-                print(f"✅ Created {len(old_npcs)} regen players")
+                print(f"✅ Created {regens_created} regen players")
             
             return len(old_players) + len(old_npcs)
     
@@ -868,15 +381,11 @@ class Database:
             
             print("✅ Cleaned up old retired players and historical data")
     
-    async def create_regen_player(self, team_id: str, position: str, original_rating: int = None):
-        """Create regenerated player to replace retired player"""
-        from data.player_names import get_random_player_name
-        
-        team = await self.get_team(team_id)
-        if not team:
-            return
-        
-        name = get_random_player_name()
+    def build_regen_player(self, team: dict, position: str, original_rating: int = None, name: str = None):
+        """Regenerated player replacing a retired one, as a REGEN_PLAYER_COLUMNS record"""
+        if name is None:
+            from data.player_names import get_random_player_name
+            name = get_random_player_name()
         
         # Regen rating is 70-85% of original player's rating
         if original_rating:
@@ -952,15 +461,9 @@ class Database:
             defending = base_rating
             physical = base_rating
         
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO npc_players 
-                (player_name, team_id, position, age, overall_rating, pace, shooting, passing, dribbling, defending, physical, potential, is_regen)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, TRUE)
-            ''', name, team_id, position, age, base_rating, pace, shooting, passing, dribbling, defending, physical, potential)
-        
-        if team:
-            print(f"  🆕 Regen: {name} ({position}, {base_rating} OVR, {potential} POT) joins {team['team_name']}")
+        print(f"  🆕 Regen: {name} ({position}, {base_rating} OVR, {potential} POT) joins {team['team_name']}")
+        return (name, team['team_id'], position, age, base_rating, pace, shooting, passing, dribbling,
+                defending, physical, potential, True)
     
     async def wipe_all_user_players(self):
         """ADMIN: Delete all user-created players and reset game state"""
@@ -996,11 +499,19 @@ class Database:
                 goals_for = 0, goals_against = 0, points = 0, form = ''
             """)
             
+            from utils.standings import standings
+            await standings.rerank(conn)
+            
             await conn.execute("""
                 UPDATE npc_players SET
                 season_goals = 0, season_assists = 0, season_apps = 0
             """)
         
+        standings.invalidate()
+        
+        from utils.team_strength import team_strength
+        team_strength.invalidate_all()
+        
         print("✅ All user players wiped and game reset to Day 1")
     
     async def close(self):
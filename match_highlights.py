@@ -3,13 +3,13 @@ Post-Match Highlights Generator - DISCORD-OPTIMIZED VERSION
 Creates animated GIF with moving ball for all goals
 ✅ OPTIMIZED: Reduced frames, resized images, compressed GIFs
 ✅ ADAPTIVE: Automatically adjusts quality based on number of highlights
-✅ FIXED: True adaptive compression with retry loop
+✅ FIXED: Preset picked up front by a size probe - one streaming encode
+✅ OFF-LOOP: Frames and GIF encoding run in the render executor
 """
 import discord
-from PIL import Image, ImageDraw, ImageFont
 import io
 from typing import List, Dict, Optional
-from match_visualizer import MatchVisualizer, CoordinateMapper
+from match_visualizer import CoordinateMapper, generate_highlight_reel
 from database import db
 
 
@@ -93,7 +93,7 @@ class MatchHighlightsGenerator:
         """
         Generate ANIMATED highlights from match actions (DISCORD-OPTIMIZED)
         ✅ ADAPTIVE: Automatically adjusts quality based on number of goals
-        ✅ FIXED: Retries with lower quality if file is too large
+        ✅ FIXED: Fallback preset is chosen by a size probe, then encoded once
         
         Args:
             match_id: The match ID
@@ -182,160 +182,64 @@ class MatchHighlightsGenerator:
              'name': 'Minimum'},
         ]
         
-        # ✅ TRY EACH PRESET UNTIL UNDER 7.5MB
-        for attempt_num, preset in enumerate(fallback_presets):
-            if attempt_num > 0:
-                print(f"🔄 Attempt {attempt_num + 1}: Trying {preset.get('name', 'lower')} quality...")
+        # ✅ BUILD CLIP LIST (same selection for every preset)
+        clips = []
+        
+        for i, highlight in enumerate(highlights):
+            # Stop if we've reached max_highlights
+            if len(clips) >= settings['max_highlights']:
+                break
             
-            # Collect ALL animated frames
-            all_frames = []
-            total_actions_added = 0
+            is_home = highlight['team_id'] == match['home_team_id']
             
-            for i, highlight in enumerate(highlights):
-                # Stop if we've reached max_highlights
-                if total_actions_added >= preset['max_highlights']:
-                    break
-                
-                # ✅ Create ANIMATED frames for EACH goal scored by this player
-                if highlight['goals_scored'] > 0:
-                    goals_to_show = min(highlight['goals_scored'], preset['max_highlights'] - total_actions_added)
-                    
-                    for goal_num in range(goals_to_show):
-                        action = 'shoot'
-                        success = True
-                        is_goal = True
-                        
-                        is_home = highlight['team_id'] == match['home_team_id']
-                        
-                        player = {
-                            'player_name': highlight['player_name'],
-                            'position': highlight['position'],
-                            'user_id': highlight['user_id']
-                        }
-                        
-                        # Generate coordinates
-                        start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
-                            action, player['position'], is_home
-                        )
-                        
-                        # ✅ ADAPTIVE: Use dynamic frame count
-                        goal_frames = await MatchVisualizer.create_action_animation(
-                            action=action,
-                            player_name=player['player_name'],
-                            player_position=player['position'],
-                            defender_name=None,
-                            start_pos=(start_x, start_y),
-                            end_pos=(end_x, end_y),
-                            is_home=is_home,
-                            success=success,
-                            is_goal=is_goal,
-                            frames=preset['frames_per_goal']  # ✅ ADAPTIVE
-                        )
-                        
-                        # Add all frames from this goal to the compilation
-                        all_frames.extend(goal_frames)
-                        total_actions_added += 1
-                        
-                        if total_actions_added >= preset['max_highlights']:
-                            break
-                    
-                    continue
-                
-                # Handle assists (if no goals)
-                if highlight['assists'] > 0 and total_actions_added < preset['max_highlights']:
-                    action = 'pass'
-                    success = True
-                    is_goal = False
-                # Handle high-rated moments (if no goals/assists)
-                elif total_actions_added < preset['max_highlights']:
-                    action = ['dribble', 'tackle', 'pass', 'interception'][i % 4]
-                    success = True
-                    is_goal = False
-                else:
-                    continue
-                
-                is_home = highlight['team_id'] == match['home_team_id']
-                
-                player = {
-                    'player_name': highlight['player_name'],
-                    'position': highlight['position'],
-                    'user_id': highlight['user_id']
-                }
+            # ✅ One clip for EACH goal scored by this player
+            if highlight['goals_scored'] > 0:
+                goals_to_show = min(highlight['goals_scored'], settings['max_highlights'] - len(clips))
                 
-                # Generate coordinates
-                start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
-                    action, player['position'], is_home
-                )
+                for goal_num in range(goals_to_show):
+                    start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
+                        'shoot', highlight['position'], is_home
+                    )
+                    clips.append({
+                        'action': 'shoot',
+                        'player_name': highlight['player_name'],
+                        'player_position': highlight['position'],
+                        'defender_name': None,
+                        'start_pos': (start_x, start_y),
+                        'end_pos': (end_x, end_y),
+                        'is_home': is_home,
+                        'success': True,
+                        'is_goal': True
+                    })
                 
-                # ✅ ADAPTIVE: Use dynamic frame count for non-goals
-                action_frames = await MatchVisualizer.create_action_animation(
-                    action=action,
-                    player_name=player['player_name'],
-                    player_position=player['position'],
-                    defender_name=None,
-                    start_pos=(start_x, start_y),
-                    end_pos=(end_x, end_y),
-                    is_home=is_home,
-                    success=success,
-                    is_goal=is_goal,
-                    frames=preset['frames_per_action']  # ✅ ADAPTIVE
-                )
-                
-                all_frames.extend(action_frames)
-                total_actions_added += 1
-            
-            if not all_frames:
-                return None
-            
-            # ✅ ADAPTIVE: Resize frames using calculated factor
-            resized_frames = []
-            for frame in all_frames:
-                new_width = int(frame.width * preset['resize_factor'])
-                new_height = int(frame.height * preset['resize_factor'])
-                resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                resized_frames.append(resized)
+                continue
             
-            if attempt_num == 0:
-                print(f"   Final frame count: {len(resized_frames)}")
-                print(f"   Resolution: {resized_frames[0].width}x{resized_frames[0].height}")
-            
-            # ✅ ADAPTIVE: Create final animated GIF with dynamic settings
-            buffer = io.BytesIO()
-            resized_frames[0].save(
-                buffer,
-                format='GIF',
-                save_all=True,
-                append_images=resized_frames[1:],
-                duration=preset['duration'],  # ✅ ADAPTIVE
-                loop=0,
-                optimize=True,
-                quality=preset['quality']  # ✅ ADAPTIVE
-            )
-            buffer.seek(0)
-            
-            # ✅ CHECK FINAL SIZE
-            buffer.seek(0, 2)
-            final_size_mb = buffer.tell() / (1024 * 1024)
-            buffer.seek(0)
-            
-            if attempt_num == 0:
-                print(f"   ✅ Generated GIF: {final_size_mb:.2f}MB")
+            # Handle assists (if no goals), otherwise high-rated moments
+            if highlight['assists'] > 0:
+                action = 'pass'
             else:
-                print(f"   📊 Size: {final_size_mb:.2f}MB")
+                action = ['dribble', 'tackle', 'pass', 'interception'][i % 4]
             
-            # ✅ SUCCESS - Under 7.5MB!
-            if final_size_mb <= 7.5:
-                if attempt_num > 0:
-                    print(f"   ✅ Success with {preset.get('name', 'reduced')} quality!")
-                return buffer
-            else:
-                if attempt_num == 0:
-                    print(f"   ⚠️ Too large! Retrying with lower quality...")
-                else:
-                    print(f"   ⚠️ Still too large, trying next preset...")
-        
-        # ✅ If all attempts fail, return the smallest one
-        print(f"   ⚠️ Returning smallest version ({final_size_mb:.2f}MB)")
+            start_x, start_y, end_x, end_y = CoordinateMapper.get_action_coordinates(
+                action, highlight['position'], is_home
+            )
+            clips.append({
+                'action': action,
+                'player_name': highlight['player_name'],
+                'player_position': highlight['position'],
+                'defender_name': None,
+                'start_pos': (start_x, start_y),
+                'end_pos': (end_x, end_y),
+                'is_home': is_home,
+                'success': True,
+                'is_goal': False
+            })
+        
+        # ✅ RENDER + ENCODE OFF THE EVENT LOOP (size probe picks the preset under 7.5MB)
+        buffer = await generate_highlight_reel(clips, fallback_presets, max_size_mb=7.5)
+        
+        if buffer:
+            print(f"   ✅ Generated GIF: {len(buffer.getvalue()) / (1024 * 1024):.2f}MB")
         return buffer
     
     @staticmethod
@@ -398,42 +302,23 @@ class MatchHighlightsGenerator:
             action, player['position'], is_home
         )
         
-        # ✅ Use maximum quality for single moment
-        frames = await MatchVisualizer.create_action_animation(
-            action=action,
-            player_name=player['player_name'],
-            player_position=player['position'],
-            defender_name=None,
-            start_pos=(start_x, start_y),
-            end_pos=(end_x, end_y),
-            is_home=is_home,
-            success=True,
-            is_goal=top_moment['goals_scored'] > 0,
-            frames=settings['frames_per_goal']  # ✅ Maximum frames for single highlight
-        )
+        # ✅ Use maximum quality for single moment (rendered off the event loop)
+        clip = {
+            'action': action,
+            'player_name': player['player_name'],
+            'player_position': player['position'],
+            'defender_name': None,
+            'start_pos': (start_x, start_y),
+            'end_pos': (end_x, end_y),
+            'is_home': is_home,
+            'success': True,
+            'is_goal': top_moment['goals_scored'] > 0
+        }
         
-        # ✅ ADAPTIVE: Resize with best quality factor
-        resized_frames = []
-        for frame in frames:
-            new_width = int(frame.width * settings['resize_factor'])
-            new_height = int(frame.height * settings['resize_factor'])
-            resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            resized_frames.append(resized)
-        
-        # ✅ Save with best quality settings
-        buffer = io.BytesIO()
-        resized_frames[0].save(
-            buffer,
-            format='GIF',
-            save_all=True,
-            append_images=resized_frames[1:],
-            duration=settings['duration'],
-            loop=0,
-            optimize=True,
-            quality=settings['quality']
-        )
-        buffer.seek(0)
-        return buffer
+        # ✅ Maximum frames for single highlight, whether goal or not
+        preset = dict(settings, frames_per_action=settings['frames_per_goal'])
+        
+        return await generate_highlight_reel([clip], [preset], max_size_mb=float('inf'))
 
 
 class MatchActionLogger:
@@ -537,87 +422,24 @@ class MatchActionLogger:
              'name': 'Minimum'},
         ]
         
-        # ✅ TRY EACH PRESET
-        for attempt_num, preset in enumerate(fallback_presets):
-            if attempt_num > 0:
-                print(f"🔄 Retry {attempt_num + 1}: {preset.get('name', 'lower')} quality")
-            
-            # Generate animated frames for each action
-            all_frames = []
-            
-            for action_data in selected_actions:
-                # Create animated frames (adaptive)
-                action_frames = await MatchVisualizer.create_action_animation(
-                    action=action_data['action'],
-                    player_name=action_data['player']['player_name'],
-                    player_position=action_data['player']['position'],
-                    defender_name=action_data.get('defender', {}).get('player_name') if action_data.get('defender') else None,
-                    start_pos=action_data['start_pos'],
-                    end_pos=action_data['end_pos'],
-                    is_home=action_data['is_home'],
-                    success=action_data['success'],
-                    is_goal=action_data.get('is_goal', False),
-                    frames=preset['frames_per_goal'] if action_data.get('is_goal', False) else preset['frames_per_action']  # ✅ ADAPTIVE
-                )
-                
-                all_frames.extend(action_frames)
-                
-                # Add separator frame
-                separator = Image.new('RGB', (1408, 768), color='#000000')
-                draw = ImageDraw.Draw(separator)
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 40)
-                except:
-                    font = ImageFont.load_default()
-                
-                text = f"{action_data['minute']}' - {action_data['player']['player_name']}"
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                draw.text(((1408 - text_width) // 2, 350), text, fill='white', font=font)
-                
-                # Hold separator for 2 frames (reduced from 3)
-                for _ in range(2):
-                    all_frames.append(separator.copy())
-            
-            # Create final GIF
-            if not all_frames:
-                return None
-            
-            # ✅ ADAPTIVE: Resize frames using calculated factor
-            resized_frames = []
-            for frame in all_frames:
-                new_width = int(frame.width * preset['resize_factor'])
-                new_height = int(frame.height * preset['resize_factor'])
-                resized = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                resized_frames.append(resized)
-            
-            buffer = io.BytesIO()
-            resized_frames[0].save(
-                buffer,
-                format='GIF',
-                save_all=True,
-                append_images=resized_frames[1:],
-                duration=preset['duration'],  # ✅ ADAPTIVE
-                loop=0,
-                optimize=True,
-                quality=preset['quality']  # ✅ ADAPTIVE
-            )
-            buffer.seek(0)
-            
-            # ✅ Check size
-            buffer.seek(0, 2)
-            size_mb = buffer.tell() / (1024 * 1024)
-            buffer.seek(0)
-            
-            if size_mb <= 7.5:
-                if attempt_num > 0:
-                    print(f"   ✅ Success!")
-                return buffer
-            elif attempt_num < len(fallback_presets) - 1:
-                print(f"   ⚠️ {size_mb:.2f}MB - trying lower quality...")
-        
-        # Return smallest version
-        return buffer
+        clips = []
+        for action_data in selected_actions:
+            clips.append({
+                'action': action_data['action'],
+                'player_name': action_data['player']['player_name'],
+                'player_position': action_data['player']['position'],
+                'defender_name': action_data.get('defender', {}).get('player_name') if action_data.get('defender') else None,
+                'start_pos': action_data['start_pos'],
+                'end_pos': action_data['end_pos'],
+                'is_home': action_data['is_home'],
+                'success': action_data['success'],
+                'is_goal': action_data.get('is_goal', False),
+                # Separator card after each clip
+                'separator': f"{action_data['minute']}' - {action_data['player']['player_name']}"
+            })
+        
+        # ✅ RENDER + ENCODE OFF THE EVENT LOOP (size probe picks the preset under 7.5MB)
+        return await generate_highlight_reel(clips, fallback_presets, max_size_mb=7.5)
 
 
 # Global instance
@@ -658,20 +480,20 @@ async def example_discord_usage(channel):
 
 
 if __name__ == "__main__":
-    print("Match Highlights Generator - ADAPTIVE QUALITY WITH RETRY")
-    print("=========================================================")
+    print("Match Highlights Generator - ADAPTIVE QUALITY WITH SIZE PROBE")
+    print("===============================================================")
     print()
     print("Features:")
     print("  ✅ Animated GIF with moving ball for each goal")
     print("  ✅ ADAPTIVE quality based on number of highlights")
-    print("  ✅ AUTOMATIC RETRY if file is too large")
+    print("  ✅ SIZE PROBE picks the preset - one encode, flat memory")
     print("  ✅ 2 goals: 12 frames/goal, 75% size, 90 quality → ~4MB")
     print("  ✅ 3 goals: 10 frames/goal, 70% size, 88 quality → ~5MB")
     print("  ✅ 4 goals: 9 frames/goal, 65% size, 85 quality → ~6MB")
     print("  ✅ 5 goals: 8 frames/goal, 62% size, 85 quality → ~6.5MB")
     print("  ✅ 6 goals: 7 frames/goal, 58% size, 82 quality → ~7MB")
     print("  ✅ 7+ goals: 6 frames/goal, 55% size, 80 quality → ~7.2MB")
-    print("  ✅ If too large: Automatically reduces quality and retries!")
+    print("  ✅ If too large: a lower-quality preset is picked before encoding!")
     print("  ✅ Always stays under Discord's 8MB limit!")
     print()
     print("Usage:")
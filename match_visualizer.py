@@ -1,6 +1,7 @@
 """
 Match Action Visualizer - WITH POSTGRESQL CACHING
 Loads images from PostgreSQL database for instant access
+Rendering runs in the render executor (separate processes), never on the event loop
 """
 from PIL import Image, ImageDraw, ImageFont
 import io
@@ -8,7 +9,10 @@ import random
 import math
 import asyncpg
 import os
-from typing import Tuple, Optional, Dict, List
+from functools import lru_cache
+from typing import Tuple, Optional, Dict, List, Iterator
+from utils.render_executor import render_executor
+from utils.gif_encoder import StreamingGifWriter, build_shared_palette
 
 
 class CoordinateMapper:
@@ -87,6 +91,50 @@ class CoordinateMapper:
         return (start_x, start_y, end_x, end_y)
 
 
+class LayerCache:
+    """
+    Per-process cache of pre-composited animation layers
+    
+    - stadium converted to RGBA once
+    - cutouts pre-scaled per pixel-size bucket of get_scale_factor, with remove_grass applied
+    
+    Only immutable layers live here; overlay buffers are allocated per render call,
+    so concurrent renders (threads in the in-process fallback) never share one.
+    Rebuilt automatically when the visual assets are reloaded.
+    """
+    
+    def __init__(self):
+        self._assets = None
+        self._stadium = None
+        self._cutouts = {}  # (asset_key, size_px) -> scaled + grass-free cutout
+    
+    def _sync(self):
+        assets = MatchVisualizer._assets_cache
+        if assets is not self._assets:
+            self._assets = assets
+            self._stadium = None
+            self._cutouts.clear()
+        return assets
+    
+    def stadium(self) -> Image.Image:
+        """Stadium background, already RGBA (copy before drawing on it)"""
+        assets = self._sync()
+        if self._stadium is None:
+            self._stadium = assets['stadium'].convert('RGBA')
+        return self._stadium
+    
+    def cutout(self, asset_key: str, scale: float, base_size: int = 100, clean: bool = True) -> Image.Image:
+        """Cutout scaled to int(base_size * scale) pixels (memoized per pixel size)"""
+        assets = self._sync()
+        size = int(base_size * scale)
+        key = (asset_key, size, clean)
+        
+        if key not in self._cutouts:
+            scaled = assets[asset_key].resize((size, size), Image.Resampling.LANCZOS)
+            self._cutouts[key] = MatchVisualizer.remove_grass(scaled) if clean else scaled
+        return self._cutouts[key]
+
+
 class MatchVisualizer:
     """Create match action visualizations with PostgreSQL caching"""
     
@@ -175,6 +223,12 @@ class MatchVisualizer:
         except Exception as e:
             raise Exception(f"Failed to load assets from database. Error: {e}\nDid you run setup_image_cache.py?")
     
+    @staticmethod
+    async def ensure_render_workers():
+        """Load assets and hand them to the render workers (once per session)"""
+        assets = await MatchVisualizer.load_assets()
+        render_executor.set_worker_assets(assets)
+    
     @staticmethod
     def map_coordinates(pitch_x: float, pitch_y: float) -> Tuple[int, int]:
         norm_x = pitch_x / 120.0
@@ -209,6 +263,7 @@ class MatchVisualizer:
         return cleaned
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_font(size: int) -> ImageFont.FreeTypeFont:
         try:
             return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
@@ -270,13 +325,21 @@ class MatchVisualizer:
                           defender_name: Optional[str], start_pos: Tuple[float, float],
                           end_pos: Tuple[float, float], is_home: bool, success: bool, 
                           is_goal: bool = False) -> Image.Image:
-        """Create STATIC action image"""
-        
-        assets = await MatchVisualizer.load_assets()
-        stadium = assets['stadium']
+        """Create STATIC action image (rendered in the render executor)"""
+        await MatchVisualizer.ensure_render_workers()
+        return await render_executor.run(
+            MatchVisualizer.render_action_image, action, player_name, player_position,
+            defender_name, start_pos, end_pos, is_home, success, is_goal
+        )
+    
+    @staticmethod
+    def render_action_image(action: str, player_name: str, player_position: str,
+                            defender_name: Optional[str], start_pos: Tuple[float, float],
+                            end_pos: Tuple[float, float], is_home: bool, success: bool, 
+                            is_goal: bool = False) -> Image.Image:
+        """Render STATIC action image (sync - runs inside a render worker)"""
         
-        overlay = Image.new('RGBA', stadium.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay, 'RGBA')
+        stadium = _layers.stadium()
         
         sx, sy = MatchVisualizer.map_coordinates(*start_pos)
         ex, ey = MatchVisualizer.map_coordinates(*end_pos)
@@ -284,6 +347,9 @@ class MatchVisualizer:
         start_scale = MatchVisualizer.get_scale_factor(start_pos[1])
         end_scale = MatchVisualizer.get_scale_factor(end_pos[1])
         
+        overlay = Image.new('RGBA', stadium.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay, 'RGBA')
+        
         if is_goal:
             action_color = MatchVisualizer.GOAL_GOLD
         else:
@@ -300,20 +366,18 @@ class MatchVisualizer:
         elif action in ['tackle', 'interception', 'block', 'save', 'claim_cross']:
             MatchVisualizer.draw_glow(draw, sx, sy, action_color, size=18)
         
-        stadium = stadium.convert('RGBA')
         stadium = Image.alpha_composite(stadium, overlay)
         
         # Add player
         is_goalie = action in ['save', 'claim_cross'] or player_position == 'GK'
         
         if is_goalie:
-            player_cutout = assets['goalie_home'] if is_home else assets['goalie_away']
+            player_key = 'goalie_home' if is_home else 'goalie_away'
         else:
-            player_cutout = assets['player_home'] if is_home else assets['player_away']
+            player_key = 'player_home' if is_home else 'player_away'
         
-        player_size = int(100 * start_scale)
-        player_scaled = player_cutout.resize((player_size, player_size), Image.Resampling.LANCZOS)
-        player_clean = MatchVisualizer.remove_grass(player_scaled)
+        player_clean = _layers.cutout(player_key, start_scale)
+        player_size = player_clean.width
         
         player_x = sx - player_size // 2
         player_y = sy - player_size
@@ -323,19 +387,17 @@ class MatchVisualizer:
         if defender_name and action not in ['save', 'claim_cross']:
             dx, dy = (sx + ex) // 2, (sy + ey) // 2
             mid_scale = (start_scale + end_scale) / 2
-            defender_size = int(100 * mid_scale)
             
-            defender_cutout = assets['defender_away'] if is_home else assets['defender_home']
-            defender_scaled = defender_cutout.resize((defender_size, defender_size), Image.Resampling.LANCZOS)
-            defender_clean = MatchVisualizer.remove_grass(defender_scaled)
+            defender_clean = _layers.cutout('defender_away' if is_home else 'defender_home', mid_scale)
+            defender_size = defender_clean.width
             
             defender_x = dx - defender_size // 2
             defender_y = dy - defender_size
             stadium.paste(defender_clean, (defender_x, defender_y), defender_clean)
         
         # Add ball
-        ball_size = int(35 * end_scale)
-        ball_scaled = assets['ball'].resize((ball_size, ball_size), Image.Resampling.LANCZOS)
+        ball_scaled = _layers.cutout('ball', end_scale, base_size=35, clean=False)
+        ball_size = ball_scaled.width
         
         ball_x = ex - ball_size // 2
         ball_y = ey - ball_size // 2
@@ -376,10 +438,32 @@ class MatchVisualizer:
                                defender_name: Optional[str], start_pos: Tuple[float, float],
                                end_pos: Tuple[float, float], is_home: bool, success: bool, 
                                is_goal: bool = False, frames: int = 15) -> List[Image.Image]:
-        """Create ANIMATED action frames"""
+        """Create ANIMATED action frames (rendered in the render executor)"""
+        await MatchVisualizer.ensure_render_workers()
+        return await render_executor.run(
+            MatchVisualizer.render_action_animation, action, player_name, player_position,
+            defender_name, start_pos, end_pos, is_home, success, is_goal, frames
+        )
+    
+    @staticmethod
+    def render_action_animation(action: str, player_name: str, player_position: str,
+                                defender_name: Optional[str], start_pos: Tuple[float, float],
+                                end_pos: Tuple[float, float], is_home: bool, success: bool, 
+                                is_goal: bool = False, frames: int = 15) -> List[Image.Image]:
+        """Render ANIMATED action frames (sync - runs inside a render worker)"""
+        return list(MatchVisualizer.iter_action_animation(
+            action, player_name, player_position, defender_name,
+            start_pos, end_pos, is_home, success, is_goal, frames
+        ))
+    
+    @staticmethod
+    def iter_action_animation(action: str, player_name: str, player_position: str,
+                              defender_name: Optional[str], start_pos: Tuple[float, float],
+                              end_pos: Tuple[float, float], is_home: bool, success: bool, 
+                              is_goal: bool = False, frames: int = 15) -> Iterator[Image.Image]:
+        """Yield ANIMATED action frames one at a time (streaming encoders hold one frame)"""
         
-        assets = await MatchVisualizer.load_assets()
-        stadium = assets['stadium']
+        stadium = _layers.stadium()
         
         sx, sy = MatchVisualizer.map_coordinates(*start_pos)
         ex, ey = MatchVisualizer.map_coordinates(*end_pos)
@@ -395,15 +479,36 @@ class MatchVisualizer:
         is_goalie = action in ['save', 'claim_cross'] or player_position == 'GK'
         
         if is_goalie:
-            player_cutout = assets['goalie_home'] if is_home else assets['goalie_away']
+            player_key = 'goalie_home' if is_home else 'goalie_away'
         else:
-            player_cutout = assets['player_home'] if is_home else assets['player_away']
+            player_key = 'player_home' if is_home else 'player_away'
+        
+        # Layers that are identical in every frame of the clip
+        player_clean = _layers.cutout(player_key, start_scale)
+        player_pos = (sx - player_clean.width // 2, sy - player_clean.height)
         
-        animation_frames = []
+        defender_clean = None
+        if defender_name and action not in ['save', 'claim_cross']:
+            dx, dy = (sx + ex) // 2, (sy + ey) // 2
+            mid_scale = (start_scale + end_scale) / 2
+            defender_clean = _layers.cutout('defender_away' if is_home else 'defender_home', mid_scale)
+            defender_pos = (dx - defender_clean.width // 2, dy - defender_clean.height)
+        
+        # Region the trail/glow can touch (curve bulge 25px, glow radius 30px)
+        margin = 40
+        trail_box = (
+            max(0, min(sx, ex) - margin),
+            max(0, min(sy, ey) - margin),
+            min(stadium.width, max(sx, ex) + margin),
+            min(stadium.height, max(sy, ey) + margin + 25)
+        )
+        
+        # One overlay per clip; each frame only clears the region it draws into
+        overlay = Image.new('RGBA', stadium.size, (0, 0, 0, 0))
         
         for frame_num in range(frames):
-            img = stadium.copy().convert('RGBA')
-            overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
+            img = stadium.copy()
+            overlay.paste((0, 0, 0, 0), trail_box)
             draw = ImageDraw.Draw(overlay, 'RGBA')
             
             progress = frame_num / (frames - 1)
@@ -439,37 +544,19 @@ class MatchVisualizer:
                     draw.ellipse([ex-r, ey-r, ex+r, ey+r],
                                 fill=f'{action_color}{glow_intensity:02x}')
             
-            img = Image.alpha_composite(img, overlay)
+            img.alpha_composite(overlay, dest=trail_box[:2], source=trail_box)
             
-            # Add player
-            player_size = int(100 * start_scale)
-            player_scaled = player_cutout.resize((player_size, player_size), Image.Resampling.LANCZOS)
-            player_clean = MatchVisualizer.remove_grass(player_scaled)
-            
-            player_x = sx - player_size // 2
-            player_y = sy - player_size
-            img.paste(player_clean, (player_x, player_y), player_clean)
-            
-            # Add defender
-            if defender_name and action not in ['save', 'claim_cross']:
-                dx, dy = (sx + ex) // 2, (sy + ey) // 2
-                mid_scale = (start_scale + end_scale) / 2
-                defender_size = int(100 * mid_scale)
-                
-                defender_cutout = assets['defender_away'] if is_home else assets['defender_home']
-                defender_scaled = defender_cutout.resize((defender_size, defender_size), Image.Resampling.LANCZOS)
-                defender_clean = MatchVisualizer.remove_grass(defender_scaled)
-                
-                defender_x = dx - defender_size // 2
-                defender_y = dy - defender_size
-                img.paste(defender_clean, (defender_x, defender_y), defender_clean)
+            # Add player + defender (pre-scaled, grass already removed)
+            img.paste(player_clean, player_pos, player_clean)
+            if defender_clean is not None:
+                img.paste(defender_clean, defender_pos, defender_clean)
             
             # Add ball
             current_pitch_y = start_pos[1] + (end_pos[1] - start_pos[1]) * progress
             ball_scale = MatchVisualizer.get_scale_factor(current_pitch_y)
             pulse = 1.0 + 0.15 * math.sin(progress * math.pi)
-            ball_size = int(35 * ball_scale * pulse)
-            ball_scaled = assets['ball'].resize((ball_size, ball_size), Image.Resampling.LANCZOS)
+            ball_scaled = _layers.cutout('ball', ball_scale * pulse, base_size=35, clean=False)
+            ball_size = ball_scaled.width
             
             ball_x = int(current_x) - ball_size // 2
             ball_y = int(current_y) - ball_size // 2
@@ -504,16 +591,190 @@ class MatchVisualizer:
                               fill='#000000bb', outline='white', width=3)
                 draw.text((result_x + 35, img.height - 62), result_text, fill=action_color, font=font_large)
             
-            animation_frames.append(img)
+            yield img
+
+
+# Per-process layer cache (each render worker builds its own)
+_layers = LayerCache()
+
+
+def render_action_visualization(action: str, player_name: str, player_position: str,
+                                defender_name: Optional[str], start_pos: Tuple[float, float],
+                                end_pos: Tuple[float, float], is_home: bool, success: bool,
+                                is_goal: bool = False, animated: bool = False) -> bytes:
+    """Render job: one action as PNG bytes (or GIF bytes if animated)"""
+    buffer = io.BytesIO()
+    
+    if animated:
+        frames = MatchVisualizer.render_action_animation(
+            action, player_name, player_position, defender_name,
+            start_pos, end_pos, is_home, success, is_goal, frames=15
+        )
+        frames[0].save(
+            buffer,
+            format='GIF',
+            save_all=True,
+            append_images=frames[1:],
+            duration=70,
+            loop=0
+        )
+    else:
+        img = MatchVisualizer.render_action_image(
+            action, player_name, player_position, defender_name,
+            start_pos, end_pos, is_home, success, is_goal
+        )
+        img.save(buffer, format='PNG')
+    
+    return buffer.getvalue()
+
+
+def render_separator_frame(text: str, size: Tuple[int, int] = (1408, 768)) -> Image.Image:
+    """Black title card shown between highlight clips"""
+    separator = Image.new('RGB', size, color='#000000')
+    draw = ImageDraw.Draw(separator)
+    font = MatchVisualizer.get_font(40)
+    
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    draw.text(((size[0] - text_width) // 2, 350), text, fill='white', font=font)
+    return separator
+
+
+REEL_PROBE_FACTOR = 0.25       # Probe resolution relative to full frames
+REEL_SIZE_SAFETY_MARGIN = 1.15  # Headroom on the predicted reel size
+
+
+def _clip_frame_count(clip: Dict, preset: Dict) -> int:
+    return preset['frames_per_goal'] if clip.get('is_goal') else preset['frames_per_action']
+
+
+def _iter_reel_frames(clips: List[Dict], preset: Dict) -> Iterator[Image.Image]:
+    """Yield every frame of the reel in order (clip frames, then its separator card)"""
+    for clip in clips:
+        yield from MatchVisualizer.iter_action_animation(
+            clip['action'], clip['player_name'], clip['player_position'], clip.get('defender_name'),
+            clip['start_pos'], clip['end_pos'], clip['is_home'], clip['success'], clip.get('is_goal', False),
+            frames=_clip_frame_count(clip, preset)
+        )
+        
+        if clip.get('separator'):
+            separator = render_separator_frame(clip['separator'])
+            yield separator
+            yield separator
+
+
+def _probe_reel(clips: List[Dict], presets: List[Dict], full_size: Tuple[int, int], max_bytes: float):
+    """
+    Cheap low-resolution probe: render the first clip, encode it at REEL_PROBE_FACTOR
+    with a shared palette, and scale the bytes-per-frame rate to each preset
+    
+    Returns:
+        (preset index, shared palette, predicted bytes for that preset)
+    """
+    probe_size = (int(full_size[0] * REEL_PROBE_FACTOR), int(full_size[1] * REEL_PROBE_FACTOR))
+    probe_frames = [
+        frame.resize(probe_size, Image.Resampling.LANCZOS)
+        for frame in _iter_reel_frames(clips[:1], presets[0])
+    ]
+    
+    # Palette sample: a few probe frames plus the last frame of every other clip
+    # (other cutouts, colours and result labels) and a separator card
+    samples = probe_frames[::max(1, len(probe_frames) // 4)]
+    for clip in clips[1:]:
+        last_frame = list(_iter_reel_frames([dict(clip, separator=None)], presets[-1]))[-1]
+        samples.append(last_frame.resize(probe_size, Image.Resampling.LANCZOS))
+    separators = [clip['separator'] for clip in clips if clip.get('separator')]
+    if separators:
+        samples.append(render_separator_frame(separators[0]).resize(probe_size, Image.Resampling.LANCZOS))
+    palette = build_shared_palette(samples)
+    
+    probe_buffer = io.BytesIO()
+    writer = StreamingGifWriter(probe_buffer, probe_size, palette, duration=presets[0]['duration'])
+    header_bytes = writer.bytes_written
+    for frame in probe_frames:
+        writer.add_frame(frame)
+    writer.close()
+    
+    bytes_per_frame = (writer.bytes_written - header_bytes) / len(probe_frames)
+    probe_area = probe_size[0] * probe_size[1]
+    
+    predicted = 0
+    for index, preset in enumerate(presets):
+        width = int(full_size[0] * preset['resize_factor'])
+        height = int(full_size[1] * preset['resize_factor'])
+        total_frames = sum(
+            _clip_frame_count(clip, preset) + (2 if clip.get('separator') else 0) for clip in clips
+        )
+        predicted = header_bytes + bytes_per_frame * total_frames * (width * height / probe_area)
+        predicted *= REEL_SIZE_SAFETY_MARGIN
         
-        return animation_frames
+        if predicted <= max_bytes:
+            return index, palette, predicted
+    
+    return len(presets) - 1, palette, predicted
+
+
+def render_highlight_reel(clips: List[Dict], presets: List[Dict], max_size_mb: float = 7.5) -> Tuple[bytes, int]:
+    """
+    Render job: animate every clip and stream one GIF reel
+    
+    The preset is picked up front from a low-resolution probe, so the reel is
+    normally encoded once; if it still exceeds max_size_mb it is re-encoded at the
+    next lower preset. Frames are written as they are rendered, so memory stays
+    flat however many goals were scored.
+    
+    Args:
+        clips: dicts with action, player_name, player_position, defender_name, start_pos,
+               end_pos, is_home, success, is_goal and optional separator (title card text)
+        presets: quality presets in order of preference (frames_per_goal, frames_per_action,
+                 resize_factor, duration); the first one predicted under max_size_mb wins
+    
+    Returns:
+        (GIF bytes, index of the preset used)
+    """
+    if not clips:
+        return b'', 0
+    
+    full_size = _layers.stadium().size
+    max_bytes = max_size_mb * 1024 * 1024
+    
+    preset_index, palette, predicted = _probe_reel(clips, presets, full_size, max_bytes)
+    
+    # The probe normally gets it right first time; if the reel still comes out over
+    # the cap, re-encode at the next lower preset (the last preset is returned regardless)
+    while True:
+        preset = presets[preset_index]
+        size = (int(full_size[0] * preset['resize_factor']), int(full_size[1] * preset['resize_factor']))
+        buffer = io.BytesIO()
+        writer = StreamingGifWriter(buffer, size, palette, duration=preset['duration'])
+        
+        for frame in _iter_reel_frames(clips, preset):
+            writer.add_frame(frame.resize(size, Image.Resampling.LANCZOS))
+        writer.close()
+        
+        size_mb = writer.bytes_written / (1024 * 1024)
+        estimate = f" (predicted {predicted / (1024 * 1024):.2f}MB)" if predicted is not None else ""
+        print(f"   📊 Reel preset {preset.get('name', preset_index + 1)}: {writer.frames_written} frames, "
+              f"{size_mb:.2f}MB{estimate}")
+        
+        if size_mb <= max_size_mb:
+            break
+        if preset_index == len(presets) - 1:
+            print(f"   ⚠️ Returning smallest version ({size_mb:.2f}MB)")
+            break
+        
+        print(f"   ⚠️ {size_mb:.2f}MB - trying lower quality...")
+        preset_index += 1
+        predicted = None
+    
+    return buffer.getvalue(), preset_index
 
 
 async def generate_action_visualization(action: str, player: Dict, defender: Optional[Dict],
                                  is_home: bool, success: bool, is_goal: bool = False,
                                  animated: bool = False) -> io.BytesIO:
     """
-    Generate action visualization (async version for database)
+    Generate action visualization (rendered in the render executor)
     
     Args:
         action: Action type
@@ -533,45 +794,22 @@ async def generate_action_visualization(action: str, player: Dict, defender: Opt
     
     defender_name = defender['player_name'] if defender else None
     
-    if animated:
-        frames = await MatchVisualizer.create_action_animation(
-            action=action,
-            player_name=player['player_name'],
-            player_position=player['position'],
-            defender_name=defender_name,
-            start_pos=(start_x, start_y),
-            end_pos=(end_x, end_y),
-            is_home=is_home,
-            success=success,
-            is_goal=is_goal,
-            frames=15
-        )
-        
-        buffer = io.BytesIO()
-        frames[0].save(
-            buffer,
-            format='GIF',
-            save_all=True,
-            append_images=frames[1:],
-            duration=70,
-            loop=0
-        )
-        buffer.seek(0)
-        return buffer
-    else:
-        img = await MatchVisualizer.create_action_image(
-            action=action,
-            player_name=player['player_name'],
-            player_position=player['position'],
-            defender_name=defender_name,
-            start_pos=(start_x, start_y),
-            end_pos=(end_x, end_y),
-            is_home=is_home,
-            success=success,
-            is_goal=is_goal
-        )
-        
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
-        return buffer
+    await MatchVisualizer.ensure_render_workers()
+    data = await render_executor.run(
+        render_action_visualization,
+        action, player['player_name'], player['position'], defender_name,
+        (start_x, start_y), (end_x, end_y), is_home, success, is_goal, animated
+    )
+    
+    return io.BytesIO(data)
+
+
+async def generate_highlight_reel(clips: List[Dict], presets: List[Dict], max_size_mb: float = 7.5) -> Optional[io.BytesIO]:
+    """Render and encode a highlight reel in the render executor (see render_highlight_reel)"""
+    if not clips:
+        return None
+    
+    await MatchVisualizer.ensure_render_workers()
+    data, _ = await render_executor.run(render_highlight_reel, clips, presets, max_size_mb)
+    
+    return io.BytesIO(data) if data else None
@@ -1,75 +1,49 @@
 """
-Database Migration Script - Run this once to add transfer window tables
+Database Migration Script - applies pending migrations/*.sql files
+The bot runs the same migrations on startup; use this to migrate or check status by hand
+
+    python migrate.py           # apply pending migrations
+    python migrate.py --status  # list applied / pending migrations
 """
 import asyncio
 import asyncpg
 import config
 import sys
 
-async def run_migration():
+from utils.migration_runner import migration_runner, MigrationError
+
+
+async def run_migration(status_only=False):
+    pool = None
     try:
         print("Connecting to database...")
-        conn = await asyncpg.connect(config.DATABASE_URL)
-        
-        print("Running migration...")
-        
-        # Add columns to players table
-        await conn.execute("""
-            ALTER TABLE players ADD COLUMN IF NOT EXISTS last_transfer_window INTEGER;
-        """)
-        print("✅ Added last_transfer_window column")
-        
-        await conn.execute("""
-            ALTER TABLE players ADD COLUMN IF NOT EXISTS transfers_this_season INTEGER DEFAULT 0;
-        """)
-        print("✅ Added transfers_this_season column")
-        
-        # Create transfer_offers table
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS transfer_offers (
-                offer_id SERIAL PRIMARY KEY,
-                user_id BIGINT NOT NULL,
-                team_id TEXT NOT NULL,
-                wage_offer INTEGER NOT NULL,
-                contract_length INTEGER NOT NULL,
-                offer_week INTEGER NOT NULL,
-                expires_week INTEGER NOT NULL,
-                offer_type TEXT DEFAULT 'standard',
-                previous_offer_id INTEGER,
-                performance_bonus INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("✅ Created transfer_offers table")
-        
-        # Create indexes
-        await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_transfer_offers_user_status 
-            ON transfer_offers(user_id, status);
-        """)
-        print("✅ Created index on user_id and status")
-        
-        await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_transfer_offers_week 
-            ON transfer_offers(offer_week);
-        """)
-        print("✅ Created index on offer_week")
-        
-        # Add column to game_state
-        await conn.execute("""
-            ALTER TABLE game_state ADD COLUMN IF NOT EXISTS transfer_window_active BOOLEAN DEFAULT FALSE;
-        """)
-        print("✅ Added transfer_window_active column")
-        
-        await conn.close()
-        print("\n🎉 Migration completed successfully!")
+        pool = await asyncpg.create_pool(config.DATABASE_URL, min_size=1, max_size=1)
+
+        if status_only:
+            for migration, applied in await migration_runner.status(pool):
+                print(f"{'✅' if applied else '⏳'} {migration.version:04d}_{migration.name}")
+            return True
+
+        applied = await migration_runner.run(pool)
+        if applied:
+            for name in applied:
+                print(f"✅ Applied {name}")
+            print("\n🎉 Migration completed successfully!")
+        else:
+            print("✅ Schema already up to date")
         return True
-        
+
+    except MigrationError as e:
+        print(f"\n❌ Migration error: {e}")
+        return False
     except Exception as e:
         print(f"\n❌ Migration failed: {e}")
         return False
+    finally:
+        if pool is not None:
+            await pool.close()
+
 
 if __name__ == "__main__":
-    result = asyncio.run(run_migration())
+    result = asyncio.run(run_migration(status_only='--status' in sys.argv))
     sys.exit(0 if result else 1)
@@ -0,0 +1,352 @@
+-- ============================================
+-- BASE SCHEMA
+-- ============================================
+-- Core game, match, transfer and European competition tables
+
+-- Game state table
+CREATE TABLE IF NOT EXISTS game_state (
+    id INTEGER PRIMARY KEY,
+    season_started BOOLEAN DEFAULT FALSE,
+    current_season TEXT DEFAULT '2027/28',
+    current_week INTEGER DEFAULT 0,
+    current_year INTEGER DEFAULT 2027,
+    season_start_date TEXT,
+    last_match_day TEXT,
+    next_match_day TEXT,
+    match_window_open BOOLEAN DEFAULT FALSE,
+    match_window_closes TEXT,
+    fixtures_generated BOOLEAN DEFAULT FALSE,
+    CONSTRAINT game_state_check CHECK (id = 1)
+);
+
+INSERT INTO game_state (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+
+-- Players table
+CREATE TABLE IF NOT EXISTS players (
+    user_id BIGINT PRIMARY KEY,
+    discord_username TEXT,
+    player_name TEXT NOT NULL,
+    position TEXT NOT NULL,
+    age INTEGER DEFAULT 18,
+    overall_rating INTEGER DEFAULT 60,
+    pace INTEGER DEFAULT 60,
+    shooting INTEGER DEFAULT 60,
+    passing INTEGER DEFAULT 60,
+    dribbling INTEGER DEFAULT 60,
+    defending INTEGER DEFAULT 40,
+    physical INTEGER DEFAULT 60,
+    potential INTEGER DEFAULT 75,
+    team_id TEXT DEFAULT 'free_agent',
+    league TEXT DEFAULT NULL,
+    contract_wage INTEGER DEFAULT 5000,
+    contract_years INTEGER DEFAULT 0,
+    form INTEGER DEFAULT 50,
+    morale INTEGER DEFAULT 75,
+    training_streak INTEGER DEFAULT 0,
+    last_training TEXT,
+    season_goals INTEGER DEFAULT 0,
+    season_assists INTEGER DEFAULT 0,
+    season_apps INTEGER DEFAULT 0,
+    season_rating REAL DEFAULT 0.0,
+    season_motm INTEGER DEFAULT 0,
+    career_goals INTEGER DEFAULT 0,
+    career_assists INTEGER DEFAULT 0,
+    career_apps INTEGER DEFAULT 0,
+    career_motm INTEGER DEFAULT 0,
+    injury_weeks INTEGER DEFAULT 0,
+    injury_type TEXT,
+    retired BOOLEAN DEFAULT FALSE,
+    retirement_date TEXT,
+    joined_week INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Teams table
+CREATE TABLE IF NOT EXISTS teams (
+    team_id TEXT PRIMARY KEY,
+    team_name TEXT NOT NULL,
+    league TEXT NOT NULL,
+    position INTEGER DEFAULT 10,
+    played INTEGER DEFAULT 0,
+    won INTEGER DEFAULT 0,
+    drawn INTEGER DEFAULT 0,
+    lost INTEGER DEFAULT 0,
+    goals_for INTEGER DEFAULT 0,
+    goals_against INTEGER DEFAULT 0,
+    points INTEGER DEFAULT 0,
+    budget INTEGER DEFAULT 50000000,
+    wage_budget INTEGER DEFAULT 100000,
+    form TEXT DEFAULT ''
+);
+
+-- NPC Players table
+CREATE TABLE IF NOT EXISTS npc_players (
+    npc_id SERIAL PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    team_id TEXT,
+    position TEXT NOT NULL,
+    age INTEGER DEFAULT 25,
+    overall_rating INTEGER DEFAULT 75,
+    pace INTEGER DEFAULT 70,
+    shooting INTEGER DEFAULT 70,
+    passing INTEGER DEFAULT 70,
+    dribbling INTEGER DEFAULT 70,
+    defending INTEGER DEFAULT 50,
+    physical INTEGER DEFAULT 70,
+    season_goals INTEGER DEFAULT 0,
+    season_assists INTEGER DEFAULT 0,
+    season_apps INTEGER DEFAULT 0,
+    market_value INTEGER DEFAULT 10000000,
+    retired BOOLEAN DEFAULT FALSE,
+    is_regen BOOLEAN DEFAULT FALSE,
+    potential INTEGER DEFAULT 75
+);
+
+-- Fixtures table
+CREATE TABLE IF NOT EXISTS fixtures (
+    fixture_id SERIAL PRIMARY KEY,
+    home_team_id TEXT,
+    away_team_id TEXT,
+    competition TEXT DEFAULT 'Premier League',
+    league TEXT NOT NULL,
+    week_number INTEGER,
+    season TEXT DEFAULT '2027/28',
+    home_score INTEGER,
+    away_score INTEGER,
+    played BOOLEAN DEFAULT FALSE,
+    playable BOOLEAN DEFAULT FALSE,
+    match_date TEXT
+);
+
+-- Match events table
+CREATE TABLE IF NOT EXISTS match_events (
+    event_id SERIAL PRIMARY KEY,
+    fixture_id INTEGER,
+    user_id BIGINT,
+    npc_id INTEGER,
+    event_type TEXT,
+    minute INTEGER,
+    description TEXT,
+    dice_roll INTEGER,
+    stat_modifier INTEGER,
+    total_roll INTEGER,
+    difficulty_class INTEGER,
+    success BOOLEAN,
+    rating_impact REAL DEFAULT 0.0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Active matches table
+CREATE TABLE IF NOT EXISTS active_matches (
+    match_id SERIAL PRIMARY KEY,
+    fixture_id INTEGER UNIQUE,
+    home_team_id TEXT,
+    away_team_id TEXT,
+    home_score INTEGER DEFAULT 0,
+    away_score INTEGER DEFAULT 0,
+    current_minute INTEGER DEFAULT 0,
+    events_completed INTEGER DEFAULT 0,
+    match_state TEXT DEFAULT 'waiting',
+    channel_id BIGINT,
+    message_id BIGINT,
+    last_event_time TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Match participants table
+CREATE TABLE IF NOT EXISTS match_participants (
+    participant_id SERIAL PRIMARY KEY,
+    match_id INTEGER,
+    user_id BIGINT,
+    team_id TEXT,
+    match_rating REAL DEFAULT 5.0,
+    actions_taken INTEGER DEFAULT 0,
+    goals_scored INTEGER DEFAULT 0,
+    assists INTEGER DEFAULT 0,
+    joined BOOLEAN DEFAULT FALSE
+);
+
+-- Training history
+CREATE TABLE IF NOT EXISTS training_history (
+    training_id SERIAL PRIMARY KEY,
+    user_id BIGINT,
+    training_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    stat_gains TEXT,
+    streak_bonus BOOLEAN DEFAULT FALSE,
+    overall_before INTEGER,
+    overall_after INTEGER
+);
+
+-- Transfers table
+CREATE TABLE IF NOT EXISTS transfers (
+    transfer_id SERIAL PRIMARY KEY,
+    user_id BIGINT,
+    npc_id INTEGER,
+    from_team TEXT,
+    to_team TEXT,
+    fee INTEGER,
+    wage INTEGER,
+    contract_length INTEGER,
+    season TEXT DEFAULT '2027/28',
+    transfer_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    transfer_type TEXT DEFAULT 'permanent'
+);
+
+-- News table
+CREATE TABLE IF NOT EXISTS news (
+    news_id SERIAL PRIMARY KEY,
+    headline TEXT NOT NULL,
+    content TEXT,
+    category TEXT,
+    user_id BIGINT,
+    importance INTEGER DEFAULT 5,
+    week_number INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Notifications table
+CREATE TABLE IF NOT EXISTS notifications (
+    notif_id SERIAL PRIMARY KEY,
+    user_id BIGINT,
+    message TEXT NOT NULL,
+    notif_type TEXT,
+    read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Player Traits table
+CREATE TABLE IF NOT EXISTS player_traits (
+    id SERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    trait_id TEXT NOT NULL,
+    unlocked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, trait_id)
+);
+
+-- Achievements table
+CREATE TABLE IF NOT EXISTS achievements (
+    achievement_id TEXT PRIMARY KEY,
+    achievement_name TEXT NOT NULL,
+    description TEXT,
+    icon TEXT,
+    category TEXT,
+    rarity TEXT DEFAULT 'common'
+);
+
+-- Player achievements table
+CREATE TABLE IF NOT EXISTS player_achievements (
+    id SERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    achievement_id TEXT NOT NULL,
+    unlocked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    progress INTEGER DEFAULT 0,
+    UNIQUE(user_id, achievement_id)
+);
+
+-- Settings table
+CREATE TABLE IF NOT EXISTS user_settings (
+    user_id BIGINT PRIMARY KEY,
+    notify_matches BOOLEAN DEFAULT TRUE,
+    notify_training BOOLEAN DEFAULT TRUE,
+    notify_transfers BOOLEAN DEFAULT TRUE,
+    notify_news BOOLEAN DEFAULT TRUE
+);
+
+-- European Teams
+CREATE TABLE IF NOT EXISTS european_teams (
+    team_id TEXT PRIMARY KEY,
+    team_name TEXT NOT NULL,
+    country TEXT NOT NULL,
+    league TEXT NOT NULL,
+    reputation INTEGER DEFAULT 75
+);
+
+-- European NPC Players
+CREATE TABLE IF NOT EXISTS european_npc_players (
+    npc_id SERIAL PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    team_id TEXT REFERENCES european_teams(team_id),
+    position TEXT NOT NULL,
+    overall_rating INTEGER NOT NULL,
+    age INTEGER NOT NULL,
+    nationality TEXT,
+    pace INTEGER DEFAULT 70,
+    shooting INTEGER DEFAULT 70,
+    passing INTEGER DEFAULT 70,
+    dribbling INTEGER DEFAULT 70,
+    defending INTEGER DEFAULT 70,
+    physical INTEGER DEFAULT 70,
+    value INTEGER DEFAULT 1000000,
+    wage INTEGER DEFAULT 50000,
+    retired BOOLEAN DEFAULT FALSE
+);
+
+-- European Fixtures
+CREATE TABLE IF NOT EXISTS european_fixtures (
+    fixture_id SERIAL PRIMARY KEY,
+    competition TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    group_name TEXT,
+    home_team_id TEXT NOT NULL,
+    away_team_id TEXT NOT NULL,
+    week_number INTEGER NOT NULL,
+    match_day INTEGER NOT NULL,
+    home_score INTEGER,
+    away_score INTEGER,
+    played BOOLEAN DEFAULT FALSE,
+    playable BOOLEAN DEFAULT FALSE,
+    season TEXT DEFAULT '2027/28',
+    leg INTEGER DEFAULT 1,
+    tie_id INTEGER
+);
+
+-- European Groups
+CREATE TABLE IF NOT EXISTS european_groups (
+    id SERIAL PRIMARY KEY,
+    competition TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    played INTEGER DEFAULT 0,
+    won INTEGER DEFAULT 0,
+    drawn INTEGER DEFAULT 0,
+    lost INTEGER DEFAULT 0,
+    goals_for INTEGER DEFAULT 0,
+    goals_against INTEGER DEFAULT 0,
+    points INTEGER DEFAULT 0,
+    season TEXT DEFAULT '2027/28'
+);
+
+-- Knockout Ties
+CREATE TABLE IF NOT EXISTS european_knockout (
+    tie_id SERIAL PRIMARY KEY,
+    competition TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    home_team_id TEXT NOT NULL,
+    away_team_id TEXT NOT NULL,
+    first_leg_home_score INTEGER DEFAULT 0,
+    first_leg_away_score INTEGER DEFAULT 0,
+    second_leg_home_score INTEGER DEFAULT 0,
+    second_leg_away_score INTEGER DEFAULT 0,
+    aggregate_home INTEGER DEFAULT 0,
+    aggregate_away INTEGER DEFAULT 0,
+    winner_team_id TEXT,
+    first_leg_played BOOLEAN DEFAULT FALSE,
+    second_leg_played BOOLEAN DEFAULT FALSE,
+    penalties_taken BOOLEAN DEFAULT FALSE,
+    penalty_winner TEXT,
+    season TEXT DEFAULT '2027/28'
+);
+
+-- Player European Stats
+CREATE TABLE IF NOT EXISTS player_european_stats (
+    stat_id SERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    competition TEXT NOT NULL,
+    stage TEXT DEFAULT 'group',
+    appearances INTEGER DEFAULT 0,
+    goals INTEGER DEFAULT 0,
+    assists INTEGER DEFAULT 0,
+    clean_sheets INTEGER DEFAULT 0,
+    season TEXT DEFAULT '2027/28',
+    UNIQUE(user_id, competition, season)
+);
@@ -0,0 +1,31 @@
+-- ============================================
+-- TRANSFER WINDOW SYSTEM
+-- ============================================
+
+ALTER TABLE players
+ADD COLUMN IF NOT EXISTS last_transfer_window INTEGER,
+ADD COLUMN IF NOT EXISTS transfers_this_season INTEGER DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS transfer_offers (
+    offer_id SERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    team_id TEXT NOT NULL,
+    wage_offer INTEGER NOT NULL,
+    contract_length INTEGER NOT NULL,
+    offer_week INTEGER NOT NULL,
+    expires_week INTEGER NOT NULL,
+    offer_type TEXT DEFAULT 'standard',
+    previous_offer_id INTEGER,
+    performance_bonus INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_transfer_offers_user_status
+ON transfer_offers(user_id, status);
+
+CREATE INDEX IF NOT EXISTS idx_transfer_offers_week
+ON transfer_offers(offer_week);
+
+ALTER TABLE game_state
+ADD COLUMN IF NOT EXISTS transfer_window_active BOOLEAN DEFAULT FALSE;
@@ -0,0 +1,33 @@
+-- ============================================
+-- MATCH COUNTER, REMINDERS, MOTM, EUROPEAN NPC STATS
+-- ============================================
+
+-- Which match of the week is being played
+ALTER TABLE game_state
+ADD COLUMN IF NOT EXISTS current_match_of_week INTEGER DEFAULT 0;
+
+UPDATE game_state
+SET current_match_of_week = 0
+WHERE current_match_of_week IS NULL;
+
+-- Training reminder tracking
+ALTER TABLE players
+ADD COLUMN IF NOT EXISTS last_reminded TEXT;
+
+-- Season stats for European NPCs
+ALTER TABLE european_npc_players
+ADD COLUMN IF NOT EXISTS season_goals INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS season_assists INTEGER DEFAULT 0;
+
+-- Man of the match counters
+ALTER TABLE players
+ADD COLUMN IF NOT EXISTS season_motm INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS career_motm INTEGER DEFAULT 0;
+
+UPDATE players SET season_motm = 0 WHERE season_motm IS NULL;
+UPDATE players SET career_motm = 0 WHERE career_motm IS NULL;
+
+ALTER TABLE match_participants
+ADD COLUMN IF NOT EXISTS motm BOOLEAN DEFAULT FALSE;
+
+UPDATE match_participants SET motm = FALSE WHERE motm IS NULL;
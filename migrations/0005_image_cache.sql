@@ -0,0 +1,17 @@
+-- ============================================
+-- IMAGE CACHE FOR VISUALIZATIONS AND CRESTS
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS image_cache (
+    image_key VARCHAR(50) PRIMARY KEY,
+    image_data BYTEA NOT NULL,
+    image_format VARCHAR(10) NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    file_size INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_image_cache_last_accessed
+ON image_cache(last_accessed);
@@ -0,0 +1,18 @@
+-- ============================================
+-- PERFORMANCE INDEXES
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_players_team_id ON players(team_id);
+CREATE INDEX IF NOT EXISTS idx_fixtures_week ON fixtures(week_number);
+CREATE INDEX IF NOT EXISTS idx_fixtures_playable ON fixtures(playable, played);
+CREATE INDEX IF NOT EXISTS idx_match_participants_user ON match_participants(user_id);
+CREATE INDEX IF NOT EXISTS idx_match_participants_match ON match_participants(match_id);
+CREATE INDEX IF NOT EXISTS idx_news_user_created ON news(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_training_user_date ON training_history(user_id, training_date DESC);
+CREATE INDEX IF NOT EXISTS idx_players_retired ON players(retired, age);
+CREATE INDEX IF NOT EXISTS idx_npc_players_team ON npc_players(team_id, retired);
+CREATE INDEX IF NOT EXISTS idx_transfer_offers_user ON transfer_offers(user_id, status);
+CREATE INDEX IF NOT EXISTS idx_match_events_fixture ON match_events(fixture_id, minute);
+CREATE INDEX IF NOT EXISTS idx_players_last_reminded ON players(last_reminded);
+CREATE INDEX IF NOT EXISTS idx_transfer_offers_week ON transfer_offers(offer_week);
+CREATE INDEX IF NOT EXISTS idx_fixtures_week_playable ON fixtures(week_number, playable, played);
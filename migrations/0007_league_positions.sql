@@ -0,0 +1,20 @@
+-- ============================================
+-- LEAGUE POSITIONS
+-- teams.position is the maintained rank within each league (utils/standings.py)
+-- ============================================
+
+WITH ranked AS (
+    SELECT team_id,
+           ROW_NUMBER() OVER (
+               PARTITION BY league
+               ORDER BY points DESC, (goals_for - goals_against) DESC, goals_for DESC, team_name
+           )::int AS position
+    FROM teams
+)
+UPDATE teams AS t
+SET position = r.position
+FROM ranked r
+WHERE t.team_id = r.team_id
+  AND t.position IS DISTINCT FROM r.position;
+
+CREATE INDEX IF NOT EXISTS idx_teams_league_position ON teams(league, position);
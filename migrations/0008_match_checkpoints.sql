@@ -0,0 +1,17 @@
+-- ============================================
+-- MATCH CHECKPOINTS
+-- Resumable state of every live match (utils/match_checkpoints.py)
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS match_checkpoints (
+    match_id INTEGER PRIMARY KEY REFERENCES active_matches(match_id) ON DELETE CASCADE,
+    fixture_id INTEGER NOT NULL,
+    is_european BOOLEAN DEFAULT FALSE,
+    channel_id BIGINT,
+    schedule JSONB NOT NULL,             -- [[minute, event type, team side, user_id], ...]
+    event_index INTEGER DEFAULT 0,       -- next schedule entry to play
+    home_score INTEGER DEFAULT 0,
+    away_score INTEGER DEFAULT 0,
+    state JSONB DEFAULT '{}'::jsonb,     -- match stats, cards, timeouts, AFK, pinned message
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,98 @@
+"""
+Request cache: pool checkouts must not clear the current unit of work
+
+asyncpg runs the pool's reset query through Connection.execute() on every
+release, so TrackedConnection has to tell that (and BEGIN / COMMIT / SELECT)
+apart from real writes. No database is needed: the base Connection methods
+the tracked overrides delegate to are stubbed out.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import asyncpg
+import pytest
+
+from utils.request_cache import TrackedConnection, cached_read, current_unit_of_work, unit_of_work
+
+RESET_QUERY = "SELECT pg_advisory_unlock_all();\nCLOSE ALL;\nUNLISTEN *;\nRESET ALL;"
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    executed = []
+
+    async def execute(self, query, *args, **kwargs):
+        executed.append(query)
+        return "OK"
+
+    async def fetchrow(self, query, *args, **kwargs):
+        return {'query': query, 'args': args}
+
+    async def reset(self, *, timeout=None):
+        # What asyncpg.Connection.reset does on release, minus the protocol checks
+        await self.execute(RESET_QUERY, timeout=timeout)
+
+    monkeypatch.setattr(asyncpg.Connection, 'execute', execute)
+    monkeypatch.setattr(asyncpg.Connection, 'fetchrow', fetchrow)
+    monkeypatch.setattr(asyncpg.Connection, 'reset', reset)
+
+    connection = TrackedConnection.__new__(TrackedConnection)
+    connection._aborted = True  # never connected: keeps Connection.__del__ quiet
+    connection._protocol = None
+    connection.executed = executed
+    return connection
+
+
+def make_pool(connection):
+    @asynccontextmanager
+    async def acquire():
+        try:
+            yield connection
+        finally:
+            await connection.reset()
+    return acquire
+
+
+async def with_transaction(c):
+    await c.execute("BEGIN;")
+    await c.execute("SELECT 1")
+    await c.execute("COMMIT;")
+
+
+def test_cached_read_survives_pool_release(conn):
+    acquire = make_pool(conn)
+    loads = []
+
+    async def get(key):
+        async def loader():
+            loads.append(key)
+            async with acquire() as c:
+                return dict(await c.fetchrow("SELECT * FROM players WHERE user_id = $1", key))
+        return await cached_read(('players', key), loader)
+
+    async def scenario():
+        with unit_of_work() as unit:
+            await get(1)                 # acquire -> release
+            async with acquire() as c:   # acquire -> BEGIN / SELECT / COMMIT -> release
+                await with_transaction(c)
+            await get(2)
+            await get(1)                 # still cached
+            return unit
+
+    unit = asyncio.run(scenario())
+    assert loads == [1, 2]
+    assert unit.hits == 1
+    assert RESET_QUERY in conn.executed
+
+
+def test_writes_still_clear_unit_of_work(conn):
+    async def scenario():
+        with unit_of_work() as unit:
+            await cached_read(('players', 1), lambda: asyncio.sleep(0, {'user_id': 1}))
+            await conn.execute("UPDATE players SET age = age + 1 WHERE user_id = $1", 1)
+            assert current_unit_of_work().entries == {}
+            await cached_read(('players', 1), lambda: asyncio.sleep(0, {'user_id': 1}))
+            await conn.execute("WITH moved AS (DELETE FROM npc_players WHERE npc_id = 1) SELECT 1")
+            assert unit.entries == {}
+
+    asyncio.run(scenario())
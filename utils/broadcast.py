@@ -0,0 +1,180 @@
+"""
+Broadcast Engine - fan one announcement out to every guild concurrently
+Payload is built once per event; guilds are served in parallel under a bounded semaphore
+
+- Each guild's messages go to one channel in order, behind a per-channel lock,
+  so a channel's message bucket is never hit by two broadcasts at once
+- A shared token bucket keeps total sends under Discord's global rate limit
+  (discord.py still handles any 429 it gets back)
+- Every broadcast returns a BroadcastReport with per-guild latency and failures
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_GUILDS = 8    # Guilds being posted to at the same time
+GLOBAL_SENDS_PER_SECOND = 40  # Stay below Discord's 50 requests/second global limit
+GUILD_TIMEOUT = 90            # Seconds before one slow guild is given up on
+
+RESULTS_CHANNELS = ('match-results', 'general')
+NEWS_CHANNELS = ('news-feed', 'general')
+EUROPEAN_NEWS_CHANNELS = ('european-news', 'news-feed', 'general')
+PREVIEW_CHANNELS = ('match-previews', 'news-feed', 'general')
+
+
+@dataclass
+class BroadcastMessage:
+    """One message of an announcement (rebuilt into send kwargs for every guild)"""
+    content: str = None
+    embed: discord.Embed = None
+    file_bytes: bytes = None
+    filename: str = None
+
+    def send_kwargs(self):
+        kwargs = {}
+        if self.content is not None:
+            kwargs['content'] = self.content
+        if self.embed is not None:
+            kwargs['embed'] = self.embed
+        if self.file_bytes is not None:
+            # discord.File consumes its buffer, so each guild gets a fresh one
+            kwargs['file'] = discord.File(fp=BytesIO(self.file_bytes), filename=self.filename)
+        return kwargs
+
+
+@dataclass
+class BroadcastReport:
+    """Outcome of one broadcast"""
+    event: str
+    guilds: int = 0
+    delivered: int = 0
+    skipped: int = 0                                 # No suitable channel
+    failures: dict = field(default_factory=dict)     # guild id -> error
+    latencies_ms: dict = field(default_factory=dict)  # guild id -> ms to post everything
+    guild_names: dict = field(default_factory=dict)   # guild id -> name (logs only; names aren't unique)
+    elapsed_ms: float = 0.0
+
+    @property
+    def slowest(self):
+        if not self.latencies_ms:
+            return None, 0.0
+        guild_id = max(self.latencies_ms, key=self.latencies_ms.get)
+        return guild_id, self.latencies_ms[guild_id]
+
+    def label(self, guild_id):
+        return f"{self.guild_names.get(guild_id, 'unknown guild')} ({guild_id})"
+
+    def summary(self):
+        guild_id, slowest_ms = self.slowest
+        text = (f"{self.event}: {self.delivered}/{self.guilds} guilds in {self.elapsed_ms:.0f}ms"
+                f" ({self.skipped} skipped, {len(self.failures)} failed)")
+        if guild_id is not None:
+            text += f", slowest {self.label(guild_id)} {slowest_ms:.0f}ms"
+        return text
+
+
+class RateLimiter:
+    """Token bucket for Discord API calls (shared by every broadcast)"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def find_channel(guild, channel_names):
+    """First text channel of the guild matching channel_names (in preference order)"""
+    for name in channel_names:
+        channel = discord.utils.get(guild.text_channels, name=name)
+        if channel:
+            return channel
+    return None
+
+
+class BroadcastEngine:
+    """Concurrent, rate-limited guild fan-out"""
+
+    def __init__(self, max_concurrency=MAX_CONCURRENT_GUILDS, sends_per_second=GLOBAL_SENDS_PER_SECOND,
+                 guild_timeout=GUILD_TIMEOUT):
+        self.max_concurrency = max_concurrency
+        self.guild_timeout = guild_timeout
+        self._limiter = RateLimiter(sends_per_second)
+        self._channel_locks = {}  # channel id -> asyncio.Lock
+
+    async def _post(self, channel, messages):
+        lock = self._channel_locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            for message in messages:
+                await self._limiter.acquire()
+                await channel.send(**message.send_kwargs())
+
+    async def broadcast(self, bot, event, payload, channel_names=RESULTS_CHANNELS):
+        """
+        Post an announcement to every guild the bot is in
+
+        Args:
+            event: name used in logs and the report
+            payload: list of BroadcastMessage, or a callable guild -> list of BroadcastMessage
+                     for announcements with per-guild parts (e.g. member mentions)
+            channel_names: channel preference order
+
+        Returns:
+            BroadcastReport
+        """
+        guilds = list(bot.guilds)
+        report = BroadcastReport(event=event, guilds=len(guilds))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+
+        async def deliver(guild):
+            report.guild_names[guild.id] = guild.name
+            channel = find_channel(guild, channel_names)
+            try:
+                messages = payload(guild) if callable(payload) and channel else payload
+            except Exception as e:
+                report.failures[guild.id] = f"{type(e).__name__}: {e}"
+                return
+            if not channel or not messages:
+                report.skipped += 1
+                return
+
+            async with semaphore:
+                guild_started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(self._post(channel, messages), timeout=self.guild_timeout)
+                except Exception as e:
+                    report.failures[guild.id] = f"{type(e).__name__}: {e}"
+                    return
+                finally:
+                    report.latencies_ms[guild.id] = (time.perf_counter() - guild_started) * 1000
+                report.delivered += 1
+
+        await asyncio.gather(*(deliver(guild) for guild in guilds))
+        report.elapsed_ms = (time.perf_counter() - started) * 1000
+
+        for guild_id, error in report.failures.items():
+            logger.warning(f"⚠️ {event}: could not post to {report.label(guild_id)}: {error}")
+        logger.info(f"📣 {report.summary()}")
+        return report
+
+
+# Global broadcast engine instance
+broadcaster = BroadcastEngine()
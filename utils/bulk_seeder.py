@@ -0,0 +1,80 @@
+"""
+Bulk Seeder - write seeded teams and squads with COPY instead of per-row INSERTs
+Rows are built in memory first, then every table gets one copy_records_to_table
+
+- SeedBatch collects records per (table, columns); write() copies them all in one
+  transaction, in the order the tables were first added (parents before children)
+- The column tuples below are the one place the seeded columns are listed, so
+  callers build plain tuples in the same order
+"""
+import logging
+import time
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+TEAM_COLUMNS = ('team_id', 'team_name', 'league', 'budget', 'wage_budget')
+
+NPC_PLAYER_COLUMNS = (
+    'player_name', 'team_id', 'position', 'age', 'overall_rating',
+    'pace', 'shooting', 'passing', 'dribbling', 'defending', 'physical', 'is_regen'
+)
+
+REGEN_PLAYER_COLUMNS = (
+    'player_name', 'team_id', 'position', 'age', 'overall_rating',
+    'pace', 'shooting', 'passing', 'dribbling', 'defending', 'physical', 'potential', 'is_regen'
+)
+
+EUROPEAN_TEAM_COLUMNS = ('team_id', 'team_name', 'country', 'league', 'reputation')
+
+EUROPEAN_NPC_PLAYER_COLUMNS = (
+    'player_name', 'team_id', 'position', 'overall_rating', 'age', 'nationality',
+    'pace', 'shooting', 'passing', 'dribbling', 'defending', 'physical', 'value', 'wage'
+)
+
+
+class SeedBatch:
+    """Records waiting to be copied, grouped by table"""
+
+    def __init__(self):
+        self._tables = {}  # (table, columns) -> list of record tuples
+
+    def add(self, table, columns, record):
+        self._tables.setdefault((table, columns), []).append(tuple(record))
+
+    def extend(self, table, columns, records):
+        self._tables.setdefault((table, columns), []).extend(tuple(r) for r in records)
+
+    def count(self, table=None):
+        return sum(len(records) for (name, _), records in self._tables.items() if table in (None, name))
+
+    async def write(self, conn=None):
+        """
+        COPY every table's records (one copy per table, one transaction)
+
+        Args:
+            conn: connection to use (a pool connection is acquired if None)
+
+        Returns:
+            dict of table -> rows written
+        """
+        if conn is None:
+            async with db.pool.acquire() as conn:
+                return await self.write(conn)
+
+        written = {}
+        started = time.perf_counter()
+        async with conn.transaction():
+            for (table, columns), records in self._tables.items():
+                if not records:
+                    continue
+                await conn.copy_records_to_table(table, records=records, columns=list(columns))
+                written[table] = written.get(table, 0) + len(records)
+
+        if written:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            summary = ", ".join(f"{rows} {table}" for table, rows in written.items())
+            logger.info(f"🌱 Seeded {summary} in {elapsed_ms:.0f}ms")
+        self._tables.clear()
+        return written
@@ -0,0 +1,252 @@
+"""
+Crest Service - one place for team crest images
+Process-wide HTTP session, bounded LRU of decoded 100x100 crests,
+memoized side-by-side composites keyed by (home, away)
+
+Lookup order for a crest: memory LRU -> image_cache table -> network.
+Downloaded crests are normalized to 100x100 PNGs and persisted into image_cache,
+so after warm-up a digest or fixtures page makes zero network fetches.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from io import BytesIO
+
+import aiohttp
+from PIL import Image
+
+from database import db
+from utils.render_executor import render_executor
+
+logger = logging.getLogger(__name__)
+
+CREST_SIZE = (100, 100)
+CREST_PADDING = 40
+
+MAX_CRESTS = 256          # Decoded crests kept in memory
+MAX_COMPOSITES = 512      # (home, away) composite PNGs kept in memory
+FETCH_TIMEOUT = 5         # Seconds per crest download
+FAILED_RETRY_SECONDS = 600  # Don't re-download a failing URL for 10 minutes
+
+
+def normalize_crest(raw_bytes):
+    """Render job: decode any crest image and return a 100x100 RGBA PNG"""
+    crest = Image.open(BytesIO(raw_bytes)).convert("RGBA").resize(CREST_SIZE, Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    crest.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def composite_crests(home_crest, away_crest):
+    """
+    Render job: paste both crests side by side on a transparent canvas
+
+    Args:
+        home_crest / away_crest: decoded 100x100 RGBA crests (or None to leave that side empty)
+
+    Returns:
+        PNG bytes
+    """
+    width = CREST_SIZE[0] * 2 + CREST_PADDING
+    height = CREST_SIZE[1]
+    img = Image.new("RGBA", (width, height), (255, 255, 255, 0))
+
+    if home_crest is not None:
+        img.paste(home_crest, (0, 0), home_crest)
+    if away_crest is not None:
+        img.paste(away_crest, (CREST_SIZE[0] + CREST_PADDING, 0), away_crest)
+
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _decode(png_bytes):
+    crest = Image.open(BytesIO(png_bytes))
+    crest.load()
+    return crest
+
+
+def crest_cache_key(url):
+    """image_cache key for a crest URL (image_key is VARCHAR(50))"""
+    return f"crest:{hashlib.sha1(url.encode()).hexdigest()[:32]}"
+
+
+class CrestService:
+    """Shared crest downloader/cache"""
+
+    def __init__(self, max_crests=MAX_CRESTS, max_composites=MAX_COMPOSITES):
+        self.max_crests = max_crests
+        self.max_composites = max_composites
+
+        self._session = None
+        self._crests = OrderedDict()      # crest_cache_key(url) -> decoded 100x100 crest
+        self._composites = OrderedDict()  # (home_url, away_url) -> PNG bytes
+        self._inflight = {}               # crest key -> task (one download per URL at a time)
+        self._failed = {}                 # url -> monotonic time of last failure
+
+        self.stats = {'memory_hits': 0, 'db_hits': 0, 'fetches': 0, 'fetch_failures': 0, 'composites': 0}
+
+    # ========== SESSION ==========
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT))
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session (bot shutdown)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # ========== LRU HELPERS ==========
+
+    def _remember_crest(self, key, crest):
+        self._crests[key] = crest
+        self._crests.move_to_end(key)
+        while len(self._crests) > self.max_crests:
+            self._crests.popitem(last=False)
+
+    def _remember_composite(self, key, data):
+        self._composites[key] = data
+        self._composites.move_to_end(key)
+        while len(self._composites) > self.max_composites:
+            self._composites.popitem(last=False)
+
+    # ========== CRESTS ==========
+
+    async def warm_up(self):
+        """Decode the most recently used persisted crests into memory"""
+        async with db.pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT image_key, image_data
+                FROM image_cache
+                WHERE image_key LIKE 'crest:%'
+                ORDER BY last_accessed DESC
+                LIMIT $1
+            """, self.max_crests)
+
+        for row in rows:
+            try:
+                self._remember_crest(row['image_key'], _decode(row['image_data']))
+            except Exception as e:
+                logger.warning(f"⚠️ Skipping unreadable crest {row['image_key']}: {e}")
+
+        logger.info(f"✅ Crest cache warmed ({len(self._crests)} crests)")
+
+    async def _persist(self, url, png_bytes):
+        async with db.pool.acquire() as conn:
+            await conn.execute("""
+                INSERT INTO image_cache (image_key, image_data, image_format, width, height, file_size)
+                VALUES ($1, $2, 'PNG', $3, $4, $5)
+                ON CONFLICT (image_key) DO UPDATE
+                SET image_data = EXCLUDED.image_data,
+                    file_size = EXCLUDED.file_size,
+                    last_accessed = CURRENT_TIMESTAMP
+            """, crest_cache_key(url), png_bytes, CREST_SIZE[0], CREST_SIZE[1], len(png_bytes))
+
+    async def _resolve(self, url):
+        """Load a crest that is not in memory: image_cache first, then the network"""
+        try:
+            # Touch last_accessed so warm_up keeps preferring crests that are still in use
+            async with db.pool.acquire() as conn:
+                png_bytes = await conn.fetchval("""
+                    UPDATE image_cache SET last_accessed = CURRENT_TIMESTAMP
+                    WHERE image_key = $1
+                    RETURNING image_data
+                """, crest_cache_key(url))
+            if png_bytes:
+                self.stats['db_hits'] += 1
+                return _decode(png_bytes)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read cached crest: {e}")
+
+        failed_at = self._failed.get(url)
+        if failed_at and time.monotonic() - failed_at < FAILED_RETRY_SECONDS:
+            return None
+
+        self.stats['fetches'] += 1
+        try:
+            async with self._get_session().get(url) as r:
+                if r.status != 200:
+                    raise Exception(f"status {r.status}")
+                raw_bytes = await r.read()
+
+            png_bytes = await render_executor.run(normalize_crest, raw_bytes)
+        except Exception as e:
+            self.stats['fetch_failures'] += 1
+            self._failed[url] = time.monotonic()
+            print(f"  ⚠️ Could not fetch crest {url}: {e}")
+            return None
+
+        self._failed.pop(url, None)
+        try:
+            await self._persist(url, png_bytes)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not persist crest: {e}")
+
+        return _decode(png_bytes)
+
+    async def get_crest(self, url):
+        """Decoded 100x100 RGBA crest for a URL (None if unavailable)"""
+        if not url:
+            return None
+
+        key = crest_cache_key(url)
+        if key in self._crests:
+            self.stats['memory_hits'] += 1
+            self._crests.move_to_end(key)
+            return self._crests[key]
+
+        # Share one download between concurrent callers
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        crest = await asyncio.shield(task)
+        if crest is not None:
+            self._remember_crest(key, crest)
+        return crest
+
+    async def prefetch(self, urls):
+        """Resolve many crests concurrently (e.g. before building a fixtures page)"""
+        await asyncio.gather(*(self.get_crest(url) for url in set(urls) if url))
+
+    # ========== COMPOSITES ==========
+
+    async def get_composite(self, home_url, away_url):
+        """
+        Side-by-side crest image for a matchup
+
+        Returns:
+            BytesIO buffer with PNG image, or None if failed
+        """
+        key = (home_url or None, away_url or None)
+
+        if key in self._composites:
+            self._composites.move_to_end(key)
+            return BytesIO(self._composites[key])
+
+        try:
+            home_crest, away_crest = await asyncio.gather(self.get_crest(home_url), self.get_crest(away_url))
+
+            data = await render_executor.run(composite_crests, home_crest, away_crest)
+            self.stats['composites'] += 1
+        except Exception as e:
+            print(f"  ❌ Error generating crests image: {e}")
+            return None
+
+        # Only memoize complete images so a failed download isn't stuck in the cache
+        if (home_crest is not None or not home_url) and (away_crest is not None or not away_url):
+            self._remember_composite(key, data)
+
+        return BytesIO(data)
+
+
+# Global crest service instance
+crest_service = CrestService()
@@ -0,0 +1,124 @@
+"""
+DM Dispatcher - send many direct messages concurrently
+Bounded worker pool, shared rate limiter, LRU cache of fetched users
+
+Used for bursts like the daily training reminders: the caller builds every
+message up front, the dispatcher sends them in parallel and returns which
+users were reached, so the caller can record them in one UPDATE.
+queue_many() does the same in the background for callers that don't need the report.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import discord
+
+from utils.broadcast import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_DMS = 10    # DMs in flight at the same time
+DM_SENDS_PER_SECOND = 20   # fetch_user / DM channel / send calls per second
+MAX_CACHED_USERS = 5000    # Fetched discord.User objects kept in memory
+DM_TIMEOUT = 30            # Seconds before one DM is given up on
+
+
+@dataclass
+class DispatchReport:
+    """Outcome of one DM burst"""
+    event: str
+    attempted: int = 0
+    sent: list = field(default_factory=list)        # user_ids reached
+    failures: dict = field(default_factory=dict)    # user_id -> error
+    elapsed_ms: float = 0.0
+
+    def summary(self):
+        return (f"{self.event}: {len(self.sent)}/{self.attempted} DMs in {self.elapsed_ms:.0f}ms"
+                f" ({len(self.failures)} failed)")
+
+
+class DMDispatcher:
+    """Concurrent, rate-limited DM sender"""
+
+    def __init__(self, max_concurrency=MAX_CONCURRENT_DMS, sends_per_second=DM_SENDS_PER_SECOND,
+                 max_cached_users=MAX_CACHED_USERS, timeout=DM_TIMEOUT):
+        self.max_concurrency = max_concurrency
+        self.max_cached_users = max_cached_users
+        self.timeout = timeout
+        self._limiter = RateLimiter(sends_per_second)
+        self._users = OrderedDict()  # user_id -> discord.User
+        self._tasks = set()          # queued bursts still sending
+
+    async def get_user(self, bot, user_id):
+        """Client cache first, then our LRU, then one rate-limited fetch_user"""
+        user = bot.get_user(user_id)
+        if user is not None:
+            return user
+
+        user = self._users.get(user_id)
+        if user is None:
+            await self._limiter.acquire()
+            user = await bot.fetch_user(user_id)
+
+        self._users[user_id] = user
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_cached_users:
+            self._users.popitem(last=False)
+        return user
+
+    async def _send(self, bot, user_id, kwargs):
+        user = await self.get_user(bot, user_id)
+        if user.dm_channel is None:
+            await self._limiter.acquire()
+            await user.create_dm()
+        await self._limiter.acquire()
+        await user.send(**kwargs)
+
+    async def send_many(self, bot, event, jobs):
+        """
+        Send one DM per job
+
+        Args:
+            event: name used in logs and the report
+            jobs: iterable of (user_id, send kwargs) pairs, e.g. (123, {'embed': embed})
+
+        Returns:
+            DispatchReport
+        """
+        jobs = list(jobs)
+        report = DispatchReport(event=event, attempted=len(jobs))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+
+        async def deliver(user_id, kwargs):
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(self._send(bot, user_id, kwargs), timeout=self.timeout)
+                except discord.Forbidden:
+                    report.failures[user_id] = "DMs closed"
+                    return
+                except Exception as e:
+                    report.failures[user_id] = f"{type(e).__name__}: {e}"
+                    return
+                report.sent.append(user_id)
+
+        await asyncio.gather(*(deliver(user_id, kwargs) for user_id, kwargs in jobs))
+        report.elapsed_ms = (time.perf_counter() - started) * 1000
+
+        for user_id, error in report.failures.items():
+            logger.debug(f"   - {event}: could not DM {user_id}: {error}")
+        logger.info(f"📨 {report.summary()}")
+        return report
+
+    def queue_many(self, bot, event, jobs):
+        """send_many() as a background task (the caller doesn't wait for delivery)"""
+        task = asyncio.create_task(self.send_many(bot, event, list(jobs)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+
+# Global DM dispatcher instance
+dm_dispatcher = DMDispatcher()
@@ -15,28 +15,23 @@ async def draw_groups(season='2027/28'):
     """Draw Champions League and Europa League groups"""
     print("🏆 Drawing European groups...")
     
+    from utils.standings import standings
+    
     async with db.pool.acquire() as conn:
-        # Get qualified English teams based on current standings
-        standings = await conn.fetch("""
-            SELECT team_id, position
-            FROM teams
-            WHERE league = 'Premier League'
-            ORDER BY points DESC, (goals_for - goals_against) DESC, goals_for DESC
-        """)
+        # Rerank first: on a fresh seed with no results yet every position is still the column default
+        if await standings.rerank(conn):
+            standings.invalidate()
+        
+        # Get qualified English teams based on current standings (table is served in position order)
+        pl_table = await standings.get_table('Premier League')
         
         cl_teams = []
         el_teams = []
         
-        for i, row in enumerate(standings, 1):
-            # Update position field for accuracy
-            await conn.execute(
-                "UPDATE teams SET position = $1 WHERE team_id = $2",
-                i, row['team_id']
-            )
-            
-            if i in config.CL_QUALIFICATION_POSITIONS['Premier League']:
+        for position, row in enumerate(pl_table, 1):
+            if position in config.CL_QUALIFICATION_POSITIONS['Premier League']:
                 cl_teams.append(row['team_id'])
-            elif i in config.EL_QUALIFICATION_POSITIONS['Premier League']:
+            elif position in config.EL_QUALIFICATION_POSITIONS['Premier League']:
                 el_teams.append(row['team_id'])
         
         # Get all European teams
@@ -127,6 +122,53 @@ async def create_group_fixtures(conn, competition, group_name, teams, season):
                 VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
             """, competition, 'group', group_name, home, away, week, season, match_day)
 
+KNOCKOUT_STAGES = ('r16', 'quarters', 'semis', 'final')
+
+
+def knockout_schedule(stage):
+    """(weeks of leg 1 / leg 2, knockout match day) for a stage"""
+    if stage == 'r16':
+        return config.KNOCKOUT_R16_WEEKS, 1  # R16 is match day 1 of knockouts
+    elif stage == 'quarters':
+        return config.KNOCKOUT_QF_WEEKS, 2  # QF is match day 2
+    elif stage == 'semis':
+        return config.KNOCKOUT_SF_WEEKS, 3  # SF is match day 3
+    return [config.KNOCKOUT_FINAL_WEEK], 4  # Final is match day 4
+
+
+def draw_r16_pairs(winners, runners_up):
+    """
+    Pair group winners with runners-up (home, away), avoiding same-group ties where possible
+
+    Args:
+        winners / runners_up: dicts with team_id and group_name
+    """
+    winners = list(winners)
+    runners_up = list(runners_up)
+    random.shuffle(winners)
+    random.shuffle(runners_up)
+
+    pairs = []
+    count = min(len(winners), len(runners_up))
+    for i in range(count):
+        winner = winners[i]
+        runner = runners_up[i]
+
+        if winner['group_name'] == runner['group_name'] and i < count - 1:
+            runners_up[i], runners_up[i+1] = runners_up[i+1], runners_up[i]
+            runner = runners_up[i]
+
+        pairs.append((winner['team_id'], runner['team_id']))
+    return pairs
+
+
+def draw_next_round_pairs(winner_ids):
+    """Random (home, away) pairs from the previous round's winners"""
+    winner_ids = list(winner_ids)
+    random.shuffle(winner_ids)
+    return [(winner_ids[i], winner_ids[i+1]) for i in range(0, len(winner_ids) - 1, 2)]
+
+
 async def generate_knockout_draw(competition, stage, season):
     """Generate knockout stage draw"""
     print(f"🏆 Drawing {stage} for {competition}...")
@@ -151,22 +193,7 @@ async def generate_knockout_draw(competition, stage, season):
                     winners.append(dict(standings[0]))
                     runners_up.append(dict(standings[1]))
             
-            random.shuffle(winners)
-            random.shuffle(runners_up)
-            
-            for i in range(8):
-                winner = winners[i]
-                runner = runners_up[i]
-                
-                if winner['group_name'] == runner['group_name'] and i < 7:
-                    runners_up[i], runners_up[i+1] = runners_up[i+1], runners_up[i]
-                    runner = runners_up[i]
-                
-                await conn.execute("""
-                    INSERT INTO european_knockout
-                    (competition, stage, home_team_id, away_team_id, season)
-                    VALUES ($1, $2, $3, $4, $5)
-                """, competition, stage, winner['team_id'], runner['team_id'], season)
+            pairs = draw_r16_pairs(winners, runners_up)
         
         else:
             prev_stage = {'quarters': 'r16', 'semis': 'quarters', 'final': 'semis'}[stage]
@@ -178,34 +205,21 @@ async def generate_knockout_draw(competition, stage, season):
                 AND winner_team_id IS NOT NULL
             """, competition, prev_stage, season)
             
-            winner_ids = [w['winner_team_id'] for w in winners]
-            random.shuffle(winner_ids)
-            
-            for i in range(0, len(winner_ids), 2):
-                if i+1 < len(winner_ids):
-                    await conn.execute("""
-                        INSERT INTO european_knockout
-                        (competition, stage, home_team_id, away_team_id, season)
-                        VALUES ($1, $2, $3, $4, $5)
-                    """, competition, stage, winner_ids[i], winner_ids[i+1], season)
+            pairs = draw_next_round_pairs(w['winner_team_id'] for w in winners)
+        
+        for home_team_id, away_team_id in pairs:
+            await conn.execute("""
+                INSERT INTO european_knockout
+                (competition, stage, home_team_id, away_team_id, season)
+                VALUES ($1, $2, $3, $4, $5)
+            """, competition, stage, home_team_id, away_team_id, season)
         
         await create_knockout_fixtures(conn, competition, stage, season)
         print(f"✅ {stage.upper()} draw complete!")
 
 async def create_knockout_fixtures(conn, competition, stage, season):
     """Create knockout fixtures"""
-    if stage == 'r16':
-        weeks = config.KNOCKOUT_R16_WEEKS
-        match_day = 1  # R16 is match day 1 of knockouts
-    elif stage == 'quarters':
-        weeks = config.KNOCKOUT_QF_WEEKS
-        match_day = 2  # QF is match day 2
-    elif stage == 'semis':
-        weeks = config.KNOCKOUT_SF_WEEKS
-        match_day = 3  # SF is match day 3
-    else:
-        weeks = [config.KNOCKOUT_FINAL_WEEK]
-        match_day = 4  # Final is match day 4
+    weeks, match_day = knockout_schedule(stage)
     
     ties = await conn.fetch("""
         SELECT tie_id, home_team_id, away_team_id
@@ -1,54 +1,25 @@
 """
 Mid-Season European Start - Simulates Missed Weeks
-FIXED: Import match_engine instance instead of method
+Catch-up and simulate-to-end run on the in-memory engine (utils/european_season_engine.py)
 """
 
 from database import db
+from utils.team_strength import team_strength
+from utils.scoreline_engine import simulate_npc_scorelines
+from utils.team_directory import team_directory
 import config
 
 async def simulate_missed_european_weeks(missed_weeks, season):
-    """Simulate all missed European weeks to catch up"""
+    """Simulate all missed European weeks to catch up (one transaction, bulk writes)"""
     print(f"🏆 Simulating {len(missed_weeks)} missed weeks...")
     
-    # CRITICAL FIX: Import match_engine instance
-    from utils import match_engine as me_module
-    
-    if not me_module.match_engine:
-        print("❌ Match engine not initialized!")
-        return {'matches_simulated': 0, 'weeks_simulated': 0}
-    
-    matches_simulated = 0
+    from utils.european_season_engine import EuropeanSeason
     
     async with db.pool.acquire() as conn:
-        for week in missed_weeks:
-            fixtures = await conn.fetch("""
-                SELECT * FROM european_fixtures
-                WHERE week_number = $1 AND season = $2 AND stage = 'group'
-            """, week, season)
-            
-            for fixture in fixtures:
-                # FIXED: Use match_engine instance
-                result = await me_module.match_engine.simulate_npc_match(
-                    fixture['home_team_id'],
-                    fixture['away_team_id'],
-                    is_european=True
-                )
-                
-                await conn.execute("""
-                    UPDATE european_fixtures
-                    SET home_score = $1, away_score = $2, played = TRUE
-                    WHERE fixture_id = $3
-                """, result['home_score'], result['away_score'], fixture['fixture_id'])
-                
-                await update_standings(
-                    conn, fixture['competition'], fixture['group_name'],
-                    fixture['home_team_id'], fixture['away_team_id'],
-                    result['home_score'], result['away_score']
-                )
-                
-                matches_simulated += 1
-            
-            print(f"  ✅ Week {week}: {len(fixtures)} matches")
+        async with conn.transaction():
+            european_season = await EuropeanSeason.load(conn, season)
+            matches_simulated = await european_season.play_group_weeks(missed_weeks)
+            await european_season.commit(conn)
     
     print(f"🎉 Done! {matches_simulated} matches simulated")
     
@@ -57,225 +28,73 @@ async def simulate_missed_european_weeks(missed_weeks, season):
         'weeks_simulated': len(missed_weeks)
     }
 
-async def update_standings(conn, comp, group, home, away, home_score, away_score):
-    """Update group standings after simulated match"""
-    
-    if home_score > away_score:
-        await conn.execute("""
-            UPDATE european_groups
-            SET played = played + 1, won = won + 1, 
-                goals_for = goals_for + $1, goals_against = goals_against + $2,
-                points = points + 3
-            WHERE competition = $3 AND group_name = $4 AND team_id = $5
-        """, home_score, away_score, comp, group, home)
-        
-        await conn.execute("""
-            UPDATE european_groups
-            SET played = played + 1, lost = lost + 1,
-                goals_for = goals_for + $1, goals_against = goals_against + $2
-            WHERE competition = $3 AND group_name = $4 AND team_id = $5
-        """, away_score, home_score, comp, group, away)
-    
-    elif away_score > home_score:
-        await conn.execute("""
-            UPDATE european_groups
-            SET played = played + 1, lost = lost + 1,
-                goals_for = goals_for + $1, goals_against = goals_against + $2
-            WHERE competition = $3 AND group_name = $4 AND team_id = $5
-        """, home_score, away_score, comp, group, home)
-        
-        await conn.execute("""
-            UPDATE european_groups
-            SET played = played + 1, won = won + 1,
-                goals_for = goals_for + $1, goals_against = goals_against + $2,
-                points = points + 3
-            WHERE competition = $3 AND group_name = $4 AND team_id = $5
-        """, away_score, home_score, comp, group, away)
-    else:
-        for team in [home, away]:
-            await conn.execute("""
-                UPDATE european_groups
-                SET played = played + 1, drawn = drawn + 1,
-                    goals_for = goals_for + $1, goals_against = goals_against + $2,
-                    points = points + 1
-                WHERE competition = $3 AND group_name = $4 AND team_id = $5
-            """, home_score, away_score, comp, group, team)
+
+async def simulate_fixture_scores(fixtures, rng=None):
+    """
+    Simulate scorelines for a list of fixtures in one vectorized call
+    Ratings come from the team strength cache (same model as simulate_npc_match)
+    
+    Returns:
+        (home_scores, away_scores) as lists of ints
+    """
+    if not fixtures:
+        return [], []
+    
+    team_ids = [f['home_team_id'] for f in fixtures] + [f['away_team_id'] for f in fixtures]
+    ratings = await team_strength.get_ratings(team_ids)
+    
+    def rating(team_id):
+        return ratings[team_id] if ratings[team_id] is not None else 75
+    
+    home_goals, away_goals = simulate_npc_scorelines(
+        [rating(f['home_team_id']) for f in fixtures],
+        [rating(f['away_team_id']) for f in fixtures],
+        rng=rng
+    )
+    return home_goals.tolist(), away_goals.tolist()
 
 
 async def simulate_full_european_season(season, current_week):
-    """Simulate ENTIRE European season to completion"""
-    print(f"🏆 Simulating FULL European season...")
-    
-    # CRITICAL FIX: Import match_engine instance
-    from utils import match_engine as me_module
+    """
+    Simulate ENTIRE European season to completion
     
-    if not me_module.match_engine:
-        print("❌ Match engine not initialized!")
-        return {
-            'group_matches': 0,
-            'knockout_matches': 0,
-            'cl_winner': 'Unknown',
-            'el_winner': 'Unknown'
-        }
+    All groups, fixtures and ties are loaded into memory, every remaining round
+    (group weeks, draws, both legs, finals) is played there, and everything is
+    written in one transaction - if anything fails, nothing is saved.
+    """
+    print(f"🏆 Simulating FULL European season...")
     
-    group_matches = 0
-    knockout_matches = 0
+    from utils.european_season_engine import EuropeanSeason
     
     async with db.pool.acquire() as conn:
-        # Use transaction for data consistency
         async with conn.transaction():
+            european_season = await EuropeanSeason.load(conn, season)
+            
             # Simulate all remaining group stage matches
             remaining_group_weeks = [w for w in config.GROUP_STAGE_WEEKS if w >= current_week]
+            await european_season.play_group_weeks(remaining_group_weeks)
             
-            if remaining_group_weeks:
-                group_results = await simulate_missed_european_weeks(remaining_group_weeks, season)
-                group_matches = group_results['matches_simulated']
-            
-            # Simulate all knockout stages
-            from utils.european_competitions import (
-                generate_knockout_draw,
-                close_knockout_round
-            )
-            
-            # R16
-            await generate_knockout_draw('CL', 'r16', season)
-            await generate_knockout_draw('EL', 'r16', season)
-            knockout_matches += await simulate_knockout_stage('CL', 'r16', season, conn, me_module)
-            knockout_matches += await simulate_knockout_stage('EL', 'r16', season, conn, me_module)
-            await close_knockout_round('CL', 'r16', season)
-            await close_knockout_round('EL', 'r16', season)
-            
-            # Quarters
-            await generate_knockout_draw('CL', 'quarters', season)
-            await generate_knockout_draw('EL', 'quarters', season)
-            knockout_matches += await simulate_knockout_stage('CL', 'quarters', season, conn, me_module)
-            knockout_matches += await simulate_knockout_stage('EL', 'quarters', season, conn, me_module)
-            await close_knockout_round('CL', 'quarters', season)
-            await close_knockout_round('EL', 'quarters', season)
+            # Draw, play and decide every knockout round
+            await european_season.play_knockouts()
             
-            # Semis
-            await generate_knockout_draw('CL', 'semis', season)
-            await generate_knockout_draw('EL', 'semis', season)
-            knockout_matches += await simulate_knockout_stage('CL', 'semis', season, conn, me_module)
-            knockout_matches += await simulate_knockout_stage('EL', 'semis', season, conn, me_module)
-            await close_knockout_round('CL', 'semis', season)
-            await close_knockout_round('EL', 'semis', season)
-            
-            # Finals
-            await generate_knockout_draw('CL', 'final', season)
-            await generate_knockout_draw('EL', 'final', season)
-            knockout_matches += await simulate_knockout_stage('CL', 'final', season, conn, me_module)
-            knockout_matches += await simulate_knockout_stage('EL', 'final', season, conn, me_module)
-            await close_knockout_round('CL', 'final', season)
-            await close_knockout_round('EL', 'final', season)
-            
-            # Get winners
-            cl_winner = await conn.fetchrow("""
-                SELECT k.winner_team_id,
-                       COALESCE(t.team_name, et.team_name) as team_name
-                FROM european_knockout k
-                LEFT JOIN teams t ON k.winner_team_id = t.team_id
-                LEFT JOIN european_teams et ON k.winner_team_id = et.team_id
-                WHERE k.competition = 'CL' AND k.stage = 'final' AND k.season = $1
-                  AND k.winner_team_id IS NOT NULL
-            """, season)
-            
-            el_winner = await conn.fetchrow("""
-                SELECT k.winner_team_id,
-                       COALESCE(t.team_name, et.team_name) as team_name
-                FROM european_knockout k
-                LEFT JOIN teams t ON k.winner_team_id = t.team_id
-                LEFT JOIN european_teams et ON k.winner_team_id = et.team_id
-                WHERE k.competition = 'EL' AND k.stage = 'final' AND k.season = $1
-                  AND k.winner_team_id IS NOT NULL
-            """, season)
+            await european_season.commit(conn)
+    
+    await team_directory.ensure_loaded()
+    cl_winner = team_directory.name(european_season.winner('CL'), default=None)
+    el_winner = team_directory.name(european_season.winner('EL'), default=None)
     
     print(f"🎉 Full season simulated!")
-    print(f"🏆 CL Winner: {cl_winner['team_name'] if cl_winner else 'N/A'}")
-    print(f"🏆 EL Winner: {el_winner['team_name'] if el_winner else 'N/A'}")
+    print(f"🏆 CL Winner: {cl_winner or 'N/A'}")
+    print(f"🏆 EL Winner: {el_winner or 'N/A'}")
     
     return {
-        'group_matches': group_matches,
-        'knockout_matches': knockout_matches,
-        'cl_winner': cl_winner['team_name'] if cl_winner else 'Unknown',
-        'el_winner': el_winner['team_name'] if el_winner else 'Unknown'
+        'group_matches': european_season.group_matches,
+        'knockout_matches': european_season.knockout_matches,
+        'cl_winner': cl_winner or 'Unknown',
+        'el_winner': el_winner or 'Unknown'
     }
 
 
-async def simulate_knockout_stage(competition, stage, season, conn, me_module):
-    """Simulate all matches in a knockout stage and determine winners"""
-    import random
-    
-    matches = 0
-    is_final = (stage == 'final')
-    
-    # Get all fixtures for this stage
-    fixtures = await conn.fetch("""
-        SELECT * FROM european_fixtures
-        WHERE competition = $1 AND stage = $2 AND season = $3 AND played = FALSE
-        ORDER BY tie_id, leg
-    """, competition, stage, season)
-    
-    # Simulate all matches
-    for fixture in fixtures:
-        result = await me_module.match_engine.simulate_npc_match(
-            fixture['home_team_id'],
-            fixture['away_team_id'],
-            is_european=True
-        )
-        
-        await conn.execute("""
-            UPDATE european_fixtures
-            SET home_score = $1, away_score = $2, played = TRUE
-            WHERE fixture_id = $3
-        """, result['home_score'], result['away_score'], fixture['fixture_id'])
-        
-        matches += 1
-    
-    # Determine winners for each tie
-    if is_final:
-        # Finals are single leg
-        for fixture in fixtures:
-            fixture_updated = await conn.fetchrow("""
-                SELECT * FROM european_fixtures
-                WHERE fixture_id = $1
-            """, fixture['fixture_id'])
-            
-            winner_id = determine_single_leg_winner(
-                fixture_updated['home_team_id'],
-                fixture_updated['away_team_id'],
-                fixture_updated['home_score'],
-                fixture_updated['away_score']
-            )
-            
-            await conn.execute("""
-                UPDATE european_knockout
-                SET winner_team_id = $1
-                WHERE tie_id = $2
-            """, winner_id, fixture_updated['tie_id'])
-    else:
-        # Two-legged ties
-        tie_ids = set(f['tie_id'] for f in fixtures)
-        
-        for tie_id in tie_ids:
-            legs = await conn.fetch("""
-                SELECT * FROM european_fixtures
-                WHERE tie_id = $1 AND played = TRUE
-                ORDER BY leg
-            """, tie_id)
-            
-            if len(legs) == 2:
-                winner_id = determine_two_leg_winner(legs[0], legs[1])
-                
-                await conn.execute("""
-                    UPDATE european_knockout
-                    SET winner_team_id = $1
-                    WHERE tie_id = $2
-                """, winner_id, tie_id)
-    
-    return matches
-
-
 def determine_single_leg_winner(home_id, away_id, home_score, away_score):
     """Determine winner of single-leg match (with ET/penalties if needed)"""
     import random
@@ -1,9 +1,11 @@
 """
 Populate European teams with real player rosters
+Teams and players are built in memory and written with one COPY per table
 """
 
 from database import db
 from data.european_players import TEAM_ROSTERS
+from utils.bulk_seeder import SeedBatch, EUROPEAN_TEAM_COLUMNS, EUROPEAN_NPC_PLAYER_COLUMNS
 import random
 
 def calculate_attributes(position, rating):
@@ -67,19 +69,20 @@ async def populate_european_teams():
     async with db.pool.acquire() as conn:
         teams_added = 0
         players_added = 0
+        batch = SeedBatch()
+        
+        # COPY has no ON CONFLICT, so skip teams that already exist
+        existing = {row['team_id'] for row in await conn.fetch("SELECT team_id FROM european_teams")}
         
         for team_id, team_data in TEAM_ROSTERS.items():
-            # Insert team
-            await conn.execute("""
-                INSERT INTO european_teams (team_id, team_name, country, league, reputation)
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (team_id) DO NOTHING
-            """, team_id, team_data['name'], team_data['country'], 
-                 team_data['league'], 85)
+            if team_id in existing:
+                continue
+            
+            batch.add('european_teams', EUROPEAN_TEAM_COLUMNS,
+                      (team_id, team_data['name'], team_data['country'], team_data['league'], 85))
             
             teams_added += 1
             
-            # Insert players
             for player in team_data['players']:
                 stats = calculate_attributes(player['pos'], player['rating'])
                 
@@ -94,19 +97,19 @@ async def populate_european_teams():
                 
                 wage = player['rating'] * 10000
                 
-                await conn.execute("""
-                    INSERT INTO european_npc_players 
-                    (player_name, team_id, position, overall_rating, age, nationality,
-                     pace, shooting, passing, dribbling, defending, physical, value, wage)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                """, player['name'], team_id, player['pos'], player['rating'],
-                     player['age'], player['nat'], stats['pace'], stats['shooting'],
-                     stats['passing'], stats['dribbling'], stats['defending'], 
-                     stats['physical'], value, wage)
+                batch.add('european_npc_players', EUROPEAN_NPC_PLAYER_COLUMNS, (
+                    player['name'], team_id, player['pos'], player['rating'],
+                    player['age'], player['nat'], stats['pace'], stats['shooting'],
+                    stats['passing'], stats['dribbling'], stats['defending'],
+                    stats['physical'], value, wage
+                ))
                 
                 players_added += 1
             
             print(f"  ✅ {team_data['name']}: {len(team_data['players'])} players")
+        
+        # Teams are added first, so they are copied before the players referencing them
+        await batch.write(conn)
     
     print(f"🎉 Populated {teams_added} teams with {players_added} players!")
     return teams_added, players_added
@@ -0,0 +1,309 @@
+"""
+European Season Engine - play the rest of a European season in memory
+Groups, fixtures and knockout ties are loaded once, every remaining round is
+simulated against that state, and the results are committed together
+
+- Scorelines come from simulate_fixture_scores, one vectorized call per round
+- Two-legged ties are decided by determine_two_leg_winner (aggregate, away goals,
+  penalties), finals by determine_single_leg_winner
+- commit() writes fixture results, european_groups standings, knockout winners
+  and any newly drawn ties / fixtures with set-based statements on the caller's
+  connection, so inside a transaction the whole season is all-or-nothing
+"""
+import logging
+
+from utils.european_competitions import (
+    KNOCKOUT_STAGES, knockout_schedule, draw_r16_pairs, draw_next_round_pairs
+)
+from utils.european_mid_season import (
+    simulate_fixture_scores, determine_two_leg_winner, determine_single_leg_winner
+)
+
+logger = logging.getLogger(__name__)
+
+COMPETITIONS = ('CL', 'EL')
+GROUP_NAMES = ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H')
+
+KNOCKOUT_COLUMNS = (
+    'tie_id', 'competition', 'stage', 'home_team_id', 'away_team_id',
+    'first_leg_home_score', 'first_leg_away_score', 'second_leg_home_score', 'second_leg_away_score',
+    'aggregate_home', 'aggregate_away', 'winner_team_id', 'first_leg_played', 'second_leg_played',
+    'penalties_taken', 'penalty_winner', 'season'
+)
+
+FIXTURE_COLUMNS = (
+    'competition', 'stage', 'group_name', 'home_team_id', 'away_team_id', 'week_number', 'match_day',
+    'home_score', 'away_score', 'played', 'playable', 'season', 'leg', 'tie_id'
+)
+
+
+class EuropeanSeason:
+    """In-memory European season for one season string"""
+
+    def __init__(self, season):
+        self.season = season
+        self.groups = {}    # (competition, group_name, team_id) -> european_groups row
+        self.fixtures = []  # european_fixtures rows (new ones have fixture_id None)
+        self.ties = []      # european_knockout rows (new ones have a placeholder tie_id)
+
+        self._played = set()          # ids of fixture dicts simulated in memory
+        self._decided = set()         # ids of tie dicts decided in memory
+        self._new_tie_ids = 0
+
+        self.group_matches = 0
+        self.knockout_matches = 0
+
+    # ========== LOAD ==========
+
+    @classmethod
+    async def load(cls, conn, season):
+        """Read the season's groups, fixtures and ties (rows are locked until the transaction ends)"""
+        state = cls(season)
+
+        groups = await conn.fetch(
+            "SELECT * FROM european_groups WHERE season = $1 ORDER BY id FOR UPDATE", season
+        )
+        fixtures = await conn.fetch(
+            "SELECT * FROM european_fixtures WHERE season = $1 ORDER BY fixture_id FOR UPDATE", season
+        )
+        ties = await conn.fetch(
+            "SELECT * FROM european_knockout WHERE season = $1 ORDER BY tie_id FOR UPDATE", season
+        )
+
+        state.groups = {(g['competition'], g['group_name'], g['team_id']): dict(g) for g in groups}
+        state.fixtures = [dict(f) for f in fixtures]
+        state.ties = [dict(t) for t in ties]
+        return state
+
+    # ========== GROUP STAGE ==========
+
+    async def play_group_weeks(self, weeks=None):
+        """
+        Simulate unplayed group fixtures (of the given weeks, or all of them)
+
+        Returns:
+            number of matches simulated
+        """
+        fixtures = [
+            f for f in self.fixtures
+            if f['stage'] == 'group' and not f['played'] and (weeks is None or f['week_number'] in weeks)
+        ]
+        home_scores, away_scores = await simulate_fixture_scores(fixtures)
+
+        for fixture, home_score, away_score in zip(fixtures, home_scores, away_scores):
+            self._record(fixture, home_score, away_score)
+            self._apply_group_result(fixture, home_score, away_score)
+
+        self.group_matches += len(fixtures)
+        return len(fixtures)
+
+    def _apply_group_result(self, fixture, home_score, away_score):
+        for team_id, scored, conceded in ((fixture['home_team_id'], home_score, away_score),
+                                          (fixture['away_team_id'], away_score, home_score)):
+            row = self.groups.get((fixture['competition'], fixture['group_name'], team_id))
+            if row is None:
+                continue
+            row['played'] += 1
+            row['goals_for'] += scored
+            row['goals_against'] += conceded
+            if scored > conceded:
+                row['won'] += 1
+                row['points'] += 3
+            elif scored == conceded:
+                row['drawn'] += 1
+                row['points'] += 1
+            else:
+                row['lost'] += 1
+
+    def group_table(self, competition, group_name):
+        """Group standings, best first (same order as generate_knockout_draw)"""
+        rows = [row for (comp, group, _), row in self.groups.items() if comp == competition and group == group_name]
+        return sorted(rows, key=lambda r: (-r['points'], -(r['goals_for'] - r['goals_against']), -r['goals_for']))
+
+    # ========== KNOCKOUTS ==========
+
+    async def play_knockouts(self):
+        """Draw (where not drawn yet), simulate and decide every remaining knockout round"""
+        for stage in KNOCKOUT_STAGES:
+            for competition in COMPETITIONS:
+                if not self.stage_ties(competition, stage):
+                    self._draw(competition, stage)
+
+            fixtures = [
+                f for f in self.fixtures
+                if f['stage'] == stage and f['competition'] in COMPETITIONS and not f['played']
+            ]
+            home_scores, away_scores = await simulate_fixture_scores(fixtures)
+            for fixture, home_score, away_score in zip(fixtures, home_scores, away_scores):
+                self._record(fixture, home_score, away_score)
+            self.knockout_matches += len(fixtures)
+
+            for competition in COMPETITIONS:
+                for tie in self.stage_ties(competition, stage):
+                    if tie['winner_team_id'] is None:
+                        self._decide(tie, stage)
+
+    def stage_ties(self, competition, stage):
+        return [t for t in self.ties if t['competition'] == competition and t['stage'] == stage]
+
+    def _draw(self, competition, stage):
+        if stage == 'r16':
+            winners, runners_up = [], []
+            for group_name in GROUP_NAMES:
+                table = self.group_table(competition, group_name)
+                if len(table) >= 2:
+                    winners.append(table[0])
+                    runners_up.append(table[1])
+            pairs = draw_r16_pairs(winners, runners_up)
+        else:
+            prev_stage = KNOCKOUT_STAGES[KNOCKOUT_STAGES.index(stage) - 1]
+            pairs = draw_next_round_pairs(
+                t['winner_team_id'] for t in self.stage_ties(competition, prev_stage) if t['winner_team_id']
+            )
+
+        weeks, match_day = knockout_schedule(stage)
+        for home_team_id, away_team_id in pairs:
+            # Placeholder id (negative) until commit() reserves real tie_ids
+            self._new_tie_ids += 1
+            tie = {
+                'tie_id': -self._new_tie_ids, 'competition': competition, 'stage': stage,
+                'home_team_id': home_team_id, 'away_team_id': away_team_id,
+                'first_leg_home_score': 0, 'first_leg_away_score': 0,
+                'second_leg_home_score': 0, 'second_leg_away_score': 0,
+                'aggregate_home': 0, 'aggregate_away': 0, 'winner_team_id': None,
+                'first_leg_played': False, 'second_leg_played': False,
+                'penalties_taken': False, 'penalty_winner': None, 'season': self.season,
+            }
+            self.ties.append(tie)
+
+            legs = [(1, home_team_id, away_team_id)]
+            if stage != 'final':
+                legs.append((2, away_team_id, home_team_id))
+            for leg, home, away in legs:
+                self.fixtures.append({
+                    'fixture_id': None, 'competition': competition, 'stage': stage, 'group_name': None,
+                    'home_team_id': home, 'away_team_id': away, 'week_number': weeks[leg - 1],
+                    'match_day': match_day, 'home_score': None, 'away_score': None,
+                    'played': False, 'playable': False, 'season': self.season, 'leg': leg,
+                    'tie_id': tie['tie_id'],
+                })
+
+    def _decide(self, tie, stage):
+        legs = sorted((f for f in self.fixtures if f['tie_id'] == tie['tie_id'] and f['played']),
+                      key=lambda f: f['leg'])
+
+        if stage == 'final':
+            if not legs:
+                return
+            final = legs[0]
+            winner = determine_single_leg_winner(final['home_team_id'], final['away_team_id'],
+                                                 final['home_score'], final['away_score'])
+            tie['first_leg_home_score'], tie['first_leg_away_score'] = final['home_score'], final['away_score']
+            tie['aggregate_home'], tie['aggregate_away'] = final['home_score'], final['away_score']
+            tie['first_leg_played'] = True
+            penalties = final['home_score'] == final['away_score']
+        else:
+            if len(legs) < 2:
+                return
+            first, second = legs[0], legs[1]
+            winner = determine_two_leg_winner(first, second)
+            tie['first_leg_home_score'], tie['first_leg_away_score'] = first['home_score'], first['away_score']
+            tie['second_leg_home_score'], tie['second_leg_away_score'] = second['home_score'], second['away_score']
+            tie['aggregate_home'] = first['home_score'] + second['away_score']
+            tie['aggregate_away'] = first['away_score'] + second['home_score']
+            tie['first_leg_played'] = tie['second_leg_played'] = True
+            penalties = (tie['aggregate_home'] == tie['aggregate_away']
+                         and second['away_score'] == first['away_score'])
+
+        tie['winner_team_id'] = winner
+        if penalties:
+            tie['penalties_taken'] = True
+            tie['penalty_winner'] = winner
+        self._decided.add(id(tie))
+
+    def _record(self, fixture, home_score, away_score):
+        fixture['home_score'], fixture['away_score'] = int(home_score), int(away_score)
+        fixture['played'] = True
+        fixture['playable'] = False
+        self._played.add(id(fixture))
+
+    def winner(self, competition):
+        """Winning team_id of the competition's final (None if undecided)"""
+        finals = self.stage_ties(competition, 'final')
+        return finals[0]['winner_team_id'] if finals else None
+
+    # ========== COMMIT ==========
+
+    async def commit(self, conn):
+        """Write everything simulated in memory (call inside the loading transaction)"""
+        # Real tie_ids for ties drawn in memory
+        new_ties = [t for t in self.ties if t['tie_id'] < 0]
+        if new_ties:
+            ids = await conn.fetch(
+                "SELECT nextval(pg_get_serial_sequence('european_knockout', 'tie_id')) AS tie_id "
+                "FROM generate_series(1, $1)", len(new_ties)
+            )
+            real_ids = {tie['tie_id']: row['tie_id'] for tie, row in zip(new_ties, ids)}
+            for tie in new_ties:
+                tie['tie_id'] = real_ids[tie['tie_id']]
+            for fixture in self.fixtures:
+                if fixture['tie_id'] is not None and fixture['tie_id'] < 0:
+                    fixture['tie_id'] = real_ids[fixture['tie_id']]
+
+            await conn.copy_records_to_table('european_knockout', records=[
+                tuple(t[c] for c in KNOCKOUT_COLUMNS) for t in new_ties
+            ], columns=list(KNOCKOUT_COLUMNS))
+
+        new_fixtures = [f for f in self.fixtures if f['fixture_id'] is None]
+        if new_fixtures:
+            await conn.copy_records_to_table('european_fixtures', records=[
+                tuple(f[c] for c in FIXTURE_COLUMNS) for f in new_fixtures
+            ], columns=list(FIXTURE_COLUMNS))
+
+        played = [f for f in self.fixtures if f['fixture_id'] is not None and id(f) in self._played]
+        if played:
+            await conn.execute("""
+                UPDATE european_fixtures AS f
+                SET home_score = r.home_score, away_score = r.away_score, played = TRUE, playable = FALSE
+                FROM UNNEST($1::int[], $2::int[], $3::int[]) AS r(fixture_id, home_score, away_score)
+                WHERE f.fixture_id = r.fixture_id
+            """, [f['fixture_id'] for f in played], [f['home_score'] for f in played],
+                [f['away_score'] for f in played])
+
+        if self.group_matches:
+            rows = list(self.groups.values())
+            await conn.execute("""
+                UPDATE european_groups AS g
+                SET played = r.played, won = r.won, drawn = r.drawn, lost = r.lost,
+                    goals_for = r.goals_for, goals_against = r.goals_against, points = r.points
+                FROM UNNEST($1::int[], $2::int[], $3::int[], $4::int[], $5::int[], $6::int[], $7::int[], $8::int[])
+                     AS r(id, played, won, drawn, lost, goals_for, goals_against, points)
+                WHERE g.id = r.id
+            """, [r['id'] for r in rows], [r['played'] for r in rows], [r['won'] for r in rows],
+                [r['drawn'] for r in rows], [r['lost'] for r in rows], [r['goals_for'] for r in rows],
+                [r['goals_against'] for r in rows], [r['points'] for r in rows])
+
+        new_tie_keys = {id(t) for t in new_ties}
+        decided = [t for t in self.ties if id(t) in self._decided and id(t) not in new_tie_keys]
+        if decided:
+            await conn.execute("""
+                UPDATE european_knockout AS k
+                SET first_leg_home_score = r.fl_home, first_leg_away_score = r.fl_away,
+                    second_leg_home_score = r.sl_home, second_leg_away_score = r.sl_away,
+                    aggregate_home = r.agg_home, aggregate_away = r.agg_away,
+                    winner_team_id = r.winner, first_leg_played = r.fl_played,
+                    second_leg_played = r.sl_played, penalties_taken = r.penalties,
+                    penalty_winner = r.penalty_winner
+                FROM UNNEST($1::int[], $2::int[], $3::int[], $4::int[], $5::int[], $6::int[], $7::int[],
+                            $8::text[], $9::bool[], $10::bool[], $11::bool[], $12::text[])
+                     AS r(tie_id, fl_home, fl_away, sl_home, sl_away, agg_home, agg_away,
+                          winner, fl_played, sl_played, penalties, penalty_winner)
+                WHERE k.tie_id = r.tie_id
+            """, *[[t[c] for t in decided] for c in (
+                'tie_id', 'first_leg_home_score', 'first_leg_away_score', 'second_leg_home_score',
+                'second_leg_away_score', 'aggregate_home', 'aggregate_away', 'winner_team_id',
+                'first_leg_played', 'second_leg_played', 'penalties_taken', 'penalty_winner')])
+
+        logger.info(f"🏆 European season {self.season} committed: {self.group_matches} group + "
+                    f"{self.knockout_matches} knockout matches, {len(new_ties)} new ties")
+
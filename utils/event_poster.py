@@ -7,9 +7,9 @@ Posts beautiful, themed news embeds to Discord channels with side-by-side team c
 import discord
 from database import db
 import config
-from io import BytesIO
-from PIL import Image
-import aiohttp
+from utils.crest_service import crest_service
+from utils.standings import standings
+from utils.broadcast import broadcaster, BroadcastMessage, NEWS_CHANNELS, EUROPEAN_NEWS_CHANNELS, PREVIEW_CHANNELS
 
 # ========================================
 # NEWS CATEGORY GIF/LOGO URLS
@@ -36,77 +36,6 @@ NEWS_CATEGORY_GIFS = {
 }
 
 
-async def generate_crests_image(home_crest_url, away_crest_url):
-    """
-    Generate combined image with both team crests side by side
-    Matches the European commands style
-
-    Args:
-        home_crest_url: URL for home team crest
-        away_crest_url: URL for away team crest
-
-    Returns:
-        BytesIO buffer with PNG image, or None if failed
-    """
-    try:
-        async with aiohttp.ClientSession() as session:
-            home_img_bytes = None
-            away_img_bytes = None
-
-            # Download home crest
-            if home_crest_url:
-                try:
-                    async with session.get(home_crest_url, timeout=aiohttp.ClientTimeout(total=5)) as r:
-                        if r.status == 200:
-                            home_img_bytes = await r.read()
-                except Exception as e:
-                    print(f"  ⚠️ Could not fetch home crest: {e}")
-
-            # Download away crest
-            if away_crest_url:
-                try:
-                    async with session.get(away_crest_url, timeout=aiohttp.ClientTimeout(total=5)) as r:
-                        if r.status == 200:
-                            away_img_bytes = await r.read()
-                except Exception as e:
-                    print(f"  ⚠️ Could not fetch away crest: {e}")
-
-        # Create combined image
-        size = (100, 100)  # Size for each crest
-        padding = 40  # Space between crests
-        width = size[0] * 2 + padding
-        height = size[1]
-
-        # Create transparent background
-        img = Image.new("RGBA", (width, height), (255, 255, 255, 0))
-
-        # Add home crest (left side)
-        if home_img_bytes:
-            try:
-                home = Image.open(BytesIO(home_img_bytes)).convert("RGBA").resize(size, Image.Resampling.LANCZOS)
-                img.paste(home, (0, 0), home)
-            except Exception as e:
-                print(f"  ⚠️ Could not process home crest: {e}")
-
-        # Add away crest (right side)
-        if away_img_bytes:
-            try:
-                away = Image.open(BytesIO(away_img_bytes)).convert("RGBA").resize(size, Image.Resampling.LANCZOS)
-                img.paste(away, (size[0] + padding, 0), away)
-            except Exception as e:
-                print(f"  ⚠️ Could not process away crest: {e}")
-
-        # Save to buffer
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        return buffer
-
-    except Exception as e:
-        print(f"  ❌ Error generating crests image: {e}")
-        return None
-
-
 async def post_transfer_news_to_channel(bot, guild, transfer_info):
     """
     Post a transfer announcement to the transfer-news channel WITH CLUB CRESTS
@@ -209,7 +138,7 @@ async def post_transfer_news_to_channel(bot, guild, transfer_info):
 
             # Generate combined crests image
             if from_crest or to_crest:
-                crests_buffer = await generate_crests_image(from_crest, to_crest)
+                crests_buffer = await crest_service.get_composite(from_crest, to_crest)
                 if crests_buffer:
                     file = discord.File(fp=crests_buffer, filename="transfer_crests.png")
                     embed.set_image(url="attachment://transfer_crests.png")
@@ -393,7 +322,7 @@ async def post_match_result_to_channel(bot, guild, fixture, home_score, away_sco
         
         # Add crests image if available
         if home_crest or away_crest:
-            crests_buffer = await generate_crests_image(home_crest, away_crest)
+            crests_buffer = await crest_service.get_composite(home_crest, away_crest)
             if crests_buffer:
                 crests_file = discord.File(fp=crests_buffer, filename="match_crests.png")
                 files_to_send.append(crests_file)
@@ -428,22 +357,24 @@ async def post_european_results(bot, competition, week_number):
 
     try:
         async with db.pool.acquire() as conn:
-            results = await conn.fetch("""
-                                       SELECT f.*,
-                                              f.home_team_id,
-                                              f.away_team_id,
-                                              COALESCE(t1.team_name, et1.team_name) as home_name,
-                                              COALESCE(t2.team_name, et2.team_name) as away_name
-                                       FROM european_fixtures f
-                                                LEFT JOIN teams t1 ON f.home_team_id = t1.team_id
-                                                LEFT JOIN teams t2 ON f.away_team_id = t2.team_id
-                                                LEFT JOIN european_teams et1 ON f.home_team_id = et1.team_id
-                                                LEFT JOIN european_teams et2 ON f.away_team_id = et2.team_id
-                                       WHERE f.competition = $1
-                                         AND f.week_number = $2
-                                         AND f.played = TRUE
-                                       ORDER BY f.home_score + f.away_score DESC
-                                       """, competition, week_number)
+            rows = await conn.fetch("""
+                                    SELECT f.*
+                                    FROM european_fixtures f
+                                    WHERE f.competition = $1
+                                      AND f.week_number = $2
+                                      AND f.played = TRUE
+                                    ORDER BY f.home_score + f.away_score DESC
+                                    """, competition, week_number)
+
+        # Team names from the team directory instead of four joins
+        from utils.team_directory import team_directory
+        await team_directory.ensure_loaded()
+        results = [
+            {**dict(row),
+             'home_name': team_directory.name(row['home_team_id'], default=None),
+             'away_name': team_directory.name(row['away_team_id'], default=None)}
+            for row in rows
+        ]
 
         if not results:
             print(f"  📰 No {comp_name} results for Week {week_number}")
@@ -452,107 +383,88 @@ async def post_european_results(bot, competition, week_number):
         from utils.football_data_api import get_team_crest_url, get_competition_logo
         comp_logo = get_competition_logo(comp_name)
 
-        # Post to all guilds
-        for guild in bot.guilds:
-            try:
-                # Find appropriate channel
-                news_channel = discord.utils.get(guild.text_channels, name='european-news')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='news-feed')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='general')
-
-                if not news_channel:
-                    continue
-
-                # 🆕 POST CATEGORY GIF based on competition
-                gif_key = 'champions_league_results' if competition == 'CL' else 'europa_league_results'
-                await news_channel.send(NEWS_CATEGORY_GIFS[gif_key])
-
-                # Send header message
-                header = f"## {comp_emoji} {comp_name} Results - Week {week_number}\n"
-                header += f"**{len(results)} matches completed**"
-
-                await news_channel.send(header)
-
-                # Create beautiful result embeds (max 10 per batch)
-                for idx, result in enumerate(results[:10]):
-                    # Get crests
-                    home_crest = get_team_crest_url(result['home_team_id'])
-                    away_crest = get_team_crest_url(result['away_team_id'])
-
-                    # Determine result
-                    if result['home_score'] > result['away_score']:
-                        result_emoji = "🏆"
-                        winner_text = f"**{result['home_name']} wins!**"
-                    elif result['away_score'] > result['home_score']:
-                        result_emoji = "🏆"
-                        winner_text = f"**{result['away_name']} wins!**"
-                    else:
-                        result_emoji = "🤝"
-                        winner_text = "**Draw!**"
-
-                    # Stage info
-                    if result['stage'] == 'group':
-                        stage_text = f"Group {result.get('group_name', '?')}"
-                    else:
-                        leg = f" - Leg {result['leg']}" if result.get('leg', 1) > 1 else ""
-                        stage_text = f"{result['stage'].title()}{leg}"
-
-                    embed = discord.Embed(
-                        title=f"{comp_emoji} {comp_name} - {stage_text}",
-                        description=f"## {result['home_name']} **{result['home_score']} - {result['away_score']}** {result['away_name']}\n\n{result_emoji} {winner_text}",
-                        color=comp_color
-                    )
-
-                    # Competition logo as thumbnail
-                    if comp_logo:
-                        embed.set_thumbnail(url=comp_logo)
+        # 🆕 POST CATEGORY GIF based on competition
+        gif_key = 'champions_league_results' if competition == 'CL' else 'europa_league_results'
+        messages = [BroadcastMessage(content=NEWS_CATEGORY_GIFS[gif_key])]
+
+        # Send header message
+        header = f"## {comp_emoji} {comp_name} Results - Week {week_number}\n"
+        header += f"**{len(results)} matches completed**"
+
+        messages.append(BroadcastMessage(content=header))
+
+        # Create beautiful result embeds (max 10 per batch)
+        for idx, result in enumerate(results[:10]):
+            # Get crests
+            home_crest = get_team_crest_url(result['home_team_id'])
+            away_crest = get_team_crest_url(result['away_team_id'])
+
+            # Determine result
+            if result['home_score'] > result['away_score']:
+                result_emoji = "🏆"
+                winner_text = f"**{result['home_name']} wins!**"
+            elif result['away_score'] > result['home_score']:
+                result_emoji = "🏆"
+                winner_text = f"**{result['away_name']} wins!**"
+            else:
+                result_emoji = "🤝"
+                winner_text = "**Draw!**"
 
-                    # Home team crest as author
-                    if home_crest:
-                        embed.set_author(name=result['home_name'], icon_url=home_crest)
+            # Stage info
+            if result['stage'] == 'group':
+                stage_text = f"Group {result.get('group_name', '?')}"
+            else:
+                leg = f" - Leg {result['leg']}" if result.get('leg', 1) > 1 else ""
+                stage_text = f"{result['stage'].title()}{leg}"
 
-                    # Match stats
-                    embed.add_field(
-                        name="📊 Match Info",
-                        value=f"**Week:** {week_number}\n**Stage:** {stage_text}",
-                        inline=True
-                    )
+            embed = discord.Embed(
+                title=f"{comp_emoji} {comp_name} - {stage_text}",
+                description=f"## {result['home_name']} **{result['home_score']} - {result['away_score']}** {result['away_name']}\n\n{result_emoji} {winner_text}",
+                color=comp_color
+            )
 
-                    # Goal scorers would go here if tracked
-                    total_goals = result['home_score'] + result['away_score']
-                    if total_goals >= 4:
-                        embed.add_field(
-                            name="⚽ Goals",
-                            value=f"🔥 **{total_goals} goal thriller!**",
-                            inline=True
-                        )
+            # Competition logo as thumbnail
+            if comp_logo:
+                embed.set_thumbnail(url=comp_logo)
 
-                    # Generate combined crests image
-                    if home_crest or away_crest:
-                        crests_buffer = await generate_crests_image(home_crest, away_crest)
-                        if crests_buffer:
-                            file = discord.File(fp=crests_buffer, filename=f"euro_crests_{idx}.png")
-                            embed.set_image(url=f"attachment://euro_crests_{idx}.png")
+            # Home team crest as author
+            if home_crest:
+                embed.set_author(name=result['home_name'], icon_url=home_crest)
 
-                            # Away team crest as footer
-                            if away_crest:
-                                embed.set_footer(text=result['away_name'], icon_url=away_crest)
+            # Match stats
+            embed.add_field(
+                name="📊 Match Info",
+                value=f"**Week:** {week_number}\n**Stage:** {stage_text}",
+                inline=True
+            )
 
-                            await news_channel.send(embed=embed, file=file)
-                            continue
+            # Goal scorers would go here if tracked
+            total_goals = result['home_score'] + result['away_score']
+            if total_goals >= 4:
+                embed.add_field(
+                    name="⚽ Goals",
+                    value=f"🔥 **{total_goals} goal thriller!**",
+                    inline=True
+                )
 
-                    # Fallback without image
-                    if away_crest:
-                        embed.set_footer(text=result['away_name'], icon_url=away_crest)
+            # Away team crest as footer
+            if away_crest:
+                embed.set_footer(text=result['away_name'], icon_url=away_crest)
 
-                    await news_channel.send(embed=embed)
+            # Generate combined crests image (once, shared by every guild)
+            crests_buffer = None
+            if home_crest or away_crest:
+                crests_buffer = await crest_service.get_composite(home_crest, away_crest)
 
-                print(f"  ✅ Posted beautiful {comp_name} results to {guild.name}")
+            if crests_buffer:
+                embed.set_image(url=f"attachment://euro_crests_{idx}.png")
+                messages.append(BroadcastMessage(embed=embed, file_bytes=crests_buffer.getvalue(),
+                                                 filename=f"euro_crests_{idx}.png"))
+            else:
+                messages.append(BroadcastMessage(embed=embed))
 
-            except Exception as e:
-                print(f"  ❌ Could not post to {guild.name}: {e}")
+        report = await broadcaster.broadcast(bot, f"{competition.lower()}_results", messages, EUROPEAN_NEWS_CHANNELS)
+        print(f"  ✅ Posted beautiful {comp_name} results to {report.delivered}/{report.guilds} guilds")
 
     except Exception as e:
         print(f"❌ Error in post_european_results: {e}")
@@ -565,504 +477,469 @@ async def post_weekly_news_digest(bot, week_number: int):
     🆕 PREMIUM MULTI-EMBED WEEKLY NEWS DIGEST WITH CRESTS
     Posts 5-7 separate themed embeds for comprehensive coverage
     ✅ FIXED: UPCOMING FIXTURES checks if players participate in European matches
+    Built once, then broadcast to every guild concurrently
     """
     try:
         state = await db.get_game_state()
+        messages = []
 
-        # Post to all guilds
-        for guild in bot.guilds:
-            try:
-                news_channel = discord.utils.get(guild.text_channels, name="news-feed")
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name="general")
-
-                if not news_channel:
-                    continue
+        # 🆕 POST CATEGORY GIF for weekly digest header
+        messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['weekly_digest_header']))
 
-                # 🆕 POST CATEGORY GIF for weekly digest header
-                await news_channel.send(NEWS_CATEGORY_GIFS['weekly_digest_header'])
+        # Header message
+        header_msg = (
+            f"# 📰 WEEK {week_number} REVIEW\n"
+            f"**Season {state['current_season']} • {config.SEASON_TOTAL_WEEKS - week_number} weeks remaining**\n"
+            f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        )
+        messages.append(BroadcastMessage(content=header_msg))
 
-                # Header message
-                header_msg = (
-                    f"# 📰 WEEK {week_number} REVIEW\n"
-                    f"**Season {state['current_season']} • {config.SEASON_TOTAL_WEEKS - week_number} weeks remaining**\n"
-                    f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        # 1️⃣ MATCH OF THE WEEK
+        async with db.pool.acquire() as conn:
+            motw = await conn.fetchrow("""
+                                       SELECT f.*,
+                                              ht.team_name                  as home_name,
+                                              at.team_name                  as away_name,
+                                              (f.home_score + f.away_score) as total_goals
+                                       FROM fixtures f
+                                                JOIN teams ht ON f.home_team_id = ht.team_id
+                                                JOIN teams at
+                                       ON f.away_team_id = at.team_id
+                                       WHERE f.week_number = $1 AND f.played = TRUE
+                                       ORDER BY total_goals DESC, ABS(f.home_score - f.away_score) DESC
+                                           LIMIT 1
+                                       """, week_number)
+
+            if motw:
+                # 🆕 POST CATEGORY GIF for Match of the Week
+                messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['match_of_week']))
+
+                from utils.football_data_api import get_team_crest_url
+                home_crest = get_team_crest_url(motw['home_team_id'])
+                away_crest = get_team_crest_url(motw['away_team_id'])
+
+                motw_embed = discord.Embed(
+                    title="🏆 MATCH OF THE WEEK",
+                    description=f"## {motw['home_name']} **{motw['home_score']}** - **{motw['away_score']}** {motw['away_name']}",
+                    color=discord.Color.gold()
                 )
-                await news_channel.send(header_msg)
-
-                embeds_to_send = []
-                files_to_send = []
-
-                # 1️⃣ MATCH OF THE WEEK
-                async with db.pool.acquire() as conn:
-                    motw = await conn.fetchrow("""
-                                               SELECT f.*,
-                                                      ht.team_name                  as home_name,
-                                                      at.team_name                  as away_name,
-                                                      (f.home_score + f.away_score) as total_goals
-                                               FROM fixtures f
-                                                        JOIN teams ht ON f.home_team_id = ht.team_id
-                                                        JOIN teams at
-                                               ON f.away_team_id = at.team_id
-                                               WHERE f.week_number = $1 AND f.played = TRUE
-                                               ORDER BY total_goals DESC, ABS(f.home_score - f.away_score) DESC
-                                                   LIMIT 1
-                                               """, week_number)
-
-                    if motw:
-                        # 🆕 POST CATEGORY GIF for Match of the Week
-                        await news_channel.send(NEWS_CATEGORY_GIFS['match_of_week'])
-
-                        from utils.football_data_api import get_team_crest_url
-                        home_crest = get_team_crest_url(motw['home_team_id'])
-                        away_crest = get_team_crest_url(motw['away_team_id'])
-
-                        motw_embed = discord.Embed(
-                            title="🏆 MATCH OF THE WEEK",
-                            description=f"## {motw['home_name']} **{motw['home_score']}** - **{motw['away_score']}** {motw['away_name']}",
-                            color=discord.Color.gold()
-                        )
-
-                        if home_crest:
-                            motw_embed.set_author(name=motw['home_name'], icon_url=home_crest)
-
-                        # FIXED: JOIN with players table for goal scorers
-                        goal_scorers = await conn.fetch("""
-                                                        SELECT p.player_name, p.team_id, me.event_type
-                                                        FROM match_events me
-                                                                 JOIN players p ON me.user_id = p.user_id
-                                                        WHERE me.fixture_id = $1
-                                                          AND me.event_type IN ('goal', 'penalty_goal')
-                                                        ORDER BY me.minute
-                                                        """, motw['fixture_id'])
-
-                        if goal_scorers:
-                            home_scorers = [g['player_name'] for g in goal_scorers if
-                                            g['team_id'] == motw['home_team_id']]
-                            away_scorers = [g['player_name'] for g in goal_scorers if
-                                            g['team_id'] == motw['away_team_id']]
-
-                            scorers_text = ""
-                            if home_scorers:
-                                scorers_text += f"⚽ **{motw['home_name']}:** {', '.join(home_scorers)}\n"
-                            if away_scorers:
-                                scorers_text += f"⚽ **{motw['away_name']}:** {', '.join(away_scorers)}\n"
-
-                            if scorers_text:
-                                motw_embed.add_field(
-                                    name="⚽ Goal Scorers",
-                                    value=scorers_text,
-                                    inline=False
-                                )
-
-                        if motw['total_goals'] >= 5:
-                            motw_embed.add_field(
-                                name="🔥 Goal Fest!",
-                                value=f"**{motw['total_goals']} goals** in an absolute thriller!",
-                                inline=True
-                            )
-
-                        # FIXED: Get match_id first, then get MOTM
-                        match_id = await conn.fetchval("""
-                                                       SELECT match_id
-                                                       FROM active_matches
-                                                       WHERE fixture_id = $1
-                                                       """, motw['fixture_id'])
-
-                        if match_id:
-                            motm = await conn.fetchrow("""
-                                                       SELECT p.player_name, mp.match_rating
-                                                       FROM match_participants mp
-                                                                JOIN players p ON mp.user_id = p.user_id
-                                                       WHERE mp.match_id = $1
-                                                         AND mp.motm = TRUE LIMIT 1
-                                                       """, match_id)
-
-                            if motm:
-                                motw_embed.add_field(
-                                    name="⭐ Man of the Match",
-                                    value=f"**{motm['player_name']}** ({motm['match_rating']:.1f} rating)",
-                                    inline=True
-                                )
-
-                        if motw['home_score'] > motw['away_score']:
-                            winner = motw['home_name']
-                            result_emoji = "🏆"
-                        elif motw['away_score'] > motw['home_score']:
-                            winner = motw['away_name']
-                            result_emoji = "🏆"
-                        else:
-                            winner = "Both teams share"
-                            result_emoji = "🤝"
 
+                if home_crest:
+                    motw_embed.set_author(name=motw['home_name'], icon_url=home_crest)
+
+                # FIXED: JOIN with players table for goal scorers
+                goal_scorers = await conn.fetch("""
+                                                SELECT p.player_name, p.team_id, me.event_type
+                                                FROM match_events me
+                                                         JOIN players p ON me.user_id = p.user_id
+                                                WHERE me.fixture_id = $1
+                                                  AND me.event_type IN ('goal', 'penalty_goal')
+                                                ORDER BY me.minute
+                                                """, motw['fixture_id'])
+
+                if goal_scorers:
+                    home_scorers = [g['player_name'] for g in goal_scorers if
+                                    g['team_id'] == motw['home_team_id']]
+                    away_scorers = [g['player_name'] for g in goal_scorers if
+                                    g['team_id'] == motw['away_team_id']]
+
+                    scorers_text = ""
+                    if home_scorers:
+                        scorers_text += f"⚽ **{motw['home_name']}:** {', '.join(home_scorers)}\n"
+                    if away_scorers:
+                        scorers_text += f"⚽ **{motw['away_name']}:** {', '.join(away_scorers)}\n"
+
+                    if scorers_text:
                         motw_embed.add_field(
-                            name=f"{result_emoji} Result",
-                            value=f"**{winner}** the points in Week {week_number}'s standout fixture",
+                            name="⚽ Goal Scorers",
+                            value=scorers_text,
                             inline=False
                         )
 
-                        if home_crest or away_crest:
-                            crests_buffer = await generate_crests_image(home_crest, away_crest)
-                            if crests_buffer:
-                                file = discord.File(fp=crests_buffer, filename="motw_crests.png")
-                                motw_embed.set_image(url="attachment://motw_crests.png")
-                                await news_channel.send(embed=motw_embed, file=file)
-                            else:
-                                if away_crest:
-                                    motw_embed.set_footer(text=motw['away_name'], icon_url=away_crest)
-                                await news_channel.send(embed=motw_embed)
-                        else:
-                            if away_crest:
-                                motw_embed.set_footer(text=motw['away_name'], icon_url=away_crest)
-                            await news_channel.send(embed=motw_embed)
-
-                # 2️⃣ PREMIER LEAGUE TABLE
-                async with db.pool.acquire() as conn:
-                    pl_standings = await conn.fetch("""
-                                                    SELECT team_name,
-                                                           points,
-                                                           played,
-                                                           won,
-                                                           drawn,
-                                                           lost,
-                                                           goals_for,
-                                                           goals_against,
-                                                           (goals_for - goals_against) as gd
-                                                    FROM teams
-                                                    WHERE league = 'Premier League'
-                                                    ORDER BY points DESC, gd DESC, goals_for DESC
-                                                    """)
-
-                    if pl_standings:
-                        # 🆕 POST CATEGORY GIF for League Table
-                        await news_channel.send(NEWS_CATEGORY_GIFS['league_table'])
-
-                        table_embed = discord.Embed(
-                            title="📊 PREMIER LEAGUE TABLE",
-                            description="**Current Standings**",
-                            color=discord.Color.purple()
+                if motw['total_goals'] >= 5:
+                    motw_embed.add_field(
+                        name="🔥 Goal Fest!",
+                        value=f"**{motw['total_goals']} goals** in an absolute thriller!",
+                        inline=True
+                    )
+
+                # FIXED: Get match_id first, then get MOTM
+                match_id = await conn.fetchval("""
+                                               SELECT match_id
+                                               FROM active_matches
+                                               WHERE fixture_id = $1
+                                               """, motw['fixture_id'])
+
+                if match_id:
+                    motm = await conn.fetchrow("""
+                                               SELECT p.player_name, mp.match_rating
+                                               FROM match_participants mp
+                                                        JOIN players p ON mp.user_id = p.user_id
+                                               WHERE mp.match_id = $1
+                                                 AND mp.motm = TRUE LIMIT 1
+                                               """, match_id)
+
+                    if motm:
+                        motw_embed.add_field(
+                            name="⭐ Man of the Match",
+                            value=f"**{motm['player_name']}** ({motm['match_rating']:.1f} rating)",
+                            inline=True
                         )
 
-                        top4_text = ""
-                        for i, team in enumerate(pl_standings[:4], 1):
-                            emoji = ["🥇", "🥈", "🥉", "4️⃣"][i - 1]
-                            top4_text += f"{emoji} **{team['team_name']}** - {team['points']} pts\n"
-                            top4_text += f"   {team['won']}W {team['drawn']}D {team['lost']}L • GD {team['gd']:+d}\n"
+                if motw['home_score'] > motw['away_score']:
+                    winner = motw['home_name']
+                    result_emoji = "🏆"
+                elif motw['away_score'] > motw['home_score']:
+                    winner = motw['away_name']
+                    result_emoji = "🏆"
+                else:
+                    winner = "Both teams share"
+                    result_emoji = "🤝"
 
-                        table_embed.add_field(
-                            name="🏆 Champions League Zone",
-                            value=top4_text,
-                            inline=False
-                        )
+                motw_embed.add_field(
+                    name=f"{result_emoji} Result",
+                    value=f"**{winner}** the points in Week {week_number}'s standout fixture",
+                    inline=False
+                )
 
-                        if len(pl_standings) >= 6:
-                            europa_text = ""
-                            for i, team in enumerate(pl_standings[4:6], 5):
-                                europa_text += f"{i}. **{team['team_name']}** - {team['points']} pts\n"
+                crests_buffer = None
+                if home_crest or away_crest:
+                    crests_buffer = await crest_service.get_composite(home_crest, away_crest)
 
-                            table_embed.add_field(
-                                name="🌟 Europa League Zone",
-                                value=europa_text,
-                                inline=False
-                            )
+                if crests_buffer:
+                    motw_embed.set_image(url="attachment://motw_crests.png")
+                    messages.append(BroadcastMessage(embed=motw_embed, file_bytes=crests_buffer.getvalue(),
+                                                     filename="motw_crests.png"))
+                else:
+                    if away_crest:
+                        motw_embed.set_footer(text=motw['away_name'], icon_url=away_crest)
+                    messages.append(BroadcastMessage(embed=motw_embed))
 
-                        if len(pl_standings) >= 20:
-                            rel_text = ""
-                            for i, team in enumerate(pl_standings[-3:], len(pl_standings) - 2):
-                                rel_text += f"{i}. **{team['team_name']}** - {team['points']} pts ⚠️\n"
+        # 2️⃣ PREMIER LEAGUE TABLE
+        pl_standings = await standings.get_table('Premier League')
 
-                            table_embed.add_field(
-                                name="🔴 Relegation Zone",
-                                value=rel_text,
-                                inline=False
-                            )
+        if pl_standings:
+            # 🆕 POST CATEGORY GIF for League Table
+            messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['league_table']))
 
-                        table_embed.set_footer(text=f"Week {week_number} Standings")
-                        await news_channel.send(embed=table_embed)
-
-                # 3️⃣ PLAYER SPOTLIGHT
-                async with db.pool.acquire() as conn:
-                    top_players = await conn.fetch("""
-                                                   SELECT p.player_name,
-                                                          p.season_goals,
-                                                          p.season_assists,
-                                                          p.season_motm,
-                                                          t.team_name
-                                                   FROM players p
-                                                            LEFT JOIN teams t ON p.team_id = t.team_id
-                                                   WHERE p.retired = FALSE
-                                                     AND p.team_id != 'free_agent'
-                          AND (p.season_goals > 0 OR p.season_assists > 0 OR p.season_motm > 0)
-                                                   ORDER BY p.season_goals DESC, p.season_assists DESC
-                                                       LIMIT 5
-                                                   """)
-
-                    if top_players:
-                        # 🆕 POST CATEGORY GIF for Player Spotlight
-                        await news_channel.send(NEWS_CATEGORY_GIFS['player_spotlight'])
-
-                        player_embed = discord.Embed(
-                            title="⭐ PLAYER SPOTLIGHT",
-                            description="**Season Leaders**",
-                            color=discord.Color.orange()
-                        )
+            table_embed = discord.Embed(
+                title="📊 PREMIER LEAGUE TABLE",
+                description="**Current Standings**",
+                color=discord.Color.purple()
+            )
 
-                        scorers_text = ""
-                        for i, player in enumerate(top_players, 1):
-                            medal = ["🥇", "🥈", "🥉"][i - 1] if i <= 3 else f"{i}."
-                            scorers_text += (
-                                f"{medal} **{player['player_name']}** ({player['team_name']})\n"
-                                f"   ⚽ {player['season_goals']}G • 🎯 {player['season_assists']}A"
-                            )
-                            if player['season_motm'] > 0:
-                                scorers_text += f" • 🏅 {player['season_motm']} MOTM"
-                            scorers_text += "\n"
+            top4_text = ""
+            for i, team in enumerate(pl_standings[:4], 1):
+                emoji = ["🥇", "🥈", "🥉", "4️⃣"][i - 1]
+                top4_text += f"{emoji} **{team['team_name']}** - {team['points']} pts\n"
+                top4_text += f"   {team['won']}W {team['drawn']}D {team['lost']}L • GD {team['gd']:+d}\n"
 
-                        player_embed.add_field(
-                            name="👟 Top Performers",
-                            value=scorers_text,
-                            inline=False
-                        )
+            table_embed.add_field(
+                name="🏆 Champions League Zone",
+                value=top4_text,
+                inline=False
+            )
 
-                        await news_channel.send(embed=player_embed)
-
-                # 4️⃣ HOT & COLD
-                async with db.pool.acquire() as conn:
-                    hot_teams = await conn.fetch("""
-                                                 SELECT team_name, points, won
-                                                 FROM teams
-                                                 WHERE league = 'Premier League'
-                                                   AND won >= 3
-                                                 ORDER BY points DESC LIMIT 3
-                                                 """)
-
-                    cold_teams = await conn.fetch("""
-                                                  SELECT team_name, points, lost
-                                                  FROM teams
-                                                  WHERE league = 'Premier League'
-                                                    AND lost >= 3
-                                                  ORDER BY points ASC LIMIT 3
-                                                  """)
-
-                    if hot_teams or cold_teams:
-                        # 🆕 POST CATEGORY GIF for Form Guide
-                        await news_channel.send(NEWS_CATEGORY_GIFS['form_guide'])
-
-                        form_embed = discord.Embed(
-                            title="🔥 FORM GUIDE",
-                            description="**Hot & Cold Teams**",
-                            color=discord.Color.red()
-                        )
+            if len(pl_standings) >= 6:
+                europa_text = ""
+                for i, team in enumerate(pl_standings[4:6], 5):
+                    europa_text += f"{i}. **{team['team_name']}** - {team['points']} pts\n"
 
-                        if hot_teams:
-                            hot_text = ""
-                            for team in hot_teams:
-                                hot_text += f"🔥 **{team['team_name']}** - {team['won']} wins\n"
+                table_embed.add_field(
+                    name="🌟 Europa League Zone",
+                    value=europa_text,
+                    inline=False
+                )
 
-                            form_embed.add_field(
-                                name="📈 On Fire",
-                                value=hot_text,
-                                inline=True
-                            )
+            if len(pl_standings) >= 20:
+                rel_text = ""
+                for i, team in enumerate(pl_standings[-3:], len(pl_standings) - 2):
+                    rel_text += f"{i}. **{team['team_name']}** - {team['points']} pts ⚠️\n"
 
-                        if cold_teams:
-                            cold_text = ""
-                            for team in cold_teams:
-                                cold_text += f"❄️ **{team['team_name']}** - {team['lost']} losses\n"
+                table_embed.add_field(
+                    name="🔴 Relegation Zone",
+                    value=rel_text,
+                    inline=False
+                )
 
-                            form_embed.add_field(
-                                name="📉 Struggling",
-                                value=cold_text,
-                                inline=True
-                            )
+            table_embed.set_footer(text=f"Week {week_number} Standings")
+            messages.append(BroadcastMessage(embed=table_embed))
 
-                        await news_channel.send(embed=form_embed)
-
-                # 5️⃣ EUROPEAN SPOTLIGHT
-                if week_number in config.EUROPEAN_MATCH_WEEKS:
-                    async with db.pool.acquire() as conn:
-                        euro_count = await conn.fetchval("""
-                                                         SELECT COUNT(*)
-                                                         FROM european_fixtures
-                                                         WHERE week_number = $1
-                                                           AND played = TRUE
-                                                         """, week_number)
-
-                        if euro_count and euro_count > 0:
-                            # 🆕 POST CATEGORY GIF for European Spotlight
-                            await news_channel.send(NEWS_CATEGORY_GIFS['european_spotlight'])
-
-                            euro_embed = discord.Embed(
-                                title="🏆 EUROPEAN SPOTLIGHT",
-                                description=f"**Week {week_number} European Action**",
-                                color=discord.Color.blue()
-                            )
+        async with db.pool.acquire() as conn:
+            # 3️⃣ PLAYER SPOTLIGHT
+            top_players = await conn.fetch("""
+                                           SELECT p.player_name,
+                                                  p.season_goals,
+                                                  p.season_assists,
+                                                  p.season_motm,
+                                                  t.team_name
+                                           FROM players p
+                                                    LEFT JOIN teams t ON p.team_id = t.team_id
+                                           WHERE p.retired = FALSE
+                                             AND p.team_id != 'free_agent'
+                  AND (p.season_goals > 0 OR p.season_assists > 0 OR p.season_motm > 0)
+                                           ORDER BY p.season_goals DESC, p.season_assists DESC
+                                               LIMIT 5
+                                           """)
+
+            if top_players:
+                # 🆕 POST CATEGORY GIF for Player Spotlight
+                messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['player_spotlight']))
+
+                player_embed = discord.Embed(
+                    title="⭐ PLAYER SPOTLIGHT",
+                    description="**Season Leaders**",
+                    color=discord.Color.orange()
+                )
 
-                            english_results = await conn.fetch("""
-                                                               SELECT f.*,
-                                                                      COALESCE(ht.team_name, eht.team_name) as home_name,
-                                                                      COALESCE(at.team_name, eat.team_name) as away_name,
-                                                                      t.team_name                           as english_team
-                                                               FROM european_fixtures f
-                                                                        LEFT JOIN teams ht ON f.home_team_id = ht.team_id
-                                                                        LEFT JOIN teams at
-                                                               ON f.away_team_id = at.team_id
-                                                                   LEFT JOIN european_teams eht ON f.home_team_id = eht.team_id
-                                                                   LEFT JOIN european_teams eat ON f.away_team_id = eat.team_id
-                                                                   LEFT JOIN teams t ON (f.home_team_id = t.team_id OR f.away_team_id = t.team_id)
-                                                               WHERE f.week_number = $1
-                                                                 AND f.played = TRUE
-                                                                 AND t.league = 'Premier League'
-                                                                   LIMIT 5
-                                                               """, week_number)
-
-                            if english_results:
-                                results_text = ""
-                                for match in english_results:
-                                    comp = "⭐" if match['competition'] == 'CL' else "🌟"
-                                    results_text += (
-                                        f"{comp} **{match['home_name']}** {match['home_score']}-{match['away_score']} "
-                                        f"**{match['away_name']}**\n"
-                                    )
-
-                                euro_embed.add_field(
-                                    name="🏴󠁧󠁢󠁥󠁮󠁧󠁿 English Clubs",
-                                    value=results_text,
-                                    inline=False
-                                )
-
-                            euro_embed.add_field(
-                                name="📊 European Matches",
-                                value=f"**{euro_count}** matches played across CL & EL",
-                                inline=False
-                            )
+                scorers_text = ""
+                for i, player in enumerate(top_players, 1):
+                    medal = ["🥇", "🥈", "🥉"][i - 1] if i <= 3 else f"{i}."
+                    scorers_text += (
+                        f"{medal} **{player['player_name']}** ({player['team_name']})\n"
+                        f"   ⚽ {player['season_goals']}G • 🎯 {player['season_assists']}A"
+                    )
+                    if player['season_motm'] > 0:
+                        scorers_text += f" • 🏅 {player['season_motm']} MOTM"
+                    scorers_text += "\n"
+
+                player_embed.add_field(
+                    name="👟 Top Performers",
+                    value=scorers_text,
+                    inline=False
+                )
 
-                            await news_channel.send(embed=euro_embed)
+                messages.append(BroadcastMessage(embed=player_embed))
+
+            # 4️⃣ HOT & COLD
+            hot_teams = await conn.fetch("""
+                                         SELECT team_name, points, won
+                                         FROM teams
+                                         WHERE league = 'Premier League'
+                                           AND won >= 3
+                                         ORDER BY position LIMIT 3
+                                         """)
+
+            cold_teams = await conn.fetch("""
+                                          SELECT team_name, points, lost
+                                          FROM teams
+                                          WHERE league = 'Premier League'
+                                            AND lost >= 3
+                                          ORDER BY position DESC LIMIT 3
+                                          """)
+
+            if hot_teams or cold_teams:
+                # 🆕 POST CATEGORY GIF for Form Guide
+                messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['form_guide']))
+
+                form_embed = discord.Embed(
+                    title="🔥 FORM GUIDE",
+                    description="**Hot & Cold Teams**",
+                    color=discord.Color.red()
+                )
 
-                # 6️⃣ TRANSFER WINDOW
-                if state['current_week'] in config.TRANSFER_WINDOW_WEEKS:
-                    # 🆕 POST CATEGORY GIF for Transfer Window
-                    await news_channel.send(NEWS_CATEGORY_GIFS['transfer_window'])
+                if hot_teams:
+                    hot_text = ""
+                    for team in hot_teams:
+                        hot_text += f"🔥 **{team['team_name']}** - {team['won']} wins\n"
 
-                    transfer_embed = discord.Embed(
-                        title="💼 TRANSFER WINDOW OPEN",
-                        description="**The market is active!**",
-                        color=discord.Color.green()
+                    form_embed.add_field(
+                        name="📈 On Fire",
+                        value=hot_text,
+                        inline=True
                     )
 
-                    transfer_embed.add_field(
-                        name="🟢 Status",
-                        value="Transfer window is **OPEN**\nClubs are making moves!",
-                        inline=False
-                    )
+                if cold_teams:
+                    cold_text = ""
+                    for team in cold_teams:
+                        cold_text += f"❄️ **{team['team_name']}** - {team['lost']} losses\n"
 
-                    transfer_embed.add_field(
-                        name="📋 For Players",
-                        value="Use `/offers` to see which clubs want to sign you!",
-                        inline=False
+                    form_embed.add_field(
+                        name="📉 Struggling",
+                        value=cold_text,
+                        inline=True
                     )
 
-                    await news_channel.send(embed=transfer_embed)
+                messages.append(BroadcastMessage(embed=form_embed))
+
+            # 5️⃣ EUROPEAN SPOTLIGHT
+            if week_number in config.EUROPEAN_MATCH_WEEKS:
+                euro_count = await conn.fetchval("""
+                                                 SELECT COUNT(*)
+                                                 FROM european_fixtures
+                                                 WHERE week_number = $1
+                                                   AND played = TRUE
+                                                 """, week_number)
 
-                elif state['current_week'] + 1 in config.TRANSFER_WINDOW_WEEKS:
-                    # 🆕 POST CATEGORY GIF for Transfer Window Preview
-                    await news_channel.send(NEWS_CATEGORY_GIFS['transfer_window'])
+                if euro_count and euro_count > 0:
+                    # 🆕 POST CATEGORY GIF for European Spotlight
+                    messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['european_spotlight']))
 
-                    transfer_embed = discord.Embed(
-                        title="💼 TRANSFER WINDOW PREVIEW",
-                        description="**Window opens next week!**",
-                        color=discord.Color.gold()
+                    euro_embed = discord.Embed(
+                        title="🏆 EUROPEAN SPOTLIGHT",
+                        description=f"**Week {week_number} European Action**",
+                        color=discord.Color.blue()
                     )
 
-                    transfer_embed.add_field(
-                        name="⚠️ Next Week",
-                        value=f"Transfer window opens in **Week {state['current_week'] + 1}**\nPrepare for offers!",
+                    english_results = await conn.fetch("""
+                                                       SELECT f.*,
+                                                              COALESCE(ht.team_name, eht.team_name) as home_name,
+                                                              COALESCE(at.team_name, eat.team_name) as away_name,
+                                                              t.team_name                           as english_team
+                                                       FROM european_fixtures f
+                                                                LEFT JOIN teams ht ON f.home_team_id = ht.team_id
+                                                                LEFT JOIN teams at
+                                                       ON f.away_team_id = at.team_id
+                                                           LEFT JOIN european_teams eht ON f.home_team_id = eht.team_id
+                                                           LEFT JOIN european_teams eat ON f.away_team_id = eat.team_id
+                                                           LEFT JOIN teams t ON (f.home_team_id = t.team_id OR f.away_team_id = t.team_id)
+                                                       WHERE f.week_number = $1
+                                                         AND f.played = TRUE
+                                                         AND t.league = 'Premier League'
+                                                           LIMIT 5
+                                                       """, week_number)
+
+                    if english_results:
+                        results_text = ""
+                        for match in english_results:
+                            comp = "⭐" if match['competition'] == 'CL' else "🌟"
+                            results_text += (
+                                f"{comp} **{match['home_name']}** {match['home_score']}-{match['away_score']} "
+                                f"**{match['away_name']}**\n"
+                            )
+
+                        euro_embed.add_field(
+                            name="🏴󠁧󠁢󠁥󠁮󠁧󠁿 English Clubs",
+                            value=results_text,
+                            inline=False
+                        )
+
+                    euro_embed.add_field(
+                        name="📊 European Matches",
+                        value=f"**{euro_count}** matches played across CL & EL",
                         inline=False
                     )
 
-                    await news_channel.send(embed=transfer_embed)
+                    messages.append(BroadcastMessage(embed=euro_embed))
+
+            # ✅ FIXED: Check if any players have European matches
+            is_european_week = state['current_week'] in config.EUROPEAN_MATCH_WEEKS
+            has_european_players = False
+            if is_european_week:
+                european_count = await conn.fetchval("""
+                                                     SELECT COUNT(DISTINCT p.user_id)
+                                                     FROM players p
+                                                              JOIN european_fixtures ef
+                                                                   ON (ef.home_team_id = p.team_id OR ef.away_team_id = p.team_id)
+                                                     WHERE p.retired = FALSE
+                                                       AND p.team_id != 'free_agent'
+                    AND ef.week_number = $1
+                                                       AND ef.played = FALSE
+                                                     """, state['current_week'])
+                has_european_players = european_count > 0
+
+        # 6️⃣ TRANSFER WINDOW
+        if state['current_week'] in config.TRANSFER_WINDOW_WEEKS:
+            # 🆕 POST CATEGORY GIF for Transfer Window
+            messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['transfer_window']))
+
+            transfer_embed = discord.Embed(
+                title="💼 TRANSFER WINDOW OPEN",
+                description="**The market is active!**",
+                color=discord.Color.green()
+            )
 
-                # 7️⃣ UPCOMING FIXTURES - ✅ FIXED: Now checks if players participate in European matches
-                from utils.season_manager import get_next_match_window
-                try:
-                    next_window = get_next_match_window()
-                    day_name = next_window.strftime('%A')
+            transfer_embed.add_field(
+                name="🟢 Status",
+                value="Transfer window is **OPEN**\nClubs are making moves!",
+                inline=False
+            )
 
-                    # 🆕 POST CATEGORY GIF for Upcoming Fixtures
-                    await news_channel.send(NEWS_CATEGORY_GIFS['upcoming_fixtures'])
+            transfer_embed.add_field(
+                name="📋 For Players",
+                value="Use `/offers` to see which clubs want to sign you!",
+                inline=False
+            )
 
-                    fixtures_embed = discord.Embed(
-                        title="📅 UPCOMING FIXTURES",
-                        description=f"**Week {state['current_week']} Match Day**",
-                        color=discord.Color.green()
-                    )
+            messages.append(BroadcastMessage(embed=transfer_embed))
 
-                    is_european_week = state['current_week'] in config.EUROPEAN_MATCH_WEEKS
-
-                    # ✅ FIXED: Check if any players have European matches
-                    has_european_players = False
-                    if is_european_week:
-                        european_count = await conn.fetchval("""
-                                                             SELECT COUNT(DISTINCT p.user_id)
-                                                             FROM players p
-                                                                      JOIN european_fixtures ef
-                                                                           ON (ef.home_team_id = p.team_id OR ef.away_team_id = p.team_id)
-                                                             WHERE p.retired = FALSE
-                                                               AND p.team_id != 'free_agent'
-                            AND ef.week_number = $1
-                                                               AND ef.played = FALSE
-                                                             """, state['current_week'])
-                        has_european_players = european_count > 0
-
-                    if is_european_week:
-                        if has_european_players:
-                            # Some players have European matches - show 12 PM
-                            fixtures_embed.add_field(
-                                name="⏰ Next Match Window",
-                                value=f"**{day_name}**\nKickoff at **12:00 PM EST**",
-                                inline=True
-                            )
-                            fixtures_embed.add_field(
-                                name="🏆 European Week",
-                                value="CL/EL matches at **12 PM**\nDomestic at **3 PM**",
-                                inline=True
-                            )
-                        else:
-                            # European week but no user players participating - show 3 PM
-                            fixtures_embed.add_field(
-                                name="⏰ Next Match Window",
-                                value=f"**{day_name}**\nKickoff at **3:00 PM EST**\n*(Domestic only)*",
-                                inline=True
-                            )
-                            fixtures_embed.add_field(
-                                name="🏆 European Week",
-                                value="CL/EL matches at **12 PM** *(NPC matches)*\nDomestic at **3 PM**",
-                                inline=True
-                            )
-                    else:
-                        # Normal week - domestic only, always 3 PM
-                        fixtures_embed.add_field(
-                            name="⏰ Next Match Window",
-                            value=f"**{day_name}**\nKickoff at **3:00 PM EST**",
-                            inline=True
-                        )
-                        fixtures_embed.add_field(
-                            name="⚽ Domestic Only",
-                            value="League matches at **3 PM**",
-                            inline=True
-                        )
+        elif state['current_week'] + 1 in config.TRANSFER_WINDOW_WEEKS:
+            # 🆕 POST CATEGORY GIF for Transfer Window Preview
+            messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['transfer_window']))
 
-                    await news_channel.send(embed=fixtures_embed)
+            transfer_embed = discord.Embed(
+                title="💼 TRANSFER WINDOW PREVIEW",
+                description="**Window opens next week!**",
+                color=discord.Color.gold()
+            )
 
-                except Exception as e:
-                    print(f"  ⚠️ Could not get next window: {e}")
+            transfer_embed.add_field(
+                name="⚠️ Next Week",
+                value=f"Transfer window opens in **Week {state['current_week'] + 1}**\nPrepare for offers!",
+                inline=False
+            )
 
-                print(f"  ✅ Posted premium news digest to {guild.name}")
+            messages.append(BroadcastMessage(embed=transfer_embed))
 
-            except Exception as e:
-                print(f"  ❌ Could not post news to {guild.name}: {e}")
-                import traceback
-                traceback.print_exc()
+        # 7️⃣ UPCOMING FIXTURES - ✅ FIXED: Now checks if players participate in European matches
+        from utils.season_manager import get_next_match_window
+        try:
+            next_window = get_next_match_window()
+            day_name = next_window.strftime('%A')
+
+            fixtures_embed = discord.Embed(
+                title="📅 UPCOMING FIXTURES",
+                description=f"**Week {state['current_week']} Match Day**",
+                color=discord.Color.green()
+            )
+
+            if is_european_week:
+                if has_european_players:
+                    # Some players have European matches - show 12 PM
+                    fixtures_embed.add_field(
+                        name="⏰ Next Match Window",
+                        value=f"**{day_name}**\nKickoff at **12:00 PM EST**",
+                        inline=True
+                    )
+                    fixtures_embed.add_field(
+                        name="🏆 European Week",
+                        value="CL/EL matches at **12 PM**\nDomestic at **3 PM**",
+                        inline=True
+                    )
+                else:
+                    # European week but no user players participating - show 3 PM
+                    fixtures_embed.add_field(
+                        name="⏰ Next Match Window",
+                        value=f"**{day_name}**\nKickoff at **3:00 PM EST**\n*(Domestic only)*",
+                        inline=True
+                    )
+                    fixtures_embed.add_field(
+                        name="🏆 European Week",
+                        value="CL/EL matches at **12 PM** *(NPC matches)*\nDomestic at **3 PM**",
+                        inline=True
+                    )
+            else:
+                # Normal week - domestic only, always 3 PM
+                fixtures_embed.add_field(
+                    name="⏰ Next Match Window",
+                    value=f"**{day_name}**\nKickoff at **3:00 PM EST**",
+                    inline=True
+                )
+                fixtures_embed.add_field(
+                    name="⚽ Domestic Only",
+                    value="League matches at **3 PM**",
+                    inline=True
+                )
+
+            # 🆕 POST CATEGORY GIF for Upcoming Fixtures
+            messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['upcoming_fixtures']))
+            messages.append(BroadcastMessage(embed=fixtures_embed))
+
+        except Exception as e:
+            print(f"  ⚠️ Could not get next window: {e}")
+
+        report = await broadcaster.broadcast(bot, "weekly_news_digest", messages, NEWS_CHANNELS)
+        print(f"  ✅ Posted premium news digest to {report.delivered}/{report.guilds} guilds")
 
     except Exception as e:
         print(f"❌ Error in weekly news digest: {e}")
@@ -1076,29 +953,24 @@ async def post_european_champions(bot, season):
     """
     try:
         async with db.pool.acquire() as conn:
-            cl_winner = await conn.fetchrow("""
-                                            SELECT k.winner_team_id,
-                                                   COALESCE(t.team_name, et.team_name) as team_name
-                                            FROM european_knockout k
-                                                     LEFT JOIN teams t ON k.winner_team_id = t.team_id
-                                                     LEFT JOIN european_teams et ON k.winner_team_id = et.team_id
-                                            WHERE k.competition = 'CL'
-                                              AND k.stage = 'final'
-                                              AND k.season = $1
-                                              AND k.winner_team_id IS NOT NULL
-                                            """, season)
-
-            el_winner = await conn.fetchrow("""
-                                            SELECT k.winner_team_id,
-                                                   COALESCE(t.team_name, et.team_name) as team_name
-                                            FROM european_knockout k
-                                                     LEFT JOIN teams t ON k.winner_team_id = t.team_id
-                                                     LEFT JOIN european_teams et ON k.winner_team_id = et.team_id
-                                            WHERE k.competition = 'EL'
-                                              AND k.stage = 'final'
-                                              AND k.season = $1
-                                              AND k.winner_team_id IS NOT NULL
-                                            """, season)
+            finals = await conn.fetch("""
+                                      SELECT k.competition, k.winner_team_id
+                                      FROM european_knockout k
+                                      WHERE k.stage = 'final'
+                                        AND k.season = $1
+                                        AND k.winner_team_id IS NOT NULL
+                                      """, season)
+
+        # Winner names from the team directory
+        from utils.team_directory import team_directory
+        await team_directory.ensure_loaded()
+        winners = {
+            row['competition']: {'winner_team_id': row['winner_team_id'],
+                                 'team_name': team_directory.name(row['winner_team_id'])}
+            for row in finals
+        }
+        cl_winner = winners.get('CL')
+        el_winner = winners.get('EL')
 
         if not cl_winner and not el_winner:
             print("  ⚠️ No European champions found")
@@ -1106,79 +978,65 @@ async def post_european_champions(bot, season):
 
         from utils.football_data_api import get_team_crest_url, get_competition_logo
 
-        for guild in bot.guilds:
-            try:
-                news_channel = discord.utils.get(guild.text_channels, name='european-news')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='news-feed')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='general')
-
-                if not news_channel:
-                    continue
+        messages = []
 
-                embeds = []
+        if cl_winner:
+            # 🆕 POST CATEGORY GIF for CL Winner
+            messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['champions_league_winner']))
 
-                if cl_winner:
-                    # 🆕 POST CATEGORY GIF for CL Winner
-                    await news_channel.send(NEWS_CATEGORY_GIFS['champions_league_winner'])
+            cl_logo = get_competition_logo('Champions League')
+            winner_crest = get_team_crest_url(cl_winner['winner_team_id'])
 
-                    cl_logo = get_competition_logo('Champions League')
-                    winner_crest = get_team_crest_url(cl_winner['winner_team_id'])
-
-                    cl_embed = discord.Embed(
-                        title="⭐ CHAMPIONS LEAGUE WINNERS",
-                        description=f"# 🏆 {cl_winner['team_name'].upper()} 🏆\n\n**Champions of Europe {season}**",
-                        color=discord.Color.blue()
-                    )
+            cl_embed = discord.Embed(
+                title="⭐ CHAMPIONS LEAGUE WINNERS",
+                description=f"# 🏆 {cl_winner['team_name'].upper()} 🏆\n\n**Champions of Europe {season}**",
+                color=discord.Color.blue()
+            )
 
-                    if cl_logo:
-                        cl_embed.set_thumbnail(url=cl_logo)
+            if cl_logo:
+                cl_embed.set_thumbnail(url=cl_logo)
 
-                    if winner_crest:
-                        cl_embed.set_author(name=f"🏆 {cl_winner['team_name']}", icon_url=winner_crest)
+            if winner_crest:
+                cl_embed.set_author(name=f"🏆 {cl_winner['team_name']}", icon_url=winner_crest)
 
-                    cl_embed.add_field(
-                        name="🎉 Glory",
-                        value=f"**{cl_winner['team_name']}** are crowned Champions League winners!",
-                        inline=False
-                    )
-
-                    cl_embed.set_footer(text=f"Season {season} • The pinnacle of European football")
-                    await news_channel.send(embed=cl_embed)
+            cl_embed.add_field(
+                name="🎉 Glory",
+                value=f"**{cl_winner['team_name']}** are crowned Champions League winners!",
+                inline=False
+            )
 
-                if el_winner:
-                    # 🆕 POST CATEGORY GIF for EL Winner
-                    await news_channel.send(NEWS_CATEGORY_GIFS['europa_league_winner'])
+            cl_embed.set_footer(text=f"Season {season} • The pinnacle of European football")
+            messages.append(BroadcastMessage(embed=cl_embed))
 
-                    el_logo = get_competition_logo('Europa League')
-                    winner_crest = get_team_crest_url(el_winner['winner_team_id'])
+        if el_winner:
+            # 🆕 POST CATEGORY GIF for EL Winner
+            messages.append(BroadcastMessage(content=NEWS_CATEGORY_GIFS['europa_league_winner']))
 
-                    el_embed = discord.Embed(
-                        title="🌟 EUROPA LEAGUE WINNERS",
-                        description=f"# 🏆 {el_winner['team_name'].upper()} 🏆\n\n**Europa League Champions {season}**",
-                        color=discord.Color.gold()
-                    )
+            el_logo = get_competition_logo('Europa League')
+            winner_crest = get_team_crest_url(el_winner['winner_team_id'])
 
-                    if el_logo:
-                        el_embed.set_thumbnail(url=el_logo)
+            el_embed = discord.Embed(
+                title="🌟 EUROPA LEAGUE WINNERS",
+                description=f"# 🏆 {el_winner['team_name'].upper()} 🏆\n\n**Europa League Champions {season}**",
+                color=discord.Color.gold()
+            )
 
-                    if winner_crest:
-                        el_embed.set_author(name=f"🏆 {el_winner['team_name']}", icon_url=winner_crest)
+            if el_logo:
+                el_embed.set_thumbnail(url=el_logo)
 
-                    el_embed.add_field(
-                        name="🎉 Triumph",
-                        value=f"**{el_winner['team_name']}** claim Europa League glory!",
-                        inline=False
-                    )
+            if winner_crest:
+                el_embed.set_author(name=f"🏆 {el_winner['team_name']}", icon_url=winner_crest)
 
-                    el_embed.set_footer(text=f"Season {season} • European excellence")
-                    await news_channel.send(embed=el_embed)
+            el_embed.add_field(
+                name="🎉 Triumph",
+                value=f"**{el_winner['team_name']}** claim Europa League glory!",
+                inline=False
+            )
 
-                print(f"  ✅ Posted European champions to {guild.name}")
+            el_embed.set_footer(text=f"Season {season} • European excellence")
+            messages.append(BroadcastMessage(embed=el_embed))
 
-            except Exception as e:
-                print(f"  ❌ Could not post champions to {guild.name}: {e}")
+        await broadcaster.broadcast(bot, "european_champions", messages, EUROPEAN_NEWS_CHANNELS)
 
     except Exception as e:
         print(f"❌ Error posting European champions: {e}")
@@ -1212,59 +1070,46 @@ async def post_match_day_preview(bot, week_number):
         if not key_fixtures:
             return
 
-        for guild in bot.guilds:
-            try:
-                news_channel = discord.utils.get(guild.text_channels, name='match-previews')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='news-feed')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='general')
-
-                if not news_channel:
-                    continue
-
-                # 🆕 POST CATEGORY GIF for Match Preview
-                await news_channel.send(NEWS_CATEGORY_GIFS['match_preview'])
-
-                preview_embed = discord.Embed(
-                    title="⚽ MATCH DAY PREVIEW",
-                    description=f"**Week {week_number} • Key Fixtures**",
-                    color=discord.Color.green()
-                )
+        # 🆕 POST CATEGORY GIF for Match Preview
+        messages = [BroadcastMessage(content=NEWS_CATEGORY_GIFS['match_preview'])]
 
-                fixtures_text = ""
-                for fixture in key_fixtures:
-                    fixtures_text += (
-                        f"🏟️ **{fixture['home_name']}** vs **{fixture['away_name']}**\n"
-                        f"   {fixture['home_points']} pts vs {fixture['away_points']} pts\n\n"
-                    )
+        preview_embed = discord.Embed(
+            title="⚽ MATCH DAY PREVIEW",
+            description=f"**Week {week_number} • Key Fixtures**",
+            color=discord.Color.green()
+        )
 
-                preview_embed.add_field(
-                    name="🔥 Top Matches",
-                    value=fixtures_text,
-                    inline=False
-                )
+        fixtures_text = ""
+        for fixture in key_fixtures:
+            fixtures_text += (
+                f"🏟️ **{fixture['home_name']}** vs **{fixture['away_name']}**\n"
+                f"   {fixture['home_points']} pts vs {fixture['away_points']} pts\n\n"
+            )
 
-                if week_number in config.EUROPEAN_MATCH_WEEKS:
-                    preview_embed.add_field(
-                        name="🏆 European Action",
-                        value="Champions League & Europa League matches today!\n**12:00 PM - 2:00 PM EST**",
-                        inline=False
-                    )
+        preview_embed.add_field(
+            name="🔥 Top Matches",
+            value=fixtures_text,
+            inline=False
+        )
 
-                preview_embed.add_field(
-                    name="🎮 Play Your Match",
-                    value="Use `/play_match` when the window opens!",
-                    inline=False
-                )
+        if week_number in config.EUROPEAN_MATCH_WEEKS:
+            preview_embed.add_field(
+                name="🏆 European Action",
+                value="Champions League & Europa League matches today!\n**12:00 PM - 2:00 PM EST**",
+                inline=False
+            )
 
-                preview_embed.set_footer(text=f"Season {state['current_season']} • Week {week_number}")
+        preview_embed.add_field(
+            name="🎮 Play Your Match",
+            value="Use `/play_match` when the window opens!",
+            inline=False
+        )
 
-                await news_channel.send(embed=preview_embed)
-                print(f"  ✅ Posted match day preview to {guild.name}")
+        preview_embed.set_footer(text=f"Season {state['current_season']} • Week {week_number}")
 
-            except Exception as e:
-                print(f"  ❌ Could not post preview to {guild.name}: {e}")
+        messages.append(BroadcastMessage(embed=preview_embed))
+
+        await broadcaster.broadcast(bot, "match_day_preview", messages, PREVIEW_CHANNELS)
 
     except Exception as e:
         print(f"❌ Error posting match day preview: {e}")
@@ -1279,107 +1124,85 @@ async def post_season_finale_preview(bot):
     try:
         state = await db.get_game_state()
 
-        async with db.pool.acquire() as conn:
-            pl_standings = await conn.fetch("""
-                                            SELECT team_name,
-                                                   points,
-                                                   played,
-                                                   (goals_for - goals_against) as gd
-                                            FROM teams
-                                            WHERE league = 'Premier League'
-                                            ORDER BY points DESC, gd DESC
-                                            """)
+        pl_standings = await standings.get_table('Premier League')
 
         if not pl_standings or len(pl_standings) < 20:
             return
 
-        for guild in bot.guilds:
-            try:
-                news_channel = discord.utils.get(guild.text_channels, name='news-feed')
-                if not news_channel:
-                    news_channel = discord.utils.get(guild.text_channels, name='general')
-
-                if not news_channel:
-                    continue
-
-                # 🆕 POST CATEGORY GIF for Season Finale
-                await news_channel.send(NEWS_CATEGORY_GIFS['season_finale'])
+        # 🆕 POST CATEGORY GIF for Season Finale
+        messages = [BroadcastMessage(content=NEWS_CATEGORY_GIFS['season_finale'])]
 
-                header = (
-                    f"# 🎬 SEASON FINALE PREVIEW\n"
-                    f"**The final day approaches...**\n"
-                    f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-                )
-                await news_channel.send(header)
+        header = (
+            f"# 🎬 SEASON FINALE PREVIEW\n"
+            f"**The final day approaches...**\n"
+            f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+        )
+        messages.append(BroadcastMessage(content=header))
 
-                embeds = []
+        embeds = []
 
-                title_race_embed = discord.Embed(
-                    title="🏆 TITLE RACE",
-                    description="**Who will be crowned champions?**",
-                    color=discord.Color.gold()
-                )
+        title_race_embed = discord.Embed(
+            title="🏆 TITLE RACE",
+            description="**Who will be crowned champions?**",
+            color=discord.Color.gold()
+        )
 
-                title_text = ""
-                for i, team in enumerate(pl_standings[:3], 1):
-                    emoji = ["🥇", "🥈", "🥉"][i - 1]
-                    title_text += f"{emoji} **{team['team_name']}** - {team['points']} pts (GD: {team['gd']:+d})\n"
+        title_text = ""
+        for i, team in enumerate(pl_standings[:3], 1):
+            emoji = ["🥇", "🥈", "🥉"][i - 1]
+            title_text += f"{emoji} **{team['team_name']}** - {team['points']} pts (GD: {team['gd']:+d})\n"
 
-                title_race_embed.add_field(
-                    name="Top 3",
-                    value=title_text,
-                    inline=False
-                )
-
-                embeds.append(title_race_embed)
+        title_race_embed.add_field(
+            name="Top 3",
+            value=title_text,
+            inline=False
+        )
 
-                euro_embed = discord.Embed(
-                    title="🌟 EUROPEAN RACE",
-                    description="**Battle for Europe**",
-                    color=discord.Color.blue()
-                )
+        embeds.append(title_race_embed)
 
-                euro_text = ""
-                for i, team in enumerate(pl_standings[3:7], 4):
-                    if i <= 4:
-                        zone = "CL" if i <= 4 else "EL"
-                        euro_text += f"{i}. **{team['team_name']}** - {team['points']} pts ({zone})\n"
-                    else:
-                        euro_text += f"{i}. **{team['team_name']}** - {team['points']} pts (EL)\n"
+        euro_embed = discord.Embed(
+            title="🌟 EUROPEAN RACE",
+            description="**Battle for Europe**",
+            color=discord.Color.blue()
+        )
 
-                euro_embed.add_field(
-                    name="Positions 4-7",
-                    value=euro_text,
-                    inline=False
-                )
+        euro_text = ""
+        for i, team in enumerate(pl_standings[3:7], 4):
+            if i <= 4:
+                zone = "CL" if i <= 4 else "EL"
+                euro_text += f"{i}. **{team['team_name']}** - {team['points']} pts ({zone})\n"
+            else:
+                euro_text += f"{i}. **{team['team_name']}** - {team['points']} pts (EL)\n"
 
-                embeds.append(euro_embed)
+        euro_embed.add_field(
+            name="Positions 4-7",
+            value=euro_text,
+            inline=False
+        )
 
-                rel_embed = discord.Embed(
-                    title="🔴 RELEGATION BATTLE",
-                    description="**Who will go down?**",
-                    color=discord.Color.red()
-                )
+        embeds.append(euro_embed)
 
-                rel_text = ""
-                for i, team in enumerate(pl_standings[-4:], len(pl_standings) - 3):
-                    status = "⚠️ DANGER" if i >= len(pl_standings) - 2 else "⚠️ SAFE"
-                    rel_text += f"{i}. **{team['team_name']}** - {team['points']} pts {status}\n"
+        rel_embed = discord.Embed(
+            title="🔴 RELEGATION BATTLE",
+            description="**Who will go down?**",
+            color=discord.Color.red()
+        )
 
-                rel_embed.add_field(
-                    name="Bottom 4",
-                    value=rel_text,
-                    inline=False
-                )
+        rel_text = ""
+        for i, team in enumerate(pl_standings[-4:], len(pl_standings) - 3):
+            status = "⚠️ DANGER" if i >= len(pl_standings) - 2 else "⚠️ SAFE"
+            rel_text += f"{i}. **{team['team_name']}** - {team['points']} pts {status}\n"
 
-                embeds.append(rel_embed)
+        rel_embed.add_field(
+            name="Bottom 4",
+            value=rel_text,
+            inline=False
+        )
 
-                for embed in embeds:
-                    await news_channel.send(embed=embed)
-                print(f"  ✅ Posted season finale preview to {guild.name}")
+        embeds.append(rel_embed)
 
-            except Exception as e:
-                print(f"  ❌ Could not post finale preview to {guild.name}: {e}")
+        messages.extend(BroadcastMessage(embed=embed) for embed in embeds)
+        await broadcaster.broadcast(bot, "season_finale_preview", messages, NEWS_CHANNELS)
 
     except Exception as e:
         print(f"❌ Error posting season finale: {e}")
@@ -7,6 +7,44 @@ Morale: Affected by results, transfers, contract situation
 import discord
 from database import db
 
+MORALE_CHANGES = {
+    'win': 5,
+    'loss': -5,
+    'draw': 0,
+    'goal': 3,
+    'assist': 2,
+    'transfer_accepted': 10,
+    'transfer_rejected': -3,
+    'contract_expiring': -5,
+    'new_contract': 8,
+    'training': 1,
+    'injury': -10
+}
+
+
+def get_form_change(match_rating: float):
+    """Form change based on match rating"""
+    if match_rating >= 8.0:
+        return 10   # Excellent performance
+    elif match_rating >= 7.0:
+        return 5    # Good performance
+    elif match_rating >= 6.0:
+        return 0    # Average performance
+    elif match_rating >= 5.0:
+        return -5   # Poor performance
+    else:
+        return -10  # Very poor performance
+
+
+def apply_form_change(current_form, match_rating: float):
+    """New form after a match (pure, no database access)"""
+    return max(0, min(100, current_form + get_form_change(match_rating)))
+
+
+def apply_morale_change(current_morale, event_type: str):
+    """New morale after an event (pure, no database access)"""
+    return max(0, min(100, current_morale + MORALE_CHANGES.get(event_type, 0)))
+
 async def update_player_form(user_id: int, match_rating: float, bot=None):
     """Update player form based on match performance"""
     player = await db.get_player(user_id)
@@ -14,20 +52,7 @@ async def update_player_form(user_id: int, match_rating: float, bot=None):
         return
     
     current_form = player['form']
-    
-    # Form change based on rating
-    if match_rating >= 8.0:
-        form_change = 10  # Excellent performance
-    elif match_rating >= 7.0:
-        form_change = 5   # Good performance
-    elif match_rating >= 6.0:
-        form_change = 0   # Average performance
-    elif match_rating >= 5.0:
-        form_change = -5  # Poor performance
-    else:
-        form_change = -10 # Very poor performance
-    
-    new_form = max(0, min(100, current_form + form_change))
+    new_form = apply_form_change(current_form, match_rating)
     
     async with db.pool.acquire() as conn:
         await conn.execute(
@@ -60,23 +85,7 @@ async def update_player_morale(user_id: int, event_type: str, value: int = 0, bo
         return
     
     current_morale = player['morale']
-    
-    morale_changes = {
-        'win': 5,
-        'loss': -5,
-        'draw': 0,
-        'goal': 3,
-        'assist': 2,
-        'transfer_accepted': 10,
-        'transfer_rejected': -3,
-        'contract_expiring': -5,
-        'new_contract': 8,
-        'training': 1,
-        'injury': -10
-    }
-    
-    morale_change = morale_changes.get(event_type, 0)
-    new_morale = max(0, min(100, current_morale + morale_change))
+    new_morale = apply_morale_change(current_morale, event_type)
     
     async with db.pool.acquire() as conn:
         await conn.execute(
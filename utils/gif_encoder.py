@@ -0,0 +1,128 @@
+"""
+Streaming GIF Encoder - writes highlight reels one frame at a time
+One shared palette for the whole reel, frame-delta encoding, bounded memory
+
+Only the previous quantized frame is kept, so peak memory does not grow with
+the number of clips. Each frame is cropped to the region that changed since
+the previous frame and appended to the output buffer straight away.
+"""
+import io
+import struct
+
+from PIL import Image, ImageChops
+
+MAX_COLORS = 256
+
+
+def _o16(value):
+    return struct.pack('<H', value)
+
+
+def build_shared_palette(frames, colors=MAX_COLORS):
+    """
+    Build one palette covering a sample of frames
+
+    Returns:
+        P-mode image to pass as StreamingGifWriter(palette=...)
+    """
+    frames = list(frames)
+    width = max(f.width for f in frames)
+    height = sum(f.height for f in frames)
+
+    # Stack the samples into one montage and quantize it once
+    montage = Image.new('RGB', (width, height))
+    y = 0
+    for frame in frames:
+        montage.paste(frame.convert('RGB'), (0, y))
+        y += frame.height
+
+    return montage.quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+
+
+def _encode_image_block(indexed):
+    """
+    LZW-encode one P-mode frame with Pillow and return just its image block
+    (image descriptor + compressed data, without GIF header or trailer)
+    """
+    buffer = io.BytesIO()
+    indexed.save(buffer, format='GIF', optimize=False, interlace=False)
+    data = buffer.getvalue()
+
+    pos = 13
+    packed = data[10]
+    if packed & 0x80:
+        pos += 3 * (2 ** ((packed & 0x07) + 1))
+
+    # Skip any extension blocks before the image descriptor
+    while data[pos:pos + 1] == b'!':
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+
+    return data[pos:-1]
+
+
+class StreamingGifWriter:
+    """Incremental GIF89a writer with one global palette"""
+
+    def __init__(self, fp, size, palette, duration=70, loop=0):
+        """
+        Args:
+            fp: binary file-like object to write into
+            size: (width, height) of every frame
+            palette: P-mode image from build_shared_palette
+            duration: milliseconds per frame
+            loop: 0 = loop forever
+        """
+        self.fp = fp
+        self.size = size
+        self.palette = palette
+        self.duration = duration
+        self.frames_written = 0
+        self.bytes_written = 0
+        self._previous = None  # Previous frame's palette indices as an 'L' image
+
+        palette_bytes = bytes(palette.getpalette()[:MAX_COLORS * 3])
+        palette_bytes += b'\x00' * (MAX_COLORS * 3 - len(palette_bytes))
+
+        header = (
+            b'GIF89a'
+            + _o16(size[0]) + _o16(size[1])
+            + bytes([0xF7, 0, 0])  # global color table, 256 entries
+            + palette_bytes
+            + b'!\xff\x0bNETSCAPE2.0\x03\x01' + _o16(loop) + b'\x00'
+        )
+        self._write(header)
+
+    def _write(self, data):
+        self.fp.write(data)
+        self.bytes_written += len(data)
+
+    def add_frame(self, frame):
+        """Quantize, delta-crop and append one RGB frame"""
+        if frame.size != self.size:
+            frame = frame.resize(self.size, Image.Resampling.LANCZOS)
+
+        indexed = frame.convert('RGB').quantize(palette=self.palette, dither=Image.Dither.NONE)
+        indices = Image.frombytes('L', indexed.size, indexed.tobytes())
+
+        if self._previous is None:
+            box = (0, 0) + self.size
+        else:
+            # Unchanged frame still needs a (1px) block to keep the timing
+            box = ImageChops.difference(indices, self._previous).getbbox() or (0, 0, 1, 1)
+        self._previous = indices
+
+        block = bytearray(_encode_image_block(indexed.crop(box)))
+        block[1:5] = _o16(box[0]) + _o16(box[1])
+
+        # Graphic control extension: keep previous frame (disposal 1), frame duration
+        self._write(b'!\xf9\x04\x04' + _o16(int(self.duration / 10)) + b'\x00\x00')
+        self._write(bytes(block))
+        self.frames_written += 1
+
+    def close(self):
+        """Write the GIF trailer"""
+        self._write(b';')
+        self._previous = None
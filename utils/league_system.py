@@ -1,14 +1,140 @@
 """
-League System - Promotions and Relegations
-Handles end-of-season league movements
+League System - Promotions, Relegations and League Tables
+Handles end-of-season league movements and set-based table recalculation
 """
 import logging
+import time
 from database import db
+from utils.standings import standings, LEAGUE_TABLE_ORDER
+from utils.team_directory import team_directory
 import discord
 
 logger = logging.getLogger(__name__)
 
 
+async def recalculate_league_tables(conn):
+    """
+    Rebuild W/D/L/GF/GA/points and positions for every domestic team in one statement
+
+    Fixtures are kept between seasons, so each home/away pairing counts only its most
+    recently generated fixture, and only while both teams are still in that fixture's league.
+
+    Returns:
+        number of teams updated
+    """
+    result = await conn.execute(f"""
+        WITH current_fixtures AS (
+            SELECT DISTINCT ON (home_team_id, away_team_id)
+                   home_team_id, away_team_id, home_score, away_score, played, league
+            FROM fixtures
+            ORDER BY home_team_id, away_team_id, fixture_id DESC
+        ),
+        results AS (
+            SELECT f.home_team_id AS team_id, f.home_score AS gf, f.away_score AS ga
+            FROM current_fixtures f
+            JOIN teams h ON h.team_id = f.home_team_id AND h.league = f.league
+            JOIN teams a ON a.team_id = f.away_team_id AND a.league = f.league
+            WHERE f.played
+            UNION ALL
+            SELECT f.away_team_id, f.away_score, f.home_score
+            FROM current_fixtures f
+            JOIN teams h ON h.team_id = f.home_team_id AND h.league = f.league
+            JOIN teams a ON a.team_id = f.away_team_id AND a.league = f.league
+            WHERE f.played
+        ),
+        totals AS (
+            SELECT t.team_id, t.team_name, t.league,
+                   COUNT(r.team_id)::int AS played,
+                   COUNT(*) FILTER (WHERE r.gf > r.ga)::int AS won,
+                   COUNT(*) FILTER (WHERE r.gf = r.ga)::int AS drawn,
+                   COUNT(*) FILTER (WHERE r.gf < r.ga)::int AS lost,
+                   COALESCE(SUM(r.gf), 0)::int AS goals_for,
+                   COALESCE(SUM(r.ga), 0)::int AS goals_against,
+                   (3 * COUNT(*) FILTER (WHERE r.gf > r.ga) + COUNT(*) FILTER (WHERE r.gf = r.ga))::int AS points
+            FROM teams t
+            LEFT JOIN results r ON r.team_id = t.team_id
+            GROUP BY t.team_id, t.team_name, t.league
+        ),
+        ranked AS (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY league ORDER BY {LEAGUE_TABLE_ORDER})::int AS position
+            FROM totals
+        )
+        UPDATE teams AS t
+        SET played = r.played, won = r.won, drawn = r.drawn, lost = r.lost,
+            goals_for = r.goals_for, goals_against = r.goals_against,
+            points = r.points, position = r.position
+        FROM ranked r
+        WHERE t.team_id = r.team_id
+    """)
+    return int(result.split()[-1])
+
+
+async def recalculate_group_tables(conn):
+    """
+    Rebuild every european_groups row from its played group-stage fixtures in one statement
+
+    Returns:
+        number of group rows updated
+    """
+    result = await conn.execute("""
+        WITH results AS (
+            SELECT competition, group_name, season, home_team_id AS team_id,
+                   home_score AS gf, away_score AS ga
+            FROM european_fixtures
+            WHERE stage = 'group' AND played
+            UNION ALL
+            SELECT competition, group_name, season, away_team_id,
+                   away_score, home_score
+            FROM european_fixtures
+            WHERE stage = 'group' AND played
+        ),
+        totals AS (
+            SELECT g.id,
+                   COUNT(r.team_id)::int AS played,
+                   COUNT(*) FILTER (WHERE r.gf > r.ga)::int AS won,
+                   COUNT(*) FILTER (WHERE r.gf = r.ga)::int AS drawn,
+                   COUNT(*) FILTER (WHERE r.gf < r.ga)::int AS lost,
+                   COALESCE(SUM(r.gf), 0)::int AS goals_for,
+                   COALESCE(SUM(r.ga), 0)::int AS goals_against,
+                   (3 * COUNT(*) FILTER (WHERE r.gf > r.ga) + COUNT(*) FILTER (WHERE r.gf = r.ga))::int AS points
+            FROM european_groups g
+            LEFT JOIN results r
+                   ON r.competition = g.competition AND r.group_name = g.group_name
+                  AND r.season = g.season AND r.team_id = g.team_id
+            GROUP BY g.id
+        )
+        UPDATE european_groups AS g
+        SET played = r.played, won = r.won, drawn = r.drawn, lost = r.lost,
+            goals_for = r.goals_for, goals_against = r.goals_against, points = r.points
+        FROM totals r
+        WHERE g.id = r.id
+    """)
+    return int(result.split()[-1])
+
+
+async def recalculate_all_tables(conn=None):
+    """
+    Recalculate league tables and European groups from fixtures in one transaction
+    Safe to run at any time (idempotent), e.g. as a consistency check after each window
+
+    Returns:
+        dict with teams, groups and elapsed_ms
+    """
+    if conn is None:
+        async with db.pool.acquire() as conn:
+            return await recalculate_all_tables(conn)
+
+    start = time.perf_counter()
+    async with conn.transaction():
+        teams = await recalculate_league_tables(conn)
+        groups = await recalculate_group_tables(conn)
+    standings.invalidate()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    logger.info(f"✅ Recalculated {teams} league rows and {groups} group rows in {elapsed_ms:.0f}ms")
+    return {'teams': teams, 'groups': groups, 'elapsed_ms': elapsed_ms}
+
+
 async def process_promotions_relegations(bot=None):
     """
     Process promotions and relegations at end of season
@@ -23,123 +149,95 @@ async def process_promotions_relegations(bot=None):
     
     try:
         async with db.pool.acquire() as conn:
-            # Get final league tables
-            pl_table = await conn.fetch("""
-                SELECT team_id, team_name, position, points 
-                FROM teams 
-                WHERE league = 'Premier League' 
-                ORDER BY points DESC, (goals_for - goals_against) DESC, goals_for DESC
-            """)
+            # Final league tables: recalculate once, then read all three leagues in position order
+            await recalculate_all_tables(conn)
             
-            champ_table = await conn.fetch("""
-                SELECT team_id, team_name, position, points 
+            rows = await conn.fetch("""
+                SELECT team_id, team_name, league, position, points 
                 FROM teams 
-                WHERE league = 'Championship' 
-                ORDER BY points DESC, (goals_for - goals_against) DESC, goals_for DESC
+                WHERE league IN ('Premier League', 'Championship', 'League One')
+                ORDER BY league, position
             """)
+            tables = {}
+            for row in rows:
+                tables.setdefault(row['league'], []).append(dict(row))
             
-            l1_table = await conn.fetch("""
-                SELECT team_id, team_name, position, points 
-                FROM teams 
-                WHERE league = 'League One' 
-                ORDER BY points DESC, (goals_for - goals_against) DESC, goals_for DESC
-            """)
+            pl_table = tables.get('Premier League', [])
+            champ_table = tables.get('Championship', [])
+            l1_table = tables.get('League One', [])
+            
+            # (team, new league, log line, headline, content, importance)
+            movements = []
             
             # ===== PREMIER LEAGUE RELEGATIONS (Bottom 3) =====
             if len(pl_table) >= 3:
-                relegated_from_pl = [dict(row) for row in pl_table[-3:]]
-                
-                for team in relegated_from_pl:
-                    await conn.execute("""
-                        UPDATE teams SET league = 'Championship' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    # Update player leagues
-                    await conn.execute("""
-                        UPDATE players SET league = 'Championship' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    logger.info(f"  ⬇️ RELEGATED: {team['team_name']} (PL → Championship)")
-                    
-                    await db.add_news(
+                for team in pl_table[-3:]:
+                    movements.append((
+                        team, 'Championship',
+                        f"  ⬇️ RELEGATED: {team['team_name']} (PL → Championship)",
                         f"RELEGATED: {team['team_name']} drop to Championship",
                         f"{team['team_name']} finished bottom 3 with {team['points']} points and are relegated.",
-                        "league_news",
-                        None,
                         9
-                    )
+                    ))
             
             # ===== CHAMPIONSHIP PROMOTIONS (Top 2) =====
             if len(champ_table) >= 2:
-                promoted_from_champ = [dict(row) for row in champ_table[:2]]
-                
-                for team in promoted_from_champ:
-                    await conn.execute("""
-                        UPDATE teams SET league = 'Premier League' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    # Update player leagues
-                    await conn.execute("""
-                        UPDATE players SET league = 'Premier League' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    logger.info(f"  ⬆️ PROMOTED: {team['team_name']} (Championship → PL)")
-                    
-                    await db.add_news(
+                for team in champ_table[:2]:
+                    movements.append((
+                        team, 'Premier League',
+                        f"  ⬆️ PROMOTED: {team['team_name']} (Championship → PL)",
                         f"PROMOTED: {team['team_name']} reach Premier League!",
                         f"{team['team_name']} finished top 2 with {team['points']} points and are promoted to the Premier League!",
-                        "league_news",
-                        None,
                         10
-                    )
+                    ))
             
             # ===== CHAMPIONSHIP RELEGATIONS (Bottom 3) =====
             if len(champ_table) >= 3:
-                relegated_from_champ = [dict(row) for row in champ_table[-3:]]
-                
-                for team in relegated_from_champ:
-                    await conn.execute("""
-                        UPDATE teams SET league = 'League One' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    # Update player leagues
-                    await conn.execute("""
-                        UPDATE players SET league = 'League One' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    logger.info(f"  ⬇️ RELEGATED: {team['team_name']} (Championship → L1)")
-                    
-                    await db.add_news(
+                for team in champ_table[-3:]:
+                    movements.append((
+                        team, 'League One',
+                        f"  ⬇️ RELEGATED: {team['team_name']} (Championship → L1)",
                         f"RELEGATED: {team['team_name']} drop to League One",
                         f"{team['team_name']} are relegated to League One.",
-                        "league_news",
-                        None,
                         7
-                    )
+                    ))
             
             # ===== LEAGUE ONE PROMOTIONS (Top 2) =====
             if len(l1_table) >= 2:
-                promoted_from_l1 = [dict(row) for row in l1_table[:2]]
-                
-                for team in promoted_from_l1:
-                    await conn.execute("""
-                        UPDATE teams SET league = 'Championship' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    # Update player leagues
-                    await conn.execute("""
-                        UPDATE players SET league = 'Championship' WHERE team_id = $1
-                    """, team['team_id'])
-                    
-                    logger.info(f"  ⬆️ PROMOTED: {team['team_name']} (L1 → Championship)")
-                    
-                    await db.add_news(
+                for team in l1_table[:2]:
+                    movements.append((
+                        team, 'Championship',
+                        f"  ⬆️ PROMOTED: {team['team_name']} (L1 → Championship)",
                         f"PROMOTED: {team['team_name']} reach Championship!",
                         f"{team['team_name']} are promoted to the Championship!",
-                        "league_news",
-                        None,
                         8
-                    )
+                    ))
+            
+            # Move every team and its players in two set-based UPDATEs
+            team_ids = [m[0]['team_id'] for m in movements]
+            new_leagues = [m[1] for m in movements]
+            async with conn.transaction():
+                await conn.execute("""
+                    UPDATE teams AS t SET league = m.league
+                    FROM UNNEST($1::text[], $2::text[]) AS m(team_id, league)
+                    WHERE t.team_id = m.team_id
+                """, team_ids, new_leagues)
+                
+                # Update player leagues
+                await conn.execute("""
+                    UPDATE players AS p SET league = m.league
+                    FROM UNNEST($1::text[], $2::text[]) AS m(team_id, league)
+                    WHERE p.team_id = m.team_id
+                """, team_ids, new_leagues)
+                
+                # Rank the moved teams inside their new leagues
+                await standings.rerank(conn)
+            standings.invalidate()
+            await team_directory.reload()
+            
+            for team, _, log_line, headline, content, importance in movements:
+                logger.info(log_line)
+                await db.add_news(headline, content, "league_news", None, importance)
             
             logger.info("="*60)
             logger.info("✅ PROMOTIONS & RELEGATIONS COMPLETE")
@@ -0,0 +1,186 @@
+"""
+Live Match State - write-behind buffer for active_matches score / minute
+Coalesces per-event updates in memory and flushes them in batches
+
+- run_match reports every event here instead of running its own UPDATE
+- Dirty matches are flushed together (one UNNEST UPDATE for every live match)
+  every FLUSH_INTERVAL seconds, straight away on a goal, and on close()
+- The pinned live-score embed is only edited when the score changes, or when the
+  minute moved and the last edit is at least PINNED_MINUTE_INTERVAL seconds old
+- Matches opened with a checkpoint provider also get their match_checkpoints row
+  (schedule position + counters) written in the same flush transaction
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from database import db
+from utils.match_checkpoints import match_checkpoints
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 10          # Seconds between batched flushes
+PINNED_MINUTE_INTERVAL = 8   # Minimum seconds between minute-only pinned score edits
+
+
+@dataclass
+class LiveMatchState:
+    match_id: int
+    home_score: int = 0
+    away_score: int = 0
+    minute: int = 0
+    event_index: int = 0          # Next schedule entry to play
+    persisted: tuple = (0, 0, 0, 0)  # snapshot last written to Postgres
+    checkpoint: Optional[Callable[[], dict]] = None  # Returns the counters to checkpoint
+    rendered: tuple = None        # (home_score, away_score, minute) on the pinned embed
+    rendered_at: float = 0.0
+
+    @property
+    def snapshot(self):
+        return self.home_score, self.away_score, self.minute, self.event_index
+
+    @property
+    def dirty(self):
+        return self.snapshot != self.persisted
+
+
+class LiveMatchStore:
+    """In-memory score/minute of every live match, persisted write-behind"""
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._states = {}  # match_id -> LiveMatchState
+        self._flusher = None
+        self._flush_lock = asyncio.Lock()
+
+        self.stats = {'updates': 0, 'flushes': 0, 'rows_written': 0, 'renders': 0, 'renders_skipped': 0}
+
+    # ========== LIFECYCLE ==========
+
+    def open(self, match_id, home_score=0, away_score=0, minute=0, event_index=0, checkpoint=None):
+        """
+        Start tracking a match (the active_matches row already holds these values)
+
+        Args:
+            checkpoint: optional callable returning the match's JSON-able counters;
+                        its match_checkpoints row is then updated on every flush
+        """
+        self._states[match_id] = LiveMatchState(
+            match_id, home_score, away_score, minute, event_index,
+            persisted=(home_score, away_score, minute, event_index), checkpoint=checkpoint
+        )
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_loop())
+
+    async def close(self, match_id):
+        """Flush a finished match and stop tracking it"""
+        try:
+            if match_id in self._states:
+                await self.flush([match_id])
+        except Exception as e:
+            logger.warning(f"⚠️ Final live match flush failed for match {match_id}: {e}")
+        finally:
+            self._states.pop(match_id, None)
+
+    def discard(self, match_id):
+        """Stop tracking without flushing (abandoned / cleaned-up matches)"""
+        self._states.pop(match_id, None)
+
+    def get(self, match_id):
+        return self._states.get(match_id)
+
+    # ========== UPDATES ==========
+
+    async def update(self, match_id, home_score, away_score, minute, event_index=None):
+        """Record the state after an event; goals are flushed straight away"""
+        state = self._states.get(match_id)
+        if state is None:
+            return
+
+        goal = (home_score, away_score) != (state.home_score, state.away_score)
+        state.home_score, state.away_score, state.minute = home_score, away_score, minute
+        if event_index is not None:
+            state.event_index = event_index
+        self.stats['updates'] += 1
+
+        if goal:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"⚠️ Live match flush failed (will retry): {e}")
+
+    async def flush(self, match_ids=None):
+        """
+        Write every dirty match (or just match_ids) in one UPDATE
+
+        Returns:
+            number of matches written
+        """
+        async with self._flush_lock:
+            ids = self._states.keys() if match_ids is None else match_ids
+            dirty = [self._states[m] for m in ids if m in self._states and self._states[m].dirty]
+            if not dirty:
+                return 0
+
+            snapshots = [(s, s.snapshot) for s in dirty]
+            checkpoints = [(s.match_id, snap[3], snap[0], snap[1], s.checkpoint())
+                           for s, snap in snapshots if s.checkpoint is not None]
+
+            async with db.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute("""
+                        UPDATE active_matches AS am
+                        SET home_score = s.home_score, away_score = s.away_score,
+                            current_minute = s.minute, events_completed = s.event_index
+                        FROM UNNEST($1::int[], $2::int[], $3::int[], $4::int[], $5::int[])
+                             AS s(match_id, home_score, away_score, minute, event_index)
+                        WHERE am.match_id = s.match_id
+                    """, [s.match_id for s, _ in snapshots], [snap[0] for _, snap in snapshots],
+                        [snap[1] for _, snap in snapshots], [snap[2] for _, snap in snapshots],
+                        [snap[3] for _, snap in snapshots])
+                    if checkpoints:
+                        await match_checkpoints.write(conn, checkpoints)
+
+            for state, snap in snapshots:
+                state.persisted = snap
+            self.stats['flushes'] += 1
+            self.stats['rows_written'] += len(snapshots)
+            return len(snapshots)
+
+    async def _flush_loop(self):
+        while self._states:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"⚠️ Live match flush failed (will retry): {e}")
+
+    # ========== PINNED SCORE ==========
+
+    def needs_render(self, match_id, home_score, away_score, minute):
+        """Whether the pinned score embed has to be edited for this state"""
+        state = self._states.get(match_id)
+        if state is None or state.rendered is None:
+            return True
+
+        if state.rendered == (home_score, away_score, minute):
+            self.stats['renders_skipped'] += 1
+            return False
+        if state.rendered[:2] == (home_score, away_score) and \
+                time.monotonic() - state.rendered_at < PINNED_MINUTE_INTERVAL:
+            self.stats['renders_skipped'] += 1
+            return False
+        return True
+
+    def mark_rendered(self, match_id, home_score, away_score, minute):
+        state = self._states.get(match_id)
+        if state is not None:
+            state.rendered = (home_score, away_score, minute)
+            state.rendered_at = time.monotonic()
+            self.stats['renders'] += 1
+
+
+# Global live match state instance
+live_matches = LiveMatchStore()
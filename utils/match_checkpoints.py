@@ -0,0 +1,112 @@
+"""
+Match Checkpoints - resumable snapshots of every live match
+One match_checkpoints row per match, so a restart mid-matchday can pick matches back up
+
+- The event schedule is written once, compactly, when the match kicks off
+  (player moments keep only the user_id; participant / player rows are reloaded on resume)
+- Schedule position, score and the in-memory counters are written by the
+  live match state flush (utils/live_match_state.py), in the same transaction
+  as the active_matches score
+- finalize_match deletes the row in the result transaction, so a checkpoint
+  exists exactly while a match still needs its result written
+"""
+import json
+import logging
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+RESUME_MAX_AGE = 30 * 60  # Seconds; older interrupted matches are fast-simulated instead of resumed
+
+
+def compact_schedule(schedule, minutes):
+    """[[minute, event type, team side, user_id or None], ...] for the events that will be played"""
+    return [
+        [minute, event['type'], event.get('team_side'),
+         event['participant']['user_id'] if event['type'] == 'player' else None]
+        for minute, event in zip(minutes, schedule)
+    ]
+
+
+async def expand_schedule(compact, participants):
+    """
+    Rebuild run_match's schedule and minutes from a compact schedule
+
+    Player moments whose participant / player is gone become NPC attacks for that side.
+    """
+    by_user = {p['user_id']: p for p in participants}
+    players = {}
+
+    schedule, minutes = [], []
+    for minute, event_type, team_side, user_id in compact:
+        event = {'type': event_type, 'team_side': team_side}
+        if event_type == 'player':
+            if user_id not in players:
+                players[user_id] = await db.get_player(user_id)
+            if by_user.get(user_id) and players[user_id]:
+                event.update(participant=by_user[user_id], player=players[user_id])
+            else:
+                event['type'] = 'npc_attack'
+        schedule.append(event)
+        minutes.append(minute)
+    return schedule, minutes
+
+
+class MatchCheckpoints:
+    """match_checkpoints reads and writes (periodic updates go through live_matches.flush)"""
+
+    async def create(self, match_id, fixture, is_european, channel_id, schedule, minutes):
+        """Write the kick-off checkpoint (replaces any previous one for the match)"""
+        async with db.pool.acquire() as conn:
+            await conn.execute("""
+                INSERT INTO match_checkpoints (match_id, fixture_id, is_european, channel_id, schedule)
+                VALUES ($1, $2, $3, $4, $5::jsonb)
+                ON CONFLICT (match_id) DO UPDATE
+                SET fixture_id = EXCLUDED.fixture_id, is_european = EXCLUDED.is_european,
+                    channel_id = EXCLUDED.channel_id, schedule = EXCLUDED.schedule,
+                    event_index = 0, home_score = 0, away_score = 0,
+                    state = '{}'::jsonb, updated_at = CURRENT_TIMESTAMP
+            """, match_id, fixture['fixture_id'], is_european, channel_id,
+                json.dumps(compact_schedule(schedule, minutes)))
+
+    async def write(self, conn, checkpoints):
+        """
+        Persist the progress of several matches in one UPDATE (called by the live state flush)
+
+        Args:
+            checkpoints: list of (match_id, event_index, home_score, away_score, state dict)
+        """
+        await conn.execute("""
+            UPDATE match_checkpoints AS mc
+            SET event_index = c.event_index, home_score = c.home_score, away_score = c.away_score,
+                state = c.state::jsonb, updated_at = CURRENT_TIMESTAMP
+            FROM UNNEST($1::int[], $2::int[], $3::int[], $4::int[], $5::text[])
+                 AS c(match_id, event_index, home_score, away_score, state)
+            WHERE mc.match_id = c.match_id
+        """, [c[0] for c in checkpoints], [c[1] for c in checkpoints], [c[2] for c in checkpoints],
+            [c[3] for c in checkpoints], [json.dumps(c[4]) for c in checkpoints])
+
+    async def load_all(self):
+        """Every match interrupted before its result was written"""
+        async with db.pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT *, EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - updated_at))::float AS age_seconds
+                FROM match_checkpoints
+                ORDER BY match_id
+            """)
+
+        checkpoints = []
+        for row in rows:
+            checkpoint = dict(row)
+            checkpoint['schedule'] = json.loads(checkpoint['schedule'])
+            checkpoint['state'] = json.loads(checkpoint['state'] or '{}')
+            checkpoints.append(checkpoint)
+        return checkpoints
+
+    async def delete(self, conn, match_id):
+        await conn.execute("DELETE FROM match_checkpoints WHERE match_id = $1", match_id)
+
+
+# Global match checkpoints instance
+match_checkpoints = MatchCheckpoints()
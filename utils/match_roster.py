@@ -0,0 +1,81 @@
+"""
+Match Roster - per-match snapshot of both NPC squads
+Loaded once when a match kicks off, indexed by team and position
+
+Every opponent / teammate / keeper / set-piece taker lookup during a live match
+is answered from memory, so the 40-55 events of a match make no NPC queries.
+"""
+import random
+
+from database import db
+
+DOMESTIC_TABLE = 'npc_players'
+EUROPEAN_TABLE = 'european_npc_players'
+
+
+class MatchRoster:
+    """Snapshot of the active NPCs of the teams in one match"""
+
+    def __init__(self, is_european=False):
+        self.is_european = is_european
+        self.default_table = EUROPEAN_TABLE if is_european else DOMESTIC_TABLE
+
+        self._squads = {}  # (table, team_id) -> list of NPC dicts (ordered by npc_id)
+        self._pools = {}   # (table, team_id, positions) -> filtered list, built on first use
+
+    @property
+    def tables(self):
+        """European matches also keep the domestic rows (keeper fallback for English clubs)"""
+        return (EUROPEAN_TABLE, DOMESTIC_TABLE) if self.is_european else (DOMESTIC_TABLE,)
+
+    async def load(self, team_ids):
+        """Load the squads of any teams not loaded yet (one query per table)"""
+        team_ids = [t for t in dict.fromkeys(team_ids) if (self.default_table, t) not in self._squads]
+        if not team_ids:
+            return self
+
+        async with db.pool.acquire() as conn:
+            for table in self.tables:
+                rows = await conn.fetch(f"""
+                    SELECT * FROM {table}
+                    WHERE team_id = ANY($1::text[]) AND retired = FALSE
+                    ORDER BY npc_id
+                """, team_ids)
+
+                for team_id in team_ids:
+                    self._squads[(table, team_id)] = []
+                for row in rows:
+                    self._squads[(table, row['team_id'])].append(dict(row))
+
+        self._pools = {key: pool for key, pool in self._pools.items() if key[1] not in team_ids}
+        return self
+
+    async def _pool(self, team_id, positions=None, table=None):
+        table = table or self.default_table
+        if (table, team_id) not in self._squads:
+            await self.load([team_id])
+
+        key = (table, team_id, tuple(positions) if positions else None)
+        pool = self._pools.get(key)
+        if pool is None:
+            squad = self._squads.get((table, team_id), [])
+            pool = [npc for npc in squad if not positions or npc['position'] in positions]
+            self._pools[key] = pool
+        return pool
+
+    # ========== LOOKUPS (copies, so callers can't modify the snapshot) ==========
+
+    async def random_npc(self, team_id, positions=None, table=None):
+        """Random active NPC, optionally restricted to positions (None if there is none)"""
+        pool = await self._pool(team_id, positions, table)
+        return dict(random.choice(pool)) if pool else None
+
+    async def best_npc(self, team_id, stat, positions=None, table=None):
+        """NPC with the highest value of stat (e.g. the corner taker)"""
+        pool = await self._pool(team_id, positions, table)
+        return dict(max(pool, key=lambda npc: npc[stat])) if pool else None
+
+    async def first_npc(self, team_id, positions=None, table=None):
+        """First matching NPC (e.g. the goalkeeper)"""
+        pool = await self._pool(team_id, positions, table)
+        return dict(pool[0]) if pool else None
@@ -1,5 +1,7 @@
 from database import db
-import random
+from utils.team_strength import team_strength
+from utils.scoreline_engine import simulate_strength_scorelines
+from utils.standings import standings
 
 async def simulate_all_matches(week: int):
     """Simulate all matches for a given week across all leagues"""
@@ -52,6 +54,10 @@ async def simulate_match(fixture: dict):
     await update_team_stats(fixture['home_team_id'], home_score, away_score, is_home=True)
     await update_team_stats(fixture['away_team_id'], away_score, home_score, is_home=False)
     
+    async with db.pool.acquire() as conn:
+        await standings.rerank(conn, [fixture['home_team_id'], fixture['away_team_id']])
+    standings.invalidate()
+    
     return {
         'home_team': fixture['home_team_id'],
         'away_team': fixture['away_team_id'],
@@ -69,74 +75,12 @@ async def calculate_team_strength(team_id: str, is_home: bool = False) -> int:
     
     This prevents teams with one 90-rated user + ten 65-rated NPCs
     from having their strength calculated as only 67
-    """
-    
-    async with db.pool.acquire() as conn:
-        # Get domestic players (both user and NPC)
-        user_players = await conn.fetch(
-            "SELECT overall_rating FROM players WHERE team_id = $1 AND retired = FALSE",
-            team_id
-        )
-        npc_players = await conn.fetch(
-            "SELECT overall_rating FROM npc_players WHERE team_id = $1 AND retired = FALSE",
-            team_id
-        )
-        
-        # Get European players (if this is a European team)
-        european_players = await conn.fetch(
-            "SELECT overall_rating FROM european_npc_players WHERE team_id = $1 AND retired = FALSE",
-            team_id
-        )
-    
-    # Calculate WEIGHTED average (user players count 1.5x)
-    total_weight = 0
-    total_rating = 0
-    
-    # User players are worth 1.5x (they train and improve)
-    for player in user_players:
-        total_rating += player['overall_rating'] * 1.5
-        total_weight += 1.5
     
-    # NPCs are worth 1.0x
-    for player in npc_players:
-        total_rating += player['overall_rating']
-        total_weight += 1.0
-    
-    for player in european_players:
-        total_rating += player['overall_rating']
-        total_weight += 1.0
-    
-    if total_weight == 0:
-        return 50  # Default for teams with no players
-    
-    # Calculate weighted average
-    avg_rating = total_rating / total_weight
-    
-    # Team quality modifier based on average rating
-    # This is how elite teams are identified!
-    if avg_rating >= 85:
-        team_modifier = 25  # Elite teams (Man City, Real Madrid, Bayern)
-    elif avg_rating >= 80:
-        team_modifier = 20  # Top teams (Liverpool, Arsenal, Juventus)
-    elif avg_rating >= 75:
-        team_modifier = 15  # Good teams (Aston Villa, Roma)
-    elif avg_rating >= 70:
-        team_modifier = 10  # Mid-table (Brentford, Fulham)
-    elif avg_rating >= 65:
-        team_modifier = 5   # Lower teams (Luton, Southampton)
-    else:
-        team_modifier = 0   # Weak teams (League One clubs)
-    
-    # Home advantage
-    home_bonus = 5 if is_home else 0
-    
-    # Calculate total strength
-    strength = int(avg_rating + team_modifier + home_bonus)
-    
-    # Cap at 95 to prevent unrealistic scorelines
-    return min(strength, 95)
+    Served from the shared team strength cache (utils/team_strength.py)
+    """
+    return await team_strength.get_strength(team_id, is_home=is_home)
 
-def simulate_score(home_strength: int, away_strength: int) -> tuple:
+def simulate_score(home_strength: int, away_strength: int, rng=None) -> tuple:
     """
     ✅ REBALANCED: More realistic scorelines (0-3 goals typical)
     Works for both domestic and European competitions
@@ -146,100 +90,11 @@ def simulate_score(home_strength: int, away_strength: int) -> tuple:
     - Stronger teams have higher conversion rates
     - Strength difference affects both chances and conversion
     - Elite teams (85+ strength) naturally score more
-    """
     
-    # Calculate strength difference
-    diff = home_strength - away_strength
-    
-    # ═══════════════════════════════════════════════════════════
-    # STEP 1: Determine number of scoring chances (attacks)
-    # ═══════════════════════════════════════════════════════════
-    
-    # Base chances (6-10 per team is realistic for 90 min match)
-    # Elite teams (90+ strength) will get 9-10 chances
-    # Weak teams (60 strength) will get 5-6 chances
-    home_base_chances = 7 + (home_strength - 70) // 10  # 5-9 chances
-    away_base_chances = 7 + (away_strength - 70) // 10
-    
-    # Adjust for strength difference (stronger team dominates possession)
-    if diff > 15:
-        home_base_chances += 2
-        away_base_chances -= 1
-    elif diff > 30:
-        home_base_chances += 3
-        away_base_chances -= 2
-    elif diff < -15:
-        away_base_chances += 2
-        home_base_chances -= 1
-    elif diff < -30:
-        away_base_chances += 3
-        home_base_chances -= 2
-    
-    # Add randomness (form/tactics variation)
-    home_chances = max(4, home_base_chances + random.randint(-1, 1))
-    away_chances = max(4, away_base_chances + random.randint(-1, 1))
-    
-    # ═══════════════════════════════════════════════════════════
-    # STEP 2: Convert chances to goals (realistic conversion ~10-20%)
-    # ═══════════════════════════════════════════════════════════
-    
-    home_score = 0
-    away_score = 0
-    
-    # Home team conversion rate (higher strength = better finishing)
-    # Elite teams (90 strength) get ~20% conversion
-    # Weak teams (60 strength) get ~8% conversion
-    home_conversion = min(25, 8 + (home_strength - 70) // 5)  # 8-25% range
-    if diff > 20:  # Boost against weak opponents
-        home_conversion += 5
-    
-    # Away team conversion (slight penalty for being away)
-    away_conversion = min(25, 6 + (away_strength - 70) // 5)  # 6-25% range
-    if diff < -20:  # Boost against weak opponents
-        away_conversion += 5
-    
-    # Simulate each chance
-    for _ in range(home_chances):
-        if random.randint(1, 100) <= home_conversion:
-            home_score += 1
-    
-    for _ in range(away_chances):
-        if random.randint(1, 100) <= away_conversion:
-            away_score += 1
-    
-    # ═══════════════════════════════════════════════════════════
-    # STEP 3: Special scenarios (rare events)
-    # ═══════════════════════════════════════════════════════════
-    
-    # Occasional upset bonus (10% chance if losing badly)
-    if diff > 25 and random.random() < 0.10:
-        away_score += random.randint(1, 2)  # Underdog fights back
-    elif diff < -25 and random.random() < 0.10:
-        home_score += random.randint(1, 2)
-    
-    # Very rare high-scoring thriller (3% chance)
-    if random.random() < 0.03:
-        home_score += random.randint(0, 1)
-        away_score += random.randint(0, 1)
-    
-    # Rare defensive masterclass (5% chance - very low scoring)
-    if random.random() < 0.05:
-        home_score = min(home_score, 1)
-        away_score = min(away_score, 1)
-    
-    # ═══════════════════════════════════════════════════════════
-    # STEP 4: Cap scores for realism
-    # ═══════════════════════════════════════════════════════════
-    
-    # Cap at 6 goals per team (extremely rare to score more)
-    home_score = min(home_score, 6)
-    away_score = min(away_score, 6)
-    
-    # Ensure non-negative
-    home_score = max(0, home_score)
-    away_score = max(0, away_score)
-    
-    return home_score, away_score
+    Single-fixture wrapper around utils/scoreline_engine.simulate_strength_scorelines
+    """
+    home_score, away_score = simulate_strength_scorelines(home_strength, away_strength, rng=rng)
+    return int(home_score), int(away_score)
 
 async def update_team_stats(team_id: str, goals_for: int, goals_against: int, is_home: bool):
     """Update team statistics after a match"""
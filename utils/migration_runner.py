@@ -0,0 +1,149 @@
+"""
+Migration Runner - versioned, checksummed schema migrations
+Applies migrations/NNNN_name.sql files in order and records them in schema_migrations
+
+- Fast path: one SELECT on schema_migrations; if every file is applied, no DDL runs
+- Each pending migration runs in its own transaction together with its schema_migrations row
+- A Postgres advisory lock stops two bot instances migrating at the same time
+- Editing a migration that was already applied raises MigrationChecksumError
+  (add a new numbered file instead)
+"""
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / 'migrations'
+MIGRATION_FILE_PATTERN = re.compile(r'^(\d{4})_([a-z0-9_]+)\.sql$')
+MIGRATION_LOCK_ID = 7_203_114_561  # pg_advisory_lock key shared by every instance
+
+
+class MigrationError(Exception):
+    """Raised when the migration files or history are inconsistent"""
+
+
+class MigrationChecksumError(MigrationError):
+    """Raised when an applied migration file has been edited"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    sql: str
+    checksum: str
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """Read and order the migration files (versions must be unique)"""
+    migrations = {}
+
+    for path in sorted(Path(directory).glob('*.sql')):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            raise MigrationError(f"Bad migration file name: {path.name} (expected NNNN_name.sql)")
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version:04d}")
+
+        sql = path.read_text(encoding='utf-8').replace('\r\n', '\n')
+        migrations[version] = Migration(
+            version=version,
+            name=match.group(2),
+            sql=sql,
+            checksum=hashlib.sha256(sql.encode('utf-8')).hexdigest()
+        )
+
+    return [migrations[v] for v in sorted(migrations)]
+
+
+class MigrationRunner:
+    """Brings the database schema up to date"""
+
+    def __init__(self, directory=MIGRATIONS_DIR):
+        self.directory = directory
+
+    async def _applied(self, conn):
+        """version -> checksum for every applied migration ({} if the table doesn't exist yet)"""
+        try:
+            rows = await conn.fetch("SELECT version, checksum FROM schema_migrations")
+        except asyncpg.UndefinedTableError:
+            return {}
+        return {row['version']: row['checksum'] for row in rows}
+
+    def _pending(self, migrations, applied):
+        for migration in migrations:
+            checksum = applied.get(migration.version)
+            if checksum is not None and checksum != migration.checksum:
+                raise MigrationChecksumError(
+                    f"Migration {migration.version:04d}_{migration.name} was changed after it was applied"
+                )
+        return [m for m in migrations if m.version not in applied]
+
+    async def run(self, pool):
+        """
+        Apply every pending migration
+
+        Returns:
+            list of applied migration names (empty when the schema was already current)
+        """
+        migrations = load_migrations(self.directory)
+
+        async with pool.acquire() as conn:
+            # Fast path: a single version check
+            if not self._pending(migrations, await self._applied(conn)):
+                logger.info(f"✅ Schema up to date ({len(migrations)} migrations)")
+                return []
+
+            await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_ID)
+            try:
+                await conn.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version INTEGER PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        checksum TEXT NOT NULL,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        execution_ms INTEGER
+                    )
+                """)
+
+                # Another instance may have migrated while we waited for the lock
+                pending = self._pending(migrations, await self._applied(conn))
+
+                applied = []
+                for migration in pending:
+                    logger.info(f"📋 Applying migration {migration.version:04d}_{migration.name}...")
+                    start = time.perf_counter()
+
+                    async with conn.transaction():
+                        await conn.execute(migration.sql)
+                        elapsed_ms = int((time.perf_counter() - start) * 1000)
+                        await conn.execute("""
+                            INSERT INTO schema_migrations (version, name, checksum, execution_ms)
+                            VALUES ($1, $2, $3, $4)
+                        """, migration.version, migration.name, migration.checksum, elapsed_ms)
+
+                    applied.append(f"{migration.version:04d}_{migration.name}")
+                    logger.info(f"  ✅ {migration.version:04d}_{migration.name} ({elapsed_ms}ms)")
+
+                return applied
+            finally:
+                await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_ID)
+
+    async def status(self, pool):
+        """List of (migration, applied) pairs for the CLI"""
+        migrations = load_migrations(self.directory)
+        async with pool.acquire() as conn:
+            applied = await self._applied(conn)
+        return [(m, m.version in applied) for m in migrations]
+
+
+# Global migration runner instance
+migration_runner = MigrationRunner()
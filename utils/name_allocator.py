@@ -0,0 +1,89 @@
+"""
+Name Allocator - unique NPC names from an in-memory index instead of DB probing
+Every npc_players name is loaded once; new names are checked against the set
+
+- allocate(n) generates n names in memory and reserves them straight away, so
+  names handed out in the same batch (a squad, a season's regens) can't collide
+  even before they are written
+- The index is loaded at startup (initialize_data) or on first use
+"""
+import asyncio
+import logging
+import random
+
+from database import db
+from data.player_names import FIRST_NAMES, LAST_NAMES
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 10  # Random first/last combinations tried before falling back to a number suffix
+
+
+class NameAllocator:
+    """Hands out player names not already used by any NPC"""
+
+    def __init__(self):
+        self._taken = set()
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+        self.stats = {'allocated': 0, 'collisions': 0, 'suffixed': 0}
+
+    async def load(self, force=False):
+        """Index every existing NPC name (one query)"""
+        async with self._lock:
+            if self._loaded and not force:
+                return len(self._taken)
+
+            async with db.pool.acquire() as conn:
+                rows = await conn.fetch("SELECT DISTINCT player_name FROM npc_players")
+            self._taken = {row['player_name'] for row in rows}
+            self._loaded = True
+
+        logger.info(f"✅ Name index loaded ({len(self._taken)} names)")
+        return len(self._taken)
+
+    def reserve(self, names):
+        """Mark names written by other paths (e.g. real squads) as taken"""
+        self._taken.update(names)
+
+    def is_taken(self, name):
+        return name in self._taken
+
+    async def allocate(self, count=1, first_names=FIRST_NAMES, last_names=LAST_NAMES, max_attempts=MAX_ATTEMPTS):
+        """
+        Generate and reserve count unique names
+
+        Args:
+            first_names / last_names: name pools to combine
+
+        Returns:
+            list of names
+        """
+        if not self._loaded:
+            await self.load()
+
+        names = []
+        for _ in range(count):
+            for _ in range(max_attempts):
+                name = f"{random.choice(first_names)} {random.choice(last_names)}"
+                if name not in self._taken:
+                    break
+                self.stats['collisions'] += 1
+            else:
+                # Fallback: add number suffix if all attempts failed
+                self.stats['suffixed'] += 1
+                base_name = f"{random.choice(first_names)} {random.choice(last_names)}"
+                name = f"{base_name} {random.randint(1, 999)}"
+                while name in self._taken:
+                    name = f"{base_name} {random.randint(1, 9999)}"
+
+            self._taken.add(name)
+            names.append(name)
+
+        self.stats['allocated'] += len(names)
+        return names
+
+
+# Global name allocator instance
+name_allocator = NameAllocator()
@@ -3,6 +3,7 @@ NPC Rating Manager - Keeps NPC players competitive with user players
 Automatically maintains balance over time
 """
 from database import db
+from utils.team_strength import team_strength
 import random
 
 
@@ -70,6 +71,8 @@ async def auto_update_npc_stats_periodically():
             AND RANDOM() < 0.3
         """)
         
+        team_strength.invalidate_all()
+        
         print("✅ Auto-updated ~30% of NPC players")
 
 
@@ -118,6 +121,7 @@ async def balance_team_strength(team_id: str):
                     physical = LEAST(99, physical + $1)
                 WHERE team_id = $2 AND retired = FALSE
             """, boost_amount, team_id)
+            team_strength.invalidate(team_id)
             
             print(f"✅ Boosted NPCs on {team_id} by +{boost_amount} (user avg: {avg_user_rating:.1f})")
 
@@ -162,6 +166,8 @@ async def season_start_npc_update():
         # Boost elite teams
         await boost_elite_npcs()
         
+        team_strength.invalidate_all()
+        
         print("✅ Season NPC update complete!")
 
 
@@ -192,6 +198,8 @@ async def boost_elite_npcs():
                 AND overall_rating < 85
             """, team_id)
         
+        team_strength.invalidate(*elite_teams)
+        
         print(f"✅ Boosted {len(elite_teams)} elite teams")
 
 async def update_npcs_after_match(match_id: int, home_score: int, away_score: int):
@@ -284,6 +292,8 @@ async def update_npcs_after_match(match_id: int, home_score: int, away_score: in
                 AND RANDOM() < 0.10
             """, loser)
         
+        team_strength.invalidate(home_team, away_team)
+        
         print(f"✅ Updated NPC ratings after match {match_id} ({home_score}-{away_score})")
 
 
@@ -291,66 +301,6 @@ async def get_accurate_team_strength(team_id: str, is_home: bool = False) -> int
     """
     Calculate team strength using WEIGHTED average
     User players count 1.5x more than NPCs
-    This is used by match_engine for NPC simulations
+    Served from the shared team strength cache (utils/team_strength.py)
     """
-    async with db.pool.acquire() as conn:
-        # User players (weight: 1.5x)
-        user_players = await conn.fetch("""
-            SELECT overall_rating FROM players 
-            WHERE team_id = $1 AND retired = FALSE
-        """, team_id)
-        
-        # NPC players (weight: 1.0x)
-        npc_players = await conn.fetch("""
-            SELECT overall_rating FROM npc_players 
-            WHERE team_id = $1 AND retired = FALSE
-        """, team_id)
-        
-        # European players (weight: 1.0x)
-        european_players = await conn.fetch("""
-            SELECT overall_rating FROM european_npc_players 
-            WHERE team_id = $1 AND retired = FALSE
-        """, team_id)
-    
-    # Calculate WEIGHTED average
-    total_weight = 0
-    total_rating = 0
-    
-    # User players count 1.5x
-    for player in user_players:
-        total_rating += player['overall_rating'] * 1.5
-        total_weight += 1.5
-    
-    # NPCs count 1.0x
-    for player in npc_players:
-        total_rating += player['overall_rating']
-        total_weight += 1.0
-    
-    for player in european_players:
-        total_rating += player['overall_rating']
-        total_weight += 1.0
-    
-    if total_weight == 0:
-        return 50  # Default for empty teams
-    
-    avg_rating = total_rating / total_weight
-    
-    # Team quality modifier
-    if avg_rating >= 85:
-        team_modifier = 25
-    elif avg_rating >= 80:
-        team_modifier = 20
-    elif avg_rating >= 75:
-        team_modifier = 15
-    elif avg_rating >= 70:
-        team_modifier = 10
-    elif avg_rating >= 65:
-        team_modifier = 5
-    else:
-        team_modifier = 0
-    
-    # Home advantage
-    home_bonus = 5 if is_home else 0
-    
-    strength = int(avg_rating + team_modifier + home_bonus)
-    return min(strength, 95)
+    return await team_strength.get_strength(team_id, is_home=is_home)
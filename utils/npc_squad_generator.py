@@ -1,9 +1,12 @@
 """
 NPC Squad Generator - Creates complete squads for all teams
 Ensures every team has players in all positions
-FIXED: Prevents duplicate NPC names
+FIXED: Prevents duplicate NPC names (in-memory name index, utils/name_allocator.py)
+Squads are built in memory and written with one COPY (utils/bulk_seeder.py)
 """
 from database import db
+from utils.bulk_seeder import SeedBatch, NPC_PLAYER_COLUMNS
+from utils.name_allocator import name_allocator
 import random
 
 # CHANGE #1: Move name lists OUTSIDE the function to module level
@@ -38,28 +41,14 @@ LAST_NAMES = [
     "Jimenez"
 ]
 
-# CHANGE #2: Make function async and add duplicate checking
-async def generate_random_player_name(team_id: str = None, max_attempts: int = 10):
-    """Generate unique random player name"""
-    for attempt in range(max_attempts):
-        name = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
-        
-        # Check uniqueness in database
-        async with db.pool.acquire() as conn:
-            existing = await conn.fetchrow(
-                "SELECT 1 FROM npc_players WHERE player_name = $1",
-                name
-            )
-            
-            if not existing:
-                return name
-    
-    # Fallback: add number suffix if all attempts failed
-    base_name = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
-    return f"{base_name} {random.randint(1, 999)}"
-
-async def generate_squad_for_team(team_id: str, league: str):
-    """Generate a complete squad for a team"""
+async def generate_squad_for_team(team_id: str, league: str, batch: SeedBatch = None):
+    """
+    Generate a complete squad for a team
+
+    Args:
+        batch: SeedBatch to add the squad to (written by the caller);
+               if None the squad is written straight away
+    """
 
     # Determine rating range based on league
     if league == 'Premier League':
@@ -83,10 +72,12 @@ async def generate_squad_for_team(team_id: str, league: str):
 
     players = []
 
+    # Unique names for the whole squad, checked against the in-memory name index
+    names = iter(await name_allocator.allocate(sum(squad_composition.values()), FIRST_NAMES, LAST_NAMES))
+
     for position, count in squad_composition.items():
         for i in range(count):
-            # CHANGE #3: Add await since function is now async
-            name = await generate_random_player_name(team_id)
+            name = next(names)
             age = random.randint(18, 35)
 
             # Adjust rating based on age (prime years 24-29)
@@ -166,28 +157,20 @@ async def generate_squad_for_team(team_id: str, league: str):
                 'physical': physical
             })
 
-    # Insert all players into database
-    async with db.pool.acquire() as conn:
-        for player in players:
-            await conn.execute('''
-                INSERT INTO npc_players (
-                    player_name, team_id, position, age, overall_rating,
-                    pace, shooting, passing, dribbling, defending, physical, is_regen
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, FALSE)
-            ''',
-                player['name'],
-                team_id,
-                player['position'],
-                player['age'],
-                player['overall'],
-                player['pace'],
-                player['shooting'],
-                player['passing'],
-                player['dribbling'],
-                player['defending'],
-                player['physical']
-            )
+    # Queue the squad for one bulk COPY
+    write_now = batch is None
+    if write_now:
+        batch = SeedBatch()
+
+    batch.extend('npc_players', NPC_PLAYER_COLUMNS, (
+        (player['name'], team_id, player['position'], player['age'], player['overall'],
+         player['pace'], player['shooting'], player['passing'], player['dribbling'],
+         player['defending'], player['physical'], False)
+        for player in players
+    ))
+
+    if write_now:
+        await batch.write()
 
     return len(players)
 
@@ -197,19 +180,19 @@ async def populate_all_teams():
 
     total_players = 0
 
+    # Teams that already have players, in one query
+    async with db.pool.acquire() as conn:
+        rows = await conn.fetch("SELECT DISTINCT team_id FROM npc_players WHERE team_id IS NOT NULL")
+    staffed = {row['team_id'] for row in rows}
+
+    batch = SeedBatch()
     for team in ALL_TEAMS:
-        # Check if team already has players
-        async with db.pool.acquire() as conn:
-            result = await conn.fetchrow(
-                "SELECT COUNT(*) as count FROM npc_players WHERE team_id = $1",
-                team['team_id']
-            )
-            count = result['count']
-
-        if count == 0:
-            players_added = await generate_squad_for_team(team['team_id'], team['league'])
+        if team['team_id'] not in staffed:
+            players_added = await generate_squad_for_team(team['team_id'], team['league'], batch)
             total_players += players_added
             print(f"✅ Generated {players_added} players for {team['team_name']}")
 
+    await batch.write()
+
     print(f"✅ Total NPC players created: {total_players}")
     return total_players
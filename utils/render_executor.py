@@ -0,0 +1,198 @@
+"""
+Render Executor - runs Pillow work off the event loop
+Bounded process pool with a job queue, per-job timeouts and backpressure
+
+Every visualizer frame, highlight reel and crest composite goes through
+render_executor.run(), so the gateway heartbeat, button callbacks and
+tasks.loop jobs keep running while a reel encodes.
+
+- Pool size: config.RENDER_WORKERS (0 = run jobs in a single render thread instead)
+- At most RENDER_WORKERS + RENDER_MAX_PENDING jobs are admitted at once;
+  further callers wait up to RENDER_QUEUE_TIMEOUT seconds, then get RenderQueueFull
+- A job that exceeds its timeout raises RenderTimeout and is abandoned; it keeps
+  its queue slot until the worker actually finishes it, so a hung render still
+  counts against the queue. The pool is only replaced once it is actually broken
+- New worker assets go to a fresh pool via its initializer; the previous pool
+  drains its in-flight jobs instead of being killed
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class RenderQueueFull(Exception):
+    """Raised when the render queue stays full for longer than the queue timeout"""
+
+
+class RenderTimeout(Exception):
+    """Raised when a single render job runs longer than its timeout"""
+
+
+def _init_worker(assets):
+    """Process initializer: hand the decoded visual assets to the worker once"""
+    if assets is not None:
+        from match_visualizer import MatchVisualizer
+        MatchVisualizer._assets_cache = assets
+
+
+class RenderExecutor:
+    """Bounded process pool for CPU-heavy image work"""
+
+    def __init__(self, workers=None, max_pending=None, queue_timeout=None, job_timeout=None):
+        self.workers = config.RENDER_WORKERS if workers is None else workers
+        self.max_pending = config.RENDER_MAX_PENDING if max_pending is None else max_pending
+        self.queue_timeout = config.RENDER_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        self.job_timeout = config.RENDER_JOB_TIMEOUT if job_timeout is None else job_timeout
+
+        self._pool = None
+        self._threads = None
+        self._slots = None
+        self._in_flight = 0  # admitted jobs whose work hasn't finished (abandoned ones included)
+        self._worker_assets = None
+
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'rejected': 0,
+            'running': 0,
+            'max_job_ms': 0.0,
+        }
+
+    # ========== POOL MANAGEMENT ==========
+
+    def _get_pool(self):
+        """Executor for the next job: the process pool, or the render thread when RENDER_WORKERS is 0"""
+        if self.workers <= 0:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=1, thread_name_prefix='render')
+            return self._threads
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._worker_assets,)
+            )
+            logger.info(f"✅ Render pool started ({self.workers} workers)")
+
+        return self._pool
+
+    def _drop_broken(self, pool):
+        """Forget a pool that raised BrokenProcessPool; the next job starts a fresh one"""
+        if pool is self._pool:
+            self._pool = None
+            pool.shutdown(wait=False)
+
+    def set_worker_assets(self, assets):
+        """Ship decoded visualizer assets to the workers (via the initializer of the next pool)"""
+        if assets is self._worker_assets:
+            return
+
+        self._worker_assets = assets
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            # Jobs already running keep their pool (and old assets) until they finish
+            pool.shutdown(wait=False)
+
+    def shutdown(self):
+        """Stop the pool (bot shutdown); queued jobs are cancelled"""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        threads, self._threads = self._threads, None
+        if threads is not None:
+            threads.shutdown(wait=False, cancel_futures=True)
+
+    # ========== JOBS ==========
+
+    @property
+    def queue_depth(self):
+        """Jobs admitted but not yet finished (including abandoned jobs still running)"""
+        return self._in_flight
+
+    def _release(self):
+        self._in_flight -= 1
+        self.stats['running'] -= 1
+        self._slots.release()
+
+    def _release_from(self, loop):
+        """done-callback for an abandoned job (runs in the executor's thread)"""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # Event loop already closed (bot shutdown)
+
+    async def run(self, func, *args, timeout=None):
+        """
+        Run func(*args) in the render pool and return its result
+
+        func and its arguments must be picklable (module-level functions, plain data).
+
+        Raises:
+            RenderQueueFull: the queue stayed full for queue_timeout seconds
+            RenderTimeout: the job ran longer than timeout (default job_timeout)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, self.workers) + self.max_pending)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.stats['rejected'] += 1
+            logger.warning(f"⚠️ Render queue full, rejected {func.__name__}")
+            raise RenderQueueFull(f"Render queue full ({self.queue_depth} jobs)")
+
+        self.stats['submitted'] += 1
+        self.stats['running'] += 1
+        self._in_flight += 1
+        start = time.perf_counter()
+
+        pool = None
+        job = None
+        try:
+            pool = self._get_pool()
+            job = pool.submit(func, *args)
+
+            result = await asyncio.wait_for(asyncio.wrap_future(job), timeout=timeout or self.job_timeout)
+
+            self.stats['completed'] += 1
+            return result
+
+        except asyncio.TimeoutError:
+            self.stats['timed_out'] += 1
+            logger.error(f"❌ Render job {func.__name__} timed out, abandoning it")
+            raise RenderTimeout(f"{func.__name__} exceeded {timeout or self.job_timeout}s")
+
+        except BrokenProcessPool:
+            self.stats['failed'] += 1
+            logger.error(f"❌ Render pool broke during {func.__name__}, replacing pool")
+            self._drop_broken(pool)
+            raise
+
+        except Exception:
+            self.stats['failed'] += 1
+            raise
+
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.stats['max_job_ms'] = max(self.stats['max_job_ms'], elapsed_ms)
+
+            # A job already running in a worker can't be cancelled: it keeps its slot
+            # until the worker is done with it, so the queue never undercounts busy workers
+            if job is not None and not job.done() and not job.cancel():
+                loop = asyncio.get_running_loop()
+                job.add_done_callback(lambda _: self._release_from(loop))
+            else:
+                self._release()
+
+
+# Global render executor instance
+render_executor = RenderExecutor()
@@ -0,0 +1,199 @@
+"""
+Request Cache - dedupe identical reads within one interaction or background job
+Plus a process-wide TTL cache for the single game_state row
+
+- A unit of work is bound to a contextvar: every slash command gets one
+  (CachedCommandTree.interaction_check), background jobs open one with
+  `with unit_of_work():`. Outside a unit of work reads go straight to the database.
+- Any write made through the pool (TrackedConnection) clears the current unit of
+  work once it has run (BEGIN / COMMIT, plain SELECTs and the pool's reset on
+  release don't count), and any write mentioning game_state clears the game_state
+  cache, so a command never reads back a row older than its own writes.
+- Entries also expire after UNIT_OF_WORK_MAX_AGE seconds, which bounds staleness
+  from other tasks' writes during long-running commands (views, match loops).
+"""
+import contextvars
+import logging
+import re
+import time
+from contextlib import contextmanager
+
+import asyncpg
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+UNIT_OF_WORK_MAX_AGE = 10  # Seconds a deduped read stays valid inside one unit of work
+GAME_STATE_TTL = 30        # Seconds the game_state row is cached process-wide
+
+WRITE_STATEMENT = re.compile(r'^\s*(INSERT|UPDATE|DELETE|TRUNCATE|ALTER|CREATE|DROP)\b|\bRETURNING\b'
+                             r'|^\s*WITH\b[\s\S]*\b(INSERT|UPDATE|DELETE)\b',
+                             re.IGNORECASE)
+GAME_STATE_TABLE = re.compile(r'\bgame_state\b', re.IGNORECASE)
+
+
+class UnitOfWork:
+    """Reads already made by the current interaction / job"""
+
+    def __init__(self, max_age=UNIT_OF_WORK_MAX_AGE):
+        self.max_age = max_age
+        self.entries = {}  # key -> (monotonic time, value)
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.entries.clear()
+
+
+_current_unit = contextvars.ContextVar('db_unit_of_work', default=None)
+
+
+def current_unit_of_work():
+    return _current_unit.get()
+
+
+def begin_unit_of_work():
+    """Bind a fresh unit of work to the rest of the current task"""
+    unit = UnitOfWork()
+    _current_unit.set(unit)
+    return unit
+
+
+@contextmanager
+def unit_of_work():
+    """Scope a unit of work to a block (background jobs)"""
+    unit = UnitOfWork()
+    token = _current_unit.set(unit)
+    try:
+        yield unit
+    finally:
+        _current_unit.reset(token)
+
+
+async def cached_read(key, loader):
+    """
+    Return loader()'s result, deduped within the current unit of work
+
+    Args:
+        key: hashable identity of the read, e.g. ('players', user_id)
+        loader: zero-argument coroutine function doing the real query
+    """
+    unit = _current_unit.get()
+    if unit is None:
+        return await loader()
+
+    entry = unit.entries.get(key)
+    if entry is not None and time.monotonic() - entry[0] < unit.max_age:
+        unit.hits += 1
+        value = entry[1]
+    else:
+        unit.misses += 1
+        value = await loader()
+        unit.entries[key] = (time.monotonic(), value)
+
+    # Callers may modify the dict they get back
+    return dict(value) if isinstance(value, dict) else value
+
+
+class GameStateCache:
+    """Process-wide cache of the single game_state row"""
+
+    def __init__(self, ttl=GAME_STATE_TTL):
+        self.ttl = ttl
+        self._value = None
+        self._loaded_at = 0.0
+        self._generation = 0
+
+    def invalidate(self):
+        self._value = None
+        self._generation += 1
+
+    async def get(self, loader):
+        if self._value is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return dict(self._value)
+
+        generation = self._generation
+        value = await loader()
+        # Don't keep a row that was read while a write invalidated the cache
+        if value is not None and generation == self._generation:
+            self._value = value
+            self._loaded_at = time.monotonic()
+        return dict(value) if value is not None else None
+
+
+game_state_cache = GameStateCache()
+
+
+def note_write(query=None):
+    """Invalidate cached reads after a write (query None = unknown statement)"""
+    unit = _current_unit.get()
+    if unit is not None:
+        unit.clear()
+    if query is None or GAME_STATE_TABLE.search(query):
+        game_state_cache.invalidate()
+
+
+class TrackedConnection(asyncpg.Connection):
+    """Pool connection class that invalidates the read caches on every write"""
+
+    _resetting = False
+
+    async def reset(self, *, timeout=None):
+        # The pool runs its reset query through execute() on every release;
+        # that is housekeeping, not a write
+        self._resetting = True
+        try:
+            return await super().reset(timeout=timeout)
+        finally:
+            self._resetting = False
+
+    async def execute(self, query, *args, **kwargs):
+        try:
+            return await super().execute(query, *args, **kwargs)
+        finally:
+            # BEGIN / COMMIT and plain SELECTs also come through here
+            if not self._resetting and WRITE_STATEMENT.search(query):
+                note_write(query)
+
+    async def executemany(self, command, args, **kwargs):
+        try:
+            return await super().executemany(command, args, **kwargs)
+        finally:
+            if WRITE_STATEMENT.search(command):
+                note_write(command)
+
+    async def fetch(self, query, *args, **kwargs):
+        try:
+            return await super().fetch(query, *args, **kwargs)
+        finally:
+            if WRITE_STATEMENT.search(query):
+                note_write(query)
+
+    async def fetchrow(self, query, *args, **kwargs):
+        try:
+            return await super().fetchrow(query, *args, **kwargs)
+        finally:
+            if WRITE_STATEMENT.search(query):
+                note_write(query)
+
+    async def fetchval(self, query, *args, **kwargs):
+        try:
+            return await super().fetchval(query, *args, **kwargs)
+        finally:
+            if WRITE_STATEMENT.search(query):
+                note_write(query)
+
+    async def copy_records_to_table(self, table_name, **kwargs):
+        try:
+            return await super().copy_records_to_table(table_name, **kwargs)
+        finally:
+            note_write(table_name)
+
+
+class CachedCommandTree(app_commands.CommandTree):
+    """Command tree that gives every slash command its own unit of work"""
+
+    async def interaction_check(self, interaction):
+        # Runs in the task that goes on to invoke the command
+        begin_unit_of_work()
+        return True
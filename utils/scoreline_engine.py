@@ -0,0 +1,200 @@
+"""
+Vectorized Scoreline Engine - NumPy simulation of NPC results
+Takes arrays of ratings/strengths for N fixtures and returns N scorelines in one call
+
+Two models, matching the original per-fixture loops exactly:
+- simulate_npc_scorelines: MatchEngine.simulate_npc_match model
+  (tier modifiers, +5 home advantage, 8-14 chances, cap 6, 5% chaos bonus capped at 8)
+- simulate_strength_scorelines: match_simulator.simulate_score model
+
+Pass rng=make_rng(seed) for reproducible results (tests, replays, projections).
+Inputs can be any broadcastable shape, so (fixtures, runs) arrays work for Monte-Carlo.
+For very large Monte-Carlo runs, npc_score_distribution + sample_scorelines draw from the
+exact per-fixture distribution with one uniform per sample.
+"""
+import math
+
+import numpy as np
+
+_default_rng = np.random.default_rng()
+
+
+def make_rng(seed=None):
+    """Create a generator; same seed -> same scorelines"""
+    return np.random.default_rng(seed)
+
+
+def rating_modifiers(ratings):
+    """Vectorized get_rating_modifier (team quality tiers)"""
+    ratings = np.asarray(ratings, dtype=float)
+    return np.select(
+        [ratings >= 85, ratings >= 80, ratings >= 75, ratings >= 70, ratings >= 65],
+        [25, 20, 15, 10, 5],
+        default=0
+    )
+
+
+def simulate_npc_scorelines(home_ratings, away_ratings, rng=None, size=None):
+    """
+    Simulate NPC scorelines from average squad ratings
+
+    Args:
+        home_ratings / away_ratings: scalars or arrays of average squad ratings
+        rng: numpy Generator (use make_rng(seed) for reproducible runs)
+        size: output shape (defaults to the broadcast shape of the inputs)
+
+    Returns:
+        (home_goals, away_goals) integer arrays
+    """
+    rng = rng or _default_rng
+
+    home_ratings = np.asarray(home_ratings, dtype=float)
+    away_ratings = np.asarray(away_ratings, dtype=float)
+    shape = size if size is not None else np.broadcast(home_ratings, away_ratings).shape
+
+    home_strength = home_ratings + rating_modifiers(home_ratings) + 5
+    away_strength = away_ratings + rating_modifiers(away_ratings)
+
+    # Both teams share the same number of chances in a match
+    num_chances = rng.integers(8, 15, size=shape)
+
+    home_goals = rng.binomial(num_chances, np.clip(home_strength / 400, 0, 1))
+    away_goals = rng.binomial(num_chances, np.clip(away_strength / 400, 0, 1))
+
+    home_goals = np.minimum(home_goals, 6)
+    away_goals = np.minimum(away_goals, 6)
+
+    # 5% chaos bonus
+    chaos = rng.random(shape) < 0.05
+    home_goals = np.where(chaos, np.minimum(home_goals + rng.integers(0, 3, size=shape), 8), home_goals)
+    away_goals = np.where(chaos, np.minimum(away_goals + rng.integers(0, 3, size=shape), 8), away_goals)
+
+    return home_goals, away_goals
+
+
+def simulate_strength_scorelines(home_strength, away_strength, rng=None, size=None):
+    """
+    Simulate scorelines from match strengths (match_simulator.simulate_score model)
+
+    Returns:
+        (home_goals, away_goals) integer arrays
+    """
+    rng = rng or _default_rng
+
+    home_strength = np.asarray(home_strength, dtype=int)
+    away_strength = np.asarray(away_strength, dtype=int)
+    shape = size if size is not None else np.broadcast(home_strength, away_strength).shape
+    home_strength = np.broadcast_to(home_strength, shape)
+    away_strength = np.broadcast_to(away_strength, shape)
+
+    diff = home_strength - away_strength
+
+    # STEP 1: Scoring chances
+    home_chances = 7 + (home_strength - 70) // 10
+    away_chances = 7 + (away_strength - 70) // 10
+
+    home_dominant = diff > 15
+    away_dominant = diff < -15
+    home_chances = home_chances + np.where(home_dominant, 2, 0) - np.where(away_dominant, 1, 0)
+    away_chances = away_chances + np.where(away_dominant, 2, 0) - np.where(home_dominant, 1, 0)
+
+    home_chances = np.maximum(4, home_chances + rng.integers(-1, 2, size=shape))
+    away_chances = np.maximum(4, away_chances + rng.integers(-1, 2, size=shape))
+
+    # STEP 2: Conversion (percent)
+    home_conversion = np.minimum(25, 8 + (home_strength - 70) // 5) + np.where(diff > 20, 5, 0)
+    away_conversion = np.minimum(25, 6 + (away_strength - 70) // 5) + np.where(diff < -20, 5, 0)
+
+    home_score = rng.binomial(home_chances, np.clip(home_conversion / 100, 0, 1))
+    away_score = rng.binomial(away_chances, np.clip(away_conversion / 100, 0, 1))
+
+    # STEP 3: Special scenarios
+    upset = rng.random(shape) < 0.10
+    upset_goals = rng.integers(1, 3, size=shape)
+    away_score = away_score + np.where((diff > 25) & upset, upset_goals, 0)
+    home_score = home_score + np.where((diff < -25) & upset, upset_goals, 0)
+
+    thriller = rng.random(shape) < 0.03
+    home_score = home_score + np.where(thriller, rng.integers(0, 2, size=shape), 0)
+    away_score = away_score + np.where(thriller, rng.integers(0, 2, size=shape), 0)
+
+    defensive = rng.random(shape) < 0.05
+    home_score = np.where(defensive, np.minimum(home_score, 1), home_score)
+    away_score = np.where(defensive, np.minimum(away_score, 1), away_score)
+
+    # STEP 4: Caps
+    home_score = np.clip(home_score, 0, 6)
+    away_score = np.clip(away_score, 0, 6)
+
+    return home_score, away_score
+
+
+MAX_NPC_GOALS = 8
+
+# _BINOMIAL_COEFFS[n, k] = C(n, k) for the 8-14 chance range
+_BINOMIAL_COEFFS = np.array([[math.comb(n, k) for k in range(15)] for n in range(15)], dtype=float)
+
+
+def _capped_binomial_pmfs(p, cap=6):
+    """(7, cap + 1) pmfs of Binomial(n, p) for n = 8..14, mass above cap folded into cap"""
+    n = np.arange(8, 15)[:, None]
+    k = np.arange(15)[None, :]
+    with np.errstate(invalid='ignore'):
+        pmf = np.where(k <= n, _BINOMIAL_COEFFS[8:15] * p ** k * (1 - p) ** np.maximum(n - k, 0), 0.0)
+    capped = pmf[:, :cap + 1].copy()
+    capped[:, cap] += pmf[:, cap + 1:].sum(axis=1)
+    return capped
+
+
+def npc_score_distribution(home_rating, away_rating):
+    """
+    Exact joint distribution of simulate_npc_scorelines for one fixture
+
+    Returns:
+        (9, 9) array where [h, a] = P(home scores h, away scores a)
+    """
+    home_strength = home_rating + int(rating_modifiers(home_rating)) + 5
+    away_strength = away_rating + int(rating_modifiers(away_rating))
+    home_p = min(max(home_strength / 400, 0.0), 1.0)
+    away_p = min(max(away_strength / 400, 0.0), 1.0)
+
+    # Shared chance count (8-14, uniform), goals capped at 6
+    base = _capped_binomial_pmfs(home_p).T @ _capped_binomial_pmfs(away_p) / 7
+
+    # 5% chaos bonus: each side independently +0/+1/+2 (6 + 2 never exceeds the cap of 8)
+    size = MAX_NPC_GOALS + 1
+    joint = np.zeros((size, size))
+    joint[:7, :7] = base * 0.95
+    for dh in range(3):
+        for da in range(3):
+            joint[dh:dh + 7, da:da + 7] += base * (0.05 / 9)
+    return joint
+
+
+def sample_scorelines(distributions, runs, rng=None):
+    """
+    Draw many scorelines per fixture from precomputed joint distributions
+
+    Args:
+        distributions: (F, 9, 9) array from npc_score_distribution
+        runs: number of draws per fixture
+
+    Returns:
+        (home_goals, away_goals) integer arrays of shape (F, runs)
+    """
+    rng = rng or _default_rng
+
+    distributions = np.asarray(distributions, dtype=float)
+    fixtures = distributions.shape[0]
+    size = distributions.shape[-1]
+
+    cdf = np.cumsum(distributions.reshape(fixtures, -1), axis=1)
+    cdf /= cdf[:, -1:]
+    draws = rng.random((fixtures, runs))
+
+    codes = np.empty((fixtures, runs), dtype=np.int64)
+    for i in range(fixtures):
+        codes[i] = np.searchsorted(cdf[i], draws[i], side='right')
+    np.minimum(codes, size * size - 1, out=codes)
+
+    return codes // size, codes % size
@@ -11,13 +11,17 @@ Season Management - Two Windows on Same Days
 ✅ NEW: Integrated NPC rating balance maintenance
 """
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from database import db
+from utils.standings import standings
 import config
 import logging
 import discord
 # ✅ NEW: Import NPC maintenance
 from utils.npc_rating_manager import weekly_npc_maintenance
+from utils.team_strength import team_strength
+from utils.scoreline_engine import simulate_npc_scorelines
 
 try:
     from zoneinfo import ZoneInfo
@@ -213,7 +217,7 @@ async def close_match_window(window_type='domestic', bot=None):
             # ✅ NEW: Send notification BEFORE simulating matches and advancing week
             # This ensures notification shows correct week numbers
         
-            # Now simulate matches
+            # Now simulate matches (batched: one ratings read, bulk writes)
             unplayed = await conn.fetch("""
                 SELECT * FROM fixtures 
                 WHERE week_number = $1 AND played = FALSE AND playable = TRUE
@@ -221,39 +225,9 @@ async def close_match_window(window_type='domestic', bot=None):
             
             logger.info(f"Simulating {len(unplayed)} unplayed matches...")
             
-            from utils.match_engine import match_engine
+            results = await simulate_fixtures_batch(conn, unplayed, current_week)
             
-            for fixture in unplayed:
-                result = await match_engine.simulate_npc_match(
-                    fixture['home_team_id'],
-                    fixture['away_team_id']
-                )
-                
-                await conn.execute("""
-                    UPDATE fixtures 
-                    SET home_score = $1, away_score = $2, played = TRUE, playable = FALSE
-                    WHERE fixture_id = $3
-                """, result['home_score'], result['away_score'], fixture['fixture_id'])
-                
-                await update_team_stats(conn, fixture['home_team_id'], result['home_score'], result['away_score'])
-                await update_team_stats(conn, fixture['away_team_id'], result['away_score'], result['home_score'])
-                
-                results.append({
-                    'home_team_name': result['home_team'],
-                    'away_team_name': result['away_team'],
-                    'home_score': result['home_score'],
-                    'away_score': result['away_score']
-                })
-                
-                await add_match_result_news(
-                    result['home_team'],
-                    result['away_team'],
-                    result['home_score'],
-                    result['away_score'],
-                    'match_news',
-                    current_week,
-                    competition='League'
-                )
+            await verify_tables(conn)
             
             # Now advance week AFTER notification and match simulation
             logger.info(f"ADVANCING WEEK from {current_week} to {current_week + 1}")
@@ -263,27 +237,31 @@ async def close_match_window(window_type='domestic', bot=None):
             if current_week in config.EUROPEAN_MATCH_WEEKS:
                 from utils.european_competitions import close_european_window
                 await close_european_window(current_week, bot=bot, competition=None)
+                await verify_tables(conn)
     
     return results
 
 
-async def update_team_stats(conn, team_id, goals_for, goals_against):
+async def verify_tables(conn):
+    """Consistency check after a window closes: rebuild league and group tables from fixtures"""
+    try:
+        from utils.league_system import recalculate_all_tables
+        await recalculate_all_tables(conn)
+    except Exception as e:
+        logger.error(f"❌ Table recalculation failed: {e}")
+
+
+def get_result_columns(goals_for, goals_against):
+    """Return (won, drawn, lost, points) for one side of a result"""
     if goals_for > goals_against:
-        won, drawn, lost, points = 1, 0, 0, 3
+        return 1, 0, 0, 3
     elif goals_for == goals_against:
-        won, drawn, lost, points = 0, 1, 0, 1
-    else:
-        won, drawn, lost, points = 0, 0, 1, 0
-    
-    await conn.execute("""
-        UPDATE teams 
-        SET played = played + 1, won = won + $1, drawn = drawn + $2, lost = lost + $3,
-            goals_for = goals_for + $4, goals_against = goals_against + $5, points = points + $6
-        WHERE team_id = $7
-    """, won, drawn, lost, goals_for, goals_against, points, team_id)
+        return 0, 1, 0, 1
+    return 0, 0, 1, 0
 
 
-async def add_match_result_news(home_team, away_team, home_score, away_score, category, week_number, competition='League'):
+def build_match_result_news(home_team, away_team, home_score, away_score):
+    """Build (headline, content, importance) for a match result news item"""
     if home_score > away_score:
         margin = home_score - away_score
         if margin >= 3:
@@ -307,9 +285,137 @@ async def add_match_result_news(home_team, away_team, home_score, away_score, ca
         importance = 4
         content = f"{home_team} and {away_team} drew {home_score}-{away_score}."
     
+    return headline, content, importance
+
+
+async def add_match_result_news(home_team, away_team, home_score, away_score, category, week_number, competition='League'):
+    headline, content, importance = build_match_result_news(home_team, away_team, home_score, away_score)
     await db.add_news(headline=headline, content=content, category=category, user_id=None, importance=importance, week_number=week_number)
 
 
+async def simulate_fixtures_batch(conn, fixtures, week_number, rng=None):
+    """
+    Simulate a whole week of domestic fixtures in one pass
+    
+    - Reads every squad rating for the week from the team strength cache (one query when cold)
+    - Computes all scorelines in one vectorized call (same model as simulate_npc_match)
+    - Writes fixtures, team tables and news with bulk statements in ONE transaction
+    
+    Pass rng=make_rng(seed) for reproducible results.
+    Returns the same result dicts the per-fixture loop used to build.
+    """
+    if not fixtures:
+        return []
+    
+    started = time.perf_counter()
+    
+    team_ids = list({f['home_team_id'] for f in fixtures} | {f['away_team_id'] for f in fixtures})
+    
+    rows = await conn.fetch("""
+        SELECT team_id, team_name FROM teams WHERE team_id = ANY($1::text[])
+    """, team_ids)
+    ratings = await team_strength.get_ratings(team_ids)
+    
+    teams = {
+        r['team_id']: {
+            'name': r['team_name'],
+            'rating': ratings[r['team_id']] if ratings[r['team_id']] is not None else 75
+        }
+        for r in rows
+    }
+    
+    valid = []
+    for fixture in fixtures:
+        if fixture['home_team_id'] not in teams or fixture['away_team_id'] not in teams:
+            logger.error(
+                f"Could not find teams - home_team_id: {fixture['home_team_id']}, away_team_id: {fixture['away_team_id']}")
+            continue
+        valid.append(fixture)
+    
+    if not valid:
+        return []
+    
+    # Every scoreline of the week in one vectorized call
+    home_goals, away_goals = simulate_npc_scorelines(
+        [teams[f['home_team_id']]['rating'] for f in valid],
+        [teams[f['away_team_id']]['rating'] for f in valid],
+        rng=rng
+    )
+    
+    results = []
+    fixture_ids = [f['fixture_id'] for f in valid]
+    home_scores = home_goals.tolist()
+    away_scores = away_goals.tolist()
+    table_deltas = {}
+    news_rows = []
+    
+    for fixture, home_score, away_score in zip(valid, home_scores, away_scores):
+        home = teams[fixture['home_team_id']]
+        away = teams[fixture['away_team_id']]
+        
+        for team_id, goals_for, goals_against in (
+            (fixture['home_team_id'], home_score, away_score),
+            (fixture['away_team_id'], away_score, home_score)
+        ):
+            delta = table_deltas.setdefault(team_id, [0, 0, 0, 0, 0, 0, 0])
+            won, drawn, lost, points = get_result_columns(goals_for, goals_against)
+            delta[0] += 1
+            delta[1] += won
+            delta[2] += drawn
+            delta[3] += lost
+            delta[4] += goals_for
+            delta[5] += goals_against
+            delta[6] += points
+        
+        headline, content, importance = build_match_result_news(
+            home['name'], away['name'], home_score, away_score
+        )
+        news_rows.append((headline, content, 'match_news', None, importance, week_number))
+        
+        results.append({
+            'home_team_name': home['name'],
+            'away_team_name': away['name'],
+            'home_score': home_score,
+            'away_score': away_score
+        })
+    
+    delta_team_ids = list(table_deltas.keys())
+    columns = list(zip(*table_deltas.values()))
+    
+    async with conn.transaction():
+        await conn.execute("""
+            UPDATE fixtures AS f
+            SET home_score = r.home_score, away_score = r.away_score,
+                played = TRUE, playable = FALSE
+            FROM UNNEST($1::int[], $2::int[], $3::int[]) AS r(fixture_id, home_score, away_score)
+            WHERE f.fixture_id = r.fixture_id
+        """, fixture_ids, home_scores, away_scores)
+        
+        await conn.execute("""
+            UPDATE teams AS t
+            SET played = t.played + r.played, won = t.won + r.won,
+                drawn = t.drawn + r.drawn, lost = t.lost + r.lost,
+                goals_for = t.goals_for + r.goals_for,
+                goals_against = t.goals_against + r.goals_against,
+                points = t.points + r.points
+            FROM UNNEST($1::text[], $2::int[], $3::int[], $4::int[], $5::int[], $6::int[], $7::int[], $8::int[])
+                 AS r(team_id, played, won, drawn, lost, goals_for, goals_against, points)
+            WHERE t.team_id = r.team_id
+        """, delta_team_ids, *[list(c) for c in columns])
+        
+        await standings.rerank(conn, delta_team_ids)
+        
+        await conn.executemany("""
+            INSERT INTO news (headline, content, category, user_id, importance, week_number)
+            VALUES ($1, $2, $3, $4, $5, $6)
+        """, news_rows)
+    standings.invalidate()
+    
+    logger.info(f"✅ Batch-simulated {len(fixture_ids)} fixtures in {(time.perf_counter() - started) * 1000:.0f}ms")
+    
+    return results
+
+
 async def advance_week(bot=None):
     async with db.pool.acquire() as conn:
         state = await conn.fetchrow('SELECT * FROM game_state')
@@ -365,48 +471,32 @@ async def advance_week(bot=None):
                 logger.info(f"🔄 TRANSFER WINDOW ACTIVE - Week {next_week}")
                 logger.info(f"{'='*60}")
         
-                # ✅ FIXED: Correct import path
-                from utils.transfer_window_manager import (
-                    process_weekly_transfer_offers, 
-                    simulate_npc_transfers
-                )
+                from utils.transfer_window_manager import process_weekly_transfer_offers
+                from utils.transfer_market import run_transfer_market
         
                 # 1. Generate player transfer offers (human players)
                 logger.info("📬 Generating transfer offers for players...")
                 await process_weekly_transfer_offers(bot=bot)
         
-                # 2. Simulate domestic NPC transfers
-                logger.info("🔄 Simulating domestic NPC transfers...")
-                await simulate_npc_transfers()
+                # ✅ NEW: Domestic + European NPC transfers and squad balancing, resolved in memory and written as one batch
+                logger.info("🔄 Simulating NPC transfers...")
+                counts = await run_transfer_market(next_week)
         
-                # ✅ NEW: European transfer system
-                logger.info("🌍 Processing European transfers...")
-                from utils.european_transfer_system import (
-                    simulate_european_transfers,
-                    simulate_european_to_english_transfers,
-                    simulate_english_to_european_transfers
-                )
+                # 2. Domestic NPC transfers
+                logger.info(f"  ✅ {counts['market']} domestic NPC transfers")
         
                 # 3. Inter-European transfers (Real Madrid ↔ Bayern, etc.)
-                euro_count = await simulate_european_transfers()
-                logger.info(f"  ✅ {euro_count} inter-European transfers")
+                logger.info(f"  ✅ {counts['inter_european']} inter-European transfers")
         
                 # 4. European → English transfers (Mbappe → Man City, etc.)
-                euro_to_eng = await simulate_european_to_english_transfers()
-                logger.info(f"  ✅ {euro_to_eng} European → English transfers")
+                logger.info(f"  ✅ {counts['europe_to_england']} European → English transfers")
         
                 # 5. English → European transfers (Kane → Bayern, etc.)
-                eng_to_euro = await simulate_english_to_european_transfers()
-                logger.info(f"  ✅ {eng_to_euro} English → European transfers")
-        
-                # ✅ BONUS: Balance squad sizes (optional but recommended)
-                try:
-                    from utils.npc_transfer_system import balance_team_squads
-                    balanced = await balance_team_squads()
-                    if balanced:
-                        logger.info(f"  ⚖️ {balanced} players balanced across squads")
-                except Exception as e:
-                    logger.warning(f"Squad balancing skipped: {e}")
+                logger.info(f"  ✅ {counts['england_to_europe']} English → European transfers")
+        
+                # ✅ BONUS: Balance squad sizes
+                if counts['balance']:
+                    logger.info(f"  ⚖️ {counts['balance']} players balanced across squads")
         
                 logger.info(f"{'='*60}")
                 logger.info(f"✅ TRANSFER WINDOW COMPLETE")
@@ -434,6 +524,8 @@ async def end_season(bot=None):
         await process_promotions_relegations(bot=bot)
         
         await conn.execute("UPDATE teams SET played=0, won=0, drawn=0, lost=0, goals_for=0, goals_against=0, points=0")
+        await standings.rerank(conn)
+        standings.invalidate()
         await conn.execute("UPDATE players SET season_goals=0, season_assists=0, season_apps=0, season_motm=0")
         
         await db.age_all_players(bot=bot)
@@ -0,0 +1,209 @@
+"""
+Season Projection Engine - Monte-Carlo simulation of the rest of the season
+Runs thousands of completions of the remaining fixtures with the simulate_npc_match
+rating model and reports title / European / promotion / relegation probabilities
+
+Results are cached per league and matchweek, so repeated /league calls are free
+until the next matchweek is played (or a roster change invalidates the cache).
+"""
+import asyncio
+import logging
+import time
+
+import numpy as np
+
+import config
+from database import db
+from utils.team_strength import team_strength
+from utils.scoreline_engine import make_rng, npc_score_distribution, sample_scorelines
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUNS = 10000
+DEFAULT_RATING = 75
+
+
+def run_projection(teams, fixtures, ratings, runs=DEFAULT_RUNS, rng=None):
+    """
+    Pure NumPy projection (no database access, safe to run in a worker thread)
+
+    Args:
+        teams: list of dicts with team_id, team_name, points, goals_for, goals_against
+        fixtures: list of (home_team_id, away_team_id) still to be played
+        ratings: dict team_id -> average squad rating
+        runs: number of simulated completions
+
+    Returns:
+        (T, T) array where [team, position - 1] = probability of finishing in that position
+    """
+    rng = rng or make_rng()
+
+    index = {team['team_id']: i for i, team in enumerate(teams)}
+    num_teams = len(teams)
+
+    fixtures = [(h, a) for h, a in fixtures if h in index and a in index]
+
+    points = np.repeat(np.array([t['points'] for t in teams], dtype=np.float64)[:, None], runs, axis=1)
+    goals_for = np.repeat(np.array([t['goals_for'] for t in teams], dtype=np.float64)[:, None], runs, axis=1)
+    goal_diff = np.repeat(
+        np.array([t['goals_for'] - t['goals_against'] for t in teams], dtype=np.float64)[:, None], runs, axis=1
+    )
+
+    if fixtures:
+        # One distribution per distinct pairing of ratings
+        cache = {}
+        distributions = []
+        for home_id, away_id in fixtures:
+            key = (ratings.get(home_id, DEFAULT_RATING), ratings.get(away_id, DEFAULT_RATING))
+            if key not in cache:
+                cache[key] = npc_score_distribution(*key)
+            distributions.append(cache[key])
+
+        home_goals, away_goals = sample_scorelines(np.stack(distributions), runs, rng=rng)
+        home_goals = home_goals.astype(np.float64)
+        away_goals = away_goals.astype(np.float64)
+
+        home_points = np.where(home_goals > away_goals, 3.0, np.where(home_goals == away_goals, 1.0, 0.0))
+        away_points = np.where(away_goals > home_goals, 3.0, np.where(home_goals == away_goals, 1.0, 0.0))
+
+        # (T, F) incidence matrices turn per-fixture results into per-team totals in one matmul
+        home_matrix = np.zeros((num_teams, len(fixtures)))
+        away_matrix = np.zeros((num_teams, len(fixtures)))
+        for f, (home_id, away_id) in enumerate(fixtures):
+            home_matrix[index[home_id], f] = 1
+            away_matrix[index[away_id], f] = 1
+
+        points += home_matrix @ home_points + away_matrix @ away_points
+        goals_for += home_matrix @ home_goals + away_matrix @ away_goals
+        goal_diff += home_matrix @ (home_goals - away_goals) + away_matrix @ (away_goals - home_goals)
+
+    # Same ordering as the league table: points, goal difference, goals scored, then a coin toss
+    sort_key = points * 1e8 + (goal_diff + 5000) * 1e4 + goals_for + rng.random((num_teams, runs))
+    order = np.argsort(-sort_key, axis=0)  # order[pos, run] = team index
+
+    position_probs = np.zeros((num_teams, num_teams))
+    for pos in range(num_teams):
+        position_probs[:, pos] = np.bincount(order[pos], minlength=num_teams) / runs
+
+    return position_probs
+
+
+def summarize_projection(league, teams, position_probs):
+    """Turn position probabilities into per-team title/European/promotion/relegation odds"""
+    num_teams = len(teams)
+    cl_positions = [p - 1 for p in config.CL_QUALIFICATION_POSITIONS.get(league, []) if p <= num_teams]
+    el_positions = [p - 1 for p in config.EL_QUALIFICATION_POSITIONS.get(league, []) if p <= num_teams]
+    promotion_places = config.PROMOTION_PLACES.get(league, 0)
+    relegation_places = config.RELEGATION_PLACES.get(league, 0)
+
+    positions = np.arange(1, num_teams + 1)
+    results = []
+
+    for i, team in enumerate(teams):
+        probs = position_probs[i]
+        results.append({
+            'team_id': team['team_id'],
+            'team_name': team['team_name'],
+            'points': team['points'],
+            'expected_position': float(probs @ positions),
+            'title': float(probs[0]),
+            'champions_league': float(probs[cl_positions].sum()) if cl_positions else 0.0,
+            'europa_league': float(probs[el_positions].sum()) if el_positions else 0.0,
+            'promotion': float(probs[:promotion_places].sum()) if promotion_places else 0.0,
+            'relegation': float(probs[num_teams - relegation_places:].sum()) if relegation_places else 0.0,
+        })
+
+    results.sort(key=lambda r: r['expected_position'])
+    return results
+
+
+class SeasonProjector:
+    """Per-matchweek cache of league projections"""
+
+    def __init__(self):
+        self._cache = {}  # league -> (cache_key, projection)
+        self._locks = {}
+
+    async def project_league(self, league, runs=DEFAULT_RUNS, seed=None):
+        """
+        Project the rest of the season for one league
+
+        Returns:
+            dict with season, week, runs, remaining_fixtures, elapsed_ms and teams
+            (list sorted by expected finishing position), or None if the league is empty
+        """
+        lock = self._locks.setdefault(league, asyncio.Lock())
+
+        async with lock:
+            state = await db.get_game_state()
+            current_week = state['current_week']
+
+            async with db.pool.acquire() as conn:
+                teams = await conn.fetch("""
+                    SELECT team_id, team_name, points, goals_for, goals_against
+                    FROM teams
+                    WHERE league = $1
+                    ORDER BY position
+                """, league)
+
+                fixtures = await conn.fetch("""
+                    SELECT home_team_id, away_team_id
+                    FROM fixtures
+                    WHERE league = $1
+                      AND played = FALSE
+                      AND week_number >= $2
+                      AND week_number <= $3
+                """, league, current_week, config.SEASON_TOTAL_WEEKS)
+
+            if not teams:
+                return None
+
+            teams = [dict(t) for t in teams]
+            fixtures = [(f['home_team_id'], f['away_team_id']) for f in fixtures]
+
+            cache_key = (
+                state['current_season'], current_week, len(fixtures),
+                tuple((t['team_id'], t['points']) for t in teams), runs
+            )
+            cached = self._cache.get(league)
+            if seed is None and cached and cached[0] == cache_key:
+                return cached[1]
+
+            ratings = await team_strength.get_ratings([t['team_id'] for t in teams])
+            ratings = {team_id: (rating if rating is not None else DEFAULT_RATING)
+                       for team_id, rating in ratings.items()}
+
+            start = time.perf_counter()
+            position_probs = await asyncio.to_thread(
+                run_projection, teams, fixtures, ratings, runs, make_rng(seed)
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            projection = {
+                'league': league,
+                'season': state['current_season'],
+                'week': current_week,
+                'runs': runs,
+                'remaining_fixtures': len(fixtures),
+                'elapsed_ms': elapsed_ms,
+                'teams': summarize_projection(league, teams, position_probs),
+            }
+
+            if seed is None:
+                self._cache[league] = (cache_key, projection)
+
+            logger.info(
+                f"🔮 Projected {league}: {runs} runs x {len(fixtures)} fixtures in {elapsed_ms:.0f}ms"
+            )
+            return projection
+
+    def invalidate(self, league=None):
+        """Drop cached projections (one league or all)"""
+        if league is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(league, None)
+
+
+# Global season projector instance
+season_projector = SeasonProjector()
@@ -0,0 +1,125 @@
+"""
+Standings - league tables ranked once on write, served from memory on read
+teams.position is the maintained rank (indexed on (league, position))
+
+- Every write path that changes points/goals reranks only the leagues it touched,
+  in the same transaction, and only rewrites rows whose position actually moved
+- Table reads come from an in-process cache per league, reloaded with
+  ORDER BY position after a write invalidates it
+- "What place is my club?" is a dict lookup (get_position) instead of a sort
+"""
+import asyncio
+import logging
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+LEAGUE_TABLE_ORDER = "points DESC, (goals_for - goals_against) DESC, goals_for DESC, team_name"
+
+
+class StandingsCache:
+    """Per-league standings cache backed by teams.position"""
+
+    def __init__(self):
+        self._tables = {}     # league -> list of team dicts in position order
+        self._positions = {}  # team_id -> (league, position)
+        self._locks = {}      # league -> asyncio.Lock (one reload per league at a time)
+        self._generation = 0  # bumped on invalidate, so a reload racing a write isn't cached
+
+    # ========== WRITES ==========
+
+    async def rerank(self, conn, team_ids=None):
+        """
+        Recompute teams.position for the leagues of team_ids (every league if None)
+        Call inside the transaction that changed the results, then invalidate() after commit
+
+        Returns:
+            number of teams whose position changed
+        """
+        if team_ids is None:
+            scope, args = "", []
+        else:
+            scope = "WHERE league IN (SELECT league FROM teams WHERE team_id = ANY($1::text[]))"
+            args = [list(team_ids)]
+
+        result = await conn.execute(f"""
+            WITH ranked AS (
+                SELECT team_id,
+                       ROW_NUMBER() OVER (PARTITION BY league ORDER BY {LEAGUE_TABLE_ORDER})::int AS position
+                FROM teams
+                {scope}
+            )
+            UPDATE teams AS t
+            SET position = r.position
+            FROM ranked r
+            WHERE t.team_id = r.team_id
+              AND t.position IS DISTINCT FROM r.position
+        """, *args)
+        return int(result.split()[-1])
+
+    def invalidate(self, league=None):
+        """Drop cached tables (one league, or all) so the next read reloads them"""
+        self._generation += 1
+        if league is None:
+            self._tables.clear()
+            self._positions.clear()
+            return
+
+        self._tables.pop(league, None)
+        self._positions = {
+            team_id: entry for team_id, entry in self._positions.items() if entry[0] != league
+        }
+
+    # ========== READS ==========
+
+    async def _load(self, league):
+        lock = self._locks.setdefault(league, asyncio.Lock())
+        async with lock:
+            if league in self._tables:
+                return self._tables[league]
+
+            generation = self._generation
+            async with db.pool.acquire() as conn:
+                rows = await conn.fetch("""
+                    SELECT *, (goals_for - goals_against) AS gd
+                    FROM teams
+                    WHERE league = $1
+                    ORDER BY position, team_name
+                """, league)
+
+            table = [dict(row) for row in rows]
+            if generation == self._generation:
+                self._tables[league] = table
+                for team in table:
+                    self._positions[team['team_id']] = (league, team['position'])
+            return table
+
+    async def get_table(self, league):
+        """League table in position order (copies, so callers can't modify the cache)"""
+        table = self._tables.get(league)
+        if table is None:
+            table = await self._load(league)
+        return [dict(team) for team in table]
+
+    async def get_position(self, team_id, league=None):
+        """
+        League position of a team (None if unknown)
+
+        Args:
+            league: the team's league, if known, so a cold cache loads just that table
+        """
+        entry = self._positions.get(team_id)
+        if entry is None:
+            if league is None:
+                async with db.pool.acquire() as conn:
+                    league = await conn.fetchval("SELECT league FROM teams WHERE team_id = $1", team_id)
+                if league is None:
+                    return None
+            await self._load(league)
+            entry = self._positions.get(team_id)
+        return entry[1] if entry else None
+
+
+# Global standings instance
+standings = StandingsCache()
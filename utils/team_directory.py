@@ -0,0 +1,117 @@
+"""
+Team Directory - process-wide id -> name / league / tier / crest for every club
+Covers both teams and european_teams, so name and league lookups never query
+
+- Loaded once at startup (setup_hook), two small SELECTs
+- Reloaded after anything that changes the set of clubs or their leagues
+  (promotion / relegation, seeding); team names never change at runtime
+- Lookups prefer the domestic row, like COALESCE(t.team_name, et.team_name);
+  get(..., european_first=True) mirrors the European match engine's preference
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+LEAGUE_TIERS = {'Premier League': 1, 'Championship': 2, 'League One': 3}
+CLUB_TIER_RANKS = {'elite': 1, 'top': 2, 'mid': 3, 'lower': 4}
+
+
+@dataclass(frozen=True)
+class TeamEntry:
+    team_id: str
+    team_name: str
+    league: str
+    tier: int              # English clubs: league level (1-3); European clubs: CLUB_TIERS rank (1 elite - 4 lower)
+    is_european: bool
+    country: str = None
+    crest_url: str = ''
+
+    def as_dict(self):
+        return {'team_id': self.team_id, 'team_name': self.team_name, 'league': self.league}
+
+
+class TeamDirectory:
+    """In-memory directory of domestic and European clubs"""
+
+    def __init__(self):
+        self._domestic = {}  # team_id -> TeamEntry
+        self._european = {}  # team_id -> TeamEntry
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    async def load(self):
+        """(Re)load both tables"""
+        from utils.european_transfer_system import get_club_tier
+        from utils.football_data_api import get_team_crest_url
+
+        async with self._lock:
+            async with db.pool.acquire() as conn:
+                teams = await conn.fetch("SELECT team_id, team_name, league FROM teams")
+                european_teams = await conn.fetch("SELECT team_id, team_name, league, country FROM european_teams")
+
+            self._domestic = {
+                t['team_id']: TeamEntry(t['team_id'], t['team_name'], t['league'],
+                                        LEAGUE_TIERS.get(t['league'], len(LEAGUE_TIERS)), False,
+                                        'England', get_team_crest_url(t['team_id']))
+                for t in teams
+            }
+            self._european = {
+                t['team_id']: TeamEntry(t['team_id'], t['team_name'], t['league'],
+                                        CLUB_TIER_RANKS[get_club_tier(t['team_id'])], True,
+                                        t['country'], get_team_crest_url(t['team_id']))
+                for t in european_teams
+            }
+            self._loaded = True
+
+        logger.info(f"✅ Team directory loaded ({len(self._domestic)} domestic, {len(self._european)} European)")
+
+    async def reload(self):
+        """Refresh after promotions / relegations or seeding"""
+        await self.load()
+
+    async def ensure_loaded(self):
+        if not self._loaded:
+            await self.load()
+
+    # ========== LOOKUPS ==========
+
+    def get(self, team_id, european_first=False):
+        """TeamEntry for an id (None if unknown or not loaded yet)"""
+        first, second = (self._european, self._domestic) if european_first else (self._domestic, self._european)
+        return first.get(team_id) or second.get(team_id)
+
+    def get_domestic(self, team_id):
+        """TeamEntry from teams only (None for European-only clubs)"""
+        return self._domestic.get(team_id)
+
+    async def lookup(self, team_id, european_first=False):
+        """get(), loading the directory first if this runs before setup_hook's load"""
+        await self.ensure_loaded()
+        return self.get(team_id, european_first)
+
+    def name(self, team_id, default='Unknown', european_first=False):
+        entry = self.get(team_id, european_first)
+        return entry.team_name if entry else default
+
+    def league(self, team_id, default=None):
+        entry = self.get(team_id)
+        return entry.league if entry else default
+
+    def names(self, team_ids, default='Unknown', european_first=False):
+        """{team_id: name} for several ids"""
+        return {team_id: self.name(team_id, default, european_first) for team_id in team_ids}
+
+    def domestic(self, league=None):
+        """Domestic clubs (optionally one league)"""
+        return [e for e in self._domestic.values() if league is None or e.league == league]
+
+    def european(self):
+        return list(self._european.values())
+
+
+# Global team directory instance
+team_directory = TeamDirectory()
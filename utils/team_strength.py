@@ -0,0 +1,124 @@
+"""
+Team Strength Service - single source of truth for squad strength
+Weighted average of squad ratings (user players count 1.5x) with a per-team cache
+
+The cache is invalidated by every code path that changes ratings or rosters:
+training, update_npcs_after_match, transfers, NPC maintenance and retirements.
+After warm-up, simulating a full matchweek issues zero rating queries.
+"""
+from database import db
+import logging
+
+logger = logging.getLogger(__name__)
+
+USER_PLAYER_WEIGHT = 1.5
+NPC_PLAYER_WEIGHT = 1.0
+
+
+def get_rating_modifier(rating):
+    """Team quality bonus applied on top of the average squad rating"""
+    if rating >= 85:
+        return 25  # Elite teams (Man City, Real Madrid, Bayern)
+    elif rating >= 80:
+        return 20  # Top teams (Liverpool, Arsenal, Juventus)
+    elif rating >= 75:
+        return 15  # Good teams (Aston Villa, Roma)
+    elif rating >= 70:
+        return 10  # Mid-table (Brentford, Fulham)
+    elif rating >= 65:
+        return 5   # Lower teams (Luton, Southampton)
+    return 0       # Weak teams (League One clubs)
+
+
+def calculate_strength(avg_rating, is_home=False):
+    """
+    Convert an average squad rating into match strength
+    Returns 50 for teams with no players, otherwise capped at 95
+    """
+    if avg_rating is None:
+        return 50
+
+    home_bonus = 5 if is_home else 0
+    strength = int(avg_rating + get_rating_modifier(avg_rating) + home_bonus)
+    return min(strength, 95)
+
+
+class TeamStrengthCache:
+    """Per-team cache of weighted squad ratings across all player tables"""
+
+    def __init__(self):
+        self._ratings = {}  # team_id -> weighted average rating (None = empty squad)
+        self.queries = 0
+
+    async def _load(self, team_ids=None):
+        """Load weighted ratings for the given teams (or every team) in ONE query"""
+        async with db.pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT team_id, SUM(overall_rating * weight) / SUM(weight) AS avg_rating
+                FROM (
+                    SELECT team_id, overall_rating, $2::float AS weight
+                    FROM players
+                    WHERE retired = FALSE AND ($1::text[] IS NULL OR team_id = ANY($1::text[]))
+                    UNION ALL
+                    SELECT team_id, overall_rating, $3::float
+                    FROM npc_players
+                    WHERE retired = FALSE AND ($1::text[] IS NULL OR team_id = ANY($1::text[]))
+                    UNION ALL
+                    SELECT team_id, overall_rating, $3::float
+                    FROM european_npc_players
+                    WHERE retired = FALSE AND ($1::text[] IS NULL OR team_id = ANY($1::text[]))
+                ) squad
+                WHERE team_id IS NOT NULL
+                GROUP BY team_id
+            """, team_ids, USER_PLAYER_WEIGHT, NPC_PLAYER_WEIGHT)
+
+        self.queries += 1
+        loaded = {row['team_id']: float(row['avg_rating']) for row in rows}
+
+        if team_ids is None:
+            self._ratings = loaded
+        else:
+            for team_id in team_ids:
+                self._ratings[team_id] = loaded.get(team_id)
+
+        return loaded
+
+    async def warm_up(self):
+        """Load every squad rating at once"""
+        loaded = await self._load()
+        logger.info(f"✅ Team strength cache warmed ({len(loaded)} teams)")
+
+    async def get_ratings(self, team_ids):
+        """
+        Get weighted average ratings for several teams
+        Only teams missing from the cache are queried (in one batch)
+        """
+        team_ids = list(dict.fromkeys(team_ids))
+        missing = [t for t in team_ids if t not in self._ratings]
+
+        if missing:
+            await self._load(missing)
+
+        return {t: self._ratings.get(t) for t in team_ids}
+
+    async def get_rating(self, team_id):
+        """Weighted average rating for one team (None if the squad is empty)"""
+        ratings = await self.get_ratings([team_id])
+        return ratings[team_id]
+
+    async def get_strength(self, team_id, is_home=False):
+        """Match strength for one team (rating + tier modifier + home bonus)"""
+        return calculate_strength(await self.get_rating(team_id), is_home=is_home)
+
+    def invalidate(self, *team_ids):
+        """Drop cached ratings for specific teams"""
+        for team_id in team_ids:
+            self._ratings.pop(team_id, None)
+
+    def invalidate_all(self):
+        """Drop every cached rating (bulk rating changes, transfer windows)"""
+        self._ratings.clear()
+
+
+# Global team strength instance
+team_strength = TeamStrengthCache()
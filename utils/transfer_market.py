@@ -0,0 +1,534 @@
+"""
+Transfer Market Engine - every NPC move of a transfer window resolved in memory
+Squads, squad sizes, tiers and ratings are loaded once per window, moves are written as one batch
+
+- Phases (domestic / European market, inter-European, European ↔ English, squad
+  balancing) sample candidates and destinations from the in-memory squads and
+  update them as they go, so later phases see earlier moves and a player moves
+  at most once per window
+- Team rating bounds (what a club will accept / can attract) come from running
+  per-team rating sums instead of three queries per candidate club
+- commit() writes everything in one transaction: one UPDATE per player table for
+  moves that stay in it, one DELETE ... INSERT per direction for cross-border
+  moves (the player changes table), and one COPY each for transfer history and news
+"""
+import logging
+import random
+import time
+
+import config
+from database import db
+from utils.team_directory import team_directory
+from utils.team_strength import team_strength
+from utils.season_projection import season_projector
+
+logger = logging.getLogger(__name__)
+
+DOMESTIC = 'npc_players'
+EUROPEAN = 'european_npc_players'
+EUROPEAN_LEAGUES = ('Champions League', 'Europa League')
+
+# Candidates sampled per phase (the old ORDER BY RANDOM() LIMITs)
+MARKET_DOMESTIC_CANDIDATES = 15
+MARKET_EUROPEAN_CANDIDATES = 10
+INTER_EUROPEAN_CANDIDATES = 15
+EUROPE_TO_ENGLAND_CANDIDATES = 10
+ENGLAND_TO_EUROPE_CANDIDATES = 8
+
+# Squad balancing thresholds (domestic squads)
+SMALL_SQUAD = 15
+LARGE_SQUAD = 30
+TARGET_SQUAD = 20
+MAX_BALANCE_MOVES = 3  # Per small squad per window
+
+MIN_RATING_DEFAULTS = {
+    'Premier League': 70, 'Champions League': 78, 'Europa League': 75,
+    'Championship': 60, 'League One': 50
+}
+MAX_RATING_DEFAULTS = {
+    'Premier League': 90, 'Champions League': 95, 'Europa League': 88,
+    'Championship': 78, 'League One': 70
+}
+
+NEWS_COLUMNS = ('headline', 'content', 'category', 'user_id', 'importance', 'week_number')
+TRANSFER_COLUMNS = ('npc_id', 'from_team', 'to_team', 'fee', 'wage', 'contract_length', 'transfer_type', 'season')
+
+ALL_PHASES = ('market', 'inter_european', 'europe_to_england', 'england_to_europe', 'balance')
+
+
+def _age_fee_modifier(age):
+    if age < 23:
+        return 1.5
+    elif age > 29:
+        return 0.7
+    return 1.0
+
+
+class TransferMarket:
+    """One transfer window's worth of NPC moves"""
+
+    def __init__(self, week):
+        self.week = week
+        self.players = {}           # (table, npc_id) -> player dict
+        self.squads = {}            # team_id -> set of player keys
+        self.rating_totals = {}     # team_id -> [rating sum, count] (NPCs + human players)
+        self.human_players = set()  # (player_name, team_id) of human players
+        self.pl_positions = {}      # Premier League team_id -> position
+
+        self.moves = {}             # player key -> move dict
+        self.counts = {phase: 0 for phase in ALL_PHASES}
+
+    @classmethod
+    async def load(cls, conn, week):
+        """Every active NPC, human player rating and PL position (four queries)"""
+        from utils.standings import standings
+
+        market = cls(week)
+        await team_directory.ensure_loaded()
+
+        domestic = await conn.fetch("""
+            SELECT npc_id, player_name, team_id, position, age, overall_rating,
+                   pace, shooting, passing, dribbling, defending, physical, market_value, potential
+            FROM npc_players
+            WHERE retired = FALSE AND team_id IS NOT NULL
+        """)
+        european = await conn.fetch("""
+            SELECT npc_id, player_name, team_id, position, age, overall_rating, nationality,
+                   pace, shooting, passing, dribbling, defending, physical, value, wage
+            FROM european_npc_players
+            WHERE retired = FALSE AND team_id IS NOT NULL
+        """)
+        humans = await conn.fetch("""
+            SELECT player_name, team_id, overall_rating
+            FROM players
+            WHERE retired = FALSE AND team_id IS NOT NULL
+        """)
+
+        for table, rows in ((DOMESTIC, domestic), (EUROPEAN, european)):
+            for row in rows:
+                player = dict(row)
+                player['table'] = table
+                market._add(player)
+
+        for human in humans:
+            market.human_players.add((human['player_name'], human['team_id']))
+            totals = market.rating_totals.setdefault(human['team_id'], [0, 0])
+            totals[0] += human['overall_rating']
+            totals[1] += 1
+
+        market.pl_positions = {
+            team['team_id']: team['position'] for team in await standings.get_table('Premier League')
+        }
+        return market
+
+    # ========== SQUAD BOOKKEEPING ==========
+
+    def _add(self, player):
+        key = (player['table'], player['npc_id'])
+        self.players[key] = player
+        self.squads.setdefault(player['team_id'], set()).add(key)
+        totals = self.rating_totals.setdefault(player['team_id'], [0, 0])
+        totals[0] += player['overall_rating']
+        totals[1] += 1
+
+    def _move(self, key, to_team, to_table, fee, phase, value=None, wage=None, nationality=None):
+        """Record a move and update the in-memory squads"""
+        player = self.players[key]
+        from_team = player['team_id']
+
+        self.squads[from_team].discard(key)
+        self.squads.setdefault(to_team, set()).add(key)
+        rating = player['overall_rating']
+        self.rating_totals[from_team][0] -= rating
+        self.rating_totals[from_team][1] -= 1
+        totals = self.rating_totals.setdefault(to_team, [0, 0])
+        totals[0] += rating
+        totals[1] += 1
+        player['team_id'] = to_team
+
+        self.moves[key] = {
+            'key': key, 'player': player, 'from_team': from_team, 'to_team': to_team,
+            'to_table': to_table, 'fee': int(fee), 'value': value, 'wage': wage,
+            'nationality': nationality, 'phase': phase
+        }
+        self.counts[phase] += 1
+        return self.moves[key]
+
+    def _candidates(self, table, count, predicate):
+        """Random sample of unmoved players from one table (replaces ORDER BY RANDOM() LIMIT n)"""
+        pool = [
+            p for key, p in self.players.items()
+            if key[0] == table and key not in self.moves and predicate(p)
+        ]
+        return random.sample(pool, min(count, len(pool)))
+
+    def _table(self, key):
+        """Table a player will be in once the window's moves are written"""
+        move = self.moves.get(key)
+        return move['to_table'] if move else key[0]
+
+    def _league(self, player):
+        entry = team_directory.get(player['team_id'], european_first=player['table'] == EUROPEAN)
+        return entry.league if entry else None
+
+    def _rating_bounds(self, team_id, league):
+        """(minimum rating a club accepts, maximum it can attract)"""
+        total, count = self.rating_totals.get(team_id, (0, 0))
+        if not count:
+            return MIN_RATING_DEFAULTS.get(league, 50), MAX_RATING_DEFAULTS.get(league, 90)
+        avg_rating = total / count
+        return max(50, int(avg_rating - 8)), min(95, int(avg_rating + 10))
+
+    def _fits(self, entry, rating):
+        min_rating, max_rating = self._rating_bounds(entry.team_id, entry.league)
+        return min_rating <= rating <= max_rating
+
+    def _european_clubs(self, team_ids):
+        """Drop tier-list clubs that aren't in european_teams"""
+        return [t for t in team_ids if (entry := team_directory.get(t, european_first=True)) and entry.is_european]
+
+    # ========== PHASES ==========
+
+    def play_market(self, domestic_count=MARKET_DOMESTIC_CANDIDATES, european_count=MARKET_EUROPEAN_CANDIDATES):
+        """Domestic + European NPCs move between leagues by rating (lateral, up or down)"""
+        candidates = (
+            self._candidates(DOMESTIC, domestic_count,
+                             lambda p: 20 <= p['age'] <= 32 and 60 <= p['overall_rating'] <= 85)
+            + self._candidates(EUROPEAN, european_count,
+                               lambda p: 20 <= p['age'] <= 32 and 60 <= p['overall_rating'] <= 90)
+        )
+
+        for player in candidates:
+            # 25% chance to transfer
+            if random.random() > 0.25:
+                continue
+
+            current_league = self._league(player)
+            rating = player['overall_rating']
+
+            potential_leagues = []
+            if rating >= 78:
+                potential_leagues.extend(['Premier League', 'Champions League', 'Europa League'])
+            if rating >= 68:
+                potential_leagues.extend(['Championship', 'Europa League'])
+            if rating >= 58:
+                potential_leagues.append('League One')
+
+            # 60% lateral moves, 40% up/down
+            if random.random() < 0.6 and current_league in potential_leagues:
+                target_league = current_league
+            else:
+                potential_leagues = [l for l in potential_leagues if l != current_league]
+                if not potential_leagues:
+                    continue
+                target_league = random.choice(potential_leagues)
+
+            if target_league in EUROPEAN_LEAGUES:
+                clubs = [e for e in team_directory.european() if e.league == target_league]
+            else:
+                clubs = team_directory.domestic(target_league)
+            clubs = [e for e in clubs if e.team_id != player['team_id']]
+            if not clubs:
+                continue
+
+            # First of up to 10 random clubs whose rating range fits the player
+            new_team = next((e for e in random.sample(clubs, min(10, len(clubs))) if self._fits(e, rating)), None)
+            if not new_team:
+                continue
+
+            fee = rating * 100000 * _age_fee_modifier(player['age']) * random.uniform(0.7, 1.3)
+            to_table = EUROPEAN if target_league in EUROPEAN_LEAGUES else DOMESTIC
+            self._move((player['table'], player['npc_id']), new_team.team_id, to_table, fee, 'market',
+                       value=int(fee) if to_table != player['table'] else None,
+                       wage=rating * 1000, nationality='Unknown')
+
+    def play_inter_european(self, count=INTER_EUROPEAN_CANDIDATES):
+        """European NPCs move between European clubs along the tier ladder"""
+        from utils.european_transfer_system import get_club_tier, get_appropriate_destinations
+
+        candidates = self._candidates(EUROPEAN, count,
+                                      lambda p: p['overall_rating'] >= 75 and 20 <= p['age'] <= 32)
+        for player in candidates:
+            rating = player['overall_rating']
+            if rating >= 88:
+                transfer_chance = 0.4  # 40% chance for elite
+            elif rating >= 85:
+                transfer_chance = 0.35
+            elif rating >= 82:
+                transfer_chance = 0.25
+            else:
+                transfer_chance = 0.15
+
+            if random.random() > transfer_chance:
+                continue
+
+            current_tier = get_club_tier(player['team_id'])
+            available_clubs = [
+                c for c in self._european_clubs(get_appropriate_destinations(rating, current_tier))
+                if c != player['team_id']
+            ]
+            if not available_clubs:
+                continue
+
+            new_club = random.choice(available_clubs)
+            new_tier = get_club_tier(new_club)
+
+            # Fee calculation based on tier movement
+            if new_tier == 'elite' and current_tier != 'elite':
+                fee = player['value'] * random.uniform(1.3, 1.8)  # Moving up costs more
+            elif new_tier == current_tier:
+                fee = player['value'] * random.uniform(0.9, 1.2)  # Similar level
+            else:
+                fee = player['value'] * random.uniform(0.8, 1.1)  # Moving down
+
+            self._move((EUROPEAN, player['npc_id']), new_club, EUROPEAN, fee, 'inter_european', value=int(fee))
+
+    def play_europe_to_england(self, count=EUROPE_TO_ENGLAND_CANDIDATES):
+        """European NPCs join English clubs matched to their quality"""
+        candidates = self._candidates(EUROPEAN, count,
+                                      lambda p: p['overall_rating'] >= 80 and 20 <= p['age'] <= 30)
+        premier_league = [e.team_id for e in team_directory.domestic('Premier League')]
+        top_english = [e.team_id for e in team_directory.domestic()
+                       if e.league in ('Premier League', 'Championship')]
+
+        for player in candidates:
+            rating = player['overall_rating']
+            # Lower-rated players less likely to move to England
+            if rating >= 85:
+                transfer_chance = 0.25
+            elif rating >= 82:
+                transfer_chance = 0.15
+            else:
+                transfer_chance = 0.08
+
+            if random.random() > transfer_chance:
+                continue
+
+            if rating >= 88:
+                # Elite players to top PL clubs
+                english_clubs = [t for t in premier_league if (self.pl_positions.get(t) or 99) <= 8]
+            elif rating >= 83:
+                # Good players to mid-table PL clubs
+                english_clubs = [t for t in premier_league if 7 <= (self.pl_positions.get(t) or 0) <= 15]
+            else:
+                # Decent players anywhere in PL or Championship
+                english_clubs = top_english
+
+            if not english_clubs:
+                continue
+
+            fee = player['value'] * random.uniform(1.2, 1.8)  # English premium
+            self._move((EUROPEAN, player['npc_id']), random.choice(english_clubs), DOMESTIC, fee,
+                       'europe_to_england', value=int(fee))
+
+    def play_england_to_europe(self, count=ENGLAND_TO_EUROPE_CANDIDATES):
+        """English NPCs (never human players) join European clubs"""
+        from utils.european_transfer_system import get_appropriate_destinations
+
+        def eligible(p):
+            return (p['overall_rating'] >= 80 and 20 <= p['age'] <= 32
+                    and team_directory.league(p['team_id']) in ('Premier League', 'Championship')
+                    and (p['player_name'], p['team_id']) not in self.human_players)
+
+        for player in self._candidates(DOMESTIC, count, eligible):
+            rating = player['overall_rating']
+            if rating >= 85:
+                transfer_chance = 0.3
+            elif rating >= 82:
+                transfer_chance = 0.2
+            else:
+                transfer_chance = 0.1
+
+            if random.random() > transfer_chance:
+                continue
+
+            # English players valued highly
+            possible_destinations = self._european_clubs(get_appropriate_destinations(rating, 'top'))
+            if not possible_destinations:
+                continue
+
+            fee = (player['market_value'] or rating * 100000) * random.uniform(1.2, 1.8)
+            self._move((DOMESTIC, player['npc_id']), random.choice(possible_destinations), EUROPEAN, fee,
+                       'england_to_europe', value=int(fee), wage=rating * 1000, nationality='England')
+
+    def balance_squads(self):
+        """Move players from domestic squads over LARGE_SQUAD to same-league squads under SMALL_SQUAD"""
+        def size(team_id):
+            return sum(1 for key in self.squads.get(team_id, ()) if self._table(key) == DOMESTIC)
+
+        clubs = team_directory.domestic()
+        large_squads = [e for e in clubs if size(e.team_id) > LARGE_SQUAD]
+        small_squads = [e for e in clubs if size(e.team_id) < SMALL_SQUAD]
+
+        for small_team in small_squads:
+            same_league_large = [e for e in large_squads if e.league == small_team.league]
+            if not same_league_large:
+                continue
+
+            large_team = random.choice(same_league_large)
+            needed = TARGET_SQUAD - size(small_team.team_id)
+            excess = [
+                key for key in self.squads.get(large_team.team_id, ())
+                if key[0] == DOMESTIC and key not in self.moves
+            ]
+            for key in random.sample(excess, max(0, min(needed, MAX_BALANCE_MOVES, len(excess)))):
+                self._move(key, small_team.team_id, DOMESTIC, 0, 'balance')
+
+    def play(self, phases=ALL_PHASES):
+        """Run phases in window order"""
+        runners = {
+            'market': self.play_market,
+            'inter_european': self.play_inter_european,
+            'europe_to_england': self.play_europe_to_england,
+            'england_to_europe': self.play_england_to_europe,
+            'balance': self.balance_squads,
+        }
+        for phase in ALL_PHASES:
+            if phase in phases:
+                runners[phase]()
+        return self.counts
+
+    # ========== WRITE ==========
+
+    def _news(self):
+        """News rows for notable transfers (75+ rated or big fees)"""
+        rows = []
+        for move in self.moves.values():
+            player, rating, fee = move['player'], move['player']['overall_rating'], move['fee']
+            if move['phase'] == 'balance' or (rating < 75 and fee < 10000000):
+                continue
+            from_name = team_directory.name(move['from_team'], european_first=move['key'][0] == EUROPEAN)
+            to_name = team_directory.name(move['to_team'], european_first=move['to_table'] == EUROPEAN)
+            rows.append((
+                f"TRANSFER: {player['player_name']} joins {to_name}",
+                f"{player['player_name']} ({rating} OVR, {player['position']}) transfers from "
+                f"{from_name} to {to_name} for £{fee:,}. {player['age']} years old.",
+                "transfer_news", None, 6, self.week
+            ))
+            print(f"  📰 {player['player_name']} ({from_name} → {to_name}) £{fee:,}")
+        return rows
+
+    @staticmethod
+    def _history_npc_id(move):
+        """npc_players id recorded in transfers (None for moves that never touch npc_players)"""
+        table, npc_id = move['key']
+        if table == DOMESTIC:
+            return npc_id
+        if move['to_table'] == DOMESTIC:
+            return move.get('new_npc_id')
+        return None
+
+    async def commit(self, conn):
+        """Write every move, the transfer history and the news in one transaction"""
+        if not self.moves:
+            return 0
+
+        started = time.perf_counter()
+        stays = {DOMESTIC: [], EUROPEAN: []}
+        crosses = {DOMESTIC: [], EUROPEAN: []}  # keyed by source table
+        for (table, _), move in self.moves.items():
+            (stays if move['to_table'] == table else crosses)[table].append(move)
+
+        news = self._news()
+
+        async with conn.transaction():
+            if stays[DOMESTIC]:
+                await conn.execute("""
+                    UPDATE npc_players AS n
+                    SET team_id = m.team_id, market_value = COALESCE(m.value, n.market_value)
+                    FROM UNNEST($1::int[], $2::text[], $3::int[]) AS m(npc_id, team_id, value)
+                    WHERE n.npc_id = m.npc_id
+                """, [m['key'][1] for m in stays[DOMESTIC]], [m['to_team'] for m in stays[DOMESTIC]],
+                    [m['value'] for m in stays[DOMESTIC]])
+
+            if stays[EUROPEAN]:
+                await conn.execute("""
+                    UPDATE european_npc_players AS n
+                    SET team_id = m.team_id, value = COALESCE(m.value, n.value)
+                    FROM UNNEST($1::int[], $2::text[], $3::int[]) AS m(npc_id, team_id, value)
+                    WHERE n.npc_id = m.npc_id
+                """, [m['key'][1] for m in stays[EUROPEAN]], [m['to_team'] for m in stays[EUROPEAN]],
+                    [m['value'] for m in stays[EUROPEAN]])
+
+            if crosses[DOMESTIC]:
+                # England -> Europe: the row moves to european_npc_players
+                await conn.execute("""
+                    WITH moved AS (
+                        DELETE FROM npc_players AS n
+                        USING UNNEST($1::int[], $2::text[], $3::int[], $4::int[], $5::text[])
+                              AS m(npc_id, new_team_id, new_value, new_wage, new_nationality)
+                        WHERE n.npc_id = m.npc_id
+                        RETURNING n.*, m.new_team_id, m.new_value, m.new_wage, m.new_nationality
+                    )
+                    INSERT INTO european_npc_players
+                    (player_name, team_id, position, overall_rating, age, nationality,
+                     pace, shooting, passing, dribbling, defending, physical, value, wage)
+                    SELECT player_name, new_team_id, position, overall_rating, age, new_nationality,
+                           pace, shooting, passing, dribbling, defending, physical, new_value, new_wage
+                    FROM moved
+                """, [m['key'][1] for m in crosses[DOMESTIC]], [m['to_team'] for m in crosses[DOMESTIC]],
+                    [m['value'] for m in crosses[DOMESTIC]], [m['wage'] for m in crosses[DOMESTIC]],
+                    [m['nationality'] for m in crosses[DOMESTIC]])
+
+            if crosses[EUROPEAN]:
+                # Europe -> England: the row moves to npc_players (under a new npc_id)
+                inserted = await conn.fetch("""
+                    WITH moved AS (
+                        DELETE FROM european_npc_players AS e
+                        USING UNNEST($1::int[], $2::text[], $3::int[]) AS m(npc_id, new_team_id, new_value)
+                        WHERE e.npc_id = m.npc_id
+                        RETURNING e.*, m.new_team_id, m.new_value
+                    )
+                    INSERT INTO npc_players
+                    (player_name, team_id, position, age, overall_rating,
+                     pace, shooting, passing, dribbling, defending, physical, potential, market_value)
+                    SELECT player_name, new_team_id, position, age, overall_rating,
+                           pace, shooting, passing, dribbling, defending, physical,
+                           LEAST(95, overall_rating + 10), new_value
+                    FROM moved
+                    RETURNING npc_id, player_name, team_id
+                """, [m['key'][1] for m in crosses[EUROPEAN]], [m['to_team'] for m in crosses[EUROPEAN]],
+                    [m['value'] for m in crosses[EUROPEAN]])
+                new_ids = {(r['player_name'], r['team_id']): r['npc_id'] for r in inserted}
+                for m in crosses[EUROPEAN]:
+                    m['new_npc_id'] = new_ids.get((m['player']['player_name'], m['to_team']))
+
+            history = [
+                (self._history_npc_id(m), m['from_team'], m['to_team'], m['fee'],
+                 m['player']['overall_rating'] * 1000, random.randint(2, 4), 'transfer', config.CURRENT_SEASON)
+                for m in self.moves.values() if m['phase'] != 'balance'
+            ]
+
+            if history:
+                await conn.copy_records_to_table('transfers', records=history, columns=list(TRANSFER_COLUMNS))
+            if news:
+                await conn.copy_records_to_table('news', records=news, columns=list(NEWS_COLUMNS))
+
+        affected = {m['from_team'] for m in self.moves.values()} | {m['to_team'] for m in self.moves.values()}
+        team_strength.invalidate(*affected)
+        season_projector.invalidate()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"🔄 Transfer market: {len(self.moves)} moves, {len(news)} news items written in {elapsed_ms:.0f}ms")
+        return len(self.moves)
+
+
+async def run_transfer_market(week=None, phases=ALL_PHASES):
+    """
+    Load the market, play the requested phases and write every move
+
+    Args:
+        week: week the news is filed under (current week if None)
+
+    Returns:
+        dict of phase -> moves made
+    """
+    if week is None:
+        state = await db.get_game_state()
+        week = state['current_week'] if state else 0
+
+    async with db.pool.acquire() as conn:
+        market = await TransferMarket.load(conn, week)
+        counts = market.play(phases)
+        await market.commit(conn)
+    return counts
@@ -15,6 +15,10 @@ import random
 import config
 from datetime import datetime
 from utils.event_poster import post_transfer_news_to_channel
+from utils.team_strength import team_strength
+from utils.season_projection import season_projector
+from utils.team_directory import team_directory
+from utils.dm_dispatcher import dm_dispatcher
 
 # Position-specific Premier League minimum ratings
 POSITION_PL_MINIMUMS = {
@@ -27,6 +31,19 @@ POSITION_PL_MINIMUMS = {
     'ST': 73,   # Strikers need to produce
 }
 
+# League wage caps
+WAGE_CAPS = {
+    'Premier League': 200000,
+    'Championship': 40000,
+    'League One': 15000
+}
+
+OFFER_COLUMNS = (
+    'user_id', 'team_id', 'wage_offer', 'contract_length', 'offer_week', 'expires_week',
+    'offer_type', 'previous_offer_id', 'performance_bonus', 'status'
+)
+NEWS_COLUMNS = ('headline', 'content', 'category', 'user_id', 'importance', 'week_number')
+
 async def is_transfer_window_open(current_week: int) -> bool:
     """Check if we're in a transfer window"""
     return current_week in config.TRANSFER_WINDOW_WEEKS
@@ -55,37 +72,10 @@ async def process_weekly_transfer_offers(bot=None):
             WHERE retired = FALSE
         """)
 
-    offers_generated = 0
-    players_with_offers = 0
-
-    for player_row in players:
-        player = dict(player_row)
-        user_id = player['user_id']
-
-        # FIX: Ensure minimum 2-3 offers on opening week
-        num_offers = calculate_num_offers(player, is_opening_week=True)
-
-        if num_offers == 0:
-            print(f"  {player['player_name']}: Not generating offers (rating too low)")
-            continue
-
-        # Generate offers WITHOUT notification (will send batch notification later)
-        created_offers = await generate_offers_for_player(
-            player, current_week, num_offers,
-            bot=None,  # Don't send notification yet
-            send_notification=False
-        )
-
-        if created_offers:
-            offers_generated += len(created_offers)
-            players_with_offers += 1
-            print(f"  {player['player_name']}: Generated {len(created_offers)} offers")
-
-            # Send ONE notification per player AFTER all offers created
-            if bot:
-                await send_offer_notification(bot, user_id, len(created_offers))
-        else:
-            print(f"  {player['player_name']}: Failed to generate offers")
+    # FIX: Ensure minimum 2-3 offers on opening week
+    offers_generated, players_with_offers = await generate_offer_batch(
+        [dict(row) for row in players], current_week, is_opening_week=True, bot=bot
+    )
 
     print(f"\n=== Transfer Offers Complete ===")
     print(f"Generated {offers_generated} offers for {players_with_offers} players")
@@ -97,6 +87,9 @@ async def generate_offers_for_eligible_players(bot=None):
     SUBSEQUENT WEEKS: Generate offers ONLY for players who:
     1. Have NO pending offers
     2. Have NOT accepted a transfer this window
+
+    Eligibility for every player comes from one query (this week's offers
+    aggregated per player), offers are built in memory and written in one batch.
     """
     state = await db.get_game_state()
     current_week = state['current_week']
@@ -104,84 +97,101 @@ async def generate_offers_for_eligible_players(bot=None):
 
     print(f"\n=== Week {current_week}: Checking for Eligible Players ===")
 
-    # Get all active players
+    # All active players with this week's offers counted by status
     async with db.pool.acquire() as conn:
         all_players = await conn.fetch("""
-            SELECT user_id, player_name, overall_rating, potential, 
-                   team_id, contract_wage, contract_years, age,
-                   season_rating, season_goals, last_transfer_window, position
-            FROM players
-            WHERE retired = FALSE
-        """)
-
-    offers_generated = 0
-    players_with_offers = 0
-
+            SELECT p.user_id, p.player_name, p.overall_rating, p.potential,
+                   p.team_id, p.contract_wage, p.contract_years, p.age,
+                   p.season_rating, p.season_goals, p.last_transfer_window, p.position,
+                   COUNT(o.offer_id) FILTER (WHERE o.status = 'pending') AS pending_offers,
+                   COUNT(o.offer_id) FILTER (WHERE o.status = 'accepted') AS accepted_offers,
+                   COUNT(o.offer_id) FILTER (WHERE o.status = 'rejected') AS rejected_offers
+            FROM players p
+            LEFT JOIN transfer_offers o ON o.user_id = p.user_id AND o.offer_week = $1
+            WHERE p.retired = FALSE
+            GROUP BY p.user_id
+        """, current_week)
+
+    eligible = []
     for player_row in all_players:
         player = dict(player_row)
-        user_id = player['user_id']
 
         # SKIP if player already transferred this window
         if player.get('last_transfer_window') == current_window:
             print(f"  ❌ {player['player_name']}: Already transferred this window")
             continue
 
-        # Check if player has ANY offers this window (pending, rejected, or accepted)
-        async with db.pool.acquire() as conn:
-            offers_this_window = await conn.fetch("""
-                SELECT offer_id, status FROM transfer_offers
-                WHERE user_id = $1 
-                AND offer_week = $2
-            """, user_id, current_week)
-
         # If player has pending offers, skip (they need to respond first)
-        pending = [o for o in offers_this_window if o['status'] == 'pending']
-        if pending:
-            print(f"  ⏳ {player['player_name']}: Still has {len(pending)} pending offers")
+        if player['pending_offers']:
+            print(f"  ⏳ {player['player_name']}: Still has {player['pending_offers']} pending offers")
             continue
 
         # If player accepted an offer this window, skip
-        accepted = [o for o in offers_this_window if o['status'] == 'accepted']
-        if accepted:
+        if player['accepted_offers']:
             print(f"  ✅ {player['player_name']}: Already accepted a transfer")
             continue
 
         # ELIGIBLE: Player either has no offers this week, or rejected all offers
-        rejected = [o for o in offers_this_window if o['status'] == 'rejected']
-
-        if rejected:
-            print(f"  ✅ {player['player_name']}: Rejected {len(rejected)} offers - generating new offers")
+        if player['rejected_offers']:
+            print(f"  ✅ {player['player_name']}: Rejected {player['rejected_offers']} offers - generating new offers")
         else:
             print(f"  ✅ {player['player_name']}: No offers this week - generating offers")
 
-        # Generate 2-3 new offers
-        num_offers = calculate_num_offers(player, is_opening_week=False)
+        eligible.append(player)
 
-        if num_offers == 0:
-            print(f"  ⚠️ {player['player_name']}: Rating too low for offers")
-            continue
-
-        # Generate offers WITHOUT notification
-        created_offers = await generate_offers_for_player(
-            player, current_week, num_offers,
-            bot=None,
-            send_notification=False
-        )
-
-        if created_offers:
-            offers_generated += len(created_offers)
-            players_with_offers += 1
-            print(f"  💼 {player['player_name']}: Generated {len(created_offers)} new offers")
-
-            # Send ONE notification AFTER all offers created
-            if bot:
-                await send_offer_notification(bot, user_id, len(created_offers))
+    # Generate 2-3 new offers each, ONE notification per player afterwards
+    offers_generated, players_with_offers = await generate_offer_batch(
+        eligible, current_week, is_opening_week=False, bot=bot
+    )
 
     print(f"\n=== Eligible Player Offers Complete ===")
     print(f"Generated {offers_generated} offers for {players_with_offers} players")
 
     return offers_generated
 
+async def generate_offer_batch(players: list, current_week: int, is_opening_week: bool = False, bot=None):
+    """
+    Generate offers for many players at once
+
+    Context (recent rejections, earlier PL interest) is loaded once, offers are
+    built in memory and written with one COPY, and the DMs are queued on the
+    DM dispatcher instead of being sent inline.
+
+    Returns:
+        (offers generated, players with offers)
+    """
+    await team_directory.ensure_loaded()
+
+    all_offers = []
+    all_news = []
+    offer_counts = {}  # user_id -> offers created
+
+    async with db.pool.acquire() as conn:
+        context = await load_offer_context(conn, current_week)
+
+        for player in players:
+            num_offers = calculate_num_offers(player, is_opening_week=is_opening_week)
+
+            if num_offers == 0:
+                print(f"  ⚠️ {player['player_name']}: Rating too low for offers")
+                continue
+
+            offers, news = build_offers_for_player(player, current_week, num_offers, context)
+            if not offers:
+                continue
+
+            all_offers.extend(offers)
+            all_news.extend(news)
+            offer_counts[player['user_id']] = len(offers)
+            print(f"  💼 {player['player_name']}: Generated {len(offers)} offers")
+
+        await write_offers(conn, all_offers, all_news)
+
+    if bot and offer_counts:
+        queue_offer_notifications(bot, offer_counts)
+
+    return len(all_offers), len(offer_counts)
+
 def calculate_num_offers(player: dict, is_opening_week: bool = False) -> int:
     """
     Calculate how many offers a player should receive
@@ -232,30 +242,59 @@ def calculate_num_offers(player: dict, is_opening_week: bool = False) -> int:
 
     return max(1, min(3, base_offers))
 
-async def generate_offers_for_player(player: dict, current_week: int, num_offers: int = 3,
-                                    bot=None, send_notification: bool = True):
+async def load_offer_context(conn, current_week: int, user_ids: list = None):
     """
-    Generate transfer offers for a specific player
-    FIX: Added send_notification flag to prevent duplicate notifications
+    Everything offer generation reads besides the player (two queries)
+
+    Returns:
+        dict with 'rejected' (user_id -> recent rejected offers, newest first)
+        and 'pl_offered' (user_ids that already had a Premier League offer)
+    """
+    rejected_rows = await conn.fetch("""
+        SELECT o.* FROM transfer_offers o
+        WHERE o.offer_week >= $1
+        AND o.status = 'rejected'
+        AND ($2::bigint[] IS NULL OR o.user_id = ANY($2::bigint[]))
+        ORDER BY o.created_at DESC
+    """, current_week - 2, user_ids)
+
+    pl_rows = await conn.fetch("""
+        SELECT DISTINCT o.user_id FROM transfer_offers o
+        JOIN teams t ON o.team_id = t.team_id
+        WHERE t.league = 'Premier League'
+        AND ($1::bigint[] IS NULL OR o.user_id = ANY($1::bigint[]))
+    """, user_ids)
+
+    rejected = {}
+    for row in rejected_rows:
+        rejected.setdefault(row['user_id'], []).append(dict(row))
+
+    return {'rejected': rejected, 'pl_offered': {row['user_id'] for row in pl_rows}}
+
+def _interested_sample(league: str, count: int = 5):
+    """Up to count random clubs from a domestic league (team directory, no query)"""
+    clubs = team_directory.domestic(league)
+    return [entry.as_dict() for entry in random.sample(clubs, min(count, len(clubs)))]
+
+def build_offers_for_player(player: dict, current_week: int, num_offers: int, context: dict):
+    """
+    Build transfer offers for one player in memory
     CRITICAL FIX #2: Stricter Premier League requirements
     CRITICAL FIX #3: Exclude European competition teams from player offers
+
+    Args:
+        context: from load_offer_context (updated with any first PL offer made here)
+
+    Returns:
+        (offer dicts in OFFER_COLUMNS order plus team_name / league, news rows)
     """
 
     rating = player['overall_rating']
     potential = player['potential']
     user_id = player['user_id']
 
-    # Check for previous offers this window (for improved offers)
-    async with db.pool.acquire() as conn:
-        previous_offers = await conn.fetch(
-            """SELECT * FROM transfer_offers 
-               WHERE user_id = $1 AND offer_week >= $2 
-               AND status = 'rejected'
-               ORDER BY created_at DESC""",
-            user_id,
-            current_week - 2
-        )
-        previous_offers = [dict(row) for row in previous_offers]
+    # Previous offers this window (for improved offers)
+    previous_offers = context['rejected'].get(user_id, [])
 
     interested_teams = []
 
@@ -267,68 +306,28 @@ async def generate_offers_for_player(player: dict, current_week: int, num_offers
     
     if rating >= position_minimum:
         # Meets position-specific requirement
-        async with db.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT * FROM teams 
-                   WHERE league = $1 
-                   AND league NOT IN ('Champions League', 'Europa League')
-                   ORDER BY RANDOM() LIMIT 5""",
-                'Premier League'
-            )
-            interested_teams.extend([dict(row) for row in rows])
+        interested_teams.extend(_interested_sample('Premier League'))
     elif rating >= (position_minimum - 5) and potential >= 87:
         # High potential young players
-        async with db.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT * FROM teams 
-                   WHERE league = $1 
-                   AND league NOT IN ('Champions League', 'Europa League')
-                   ORDER BY RANDOM() LIMIT 5""",
-                'Premier League'
-            )
-            interested_teams.extend([dict(row) for row in rows])
+        interested_teams.extend(_interested_sample('Premier League'))
     elif rating >= (position_minimum - 8) and potential >= 93:
         # Exceptional wonderkids only
-        async with db.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT * FROM teams 
-                   WHERE league = $1 
-                   AND league NOT IN ('Champions League', 'Europa League')
-                   ORDER BY RANDOM() LIMIT 5""",
-                'Premier League'
-            )
-            interested_teams.extend([dict(row) for row in rows])
+        interested_teams.extend(_interested_sample('Premier League'))
 
     # Championship teams (65+ rating required)
     if rating >= 65 or (rating >= 62 and potential >= 75):
-        async with db.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT * FROM teams 
-                   WHERE league = $1 
-                   AND league NOT IN ('Champions League', 'Europa League')
-                   ORDER BY RANDOM() LIMIT 5""",
-                'Championship'
-            )
-            interested_teams.extend([dict(row) for row in rows])
+        interested_teams.extend(_interested_sample('Championship'))
 
     # League One teams (55+ rating required)
     if rating >= 55 or (rating >= 52 and potential >= 65):
-        async with db.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT * FROM teams 
-                   WHERE league = $1 
-                   AND league NOT IN ('Champions League', 'Europa League')
-                   ORDER BY RANDOM() LIMIT 5""",
-                'League One'
-            )
-            interested_teams.extend([dict(row) for row in rows])
+        interested_teams.extend(_interested_sample('League One'))
 
     # Remove current team
     interested_teams = [t for t in interested_teams if t['team_id'] != player['team_id']]
 
     if not interested_teams:
         print(f"    No interested teams found for {player['player_name']}")
-        return []
+        return [], []
 
     # Mix of new offers and improved offers
     teams_to_offer = []
@@ -356,133 +355,142 @@ async def generate_offers_for_player(player: dict, current_week: int, num_offers
 
     # Add renewal offer if contract expiring
     if player['contract_years'] <= 1 and player['team_id'] != 'free_agent':
-        current_team = await db.get_team(player['team_id'])
+        current_team = team_directory.get_domestic(player['team_id'])
         if current_team:
+            current_team = current_team.as_dict()
             current_team['is_renewal'] = True
             current_team['is_improved'] = False
             teams_to_offer.append(current_team)
             print(f"    Added renewal offer from {current_team['team_name']}")
 
-    # Create offers in database
-    created_offers = []
-    async with db.pool.acquire() as conn:
-        for team in teams_to_offer[:num_offers + 1]:
-            # Wage calculation
-            base_wage = (player['overall_rating'] ** 2) * 10
-
-            performance_bonus = 0
-            if player.get('season_rating', 6.5) >= 7.5:
-                performance_bonus = int(base_wage * 0.2)
-            if player.get('season_goals', 0) >= 10:
-                performance_bonus += int(base_wage * 0.15)
-
-            # League multipliers
-            if team['league'] == 'Premier League':
-                wage_offer = int((base_wage + performance_bonus) * random.uniform(1.5, 2.5))
-            elif team['league'] == 'Championship':
-                wage_offer = int((base_wage + performance_bonus) * random.uniform(0.8, 1.2))
-            elif team['league'] == 'League One':
-                wage_offer = int((base_wage + performance_bonus) * random.uniform(0.4, 0.7))
-            else:
-                wage_offer = int((base_wage + performance_bonus) * random.uniform(0.2, 0.4))
-
-            wage_offer = max(wage_offer, 1000)
-
-            # League wage caps
-            WAGE_CAPS = {
-                'Premier League': 200000,
-                'Championship': 40000,
-                'League One': 15000
-            }
-
-            # Apply cap
-            max_wage = WAGE_CAPS.get(team['league'], 50000)
-            wage_offer = min(wage_offer, max_wage)
-
-            # Handle special offer types
-            if team.get('is_improved'):
-                wage_offer = int(team['previous_wage'] * random.uniform(1.15, 1.25))
-                offer_type = 'improved'
-                previous_offer_id = team['previous_offer_id']
-            elif team.get('is_renewal'):
-                wage_offer = int(player['contract_wage'] * random.uniform(1.1, 1.2))
-                offer_type = 'renewal'
-                previous_offer_id = None
+    offers = []
+    news = []
+    for team in teams_to_offer[:num_offers + 1]:
+        # Wage calculation
+        base_wage = (player['overall_rating'] ** 2) * 10
+
+        performance_bonus = 0
+        if player.get('season_rating', 6.5) >= 7.5:
+            performance_bonus = int(base_wage * 0.2)
+        if player.get('season_goals', 0) >= 10:
+            performance_bonus += int(base_wage * 0.15)
+
+        # League multipliers
+        if team['league'] == 'Premier League':
+            wage_offer = int((base_wage + performance_bonus) * random.uniform(1.5, 2.5))
+        elif team['league'] == 'Championship':
+            wage_offer = int((base_wage + performance_bonus) * random.uniform(0.8, 1.2))
+        elif team['league'] == 'League One':
+            wage_offer = int((base_wage + performance_bonus) * random.uniform(0.4, 0.7))
+        else:
+            wage_offer = int((base_wage + performance_bonus) * random.uniform(0.2, 0.4))
+
+        wage_offer = max(wage_offer, 1000)
+
+        # Apply league wage cap
+        max_wage = WAGE_CAPS.get(team['league'], 50000)
+        wage_offer = min(wage_offer, max_wage)
+
+        # Handle special offer types
+        if team.get('is_improved'):
+            wage_offer = int(team['previous_wage'] * random.uniform(1.15, 1.25))
+            offer_type = 'improved'
+            previous_offer_id = team['previous_offer_id']
+        elif team.get('is_renewal'):
+            wage_offer = int(player['contract_wage'] * random.uniform(1.1, 1.2))
+            offer_type = 'renewal'
+            previous_offer_id = None
+        else:
+            offer_type = 'standard'
+            previous_offer_id = None
+
+        # Contract length
+        # Variable contract length based on club and player
+        if team['league'] == 'Premier League':
+            # Top clubs offer longer deals
+            if player['overall_rating'] >= 80:
+                contract_length = random.randint(4, 5)
             else:
-                offer_type = 'standard'
-                previous_offer_id = None
-
-            # Contract length
-            # Variable contract length based on club and player
-            if team['league'] == 'Premier League':
-                # Top clubs offer longer deals
-                if player['overall_rating'] >= 80:
-                    contract_length = random.randint(4, 5)
-                else:
-                    contract_length = random.randint(3, 4)
-            elif team['league'] == 'Championship':
-                contract_length = random.randint(2, 3)
-            else:  # League One
-                # Lower clubs offer shorter deals
-                contract_length = random.randint(1, 2)
-
-            # Age adjustments
-            if player['age'] <= 21:
-                contract_length += 1  # Longer for youth
-            elif player['age'] >= 32:
-                contract_length = max(1, contract_length - 1)  # Shorter for veterans
-
-            result = await conn.fetchrow('''
-                INSERT INTO transfer_offers (
-                    user_id, team_id, wage_offer, contract_length,
-                    offer_week, expires_week, offer_type, previous_offer_id,
-                    performance_bonus, status
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                RETURNING offer_id
-            ''',
-                user_id, team['team_id'], wage_offer, contract_length,
-                current_week, current_week, offer_type, previous_offer_id,
-                performance_bonus, 'pending'
+                contract_length = random.randint(3, 4)
+        elif team['league'] == 'Championship':
+            contract_length = random.randint(2, 3)
+        else:  # League One
+            # Lower clubs offer shorter deals
+            contract_length = random.randint(1, 2)
+
+        # Age adjustments
+        if player['age'] <= 21:
+            contract_length += 1  # Longer for youth
+        elif player['age'] >= 32:
+            contract_length = max(1, contract_length - 1)  # Shorter for veterans
+
+        offers.append({
+            'user_id': user_id,
+            'team_id': team['team_id'],
+            'wage_offer': wage_offer,
+            'contract_length': contract_length,
+            'offer_week': current_week,
+            'expires_week': current_week,
+            'offer_type': offer_type,
+            'previous_offer_id': previous_offer_id,
+            'performance_bonus': performance_bonus,
+            'status': 'pending',
+            'team_name': team['team_name'],
+            'league': team['league'],
+        })
+
+        print(f"    Created {offer_type} offer: {team['team_name']} - £{wage_offer:,}/wk")
+
+        # Add news for first Premier League offer ever
+        if team['league'] == 'Premier League' and user_id not in context['pl_offered']:
+            context['pl_offered'].add(user_id)
+            current_team_name = (team_directory.name(player['team_id'], default='current club')
+                                 if player['team_id'] != 'free_agent' else 'current club')
+
+            news.append((
+                f"PREMIER LEAGUE INTEREST: {player['player_name']} attracting top-flight scouts!",
+                f"After impressive performances for {current_team_name}, {player['player_name']} is being watched by Premier League clubs. "
+                f"{team['team_name']} have submitted their first offer.",
+                "player_news",
+                user_id,
+                9,
+                current_week
+            ))
+            print(f"    🌟 Breaking through! First PL offer for {player['player_name']}")
+
+    return offers, news
+
+async def write_offers(conn, offers: list, news: list):
+    """Insert offers and their news with one COPY each, in one transaction"""
+    if not offers and not news:
+        return
+
+    async with conn.transaction():
+        if offers:
+            await conn.copy_records_to_table(
+                'transfer_offers',
+                records=[tuple(offer[c] for c in OFFER_COLUMNS) for offer in offers],
+                columns=list(OFFER_COLUMNS)
             )
+        if news:
+            await conn.copy_records_to_table('news', records=news, columns=list(NEWS_COLUMNS))
+
+async def generate_offers_for_player(player: dict, current_week: int, num_offers: int = 3,
+                                    bot=None, send_notification: bool = True):
+    """
+    Generate transfer offers for a specific player
+    FIX: Added send_notification flag to prevent duplicate notifications
+    """
+    await team_directory.ensure_loaded()
+
+    async with db.pool.acquire() as conn:
+        context = await load_offer_context(conn, current_week, [player['user_id']])
+        created_offers, news = build_offers_for_player(player, current_week, num_offers, context)
+        await write_offers(conn, created_offers, news)
 
-            created_offers.append({
-                'offer_id': result['offer_id'],
-                'team_id': team['team_id'],
-                'team_name': team['team_name'],
-                'wage_offer': wage_offer,
-                'contract_length': contract_length,
-                'offer_type': offer_type
-            })
-
-            print(f"    Created {offer_type} offer: {team['team_name']} - £{wage_offer:,}/wk")
-
-            # Add news for first Premier League offer
-            if team['league'] == 'Premier League':
-                # Check if this is their first PL offer ever
-                existing_pl_offers = await conn.fetchval("""
-                    SELECT COUNT(*) FROM transfer_offers
-                    WHERE user_id = $1 
-                    AND team_id IN (SELECT team_id FROM teams WHERE league = 'Premier League')
-                """, user_id)
-                
-                if existing_pl_offers == 1:  # This is the first one we just created
-                    current_team = await db.get_team(player['team_id']) if player['team_id'] != 'free_agent' else None
-                    current_team_name = current_team['team_name'] if current_team else 'current club'
-                    
-                    await db.add_news(
-                        f"PREMIER LEAGUE INTEREST: {player['player_name']} attracting top-flight scouts!",
-                        f"After impressive performances for {current_team_name}, {player['player_name']} is being watched by Premier League clubs. "
-                        f"{team['team_name']} have submitted their first offer.",
-                        "player_news",
-                        user_id,
-                        9,
-                        current_week
-                    )
-                    print(f"    🌟 Breaking through! First PL offer for {player['player_name']}")
-                                        
     # FIX: Only send notification if flag is True (prevents duplicates)
     if send_notification and bot and created_offers:
-        await send_offer_notification(bot, user_id, len(created_offers))
+        await send_offer_notification(bot, player['user_id'], len(created_offers))
 
     return created_offers
 
@@ -500,118 +508,141 @@ async def get_pending_offers(user_id: int):
         return [dict(row) for row in rows]
 
 async def accept_transfer_offer(user_id: int, offer_id: int, bot=None):
-    """Accept a transfer offer and update player"""
-    async with db.pool.acquire() as conn:
-        offer_row = await conn.fetchrow(
-            "SELECT * FROM transfer_offers WHERE offer_id = $1 AND user_id = $2",
-            offer_id, user_id
-        )
-
-        if not offer_row:
-            return None, "Offer not found"
-
-        offer = dict(offer_row)
-
-        if offer['status'] != 'pending':
-            return None, "Offer is no longer available"
-
-        player = await db.get_player(user_id)
-        new_team = await db.get_team(offer['team_id'])
-        old_team = await db.get_team(player['team_id']) if player['team_id'] != 'free_agent' else None
-
-        state = await db.get_game_state()
-        current_window = get_current_transfer_window(state['current_week'])
-
-        if player.get('last_transfer_window') == current_window:
-            return None, "You've already transferred this window"
-
-        # Calculate transfer fee
-        if old_team and player['team_id'] != 'free_agent':
-            base_fee = player['overall_rating'] * 100000
-            age_modifier = 1.0
-            if player['age'] < 23:
-                age_modifier = 1.5
-            elif player['age'] > 30:
-                age_modifier = 0.6
-
-            contract_modifier = 1.0 + (player['contract_years'] * 0.1)
-            transfer_fee = int(base_fee * age_modifier * contract_modifier * random.uniform(0.5, 1.5))
-        else:
-            transfer_fee = 0
-
-        # Update player
-        await conn.execute('''
-            UPDATE players 
-            SET team_id = $1, league = $2, contract_wage = $3, contract_years = $4,
-                last_transfer_window = $5, transfers_this_season = transfers_this_season + 1
-            WHERE user_id = $6
-        ''',
-            offer['team_id'], new_team['league'], offer['wage_offer'],
-            offer['contract_length'], current_window, user_id
-        )
+    """
+    Accept a transfer offer and update player
 
-        # Mark offer accepted
-        await conn.execute(
-            "UPDATE transfer_offers SET status = 'accepted' WHERE offer_id = $1",
-            offer_id
-        )
+    Offer, player, both clubs and the current week come from one query that locks
+    the offer and player rows, and every write happens in the same transaction.
+    A second press of the button waits for the first to commit, then finds the
+    offer already accepted, so a transfer can never be applied twice.
+    """
+    async with db.pool.acquire() as conn:
+        async with conn.transaction():
+            row = await conn.fetchrow("""
+                SELECT o.status, o.team_id AS new_team_id, o.wage_offer, o.contract_length,
+                       p.player_name, p.team_id AS old_team_id, p.overall_rating, p.age,
+                       p.contract_years, p.last_transfer_window,
+                       nt.team_name AS new_team_name, nt.league AS new_league,
+                       ot.team_name AS old_team_name,
+                       gs.current_week
+                FROM transfer_offers o
+                JOIN players p ON p.user_id = o.user_id
+                LEFT JOIN teams nt ON nt.team_id = o.team_id
+                LEFT JOIN teams ot ON ot.team_id = p.team_id
+                CROSS JOIN game_state gs
+                WHERE o.offer_id = $1 AND o.user_id = $2 AND gs.id = 1
+                FOR UPDATE OF o, p
+            """, offer_id, user_id)
+
+            if not row:
+                return None, "Offer not found"
+
+            if row['status'] == 'accepted':
+                return None, "You've already accepted this offer"
+
+            if row['status'] != 'pending':
+                return None, "Offer is no longer available"
+
+            if row['new_team_name'] is None:
+                return None, "That club no longer exists"
+
+            current_week = row['current_week']
+            current_window = get_current_transfer_window(current_week)
+
+            if row['last_transfer_window'] == current_window:
+                return None, "You've already transferred this window"
+
+            old_team_id = row['old_team_id']
+            has_old_team = old_team_id != 'free_agent' and row['old_team_name'] is not None
+
+            # Calculate transfer fee
+            if has_old_team:
+                base_fee = row['overall_rating'] * 100000
+                age_modifier = 1.0
+                if row['age'] < 23:
+                    age_modifier = 1.5
+                elif row['age'] > 30:
+                    age_modifier = 0.6
+
+                contract_modifier = 1.0 + (row['contract_years'] * 0.1)
+                transfer_fee = int(base_fee * age_modifier * contract_modifier * random.uniform(0.5, 1.5))
+            else:
+                transfer_fee = 0
 
-        # Reject all other pending offers
-        await conn.execute(
-            "UPDATE transfer_offers SET status = 'rejected' WHERE user_id = $1 AND offer_id != $2 AND status = 'pending'",
-            user_id, offer_id
-        )
+            old_team_name = row['old_team_name'] if has_old_team else 'free agency'
 
-        # Record transfer
-        await conn.execute('''
-            INSERT INTO transfers (user_id, from_team, to_team, fee, wage, contract_length, transfer_type)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-        ''',
-            user_id, player['team_id'], offer['team_id'], transfer_fee,
-            offer['wage_offer'], offer['contract_length'],
-            'free_transfer' if transfer_fee == 0 else 'transfer'
-        )
+            # Update player
+            await conn.execute('''
+                UPDATE players 
+                SET team_id = $1, league = $2, contract_wage = $3, contract_years = $4,
+                    last_transfer_window = $5, transfers_this_season = transfers_this_season + 1
+                WHERE user_id = $6
+            ''',
+                row['new_team_id'], row['new_league'], row['wage_offer'],
+                row['contract_length'], current_window, user_id
+            )
 
-        old_team_name = old_team['team_name'] if old_team else 'free agency'
+            # Mark offer accepted, reject all other pending offers
+            await conn.execute("""
+                UPDATE transfer_offers
+                SET status = CASE WHEN offer_id = $2 THEN 'accepted' ELSE 'rejected' END
+                WHERE user_id = $1 AND (offer_id = $2 OR status = 'pending')
+            """, user_id, offer_id)
+
+            # Record transfer
+            await conn.execute('''
+                INSERT INTO transfers (user_id, from_team, to_team, fee, wage, contract_length, transfer_type)
+                VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ''',
+                user_id, old_team_id, row['new_team_id'], transfer_fee,
+                row['wage_offer'], row['contract_length'],
+                'free_transfer' if transfer_fee == 0 else 'transfer'
+            )
 
-        # Add news
-        await db.add_news(
-            f"TRANSFER: {player['player_name']} joins {new_team['team_name']}!",
-            f"{player['player_name']} completes move from {old_team_name} to {new_team['team_name']} "
-            f"{'for £' + f'{transfer_fee:,}' if transfer_fee > 0 else 'on a free transfer'} on a {offer['contract_length']}-year deal.",
-            "transfer_news",
-            user_id,
-            8,
-            state['current_week']
-        )
+            # Add news
+            await conn.execute("""
+                INSERT INTO news (headline, content, category, user_id, importance, week_number)
+                VALUES ($1, $2, $3, $4, $5, $6)
+            """,
+                f"TRANSFER: {row['player_name']} joins {row['new_team_name']}!",
+                f"{row['player_name']} completes move from {old_team_name} to {row['new_team_name']} "
+                f"{'for £' + f'{transfer_fee:,}' if transfer_fee > 0 else 'on a free transfer'} on a {row['contract_length']}-year deal.",
+                "transfer_news",
+                user_id,
+                8,
+                current_week
+            )
 
-        result = {
-            'player_name': player['player_name'],
-            'old_team': old_team_name,
-            'new_team': new_team['team_name'],
+    team_strength.invalidate(old_team_id, row['new_team_id'])
+    season_projector.invalidate()
+
+    result = {
+        'player_name': row['player_name'],
+        'old_team': old_team_name,
+        'new_team': row['new_team_name'],
+        'fee': transfer_fee,
+        'wage': row['wage_offer'],
+        'contract_length': row['contract_length']
+    }
+
+    # Post to transfer-news channel (after the connection is back in the pool)
+    if bot:
+        transfer_info = {
+            'player_name': row['player_name'],
+            'from_team': old_team_name,
+            'to_team': row['new_team_name'],
             'fee': transfer_fee,
-            'wage': offer['wage_offer'],
-            'contract_length': offer['contract_length']
+            'wage': row['wage_offer'],
+            'contract_length': row['contract_length']
         }
 
-        # Post to transfer-news channel
-        if bot:
-            transfer_info = {
-                'player_name': player['player_name'],
-                'from_team': old_team_name,
-                'to_team': new_team['team_name'],
-                'fee': transfer_fee,
-                'wage': offer['wage_offer'],
-                'contract_length': offer['contract_length']
-            }
-
-            for guild in bot.guilds:
-                try:
-                    await post_transfer_news_to_channel(bot, guild, transfer_info)
-                except Exception as e:
-                    print(f"Could not post transfer to {guild.name}: {e}")
-
-        return result, None
+        for guild in bot.guilds:
+            try:
+                await post_transfer_news_to_channel(bot, guild, transfer_info)
+            except Exception as e:
+                print(f"Could not post transfer to {guild.name}: {e}")
+
+    return result, None
 
 async def reject_transfer_offer(user_id: int, offer_id: int):
     """Reject a single transfer offer"""
@@ -701,6 +732,8 @@ async def close_transfer_window(bot=None):
                     contract_years = 0
                 WHERE user_id = $1
             """, player['user_id'])
+        team_strength.invalidate(player['team_id'])
+        season_projector.invalidate()
         
         # Add news about becoming free agent
         await db.add_news(
@@ -772,145 +805,35 @@ def get_current_transfer_window(week: int) -> int:
         return 2
     return 0
 
+def offer_notification_embed(num_offers: int):
+    """DM telling a player how many new offers are waiting"""
+    import discord
+    embed = discord.Embed(
+        title="📬 NEW TRANSFER OFFERS!",
+        description=f"You have **{num_offers} new club offers** waiting!\n\n"
+                   f"Use `/offers` to review them.",
+        color=discord.Color.gold()
+    )
+    embed.add_field(
+        name="⏰ Offers Expire",
+        value="At the end of this transfer window",
+        inline=False
+    )
+    return embed
+
 async def send_offer_notification(bot, user_id: int, num_offers: int):
     """Send Discord DM notification - ONLY CALLED ONCE"""
     try:
         user = await bot.fetch_user(user_id)
         if user:
-            import discord
-            embed = discord.Embed(
-                title="📬 NEW TRANSFER OFFERS!",
-                description=f"You have **{num_offers} new club offers** waiting!\n\n"
-                           f"Use `/offers` to review them.",
-                color=discord.Color.gold()
-            )
-            embed.add_field(
-                name="⏰ Offers Expire",
-                value="At the end of this transfer window",
-                inline=False
-            )
-            await user.send(embed=embed)
+            await user.send(embed=offer_notification_embed(num_offers))
             print(f"✅ Sent notification to user {user_id}")
     except Exception as e:
         print(f"❌ Could not notify user {user_id}: {e}")
 
-async def simulate_npc_transfers():
-    """
-    Simulate NPC transfers - CRITICAL FIX #1: Only during transfer windows
-    """
-
-    # CRITICAL FIX #1: CHECK TRANSFER WINDOW AT THE TOP
-    state = await db.get_game_state()
-    if state['current_week'] not in config.TRANSFER_WINDOW_WEEKS:
-        print(f"⚠️ Week {state['current_week']}: Not a transfer window, skipping NPC transfers")
-        return 0
-
-    print("\n=== Simulating NPC Transfers ===")
-
-    async with db.pool.acquire() as conn:
-        transfer_candidates = await conn.fetch("""
-            SELECT n.*, t.league 
-            FROM npc_players n
-            LEFT JOIN teams t ON n.team_id = t.team_id
-            WHERE n.retired = FALSE 
-            AND n.age BETWEEN 18 AND 33
-            AND n.overall_rating BETWEEN 55 AND 85
-            AND n.team_id IS NOT NULL
-            ORDER BY RANDOM()
-            LIMIT 20
-        """)
-
-    transfers_made = 0
-
-    for candidate in transfer_candidates:
-        if random.random() > 0.25:
-            continue
-
-        candidate = dict(candidate)
-        current_league = candidate['league']
-        rating = candidate['overall_rating']
-
-        potential_leagues = []
-        if rating >= 75:
-            potential_leagues.append('Premier League')
-        if rating >= 65:
-            potential_leagues.append('Championship')
-        if rating >= 55:
-            potential_leagues.append('League One')
-
-        if random.random() < 0.5 and current_league in potential_leagues:
-            potential_leagues.remove(current_league)
-
-        if not potential_leagues:
-            continue
-
-        target_league = random.choice(potential_leagues)
-
-        async with db.pool.acquire() as conn:
-            new_team = await conn.fetchrow("""
-                SELECT team_id, team_name, league
-                FROM teams
-                WHERE league = $1 AND team_id != $2
-                ORDER BY RANDOM()
-                LIMIT 1
-            """, target_league, candidate['team_id'])
-
-        if not new_team:
-            continue
-
-        new_team = dict(new_team)
-
-        # Calculate fee
-        base_fee = rating * 100000
-        age_modifier = 1.0
-        if candidate['age'] < 23:
-            age_modifier = 1.3
-        elif candidate['age'] > 30:
-            age_modifier = 0.6
-
-        fee = int(base_fee * age_modifier * random.uniform(0.3, 1.2))
-
-        # Execute transfer
-        async with db.pool.acquire() as conn:
-            old_team = await conn.fetchrow(
-                "SELECT team_name FROM teams WHERE team_id = $1",
-                candidate['team_id']
-            )
-
-            await conn.execute("""
-                UPDATE npc_players SET team_id = $1 WHERE npc_id = $2
-            """, new_team['team_id'], candidate['npc_id'])
-
-            await conn.execute("""
-                INSERT INTO transfers (
-                    npc_id, from_team, to_team, fee, wage, 
-                    contract_length, transfer_type
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """,
-                candidate['npc_id'],
-                candidate['team_id'],
-                new_team['team_id'],
-                fee,
-                rating * 1000,
-                random.randint(2, 4),
-                'transfer' if fee > 0 else 'free_transfer'
-            )
-
-        old_team_name = old_team['team_name'] if old_team else 'Unknown'
-
-        # Add news
-        await db.add_news(
-            f"NPC Transfer: {candidate['player_name']} joins {new_team['team_name']}",
-            f"{candidate['player_name']} ({rating} OVR) transfers from {old_team_name} to {new_team['team_name']} "
-            f"{'for £' + f'{fee:,}' if fee > 0 else 'on a free transfer'}.",
-            "transfer_news",
-            None,
-            5,
-            state['current_week']
-        )
-
-        transfers_made += 1
-        print(f"  ✅ {candidate['player_name']} ({old_team_name} -> {new_team['team_name']}) £{fee:,}")
-
-    print(f"=== {transfers_made} NPC transfers complete ===\n")
-    return transfers_made
+def queue_offer_notifications(bot, offer_counts: dict):
+    """Queue one offer DM per player on the DM dispatcher (sent in the background)"""
+    return dm_dispatcher.queue_many(
+        bot, "transfer_offers",
+        [(user_id, {'embed': offer_notification_embed(count)}) for user_id, count in offer_counts.items()]
+    )